@@ -1,7 +1,10 @@
-import yfinance as yf
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from corporate_actions import TotalReturnEngine, extract_price_field
+from news_aggregator import NewsAggregator
+
+# yfinance is imported in fetch_historical_data, when it downloads (see market_data).
 
 class AnalyticsEngine:
     """
@@ -9,10 +12,15 @@ class AnalyticsEngine:
     """
     def __init__(self, risk_free_rate=0.045):
         self.risk_free_rate = risk_free_rate # Annualized 4.5%
+        self.total_return = TotalReturnEngine()
+        self.news = NewsAggregator()
 
-    def fetch_historical_data(self, assets, period="1y"):
+    def fetch_historical_data(self, assets, period="1y", total_return=True):
         """
-        Fetches historical prices (Close) for all assets.
+        Fetches historical prices for all assets.
+        Always reads the raw 'Close' (split-adjusted, not dividend-adjusted) so results don't depend
+        on which columns the installed yfinance returns; with total_return=True, dividends from the
+        cached corporate actions are reinvested to give consistent total-return price levels.
         Returns a DataFrame of prices with Tickers as columns.
         """
         if not assets:
@@ -20,59 +28,85 @@ class AnalyticsEngine:
         
         tickers = [a['ticker'] for a in assets]
         try:
+            import yfinance as yf
             # Batch fetch
-            data = yf.download(tickers, period=period, progress=False)
-            
-            # Handle Data Structure (yfinance varies by version)
-            prices = pd.DataFrame()
-            
-            # Case 1: MultiIndex columns (PriceType, Ticker) or (Ticker, PriceType)
-            if isinstance(data.columns, pd.MultiIndex):
-                # Try getting Adj Close first from level 0 or 1
-                try:
-                    prices = data['Adj Close']
-                except KeyError:
-                    try:
-                        # Sometimes it's (Ticker, 'Adj Close')
-                        if 'Adj Close' in data.columns.get_level_values(1):
-                             prices = data.xs('Adj Close', axis=1, level=1)
-                        else:
-                             prices = data['Close']
-                    except KeyError:
-                        return pd.DataFrame()
-            # Case 2: Single Level Columns
-            else:
-                # If only one ticker, it might be just columns like [Open, Close, ...]
-                if len(tickers) == 1:
-                    if 'Adj Close' in data:
-                        prices = data[['Adj Close']].copy()
-                        prices.columns = tickers
-                    elif 'Close' in data:
-                        prices = data[['Close']].copy()
-                        prices.columns = tickers
-                else:
-                    # Flat structure?
-                    if 'Adj Close' in data:
-                         prices = data['Adj Close']
-                    elif 'Close' in data:
-                         prices = data['Close']
+            data = yf.download(tickers, period=period, auto_adjust=False, progress=False)
+            prices = extract_price_field(data, 'Close', tickers)
+            if prices.empty:
+                return pd.DataFrame()
 
             # Ensure all tickers are present
             # Filter out tickers that failed to download or are missing
-            valid_prices = pd.DataFrame()
-            for t in tickers:
-                if t in prices.columns:
-                    valid_prices[t] = prices[t]
+            valid_prices = prices.dropna(axis=1, how='all')
+            if total_return and not valid_prices.empty:
+                valid_prices = self.total_return.total_return_prices(valid_prices)
             
             return valid_prices
         except Exception as e:
             print(f"Error fetching history: {e}")
             return pd.DataFrame()
 
-    def calculate_sharpe_ratio(self, assets, ex_btc=False):
+    def value_positions(self, positions: pd.DataFrame, prices) -> pd.DataFrame:
+        """
+        Values a stacked positions table (one row per account x ticker) in one pass.
+        prices: {ticker: last price} fetched once for all accounts; a missing/zero price falls back to avg cost.
+        """
+        out = positions.copy()
+        price = pd.to_numeric(out["ticker"].map(prices), errors="coerce").fillna(0.0)
+        out["current_price"] = price.where(price != 0, out["avg_price"])
+        out["value_usd"] = out["current_price"] * out["quantity"]
+        return out
+
+    def consolidate_positions(self, valued: pd.DataFrame) -> pd.DataFrame:
+        """One row per ticker across accounts: summed quantity/value, quantity-weighted avg cost."""
+        if valued.empty:
+            return valued
+        grouped = valued.assign(cost=valued["avg_price"] * valued["quantity"]).groupby("ticker", sort=False)
+        out = grouped.agg(
+            quantity=("quantity", "sum"), cost=("cost", "sum"), value_usd=("value_usd", "sum"),
+            current_price=("current_price", "first"), asset_class=("asset_class", "first"),
+            sector=("sector", "first"), account=("account", "first"), n_accounts=("account", "nunique")
+        ).reset_index()
+        out["avg_price"] = (out["cost"] / out["quantity"].where(out["quantity"] != 0)).fillna(0.0)
+        out["account"] = out["account"].where(out["n_accounts"] == 1, out["n_accounts"].astype(str) + " accounts")
+        return out.drop(columns=["cost", "n_accounts"])
+
+    def account_summary(self, valued: pd.DataFrame) -> pd.DataFrame:
+        """Per-account totals (value, positions, weight) from the same valued positions table."""
+        if valued.empty:
+            return pd.DataFrame(columns=["account", "value_usd", "positions", "weight"])
+        out = valued.groupby("account").agg(value_usd=("value_usd", "sum"), positions=("ticker", "count")).reset_index()
+        total = out["value_usd"].sum()
+        out["weight"] = out["value_usd"] / total if total else 0.0
+        return out.sort_values("value_usd", ascending=False, ignore_index=True)
+
+    def calculate_ledger_performance(self, ledger, prices, fx_rates=None):
+        """
+        Replays the transaction ledger over the price history.
+        Returns (nav_series, twr_series, xirr). Cash is valued only when the ledger records
+        deposits/withdrawals; otherwise NAV covers positions and trades are treated as flows.
+        """
+        if ledger is None or ledger.empty or prices.empty:
+            return pd.Series(dtype=float), pd.Series(dtype=float), 0.0
+        include_cash = ledger.has_cash_flows
+        if include_cash:
+            # Dividends are paid into the replayed cash, so `prices` should be price-return (total_return=False)
+            ledger = self.total_return.credit_dividends(ledger, prices.index)
+        else:
+            # Positions-only valuation: flows must cover exactly the tickers being valued
+            ledger = ledger.subset(prices.columns)
+        ledger = self.total_return.split_adjusted_ledger(ledger)
+        nav = ledger.nav(prices, fx_rates, include_cash=include_cash)
+        twr = ledger.time_weighted_return(nav, fx_rates, include_cash=include_cash)
+        xirr = ledger.xirr(nav, fx_rates, include_cash=include_cash)
+        return nav, twr, xirr
+
+    def calculate_sharpe_ratio(self, assets, ex_btc=False, ledger=None):
         """
         Calculates the Sharpe Ratio of the portfolio.
         Optionally excludes Bitcoin (or Crypto) from the calculation.
+        If a TransactionLedger is given, positions are replayed from it (no look-ahead bias)
+        and returns are time-weighted so trades and deposits don't count as performance.
         """
         # Filter assets if Ex-BTC is requested
         active_assets = assets
@@ -83,13 +117,33 @@ class AnalyticsEngine:
             return 0.0, 0.0, pd.Series()
 
         # Fetch History
-        prices = self.fetch_historical_data(active_assets)
+        if ledger is not None and not ledger.empty:
+            active_tickers = {a['ticker'] for a in active_assets}
+            ledger_tickers = [t for t in ledger.tickers if t not in active_tickers]
+            if ex_btc:
+                ledger_tickers = [t for t in ledger_tickers if "BTC" not in t and not t.endswith("-USD")]
+            active_assets = active_assets + [{'ticker': t} for t in ledger_tickers]
+        # Ledgers with cash replay dividends as cash credits, so they need price-return history
+        use_tr = ledger is None or ledger.empty or not ledger.has_cash_flows
+        prices = self.fetch_historical_data(active_assets, total_return=use_tr)
         if prices.empty:
             return 0.0, 0.0, pd.Series()
 
         # Forward fill to handle mismatches or holidays
-        prices = prices.ffill().dropna()
+        prices = prices.ffill().dropna(how='all')
+
+        if prices.empty:
+            return 0.0, 0.0, pd.Series()
+
+        if ledger is not None and not ledger.empty:
+            nav, twr, _ = self.calculate_ledger_performance(ledger, prices)
+            nav = nav[nav > 0]
+            if len(nav) < 5:
+                return 0.0, 0.0, pd.Series()
+            portfolio_returns = (1 + twr.reindex(nav.index)).pct_change().dropna()
+            return self._sharpe_from_returns(portfolio_returns) + (nav,)
 
+        prices = prices.dropna()
         if prices.empty:
             return 0.0, 0.0, pd.Series()
         
@@ -121,11 +175,18 @@ class AnalyticsEngine:
         if portfolio_returns.empty:
             return 0.0, 0.0, portfolio_value_series
 
+        return self._sharpe_from_returns(portfolio_returns) + (portfolio_value_series,)
+
+    def _sharpe_from_returns(self, portfolio_returns):
+        """Annualized (sharpe, volatility) from daily returns."""
+        if portfolio_returns.empty:
+            return 0.0, 0.0
+
         mean_daily_return = portfolio_returns.mean()
         std_daily_return = portfolio_returns.std()
         
-        if std_daily_return == 0:
-            return 0.0, 0.0, portfolio_value_series
+        if std_daily_return == 0 or np.isnan(std_daily_return):
+            return 0.0, 0.0
 
         rf_daily = (1 + self.risk_free_rate) ** (1/252) - 1
         
@@ -133,7 +194,7 @@ class AnalyticsEngine:
         sharpe_ratio = (mean_daily_return - rf_daily) / std_daily_return * np.sqrt(252)
         annual_volatility = std_daily_return * np.sqrt(252)
         
-        return sharpe_ratio, annual_volatility, portfolio_value_series
+        return sharpe_ratio, annual_volatility
 
     def calculate_manual_sharpe(self, annual_roi, annual_vol, risk_free_rate):
         """
@@ -145,38 +206,9 @@ class AnalyticsEngine:
         return (annual_roi - risk_free_rate) / annual_vol
 
     def get_portfolio_news(self, assets, limit_per_asset=3):
-        """Fetches news for ALL assets in the portfolio."""
+        """Fetches news for ALL assets in the portfolio (parallel, disk-cached, newest first)."""
         if not assets:
             return []
             
         tickers = [a['ticker'] for a in assets if a['ticker'] != 'CASH']
-        news_items = []
-        
-        for ticker in tickers:
-            try:
-                t = yf.Ticker(ticker)
-                raw_news = t.news
-                if raw_news:
-                    count = 0
-                    for item in raw_news:
-                        if count >= limit_per_asset: break
-                        try:
-                            if not isinstance(item, dict): continue
-                            content = item.get('content', item)
-                            if not isinstance(content, dict): content = {}
-
-                            parsed = {
-                                'ticker': ticker,
-                                'title': content.get('title', 'No Title'),
-                                'link': content.get('clickThroughUrl', {}).get('url') if isinstance(content.get('clickThroughUrl'), dict) else content.get('clickThroughUrl'),
-                                'providerPublishTime': content.get('pubDate') or item.get('providerPublishTime')
-                            }
-                            if not any(n['link'] == parsed['link'] for n in news_items):
-                                news_items.append(parsed)
-                                count += 1
-                        except Exception:
-                            continue
-            except Exception:
-                continue
-                
-        return news_items
+        return self.news.get_news(tickers, limit_per_ticker=limit_per_asset)
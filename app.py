@@ -1,51 +1,13 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from portfolio_manager import PortfolioManager
-from market_data import MarketData
-from analytics_engine import AnalyticsEngine
+from views import PAGES, DEFAULT_PAGE, PageContext, load_page
+from views.common import render_footer
 import time
-import os
-import numpy as np
-from datetime import datetime, timedelta
-import pandas_datareader.data as web
-import yfinance as yf
-import streamlit.components.v1 as components
-from plotly.subplots import make_subplots # 👈 이 줄이 꼭 있어야 fig_dual이 작동합니다!
 
 # --- Setup ---
 st.set_page_config(page_title="Portfolio Manager", layout="wide", page_icon=None, initial_sidebar_state="collapsed")
 
 
 
-# --- 공통 푸터 함수 정의 (업그레이드) ---
-def render_footer(sidebar=False):
-    # 어디에 출력할지 결정 (st 또는 st.sidebar)
-    target = st.sidebar if sidebar else st
-    
-    # 사이드바용일 때는 구분선(---)을 생략하거나 마진을 줄여 조절 가능
-    if not sidebar:
-        target.markdown("---")
-    
-    target.markdown(f"""
-        <div style="
-            font-family: 'Courier New', Courier, monospace;
-            font-size: 13px;
-            color: #777777;
-            text-align: center;
-            letter-spacing: 1px;
-            padding-top: { '10px' if sidebar else '50px' };
-            padding-bottom: 20px;
-            font-weight: 500;
-            width: 100%;
-        ">
-            RABBIT TERMINAL v2026.02
-        </div>
-    """, unsafe_allow_html=True)
-
-
-
 # --- Authentication Logic ---
 if "logged_in" not in st.session_state:
     st.session_state["logged_in"] = False
@@ -136,24 +98,37 @@ if not st.session_state["logged_in"]:
     st.stop() # Prevents running the rest of the app
 
 # --- LOGGED IN DASHBOARD BELOW ---
+# [V43] 무거운 모듈(yfinance, 데이터 엔진)은 로그인 이후에만 import (로그인 화면의 콜드 스타트 단축)
+from portfolio_manager import PortfolioManager
+from market_data import MarketData
+from analytics_engine import AnalyticsEngine
+from technical_indicators import TechnicalIndicators
 
 # Add Logout Button in Sidebar (Will be rendered later but added to session logic)
 def logout():
+    # [V31] 대기 중인 변경사항을 시트에 먼저 기록
+    pm.flush()
+    st.session_state.pop("pm", None)
     st.session_state["logged_in"] = False
     st.session_state["user_id"] = None
     st.rerun()
 
 # --- Robust Initialization (Moved Here V53) ---
+def get_portfolio_manager(user_id):
+    # [V40] 세션마다 PortfolioManager 하나를 유지 (rerun 마다 재생성하지 않음)
+    # 다른 세션/시트의 변경은 메모리상의 버전 비교로만 확인하므로 변경이 없으면 저장소 I/O 없음
+    cached = st.session_state.get("pm")
+    if cached is None or cached.user_id != user_id:
+        cached = st.session_state["pm"] = PortfolioManager(user_id=user_id)
+    else:
+        cached.refresh()
+    return cached
+
 try:
     current_user = st.session_state.get("user_id", "csj")
     # Only initialize if logged in (double check, though code flow ensures it)
     if st.session_state["logged_in"]:
-         # We need to ensure pm is in session state to persist across reruns without re-init?
-         # Actually PM checks GSheets every time or we trust internal state? 
-         # GSheetsConnection handles caching (ttl). 
-         # But PM class instance should probably be cached or just re-inited is fine as it loads from cache.
-         # Let's keep it simple: Init.
-         pm = PortfolioManager(user_id=current_user) 
+         pm = get_portfolio_manager(current_user)
     else:
          st.stop() # Should be caught above
 except Exception as e:
@@ -333,164 +308,20 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# --- Robust Initialization (Fix Persistence) ---
-try:
-    # V43: Load User specific data
-    current_user = st.session_state.get("user_id", "csj") # Fallback to csj if somehow None
-    pm = PortfolioManager(user_id=current_user) 
-except Exception as e:
-    st.error(f"CRITICAL ERROR: Failed to load Portfolio Database. {str(e)}")
-    st.stop()
-
 # Cache heavy agents if possible, but MarketData needs fresh prices usually
 if 'md' not in st.session_state:
     st.session_state.md = MarketData()
 if 'ae' not in st.session_state:
     st.session_state.ae = AnalyticsEngine()
+if 'ti' not in st.session_state:
+    st.session_state.ti = TechnicalIndicators()
 
 md = st.session_state.md
 ae = st.session_state.ae
-
-# --- MACRO INTELLIGENCE CLASS (V54) ---
-class MacroThinking:
-    @staticmethod
-    @st.cache_data(ttl=3600)
-    def get_real_interest_rate_data():
-        try:
-            # 1. 넉넉하게 3년치 데이터 호출
-            start_date = datetime.now() - timedelta(days=1100)
-            end_date = datetime.now()
-            raw_data = web.DataReader(['DGS3MO', 'CPIAUCNS'], 'fred', start_date, end_date)
-            
-            # 2. [무결성 로직] CPI YoY 계산 (월간 데이터만 따로 추출)
-            # CPI 데이터가 존재하는 행만 골라내서 월간 증감률 계산
-            cpi_monthly = raw_data[['CPIAUCNS']].dropna()
-            cpi_yoy = (cpi_monthly / cpi_monthly.shift(12) - 1) * 100
-            cpi_yoy.columns = ['Inflation']
-            
-            # 3. [데이터 통합] 일간 금리 데이터프레임에 월간 Inflation 수치를 병합
-            # 최신 물가 수치를 다음 발표 전까지 매일 동일하게 적용(ffill)
-            df = raw_data[['DGS3MO']].rename(columns={'DGS3MO': 'US3M'})
-            df = df.join(cpi_yoy).ffill()
-            
-            # 4. 실질금리 계산: 3M Yield - Inflation (YoY)
-            df['Real_Rate'] = df['US3M'] - df['Inflation']
-            
-            # 최신 데이터가 누락되지 않도록 결측치 제거 후 반환
-            return df[['US3M', 'Inflation', 'Real_Rate']].dropna()
-            
-        except Exception as e:
-            st.error(f"Macro Data Error: {e}")
-            return pd.DataFrame()
-
-    @staticmethod
-    @st.cache_data(ttl=3600)
-    def get_treasury_yields():
-        try:
-            # DGS3MO, DGS1, DGS2, DGS5, DGS10, DGS30
-            tickers = ['DGS3MO', 'DGS1', 'DGS2', 'DGS3', 'DGS5', 'DGS10', 'DGS20', 'DGS30']
-            start = datetime.now() - timedelta(days=730)
-            df = web.DataReader(tickers, 'fred', start, datetime.now())
-            return df.dropna()
-        except Exception as e:
-            print(f"Treasury Data Error: {e}")
-            return pd.DataFrame()
-
-# Analytics Wrapper
-@st.cache_data(ttl=3600)
-def get_news(assets):
-    return ae.get_portfolio_news(assets, limit_per_asset=15)
-
-# 야후 파이낸스 캐싱
-@st.cache_data(ttl=3600)  # 1시간 동안 가격 데이터를 메모리에 저장
-def get_cached_historical_data(_ae, assets):
-    """야후 파이낸스 데이터를 1시간 동안 캐싱하여 차트 오프라인 방지"""
-    try:
-        return _ae.fetch_historical_data(assets)
-    except Exception as e:
-        return pd.DataFrame()
-
-
-# Helper: Process Assets
-def process_assets(assets, rates, base_currency):
-    total_val = 0.0
-    processed_assets = []
-    
-    for asset in assets:
-        price = md.get_current_price(asset['ticker'])
-        if price == 0:
-            price = asset.get('avg_price', 0.0) 
-        
-        val_usd = price * asset['quantity']
-        total_val += val_usd
-        
-        asset['current_price'] = price
-        asset['value_usd'] = val_usd
-        processed_assets.append(asset)
-    
-    # Cash
-    cash_data = pm.data.get('cash', {})
-    total_cash_usd = 0.0
-    total_cash_usd += cash_data.get('USD', 0.0)
-    total_cash_usd += cash_data.get('CAD', 0.0) / rates.get('CAD', 1.35)
-    total_cash_usd += cash_data.get('KRW', 0.0) / rates.get('KRW', 1300.0)
-    
-    total_val += total_cash_usd
-    
-    if total_cash_usd > 1:
-        processed_assets.append({
-            'ticker': 'CASH',
-            'quantity': 1,
-            'current_price': total_cash_usd,
-            'value_usd': total_cash_usd,
-            'sector': 'Liquidity',
-            'asset_class': 'Cash'
-        })
-
-    # Sort
-    def asset_rank(a):
-        ac = a.get('asset_class', 'Other')
-        if ac == 'Crypto': return 0
-        if ac == 'Stock': return 1
-        if ac == 'ETF': return 2
-        if ac == 'Index': return 3
-        if ac == 'Future': return 4
-        if ac == 'Cash': return 99
-        return 50 # Other
-    
-    # Sort by Rank -> Sector -> Value (Desc)
-    processed_assets.sort(key=lambda x: (asset_rank(x), x.get('sector', 'Unknown'), -x['value_usd']))
-    
-    display_total = total_val
-    if base_currency != 'USD':
-        display_total = total_val * rates.get(base_currency, 1.0)
-        
-    return display_total, processed_assets
-
-# --- Get Settings ---
-section_labels = pm.get_setting('section_labels', {
-    "strategic_allocation": "ALLOCATION",
-    "asset_growth": "NET ASSET VALUE",
-    "asset_manifest": "HOLDINGS", 
-    "risk_analysis": "RISK ANALYSIS",
-    "global_intel": "NEWS"
-})
-
-
-
-manual_risk = pm.get_setting('risk_inputs', {
-    "roi": 0.0,
-    "volatility": 0.0,
-    "risk_free_rate": 4.5
-})
-
-
-
-
-
-
+ti = st.session_state.ti
 
 
+ctx = PageContext(pm, md, ae, ti)
 
 # --- Sidebar ---
 with st.sidebar:
@@ -506,14 +337,14 @@ with st.sidebar:
     if 'sidebar_menu' not in st.session_state:
         st.session_state['sidebar_menu'] = "Portfolio"
 
-    # 1. 새로운 메뉴 리스트 정의
-    menu_list = ["Portfolio", "Bitcoin Standard", "Crypto", "Macro", "Market"]
+    # 1. 메뉴 리스트는 페이지 레지스트리에서 (views.PAGES)
+    menu_list = list(PAGES)
 
     # 2. [V1270 핵심] 세션에 저장된 메뉴가 새로운 리스트에 없으면 Portfolio로 초기화 
-    current_menu = st.session_state.get('sidebar_menu', "Portfolio")
+    current_menu = st.session_state.get('sidebar_menu', DEFAULT_PAGE)
     if current_menu not in menu_list:
-        current_menu = "Portfolio"
-        st.session_state['sidebar_menu'] = "Portfolio"
+        current_menu = DEFAULT_PAGE
+        st.session_state['sidebar_menu'] = DEFAULT_PAGE
 
     # 3. 라디오 버튼 렌더링
     menu = st.radio(
@@ -531,2844 +362,13 @@ with st.sidebar:
 
     st.markdown("---")
 
-    # [C] PORTFOLIO 전용 섹션 (Settings, Cash, Add Asset)
-    # Portfolio 모드일 때만 아래 내용들이 나타납니다. 
-    if menu == "Portfolio":
-        # 1. SETTINGS (통화 설정)
-        st.subheader("SETTINGS")
-        curr_val = pm.get_setting("base_currency", "USD")
-        new_curr = st.radio("CURRENCY", ["USD", "CAD", "KRW"], horizontal=True, key="sidebar_curr_v780")
-        if new_curr != curr_val:
-            pm.update_setting("base_currency", new_curr)
-            st.rerun()
-        
-        st.markdown("---")
-
-
-
-        # 2. CASH (현금 관리)
-        st.subheader("CASH")
-        cash_data = pm.data.get('cash', {'USD':0.0, 'CAD':0.0, 'KRW':0.0})
-        
-        c1, c2 = st.columns(2)
-        with c1:
-            usd_in = st.number_input("USD", value=cash_data.get('USD', 0.0), key="cash_usd")
-            if usd_in != cash_data.get('USD', 0.0):
-                pm.update_cash('USD', usd_in)
-                st.rerun()
-        with c2:
-            cad_in = st.number_input("CAD", value=cash_data.get('CAD', 0.0), key="cash_cad")
-            if cad_in != cash_data.get('CAD', 0.0):
-                pm.update_cash('CAD', cad_in)
-                st.rerun()
-        krw_in = st.number_input("KRW", value=cash_data.get('KRW', 0.0), key="cash_krw", step=1000.0)
-        if krw_in != cash_data.get('KRW', 0.0):
-            pm.update_cash('KRW', krw_in)
-            st.rerun()
-            
-        st.markdown("---")
-
-
-
-
-        # 3. ADD NEW ASSET (자산 추가 섹션)
-        st.sidebar.subheader("Add New Asset") # 익스팬더 대신 서브헤더 사용
-
-        # 폼 내부의 텍스트가 커지는 것을 방지하기 위해 폼 자체를 사이드바에 직접 배치
-        with st.sidebar.form("add_asset_form_sidebar"):
-            new_ticker = st.text_input("Ticker Symbol", placeholder="e.g. BTC, TSLA").upper()
-            
-            c_qty, c_cost = st.columns(2)
-            with c_qty:
-                new_qty = st.number_input("Qty", min_value=0.0, format="%.4f")
-            with c_cost:
-                new_cost = st.number_input("Avg Cost", min_value=0.0, format="%.2f")
-            
-            new_class = st.selectbox("Class", ["Stock", "Crypto", "ETF", "Bond", "Cash", "Other"])
-            new_sector = st.text_input("Sector", value="Technology")
-            
-            # 버튼 스타일이 전역 CSS에 오염되지 않도록 container width 활용
-            submitted_add = st.form_submit_button("ADD TO PORTFOLIO", use_container_width=True)
-            
-            if submitted_add and new_ticker:
-                curr_price = 0.0
-                info = md.get_asset_info(new_ticker)
-                if info:
-                    curr_price = md.get_current_price(new_ticker)
-                    if new_sector == "Technology":
-                        new_sector = info.get('sector', new_sector)
-                
-                new_asset_entry = {
-                    "ticker": new_ticker, "quantity": new_qty, "avg_price": new_cost,
-                    "sector": new_sector, "asset_class": new_class,
-                    "value_usd": 0.0, "current_price": curr_price
-                }
-                pm.add_or_update_asset(new_asset_entry)
-                pm.save_data()
-                st.toast(f"✅ Asset Added: {new_ticker}")
-                time.sleep(0.5)
-                st.rerun()
-
-        st.markdown("---")
+    # [C] 페이지 전용 섹션 (Portfolio: Settings, Account, Cash, Add Asset, Import)
+    # [V42] 선택된 페이지 모듈만 import (다른 페이지의 코드와 의존성은 로드하지 않음)
+    page = load_page(menu)
+    if hasattr(page, "render_sidebar"):
+        page.render_sidebar(ctx)
 
 render_footer(sidebar=True)
 
-
-
-
-
-
-
-
 # --- MAIN EXECUTION LOGIC ---
-
-if menu == "Macro":
-    # V56: Global Macro Intelligence (Full Caption System)
-    st.title("MACRO INTELLIGENCE")
-    
-    # [A] TradingView Widgets (Top)
-    st.markdown("---")
-    st.markdown("### MARKET PULSE")
-    c1, c2 = st.columns(2)
-    
-    # 디폴트: 현재 시점 기준 1년 전 (정확히 설정되어 있습니다!)
-    sync_start_date = datetime.now() - timedelta(days=365)
-    sync_start_str = sync_start_date.strftime('%Y-%m-%d')
-    
-    with c1:
-        try:
-            fed_data = web.DataReader('FEDFUNDS', 'fred', sync_start_date, datetime.now())
-            if not fed_data.empty:
-                latest_fed = fed_data.dropna().iloc[-1][0]
-                prev_fed = fed_data.dropna().iloc[-2][0]
-                
-                st.metric(label="Fed Funds Effective Rate", value=f"{latest_fed:.2f}%", 
-                          delta=f"{latest_fed - prev_fed:.2f}%", delta_color="normal")
-                
-                fig1 = px.area(fed_data.dropna(), y='FEDFUNDS')
-                fig1.update_traces(line_color='#00E676', fillcolor='rgba(0, 230, 118, 0.1)')
-                fig1.update_layout(
-                    height=200, margin=dict(t=10, b=0, l=0, r=0),
-                    paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
-                    yaxis=dict(showgrid=False, title=None, zeroline=False, 
-                               range=[fed_data['FEDFUNDS'].min() * 0.95, fed_data['FEDFUNDS'].max() * 1.05]),
-                    xaxis=dict(showgrid=False, title=None), showlegend=False)
-                st.plotly_chart(fig1, use_container_width=True, config={'displayModeBar': False})
-                
-                # [V56] Analysis Start + Source 통합 캡션
-                actual_fed_start = fed_data.index[0].strftime('%Y-%m-%d')
-                st.caption(f"Analysis Start: {actual_fed_start} | Source: Federal Reserve Bank of St. Louis (FRED)")
-                
-        except Exception as e:
-            st.error("Fed Data Offline")
-        
-    with c2:
-        try:
-            tickers = ['WALCL', 'WTREGEN', 'RRPONTSYD']
-            nl_data = web.DataReader(tickers, 'fred', sync_start_date, datetime.now())
-            
-            fed_assets = nl_data['WALCL'] / 1000000
-            tga = nl_data['WTREGEN'] / 1000000
-            rrp = nl_data['RRPONTSYD'] / 1000
-            
-            net_liquidity = (fed_assets - tga - rrp).dropna()
-            
-            if not net_liquidity.empty:
-                latest_nl = net_liquidity.iloc[-1]
-                prev_nl = net_liquidity.iloc[-2] if len(net_liquidity) > 1 else latest_nl
-                diff = latest_nl - prev_nl
-                
-                st.metric(
-                    label="Net Liquidity", 
-                    value=f"${latest_nl:.2f}T", 
-                    delta=f"{diff:.3f}T (WoW)", 
-                    delta_color="normal"
-                )
-                
-                df_plot = net_liquidity.to_frame(name='liquidity')
-                fig2 = px.area(df_plot, y='liquidity')
-                fig2.update_traces(line_color='#00E676', fillcolor='rgba(0, 230, 118, 0.1)')
-                fig2.update_layout(
-                    height=200, margin=dict(t=10, b=0, l=0, r=0),
-                    paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
-                    yaxis=dict(
-                        showgrid=False, title=None, zeroline=False, 
-                        range=[net_liquidity.min() * 0.99, net_liquidity.max() * 1.01]
-                    ),
-                    xaxis=dict(showgrid=False, title=None),
-                    showlegend=False
-                )
-                st.plotly_chart(fig2, use_container_width=True, config={'displayModeBar': False})
-                
-                # [V56] Analysis Start + Source 통합 캡션
-                actual_nl_start = net_liquidity.index[0].strftime('%Y-%m-%d')
-                st.caption(f"Analysis Start: {actual_nl_start} | Source: Federal Reserve Bank of St. Louis (FRED)")
-                
-        except Exception as e:
-            st.error(f"Net Liquidity Stream Offline")
-
-    st.markdown("---")
-
-
-
-
-    # [B] Real Interest Rate Analysis (V82: 2-Year Default & Standard Caption)
-    st.subheader("REAL INTEREST RATE")
-
-    # 1. 분석 기간 선택 (디폴트: 현재 시점 기준 2년 전)
-    rr_col1, rr_col2 = st.columns([1, 2])
-    with rr_col1:
-        rr_default_start = datetime.now() - timedelta(days=365 * 2)
-        rr_start_date = st.date_input(
-            "Analysis Start Date", 
-            value=rr_default_start, 
-            key="real_interest_rate_date"
-        )
-
-    # 2. 데이터 로드 및 처리 (V82: 선택된 날짜 연동)
-    @st.cache_data(ttl=3600)
-    def get_real_rate_data_v82(start_date):
-        try:
-            # CPI 계산을 위해 시작일보다 1년 더 전부터 가져와야 함 (YoY 계산용)
-            fetch_start = start_date - timedelta(days=365 + 30)
-            raw_data = web.DataReader(['DGS3MO', 'CPIAUCNS'], 'fred', fetch_start, datetime.now())
-            
-            # CPI YoY 계산
-            cpi_monthly = raw_data[['CPIAUCNS']].dropna()
-            cpi_yoy = (cpi_monthly / cpi_monthly.shift(12) - 1) * 100
-            cpi_yoy.columns = ['Inflation']
-            
-            # 데이터 병합 및 실질금리 계산
-            df = raw_data[['DGS3MO']].rename(columns={'DGS3MO': 'US3M'})
-            df = df.join(cpi_yoy).ffill()
-            df['Real_Rate'] = df['US3M'] - df['Inflation']
-            
-            # 사용자가 선택한 날짜 이후 데이터만 반환
-            return df[df.index >= pd.Timestamp(start_date)].dropna()
-        except Exception as e:
-            st.error(f"Real Rate Data Error: {e}")
-            return pd.DataFrame()
-
-    with st.spinner("Calculating Real Interest Rate Dynamics..."):
-        real_rate_df = get_real_rate_data_v82(rr_start_date)
-    
-    if not real_rate_df.empty:
-        # 1. 상단 메트릭 섹션
-        latest = real_rate_df.iloc[-1]
-        prev = real_rate_df.iloc[-2] if len(real_rate_df) > 1 else latest
-        
-        m1, m2, m3 = st.columns(3)
-        m1.metric("Real Interest Rate", f"{latest['Real_Rate']:.2f}%", delta=f"{latest['Real_Rate'] - prev['Real_Rate']:.2f}%")
-        m2.metric("Nominal Rate (US3M)", f"{latest['US3M']:.2f}%")
-        m3.metric("Inflation (CPI YoY)", f"{latest['Inflation']:.2f}%")
-        
-        # 2. 차트 시각화
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(x=real_rate_df.index, y=real_rate_df['Real_Rate'], fill='tozeroy', mode='lines', name='Real Rate', line=dict(color='#00E676', width=2), fillcolor='rgba(0, 230, 118, 0.1)'))
-        fig.add_trace(go.Scatter(x=real_rate_df.index, y=real_rate_df['Inflation'], mode='lines', name='Inflation', line=dict(color='#FF5252', width=1, dash='dot')))
-        
-        fig.update_layout(
-            paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', 
-            height=350, margin=dict(t=10, b=10, l=10, r=10), 
-            xaxis=dict(gridcolor='#333'), yaxis=dict(gridcolor='#333'), 
-            font=dict(color='#CCC'), legend=dict(orientation="h", y=1.02)
-        )
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # 3. [V82 핵심] 표준 캡션 추가
-        actual_start_str = real_rate_df.index[0].strftime('%Y-%m-%d')
-        st.caption(f"Analysis Start: {actual_start_str} | Source: Federal Reserve Bank of St. Louis (FRED)")
-    else:
-        st.warning("Data unavailable.")
-
-
-
-
-
-# [C] Treasury Yield Trend (V79: 2-Year Default & Date Input)
-    st.markdown("---")
-    st.subheader("U.S. TREASURY YIELD")
-
-    # 1. 분석 기간 선택 (디폴트: 현재 시점 기준 2년 전)
-    yield_col1, yield_col2 = st.columns([1, 2])
-    with yield_col1:
-        yield_default_start = datetime.now() - timedelta(days=365 * 2)
-        yield_start_date = st.date_input(
-            "Analysis Start Date", 
-            value=yield_default_start, 
-            key="treasury_yield_date"
-        )
-
-    # 2. 데이터 로드 로직 보강
-    @st.cache_data(ttl=3600)
-    def get_treasury_yields_v79(start_date):
-        try:
-            # 주요 만기 티커 (3M, 1Y, 2Y, 3Y, 5Y, 10Y, 20Y, 30Y)
-            tickers = ['DGS3MO', 'DGS1', 'DGS2', 'DGS3', 'DGS5', 'DGS10', 'DGS20', 'DGS30']
-            # 주말 데이터 유실 방지를 위해 7일 정도 더 일찍 가져옴
-            fetch_start = start_date - timedelta(days=7)
-            df = web.DataReader(tickers, 'fred', fetch_start, datetime.now())
-            return df.ffill().dropna()
-        except Exception as e:
-            st.error(f"Treasury Data Error: {e}")
-            return pd.DataFrame()
-
-    with st.spinner("Accessing U.S. Treasury Data..."):
-        # 선택된 날짜에 맞춰 데이터 호출
-        yields_df_raw = get_treasury_yields_v79(yield_start_date)
-        # 선택한 날짜 이후로 정확히 필터링
-        yields_df = yields_df_raw[yields_df_raw.index >= pd.Timestamp(yield_start_date)]
-    
-    if not yields_df.empty:
-        # 1. 상단 메트릭 섹션
-        latest = yields_df.iloc[-1]
-        prev = yields_df.iloc[-2] if len(yields_df) > 1 else latest
-        
-        cols = st.columns(5)
-        
-        # 10Y-2Y Spread (장단기 금리차 감시)
-        if 'DGS10' in latest and 'DGS2' in latest:
-            inv_val = latest['DGS10'] - latest['DGS2']
-            inv_prev = prev['DGS10'] - prev['DGS2']
-            cols[0].metric("10Y-2Y Spread", f"{inv_val:.3f}%", 
-                          delta=f"{inv_val - inv_prev:.3f}%", delta_color="normal")
-        
-        # 주요 만기별 메트릭
-        keys = [('DGS3MO', '3M'), ('DGS2', '2Y'), ('DGS10', '10Y'), ('DGS30', '30Y')]
-        for i, (tic, lab) in enumerate(keys):
-            if tic in latest:
-                cols[i+1].metric(lab, f"{latest[tic]:.2f}%", 
-                                delta=f"{latest[tic]-prev[tic]:.3f}%", delta_color="normal")
-            
-        # 2. Yield Trend 시각화
-        fig_y = go.Figure()
-        neon_colors = ['#D500F9', '#7C4DFF', '#00B0FF', '#00E676']
-        plot_ticks = [('DGS3MO', '3M'), ('DGS2', '2Y'), ('DGS10', '10Y'), ('DGS30', '30Y')]
-        
-        active_cols = [t for t, l in plot_ticks if t in yields_df.columns]
-        plot_min = yields_df[active_cols].min().min() if active_cols else 0
-        plot_max = yields_df[active_cols].max().max() if active_cols else 5
-
-        for i, (tick, label) in enumerate(plot_ticks):
-            if tick in yields_df.columns:
-                 fig_y.add_trace(go.Scatter(
-                     x=yields_df.index, y=yields_df[tick], 
-                     mode='lines', name=label,
-                     line=dict(width=1.8, color=neon_colors[i])
-                 ))
-            
-        fig_y.update_layout(
-            paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', 
-            height=450, margin=dict(t=10, b=10, l=10, r=10), 
-            xaxis=dict(showgrid=False, tickfont=dict(color='#888')), 
-            yaxis=dict(
-                gridcolor='rgba(255,255,255,0.05)', tickfont=dict(color='#888'),
-                zeroline=False, range=[plot_min * 0.95, plot_max * 1.05]
-            ), 
-            legend=dict(
-                orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1,
-                font=dict(color='#CCC')
-            ),
-            hovermode='x unified'
-        )
-        
-        # [V81] 차트 출력 및 캡션 스타일 통일
-        st.plotly_chart(fig_y, use_container_width=True, config={'displayModeBar': False})
-        
-        # CORPORATE BOND 섹션과 동일한 폰트/스타일 적용
-        actual_start_str = yields_df.index[0].strftime('%Y-%m-%d')
-        st.caption(f"Analysis Start: {actual_start_str} | Source: Federal Reserve Bank of St. Louis (FRED)")
-    else:
-        st.info("국채 금리 데이터를 스캔하는 중입니다...")
-
-
-
-
-
-    # [D] CORPORATE BOND YIELD TRACKER (V145: FRED Data)
-    st.markdown("---")
-    st.subheader("U.S. CORPORATE BOND YIELDS")
-    
-    # 1. FRED 티커 및 스타일 설정
-    bond_config = {
-        "AAA Grade": {"ticker": "BAMLC0A1CAAAEY", "color": "#00E676"},   # Green
-        "BBB Grade": {"ticker": "BAMLC0A4CBBBEY", "color": "#FFC107"},   # Orange/Gold
-        "High Yield": {"ticker": "BAMLH0A0HYM2EY", "color": "#FF5252"}   # Red
-    }
-    
-    # 2. 입력 도구
-    bond_col1, bond_col2 = st.columns([1, 2])
-    with bond_col1:
-        # bond_start_date = st.date_input("Bond Analysis Start Date", value=datetime(2025, 1, 1), key="bond_start")
-        bond_default_start = datetime.now() - timedelta(days=365)
-        bond_start_date = st.date_input("Analysis Start Date", value=bond_default_start, key="bond_start")
-    
-    with bond_col2:
-        selected_bonds = st.multiselect(
-            "Select Bond Grades",
-            options=list(bond_config.keys()),
-            default=list(bond_config.keys()),
-            key="bond_select"
-        )
-    
-    # 3. 데이터 로드 및 시각화
-    if selected_bonds:
-        with st.spinner("Accessing FRED Bond Data..."):
-            bond_tickers = [bond_config[l]["ticker"] for l in selected_bonds]
-            # FRED 데이터는 pandas_datareader(web)를 사용하는 것이 가장 안정적입니다.
-            try:
-                bond_data = web.DataReader(bond_tickers, 'fred', bond_start_date, datetime.now())
-                
-                if not bond_data.empty:
-                    bond_data = bond_data.ffill().dropna()
-                    
-                    # [레전드 순서 강제 고정]
-                    priority_order = [bond_config[k]["ticker"] for k in bond_config.keys()]
-                    final_order = [t for t in priority_order if t in bond_data.columns]
-                    bond_data = bond_data[final_order]
-                    
-                    fig_bond = go.Figure()
-                    
-                    for ticker in bond_data.columns:
-                        label = [k for k, v in bond_config.items() if v["ticker"] == ticker][0]
-                        conf = bond_config[label]
-                        
-                        # High Yield는 더 굵게 표시하여 리스크 강조
-                        line_width = 1.5 if label == "High Yield" else 1.5
-                        
-                        fig_bond.add_trace(go.Scatter(
-                            x=bond_data.index, 
-                            y=bond_data[ticker], 
-                            mode='lines', 
-                            name=label,
-                            line=dict(width=line_width, color=conf["color"]),
-                            hovertemplate=f"{label}: %{{y:.2f}}%<extra></extra>"
-                        ))
-                    
-                    fig_bond.update_layout(
-                        hovermode="x unified",
-                        paper_bgcolor='rgba(0,0,0,0)',
-                        plot_bgcolor='rgba(0,0,0,0)',
-                        height=550,
-                        margin=dict(t=10, b=10, l=10, r=10),
-                        yaxis=dict(title="Yield (%)", gridcolor='rgba(255,255,255,0.05)', zerolinecolor='#666', ticksuffix="%"),
-                        xaxis=dict(gridcolor='rgba(255,255,255,0.05)'),
-                        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1, traceorder="normal")
-                    )
-                    st.plotly_chart(fig_bond, use_container_width=True)
-                    bond_actual_base = bond_data.index[0].strftime('%Y-%m-%d')
-                    st.caption(f"Analysis Start: {bond_actual_base} | Source: Federal Reserve Bank of St. Louis (FRED)")
-            except Exception as e:
-                st.error(f"FRED Data Stream Offline: {e}")
-
-
-
-    # [E] Macro Indicators Radar (V92: PCE % Swap & Final Tuning)
-    st.markdown("---")
-    st.subheader("MACRO INDICATORS RADAR")
-
-    radar_indicators = {
-        "Leading": {
-            "T10Y2Y": "10Y-2Y Spread",
-            "ICSA": "Initial Claims",
-            "MICH": "Inflation Expectation",
-            "BAMLH0A0HYM2": "High Yield Spread"
-        },
-        "Coincident": {
-            "PAYEMS": "Nonfarm Payrolls",
-            "INDPRO": "Industrial Production",
-            "DPCCRV1Q225SBEA": "Personal Consumption", # % 변동률 지표로 교체
-            "CMRMTSPL": "Real Manufacturing Sales"
-        },
-        "Lagging": {
-            "UNRATE": "Unemployment Rate",
-            "BUSLOANS": "Commercial Loans",
-            "CP": "Corporate Profits",
-            "DRCCLACBS": "Credit Card Delinquency Rate"
-        }
-    }
-
-    tabs = st.tabs(list(radar_indicators.keys()))
-    neon_colors = ['#D500F9', '#7C4DFF', '#00B0FF', '#00E676']
-
-    for i, tab in enumerate(tabs):
-        with tab:
-            category = list(radar_indicators.keys())[i]
-            cols = st.columns(4) 
-            for j, (ticker, name) in enumerate(radar_indicators[category].items()):
-                try:
-                    # 데이터 호출 (분기별 지표 대응을 위해 900일 확보)
-                    df_raw = web.get_data_fred(ticker, start=datetime.now() - timedelta(days=900)).ffill()
-                    
-                    if not df_raw.empty:
-                        val_latest = df_raw.iloc[-1, 0]
-                        val_prev = df_raw.iloc[-2, 0]
-                        delta_val = val_latest - val_prev
-                        
-                        # --- 단위 및 출력 포맷 최적화 ---
-                        # 1. 퍼센트 기반 지표 (신규 PCE 포함)
-                        if "%" in name or ticker in ["T10Y2Y", "UNRATE", "MICH", "BAMLH0A0HYM2", "DRCCLACBS", "DPCCRV1Q225SBEA"]:
-                            display_val = f"{val_latest:.2f}%"
-                            delta_str = f"{delta_val:.2f}%"
-                        # 2. 고용 지표 (Millions)
-                        elif ticker == "PAYEMS":
-                            display_val = f"{val_latest/1000:,.1f}M"
-                            delta_str = f"{delta_val/1000:,.2f}M"
-                        # 3. 달러 기반 대형 지표 (Billions)
-                        elif "$B" in name:
-                            div = 1000 if ticker == "CMRMTSPL" else 1
-                            display_val = f"${val_latest/div:,.1f}B"
-                            delta_str = f"${delta_val/div:,.2f}B"
-                        else:
-                            display_val = f"{val_latest:,.1f}"
-                            delta_str = f"{delta_val:,.2f}"
-
-                        with cols[j]:
-                            st.metric(label=name, value=display_val, delta=delta_str, delta_color="normal")
-                            
-                            # 미니 차트 (더 굵고 선명하게)
-                            fig_mini = px.line(df_raw.tail(15), y=df_raw.columns[0])
-                            fig_mini.update_traces(line_color=neon_colors[i], width=3)
-                            fig_mini.update_layout(
-                                height=70, margin=dict(t=5, b=5, l=0, r=0),
-                                paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
-                                xaxis=dict(visible=False), yaxis=dict(visible=False), showlegend=False
-                            )
-                            st.plotly_chart(fig_mini, use_container_width=True, config={'displayModeBar': False})
-                except:
-                    pass
-
-    # [V93] 매크로 섹션 최종 출처 표기
-    st.caption("Source: Federal Reserve Bank of St. Louis (FRED)")
-
-    # 매크로 섹션의 진짜 마지막 지점에서 딱 한 번 멈춥니다.
-    render_footer()    
-    st.stop()
-
-
-
-
-
-
-
-
-
-
-
-# --- MARKET MODULE (V102: Absolute Size Enforcement) ---
-elif menu == "Market":
-
-    st.title("MARKET INTELLIGENCE")
-    
-    # [A] RELATIVE PERFORMANCE ANALYZER (V116: Bitcoin Color Fixed)
-    st.markdown("---")
-    st.subheader("GLOBAL INDICES PERFORMANCE")
-    
-    # 티커 매핑
-    compare_tickers = {
-        "Bitcoin": "BTC-USD",
-        "Total World (VT)": "VT",
-        "S&P 500": "^GSPC",
-        "Nasdaq 100": "^NDX",
-        "Russell 2000": "^RUT",
-        "Shanghai": "000001.SS",
-        "Nikkei 225": "^N225",
-        "KOSPI": "^KS11",
-        "India (Nifty 500)": "^CRSLDX",
-        "Vietnam (VN)": "^VNINDEX",        
-        "FTSE 100": "^FTSE",
-        "DAX": "^GDAXI",
-        "CAC 40": "^FCHI"
-    }
-    
-    input_col1, input_col2 = st.columns([1, 2])
-    with input_col1:
-        default_start = datetime.now() - timedelta(days=365)
-        start_date = st.date_input("Analysis Start Date", value=default_start, key="global_perf_date")
-        
-    with input_col2:
-        selected_labels = st.multiselect(
-            "Select Indices to Compare", 
-            options=list(compare_tickers.keys()),
-            default=["Bitcoin", "Total World (VT)", "S&P 500", "Shanghai", "Nikkei 225", "KOSPI", "FTSE 100", "DAX", "CAC 40"],
-            key="global_perf_select"
-        )
-    
-    if selected_labels:
-        with st.spinner("Fetching Global Market Data..."):
-            selected_tickers = [compare_tickers[l] for l in selected_labels]
-            data = yf.download(selected_tickers, start=start_date)['Close']
-            
-            if not data.empty:
-                data = data.ffill().dropna()
-                if not data.empty:
-                    # [V138: 레전드 순서 고정 로직]
-                    # 1. 우선 순위 리스트 정의 (티커 기준)
-                    priority_tickers = [compare_tickers["Bitcoin"], compare_tickers["Total World (VT)"], compare_tickers["S&P 500"]]
-                    
-                    # 2. 현재 데이터프레임 컬럼 중 우선 순위에 없는 나머지 티커들 추출
-                    remaining_tickers = [t for t in data.columns if t not in priority_tickers]
-                    
-                    # 3. 전체 순서 합치기 (우선순위 + 나머지)
-                    # 데이터에 실제로 존재하는 티커만 필터링하여 순서 재배치
-                    final_order = [t for t in priority_tickers if t in data.columns] + remaining_tickers
-                    data = data.reindex(columns=final_order)
-
-                    # 수익률 계산
-                    norm_df = (data / data.iloc[0] - 1) * 100
-                    
-                    fig_perf = go.Figure()
-                    
-                    # 이제 정렬된 데이터프레임 순서대로 루프를 돕니다.
-                    for ticker in data.columns:
-                        label = [k for k, v in compare_tickers.items() if v == ticker][0]
-                        
-                        # [핵심] 비트코인 및 주요 지수 스타일 지정
-                        if label == "Bitcoin":
-                            line_config = dict(width=3, color="#F7931A") 
-                        elif label == "KOSPI":
-                            line_config = dict(width=1.5, color="#00B0FF")
-                        elif label == "S&P 500":
-                            line_config = dict(width=1.5, color="#00E676") # S&P500 강조 (옵션)
-                        else:
-                            line_config = dict(width=1.5) 
-                        
-                        fig_perf.add_trace(go.Scatter(
-                            x=norm_df.index, 
-                            y=norm_df[ticker], 
-                            mode='lines', 
-                            name=label,
-                            line=line_config, 
-                            hovertemplate=f"{label}: %{{y:.2f}}%<extra></extra>"
-                        ))
-                    
-                    fig_perf.update_layout(
-                        hovermode="x unified",
-                        paper_bgcolor='rgba(0,0,0,0)',
-                        plot_bgcolor='rgba(0,0,0,0)',
-                        height=550,
-                        margin=dict(t=10, b=10, l=10, r=10),
-                        yaxis=dict(title="Return (%)", gridcolor='rgba(255,255,255,0.05)', zerolinecolor='#666'),
-                        xaxis=dict(gridcolor='rgba(255,255,255,0.05)'),
-                        # traceorder를 'normal'로 두면 add_trace한 순서대로 레전드가 나옵니다.
-                        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1, traceorder="normal")
-                    )
-                    st.plotly_chart(fig_perf, use_container_width=True)
-                    st.caption(f"Base Date: {data.index[0].strftime('%Y-%m-%d')} (Normalized to 0%) | Source: Yahoo Finance & Global Exchange Data")
-
-
-    # [B] U.S. INDEX ETF PERFORMANCE ANALYZER (V111: Date & Color Customization)
-    st.markdown("---")
-    st.subheader("U.S. INDEX ETF PERFORMANCE")
-    
-    # 1. 티커 및 커스텀 색상 매핑
-    # 성진님 요청: S&P500(Green), Russell(Gold/SPY색상), Nasdaq(Orange/RUT색상)
-    etf_config = {
-        "S&P 500 (SPY)": {"ticker": "SPY", "color": "#00E676"},   # 초록색
-        "Nasdaq 100 (QQQ)": {"ticker": "QQQ", "color": "#00B0FF"}, # 기존 러셀 색상(Orange)
-        "Dow 30 (DIA)": {"ticker": "DIA", "color": "#87CEEB"},    # 스카이블루
-        "Russell 2000 (IWM)": {"ticker": "IWM", "color": "#FF5252"} # 기존 S&P 색상(Gold)
-    }
-    
-    # 2. 입력 도구 상단 배치
-    etf_input_col1, etf_input_col2 = st.columns([1, 2])
-    
-    with etf_input_col1:
-        # [수정] 디폴트 시작 날짜를 2026년 1월 1일로 고정
-        etf_default_start = datetime.now() - timedelta(days=365)
-        etf_start_date = st.date_input("Analysis Start Date", value=etf_default_start, key="etf_start_date_v111")
-        
-    with etf_input_col2:
-        selected_etfs = st.multiselect(
-            "Select ETFs to Compare", 
-            options=list(etf_config.keys()),
-            default=list(etf_config.keys()),
-            key="etf_select_v111"
-        )
-    
-    # 3. 데이터 로드 및 수익률 계산
-    if selected_etfs:
-        with st.spinner("Fetching ETF Market Data..."):
-            target_tickers = [etf_config[l]["ticker"] for l in selected_etfs]
-            etf_data = yf.download(target_tickers, start=etf_start_date)['Close']
-            
-            if not etf_data.empty:
-                # [V140: MultiIndex 대응 및 순서 고정 로직]
-                etf_data = etf_data.ffill().dropna()
-                
-                if not etf_data.empty:
-                    # 1. 성진님이 정의한 etf_config의 티커 순서 추출
-                    priority_tickers = [etf_config[k]["ticker"] for k in etf_config.keys()]
-                    
-                    # 2. 실제 다운로드된 데이터의 컬럼 리스트 확인
-                    # MultiIndex인 경우를 대비해 columns.get_level_values를 고려한 안전한 추출
-                    available_cols = etf_data.columns.tolist()
-                    
-                    # 3. 데이터에 존재하는 티커만 우선순위대로 필터링
-                    final_order = [t for t in priority_tickers if t in available_cols]
-                    
-                    # 4. 순서 재배치 (여기서 오류가 주로 발생하므로 reindex 대신 직접 컬럼 슬라이싱)
-                    etf_data = etf_data[final_order]
-                    
-                    # 수익률 계산
-                    etf_norm_df = (etf_data / etf_data.iloc[0] - 1) * 100
-                    
-                    fig_etf = go.Figure()
-                    
-                    # 5. 정렬된 컬럼 순서대로 루프 실행
-                    for ticker in etf_data.columns:
-                        # 티커에 해당하는 라벨과 색상 매핑
-                        label = [k for k, v in etf_config.items() if v["ticker"] == ticker][0]
-                        line_color = etf_config[label]["color"]
-                        
-                        fig_etf.add_trace(go.Scatter(
-                            x=etf_norm_df.index, 
-                            y=etf_norm_df[ticker], 
-                            mode='lines', 
-                            name=label,
-                            line=dict(width=1.5, color=line_color),
-                            hovertemplate=f"{label}: %{{y:.2f}}%<extra></extra>"
-                        ))
-                    
-                    fig_etf.update_layout(
-                        hovermode="x unified",
-                        paper_bgcolor='rgba(0,0,0,0)',
-                        plot_bgcolor='rgba(0,0,0,0)',
-                        height=550,
-                        margin=dict(t=10, b=10, l=10, r=10),
-                        yaxis=dict(title="Return (%)", gridcolor='rgba(255,255,255,0.05)', zerolinecolor='#666'),
-                        xaxis=dict(gridcolor='rgba(255,255,255,0.05)'),
-                        # 트레이스 추가 순서대로 레전드 표시
-                        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1, traceorder="normal")
-                    )
-                    st.plotly_chart(fig_etf, use_container_width=True)
-                    st.caption(f"Base Date: {etf_data.index[0].strftime('%Y-%m-%d')} (Normalized to 0%) | Source: Yahoo Finance & Global Exchange Data")
-
-
-    # [C] SECTOR PERFORMANCE ANALYZER (V120: SPY Priority & Dot Style)
-    st.markdown("---")
-    st.subheader("U.S. SECTOR PERFORMANCE")
-    
-    # 1. 섹터 ETF 및 컬러 매핑
-    sector_config = {
-        "S&P 500 (SPY)": {"ticker": "SPY", "color": "#FFFFFF", "width": 3, "dash": "dot"}, # [수정] 점선 스타일 추가
-        "Tech-Expanded (IGM)": {"ticker": "IGM", "color": "#1E90FF", "width": 1.5, "dash": "solid"},
-        "Software (IGV)": {"ticker": "IGV", "color": "#00FFFF", "width": 1.5, "dash": "solid"},
-        "Semiconductor (SOXX)": {"ticker": "SOXX", "color": "#FF00FF", "width": 1.5, "dash": "solid"},
-        "Biotech (IBB)": {"ticker": "IBB", "color": "#008000", "width": 1.5, "dash": "solid"},
-        "Medical Devices (IHI)": {"ticker": "IHI", "color": "#FF0000", "width": 1.5, "dash": "solid"},
-        "Genomics (IDNA)": {"ticker": "IDNA", "color": "#FFFF00", "width": 1.5, "dash": "solid"},
-        "Aerospace (ITA)": {"ticker": "ITA", "color": "#FFA500", "width": 1.5, "dash": "solid"},
-        "Clean Energy (POW)": {"ticker": "POW", "color": "#00FF00", "width": 1.5, "dash": "solid"},
-        "Oil & Gas (IEO)": {"ticker": "IEO", "color": "#808080", "width": 1.5, "dash": "solid"},
-        "Utilities (IDU)": {"ticker": "IDU", "color": "#EC83B2", "width": 1.5, "dash": "solid"},
-        "Consumer Disc (IYC)": {"ticker": "IYC", "color": "#800080", "width": 1.5, "dash": "solid"},
-        "Financials (IYF)": {"ticker": "IYF", "color": "#008080", "width": 1.5, "dash": "solid"},
-        "Fintech (ARKF)": {"ticker": "ARKF", "color": "#FFC0CB", "width": 1.5, "dash": "solid"},
-        "Industrials (IYJ)": {"ticker": "IYJ", "color": "#8B4513", "width": 1.5, "dash": "solid"},
-        "Materials (IYM)": {"ticker": "IYM", "color": "#484DC4", "width": 1.5, "dash": "solid"}
-    }
-    
-    # 2. 입력 도구 (1년 트래킹 유지)
-    sec_in_col1, sec_in_col2 = st.columns([1, 2])
-    with sec_in_col1:
-        sec_default_start = datetime.now() - timedelta(days=365)
-        sec_start_date = st.date_input("Analysis Start Date", value=sec_default_start, key="sec_start")
-    
-    with sec_in_col2:
-        selected_sectors = st.multiselect(
-            "Select Sectors to Compare", 
-            options=list(sector_config.keys()),
-            default=["S&P 500 (SPY)", "Tech-Expanded (IGM)", "Semiconductor (SOXX)", "Software (IGV)", "Materials (IYM)", "Clean Energy (POW)", "Oil & Gas (IEO)", "Aerospace (ITA)", "Genomics (IDNA)"],
-            key="sec_select"
-        )
-    
-    # 3. 데이터 로드 및 시각화
-    if selected_sectors:
-        with st.spinner("Scanning Sector Rotation..."):
-            sec_target_tickers = [sector_config[l]["ticker"] for l in selected_sectors]
-            sec_raw_data = yf.download(sec_target_tickers, start=sec_start_date, progress=False)['Close']
-            
-            if not sec_raw_data.empty:
-                sec_raw_data = sec_raw_data.ffill().dropna()
-                
-                # [V120 핵심] SPY가 가장 먼저 오도록 컬럼 순서 재배치
-                if "SPY" in sec_raw_data.columns:
-                    other_cols = [c for c in sec_raw_data.columns if c != "SPY"]
-                    sec_raw_data = sec_raw_data[["SPY"] + other_cols]
-                
-                sec_norm_df = (sec_raw_data / sec_raw_data.iloc[0] - 1) * 100
-                
-                fig_sec = go.Figure()
-                
-                # 재배치된 순서대로 trace 추가 (레전드 순서 결정)
-                for ticker in sec_raw_data.columns:
-                    label = [k for k, v in sector_config.items() if v["ticker"] == ticker][0]
-                    conf = sector_config[label]
-                    
-                    fig_sec.add_trace(go.Scatter(
-                        x=sec_norm_df.index, 
-                        y=sec_norm_df[ticker], 
-                        mode='lines', 
-                        name=label,
-                        line=dict(
-                            width=conf["width"], 
-                            color=conf["color"],
-                            dash=conf.get("dash", "solid") # SPY는 dot, 나머지는 solid
-                        ),
-                        hovertemplate=f"<b>{label}</b>: %{{y:.2f}}%<extra></extra>"
-                    ))
-                
-                fig_sec.update_layout(
-                    hovermode="x unified",
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    height=600,
-                    margin=dict(t=10, b=10, l=10, r=10),
-                    yaxis=dict(title="Return (%)", gridcolor='rgba(255,255,255,0.05)', zerolinecolor='#666'),
-                    xaxis=dict(gridcolor='rgba(255,255,255,0.05)'),
-                    legend=dict(
-                        orientation="h", 
-                        yanchor="bottom", y=1.02, 
-                        xanchor="right", x=1,
-                        traceorder="normal" # 추가한 순서(SPY 우선)대로 표시
-                    )
-                )
-                st.plotly_chart(fig_sec, use_container_width=True)
-                st.caption(f"Base Date: {sec_raw_data.index[0].strftime('%Y-%m-%d')} (Normalized to 0.00%) | Source: Yahoo Finance & Global Exchange Data")
-
-
-    # [D] GROWTH vs VALUE ROTATION ANALYZER (V117)
-    st.markdown("---")
-    st.subheader("GROWTH vs VALUE")
-    
-    # 1. 입력 도구 (기존 스타일 유지, 2026/01/01 디폴트)
-    rot_in_col1, rot_in_col2 = st.columns([1, 2])
-    with rot_in_col1:
-        # [수정 포인트] 2026년 고정 대신 현재로부터 365일 전으로 설정
-        rot_default_start = datetime.now() - timedelta(days=365)
-        rot_start_date = st.date_input(
-            "Analysis Start Date", 
-            value=rot_default_start, 
-            key="rot_start"
-        )
-    
-    # 2. 데이터 로드 (VUG, VTV)
-    with st.spinner("Analyzing Style Rotation..."):
-        rot_tickers = ["VUG", "VTV"]
-        rot_data = yf.download(rot_tickers, start=rot_start_date)['Close']
-        
-        if not rot_data.empty:
-            rot_data = rot_data.ffill().dropna()
-            
-            # 수익률 표준화 (0% 기준)
-            rot_norm = (rot_data / rot_data.iloc[0] - 1) * 100
-            
-            # 성장주/가치주 비율 계산 (VUG / VTV)
-            # 이 비율이 상승하면 성장주 우위, 하락하면 가치주 우위입니다.
-            ratio = rot_data["VUG"] / rot_data["VTV"]
-            ratio_norm = (ratio / ratio.iloc[0] - 1) * 100 # 비율도 변화율로 변환
-            
-            # 차트 생성 (수익률 비교 + 비율 변화)
-            fig_rot = go.Figure()
-            
-            # [V119 핵심] 레전드 순서 1번: Growth/Value Ratio (화이트 강조선)
-            fig_rot.add_trace(go.Scatter(
-                x=ratio_norm.index, y=ratio_norm,
-                mode='lines', name="Growth/Value",
-                line=dict(width=3, color="#FFFFFF", dash='dot'), # 점선 유지
-                hovertemplate="Ratio Change: %{y:.2f}%<extra></extra>"
-            ))
-
-            # 레전드 순서 2번: 성장주 (VUG)
-            fig_rot.add_trace(go.Scatter(
-                x=rot_norm.index, y=rot_norm["VUG"],
-                mode='lines', name="Growth (VUG)",
-                line=dict(width=1.5, color="#00E5FF"),
-                hovertemplate="Growth: %{y:.2f}%<extra></extra>"
-            ))
-            
-            # 레전드 순서 3번: 가치주 (VTV)
-            fig_rot.add_trace(go.Scatter(
-                x=rot_norm.index, y=rot_norm["VTV"],
-                mode='lines', name="Value (VTV)",
-                line=dict(width=1.5, color="#FFC107"),
-                hovertemplate="Value: %{y:.2f}%<extra></extra>"
-            ))
-            
-            fig_rot.update_layout(
-                hovermode="x unified",
-                paper_bgcolor='rgba(0,0,0,0)',
-                plot_bgcolor='rgba(0,0,0,0)',
-                height=550,
-                margin=dict(t=10, b=10, l=10, r=10),
-                yaxis=dict(title="Performance / Ratio Change (%)", gridcolor='rgba(255,255,255,0.05)', zerolinecolor='#666'),
-                xaxis=dict(gridcolor='rgba(255,255,255,0.05)'),
-                legend=dict(
-                    orientation="h", 
-                    yanchor="bottom", y=1.02, 
-                    xanchor="right", x=1,
-                    traceorder="normal" # 코딩한 순서(Ratio -> Growth -> Value) 강제 유지
-                )
-            )
-            
-            st.plotly_chart(fig_rot, use_container_width=True)
-            st.caption(f"Base Date: {rot_data.index[0].strftime('%Y-%m-%d')} (Normalized to 0%) | Source: Yahoo Finance & Global Exchange Data")
-
-            # 3. 전략적 코멘트
-            current_ratio = ratio_norm.iloc[-1]
-            status = "성장주 우위" if current_ratio > 0 else "가치주 우위"
-            st.info(f"**Insight:** 기준일 대비 **{status}** 상태입니다. (Ratio 변동률: {current_ratio:.2f}%)")
-
-
-    # [F] COMMODITIES & DOLLAR INDEX RADAR (V121: Sequence Enforcement)
-    st.markdown("---")
-    st.subheader("COMMODITIES PERFORMANCE") 
-
-    # 1. 딕셔너리 순서 및 스타일 업데이트
-    com_config = {
-        "DXY": {
-            "ticker": "DX-Y.NYB", 
-            "color": "#FFFFFF", 
-            "width": 3, 
-            "dash": "dot"  # [업데이트] 점선 스타일 추가
-        },
-        
-        "Gold": {"ticker": "GC=F", "color": "#FFD700", "width": 1.5, "dash": "solid"},
-        "Copper": {"ticker": "HG=F", "color": "#B87333", "width": 1.5, "dash": "solid"},        
-        "Silver": {
-            "ticker": "SI=F", 
-            "color": "#1E90FF", # [업데이트] DodgerBlue (달러와 확실히 구분됨)
-            "width": 1.5, 
-            "dash": "solid"
-        },
-        "Palladium": {"ticker": "PA=F", "color": "#CED4DA", "width": 1.5, "dash": "solid"},
-        "Platinum": {"ticker": "PL=F", "color": "#E5E4E2", "width": 1.5, "dash": "solid"},
-        "WTI Crude": {"ticker": "CL=F", "color": "#FF4500", "width": 1.5, "dash": "solid"},
-        "Brent Oil": {"ticker": "BZ=F", "color": "#8B0000", "width": 1.5, "dash": "solid"},
-        "Natural Gas": {"ticker": "NG=F", "color": "#00CED1", "width": 1.5, "dash": "solid"},
-    }
-    
-    # 2. 입력 도구 (기존과 동일)
-    com_in_col1, com_in_col2 = st.columns([1, 2])
-    with com_in_col1:
-        # [수정 포인트] 현재 시점으로부터 365일 전으로 디폴트 설정
-        com_default_start = datetime.now() - timedelta(days=365)
-        com_start_date = st.date_input(
-            "Analysis Start Date", 
-            value=com_default_start, 
-            key="com_start_v121"
-        )
-    with com_in_col2:
-        selected_coms = st.multiselect(
-            "Select Commodities to Compare", 
-            options=list(com_config.keys()),
-            default=["DXY", "Gold", "Silver", "Copper", "WTI Crude", "Natural Gas"],
-            key="com_select_v121"
-        )
-    
-    # 3. 데이터 로드 및 시각화
-    if selected_coms:
-        with st.spinner("Scanning Commodity Markets..."):
-            com_target_tickers = [com_config[l]["ticker"] for l in selected_coms]
-            com_raw_data = yf.download(com_target_tickers, start=com_start_date)['Close']
-            
-            if not com_raw_data.empty:
-                # [핵심] 알파벳 순으로 정렬된 컬럼을 우리가 선택한 순서(com_target_tickers)대로 재배치
-                com_raw_data = com_raw_data.reindex(columns=com_target_tickers)
-                
-                com_raw_data = com_raw_data.ffill().dropna()
-                if not com_raw_data.empty:
-                    com_norm_df = (com_raw_data / com_raw_data.iloc[0] - 1) * 100
-                    
-                    fig_com = go.Figure()
-                    
-                    # 이제 정렬된 데이터프레임 순서대로 루프를 돌기 때문에 레전드가 순서대로 나옵니다.
-                    for ticker in com_norm_df.columns:
-                        label = [k for k, v in com_config.items() if v["ticker"] == ticker][0]
-                        conf = com_config[label]
-                        
-                        fig_com.add_trace(go.Scatter(
-                            x=com_norm_df.index, 
-                            y=com_norm_df[ticker], 
-                            mode='lines', 
-                            name=label,
-                            line=dict(width=conf["width"], color=conf["color"], 
-                            dash=conf.get("dash", "solid")),
-                            hovertemplate=f"{label}: %{{y:.2f}}%<extra></extra>"
-                        ))
-                    
-                    fig_com.update_layout(
-                        hovermode="x unified",
-                        paper_bgcolor='rgba(0,0,0,0)',
-                        plot_bgcolor='rgba(0,0,0,0)',
-                        height=550,
-                        margin=dict(t=10, b=10, l=10, r=10),
-                        yaxis=dict(title="Return (%)", gridcolor='rgba(255,255,255,0.05)', zerolinecolor='#666'),
-                        xaxis=dict(gridcolor='rgba(255,255,255,0.05)'),
-                        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-                    )
-                    st.plotly_chart(fig_com, use_container_width=True)
-                    st.caption(f"Base Date: {rot_data.index[0].strftime('%Y-%m-%d')} (Normalized to 0%) | Source: Yahoo Finance & Global Exchange Data")
-
-
-    # [G] COPPER / GOLD RATIO ANALYZER (V122: The Economic Pulse)
-    st.markdown("---")
-    st.subheader("COPPER/GOLD RATIO")
-    
-    # 1. 입력 도구 (2026/01/01 디폴트)
-    cgr_in_col1, cgr_in_col2 = st.columns([1, 2])
-    with cgr_in_col1:
-        # [수정 포인트] 현재 시점으로부터 365일 전으로 디폴트 설정
-        cgr_default_start = datetime.now() - timedelta(days=365)
-        cgr_start_date = st.date_input(
-            "Analysis Start Date", 
-            value=cgr_default_start, 
-            key="cgr_start"
-        )
-    
-    # 2. 데이터 로드 (Copper: HG=F, Gold: GC=F)
-    with st.spinner("Calculating Economic Pulse..."):
-        cgr_tickers = ["HG=F", "GC=F"]
-        cgr_data = yf.download(cgr_tickers, start=cgr_start_date)['Close']
-        
-        if not cgr_data.empty:
-            cgr_data = cgr_data.ffill().dropna()
-            
-            # 수익률 표준화 (0% 기준)
-            cgr_norm = (cgr_data / cgr_data.iloc[0] - 1) * 100
-            
-            # Copper / Gold Ratio 계산
-            cg_ratio = cgr_data["HG=F"] / cgr_data["GC=F"]
-            cg_ratio_norm = (cg_ratio / cg_ratio.iloc[0] - 1) * 100 # 비율의 변화율
-            
-            # 차트 생성
-            fig_cgr = go.Figure()
-            
-            # [V124 핵심] 레전드 순서 1번: Copper/Gold Ratio (화이트 강조 점선)
-            fig_cgr.add_trace(go.Scatter(
-                x=cg_ratio_norm.index, y=cg_ratio_norm,
-                mode='lines', name="Copper/Gold",
-                line=dict(width=3, color="#FFFFFF", dash='dot'), # 화이트 점선 유지
-                hovertemplate="Ratio Change: %{y:.2f}%<extra></extra>"
-            ))
-            
-            # 레전드 순서 2번: Copper (HG=F)
-            fig_cgr.add_trace(go.Scatter(
-                x=cgr_norm.index, y=cgr_norm["HG=F"],
-                mode='lines', name="Copper",
-                line=dict(width=1.5, color="#B87333"),
-                hovertemplate="Copper: %{y:.2f}%<extra></extra>"
-            ))
-            
-            # 레전드 순서 3번: Gold (GC=F)
-            fig_cgr.add_trace(go.Scatter(
-                x=cgr_norm.index, y=cgr_norm["GC=F"],
-                mode='lines', name="Gold",
-                line=dict(width=1.5, color="#FFD700"),
-                hovertemplate="Gold: %{y:.2f}%<extra></extra>"
-            ))
-            
-            fig_cgr.update_layout(
-                hovermode="x unified",
-                paper_bgcolor='rgba(0,0,0,0)',
-                plot_bgcolor='rgba(0,0,0,0)',
-                height=550,
-                margin=dict(t=10, b=10, l=10, r=10),
-                yaxis=dict(title="Performance / Ratio Change (%)", gridcolor='rgba(255,255,255,0.05)', zerolinecolor='#666'),
-                xaxis=dict(gridcolor='rgba(255,255,255,0.05)'),
-                legend=dict(
-                    orientation="h", 
-                    yanchor="bottom", y=1.02, 
-                    xanchor="right", x=1,
-                    traceorder="normal" # 추가한 순서(Ratio 우선) 강제 적용
-                )
-            )
-            
-            st.plotly_chart(fig_perf_cgr if 'fig_perf_cgr' in locals() else fig_cgr, use_container_width=True)
-            st.caption(f"Base Date: {cgr_data.index[0].strftime('%Y-%m-%d')} (Normalized to 0%) | Source: Yahoo Finance & Global Exchange Data")
-            
-            # 3. 전략적 진단
-            current_cgr = cg_ratio_norm.iloc[-1]
-            cgr_status = "경기 확장/인플레이션 압력" if current_cgr > 0 else "경기 둔화/디플레이션 우려"
-            st.info(f"**Insight:** 기준일 대비 Copper/Gold 비율이 **{current_cgr:.2f}% { '상승' if current_cgr > 0 else '하락' }**하여, **{cgr_status}** 시그널을 보이고 있습니다.")
-
-    render_footer()
-    st.stop()
-
-
-
-
-
-
-
-
-
-
-# --- MARKET MODULE (V102: Absolute Size Enforcement) ---
-elif menu == "Crypto":
-
-    st.title("CRYPTO INTELLIGENCE")
-    
-    # [A] TOP 10 CRYPTO PERFORMANCE (Excl. Stablecoins)
-    st.markdown("---")
-    st.subheader("TOP 10 CRYPTO PERFORMANCE")
-    
-    # 1. 시총 상위 10개 코인 티커 매핑 (스테이블코인 제외)
-    crypto_config = {
-        "Bitcoin": {"ticker": "BTC-USD", "color": "#F7931A", "width": 3},   # BTC 오렌지색
-        "Ethereum": {"ticker": "ETH-USD", "color": "#627EEA", "width": 1.5},  # ETH 블루
-        "Solana": {"ticker": "SOL-USD", "color": "#AF52DE", "width": 1.5},
-        "BNB": {"ticker": "BNB-USD", "color": "#F3BA2F", "width": 1.5},
-        "XRP": {"ticker": "XRP-USD", "color": "#14F195", "width": 1.5},
-        "Cardano": {"ticker": "ADA-USD", "color": "#0033AD", "width": 1.5},
-        "Avalanche": {"ticker": "AVAX-USD", "color": "#E84142", "width": 1.5},
-        "Dogecoin": {"ticker": "DOGE-USD", "color": "#C2A633", "width": 1.5},
-        "Tron": {"ticker": "TRX-USD", "color": "#FF0013", "width": 1.5},
-        "Chainlink": {"ticker": "LINK-USD", "color": "#2A5ADA", "width": 1.5}
-    }
-    
-    # 2. 입력 도구
-    c_col1, c_col2 = st.columns([1, 2])
-    with c_col1:
-        # 비트코인 표준에 맞춰 올해 초부터를 기본값으로 설정
-        crypto_default_start = datetime.now() - timedelta(days=365)
-        crypto_start_date = st.date_input("Analysis Start Date", value=crypto_default_start, key="crypto_perf_date")
-        
-    with c_col2:
-        selected_cryptos = st.multiselect(
-            "Select Assets to Compare", 
-            options=list(crypto_config.keys()),
-            default=["Bitcoin", "Ethereum", "Solana", "BNB", "XRP", "Cardano", "Avalanche", "Dogecoin", "Tron", "Chainlink"], # 주요 코인 기본 선택
-            key="crypto_perf_select"
-        )
-    
-    # 3. 데이터 로드 및 시각화
-    if selected_cryptos:
-        with st.spinner("Syncing with Blockchain Data (via yfinance)..."):
-            c_target_tickers = [crypto_config[l]["ticker"] for l in selected_cryptos]
-            c_data = yf.download(c_target_tickers, start=crypto_start_date)['Close']
-            
-            if not c_data.empty:
-                c_data = c_data.ffill().dropna()
-                
-                if not c_data.empty:
-                    # [레전드 순서 고정] 정의한 crypto_config 순서대로
-                    c_priority = [crypto_config[k]["ticker"] for k in crypto_config.keys()]
-                    c_final_order = [t for t in c_priority if t in c_data.columns]
-                    c_data = c_data[c_final_order]
-                    
-                    # 수익률 계산
-                    c_norm_df = (c_data / c_data.iloc[0] - 1) * 100
-                    
-                    fig_crypto = go.Figure()
-                    
-                    for ticker in c_data.columns:
-                        label = [k for k, v in crypto_config.items() if v["ticker"] == ticker][0]
-                        conf = crypto_config[label]
-                        
-                        fig_crypto.add_trace(go.Scatter(
-                            x=c_norm_df.index, 
-                            y=c_norm_df[ticker], 
-                            mode='lines', 
-                            name=label,
-                            line=dict(width=conf["width"], color=conf["color"]),
-                            hovertemplate=f"{label}: %{{y:.2f}}%<extra></extra>"
-                        ))
-                    
-                    fig_crypto.update_layout(
-                        hovermode="x unified",
-                        paper_bgcolor='rgba(0,0,0,0)',
-                        plot_bgcolor='rgba(0,0,0,0)',
-                        height=550,
-                        margin=dict(t=10, b=10, l=10, r=10),
-                        yaxis=dict(title="Return (%)", gridcolor='rgba(255,255,255,0.05)', zerolinecolor='#666'),
-                        xaxis=dict(gridcolor='rgba(255,255,255,0.05)'),
-                        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1, traceorder="normal")
-                    )
-                    st.plotly_chart(fig_crypto, use_container_width=True)
-                    st.caption(f"Base Date: {c_data.index[0].strftime('%Y-%m-%d')} (Normalized to 0.00%) | Source: Yahoo Finance & Global Exchange Data")
-
-
-
-
-    # [B] BITCOIN 217-WEEK CYCLE RADAR (V202: Clean RSI)
-    st.markdown("---")
-    st.subheader("BTC TECHNICAL RADAR")
-
-    tech_col1, tech_col2 = st.columns([1, 2])
-    with tech_col1:
-        tech_start_date = st.date_input("Analysis Start Date", value=datetime.now() - timedelta(days=365*2), key="btc_tech_v202")
-
-    with st.spinner("Calculating Strategic Indicators..."):
-        fetch_start_long = tech_start_date - timedelta(days=365*6)
-        btc_raw = yf.download("BTC-USD", start=fetch_start_long, interval='1d', progress=False)
-        
-        if not btc_raw.empty:
-            if isinstance(btc_raw.columns, pd.MultiIndex):
-                d_prices = btc_raw['Close']['BTC-USD']
-            else:
-                d_prices = btc_raw['Close']
-                
-            d_prices = d_prices.ffill().dropna()
-            w_prices = d_prices.resample('W').last()
-
-            if len(w_prices) >= 217:
-                sma217w = w_prices.rolling(window=217).mean()
-                ema217w = w_prices.ewm(span=217, adjust=False).mean()
-                median217w = (sma217w + ema217w) / 2
-                median_daily = median217w.reindex(d_prices.index).ffill()
-                
-                # RSI 계산 (일봉 14일)
-                delta = d_prices.diff()
-                gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-                loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-                rs = gain / loss.replace(0, np.nan) 
-                rsi = 100 - (100 / (1 + rs))
-                
-                mask = d_prices.index.date >= tech_start_date
-                p_disp = d_prices[mask]
-                m_disp = median_daily[mask]
-                rsi_disp = rsi[mask].fillna(50)
-                
-                fig_tech = make_subplots(
-                    rows=2, cols=1, shared_xaxes=True, 
-                    vertical_spacing=0.08, row_heights=[0.7, 0.3],
-                    subplot_titles=("BTC", "RSI")
-                )
-                
-                # Trace 1: BTC Price
-                fig_tech.add_trace(go.Scatter(
-                    x=p_disp.index, y=p_disp, name="BTC", 
-                    line=dict(color="#F7931A", width=1.5)
-                ), row=1, col=1)
-                
-                # Trace 2: 217W Median
-                fig_tech.add_trace(go.Scatter(
-                    x=m_disp.index, y=m_disp, name="217W Median", 
-                    line=dict(color="#00E676", width=2, dash='dashdot') 
-                ), row=1, col=1)
-                
-                # Trace 3: RSI (선만 깔끔하게 표시)
-                fig_tech.add_trace(go.Scatter(
-                    x=rsi_disp.index, y=rsi_disp, name="RSI", 
-                    line=dict(color="#AF52DE", width=1.5)
-                ), row=2, col=1)
-                
-                # [수정] 30, 70 기준선만 명확하게 표시
-                fig_tech.add_hline(y=70, line_dash="dash", line_color="#FF5252", line_width=1, opacity=0.8, row=2, col=1)
-                fig_tech.add_hline(y=30, line_dash="dash", line_color="#00E676", line_width=1, opacity=0.8, row=2, col=1)
-                
-                fig_tech.update_layout(
-                    hovermode="x unified", height=650,
-                    paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
-                    margin=dict(t=10, b=10, l=10, r=10),
-                    legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1, traceorder="normal")
-                )
-                
-                fig_tech.update_yaxes(gridcolor='rgba(255,255,255,0.05)', row=1, col=1)
-                fig_tech.update_yaxes(range=[0, 100], gridcolor='rgba(255,255,255,0.05)', row=2, col=1)
-                
-                st.plotly_chart(fig_tech, use_container_width=True)
-                
-                # [추가] 실제 데이터 시작일 기준 Base Date 캡션
-                tech_actual_base = p_disp.index[0].strftime('%Y-%m-%d')
-                st.caption(f"Analysis Start: {tech_actual_base} | Source: Yahoo Finance & Global Exchange Data")
-
-                # 전략적 진단
-                curr_p = float(p_disp.iloc[-1])
-                curr_m = float(m_disp.iloc[-1])
-                curr_rsi = float(rsi_disp.iloc[-1])
-                dist = ((curr_p / curr_m) - 1) * 100
-                st.info(f"**Current:** BTC vs 217W Median: **{dist:.2f}%** | RSI: **{curr_rsi:.2f}**")
-            else:
-                st.warning("데이터가 부족합니다.")
-
-
-
-
-
-    # [C] CRYPTO VOLATILITY & PRICE OVERLAY (V230: Legend Sorted)
-    st.markdown("---")
-    st.subheader("BTC VOLATILITY vs PRICE")
-
-    vol_col1, vol_col2 = st.columns([1, 2])
-    with vol_col1:
-        vol_start_date = st.date_input("Analysis Start Date", value=datetime.now() - timedelta(days=365), key="vol_price_final_v230")
-
-    with st.spinner("Analyzing BTC Pulse..."):
-        fetch_start = vol_start_date - timedelta(days=60)
-        btc_data = yf.download("BTC-USD", start=fetch_start, progress=False)
-        
-        if not btc_data.empty:
-            # MultiIndex 구조 완벽 방어
-            if isinstance(btc_data.columns, pd.MultiIndex):
-                price_series = btc_data['Close']['BTC-USD']
-            else:
-                price_series = btc_data['Close']
-                
-            price_series = price_series.ffill().dropna()
-            
-            if len(price_series) > 30:
-                daily_returns = price_series.pct_change().dropna()
-                rolling_std = daily_returns.rolling(window=30, min_periods=20).std()
-                vol_30d = rolling_std * np.sqrt(365) * 100
-                
-                vol_display = vol_30d[vol_30d.index.date >= vol_start_date].dropna()
-                price_display = price_series[price_series.index.date >= vol_start_date].dropna()
-                
-                if not vol_display.empty:
-                    fig_dual = make_subplots(specs=[[{"secondary_y": True}]])
-                    
-                    # [레전드 순서 1] BTC Price (Secondary Y: True)
-                    fig_dual.add_trace(go.Scatter(
-                        x=price_display.index, y=price_display,
-                        mode='lines', name="BTC",
-                        line=dict(width=1.5, color="#F7931A")
-                    ), secondary_y=True)
-
-                    # [레전드 순서 2] 30D Volatility (Secondary Y: False)
-                    fig_dual.add_trace(go.Scatter(
-                        x=vol_display.index, y=vol_display,
-                        mode='lines', name="Volatility(30D)",
-                        line=dict(width=1.5, color="#00E5FF"),
-                        fill='tozeroy', fillcolor='rgba(0, 229, 255, 0.1)'
-                    ), secondary_y=False)
-                    
-                    # avg_vol 스칼라 변환
-                    raw_avg = vol_display.mean()
-                    avg_vol = float(raw_avg.iloc[0]) if isinstance(raw_avg, pd.Series) else float(raw_avg)
-                    
-                    fig_dual.add_hline(
-                        y=avg_vol, line_dash="dot", line_color="#FF5252", 
-                        annotation_text=f"AVG: {avg_vol:.1f}%",
-                        secondary_y=False
-                    )
-                    
-                    fig_dual.update_layout(
-                        hovermode="x unified",
-                        paper_bgcolor='rgba(0,0,0,0)',
-                        plot_bgcolor='rgba(0,0,0,0)',
-                        height=550,
-                        margin=dict(t=10, b=10, l=10, r=10),
-                        legend=dict(
-                            orientation="h", 
-                            yanchor="bottom", y=1.02, 
-                            xanchor="right", x=0.95, # 통일성을 위해 1로 고정
-                            traceorder="normal"
-                        ),
-                        yaxis=dict(title="Vol (%)", gridcolor='rgba(255,255,255,0.05)', ticksuffix="%"),
-                        yaxis2=dict(title="Price (USD)", showgrid=False)
-                    )
-                    
-                    st.plotly_chart(fig_dual, use_container_width=True)
-                    
-                    # [추가] 실제 데이터 시작일 기준 Base Date 캡션
-                    v_actual_base = vol_display.index[0].strftime('%Y-%m-%d')
-                    st.caption(f"Analysis Start: {v_actual_base} | Source: Yahoo Finance & Global Exchange Data")
-
-                    # 인포 박스 출력
-                    curr_vol = float(vol_display.iloc[-1])
-                    curr_price = float(price_display.iloc[-1])
-                    st.info(f"**Current:** BTC ${curr_price:,.0f} | Volatility {curr_vol:.2f}%")
-
-
-
-    # [D] CRYPTO vs STOCK CORRELATION & PRICE (V228: Legend Sorted & White Dot)
-    st.markdown("---")
-    st.subheader("BTC vs U.S. STOCK CORRELATION")
-
-    c_col1, c_col2 = st.columns([1, 2])
-    with c_col1:
-        corr_start_date = st.date_input("Analysis Start Date", value=datetime.now() - timedelta(days=365), key="c_date_v228")
-    with c_col2:
-        s_bench = st.selectbox("Benchmark", ["Nasdaq 100 (^NDX)", "S&P 500 (^GSPC)"], key="s_bench_v228")
-        s_ticker = "^NDX" if "Nasdaq" in s_bench else "^GSPC"
-
-    with st.spinner("Analyzing Correlation Dynamics..."):
-        c_fetch_start = corr_start_date - timedelta(days=100)
-        c_raw = yf.download(["BTC-USD", s_ticker], start=c_fetch_start, progress=False)['Close']
-        
-        if not c_raw.empty:
-            c_raw = c_raw.ffill().dropna()
-            c_rets = c_raw.pct_change().dropna()
-            c_series = c_rets["BTC-USD"].rolling(window=60).corr(c_rets[s_ticker]).dropna()
-            
-            c_common = c_series.index.intersection(c_raw.index)
-            c_final = c_series.loc[c_common]
-            cp_final = c_raw.loc[c_common, "BTC-USD"]
-            
-            c_mask = c_final.index.date >= corr_start_date
-            c_disp = c_final[c_mask]
-            cp_disp = cp_final[c_mask]
-            
-            if not c_disp.empty:
-                from plotly.subplots import make_subplots
-                fig_c = make_subplots(specs=[[{"secondary_y": True}]])
-
-                # 1. 배경 채우기 전용 (레전드에 나타나지 않음) 
-                fig_c.add_trace(go.Scatter(
-                    x=c_disp.index, y=c_disp, 
-                    fill='tozeroy', 
-                    fillcolor='rgba(255, 255, 255, 0.05)',
-                    line=dict(width=0), # 선은 안 보임
-                    showlegend=False,   # 레전드 제외
-                    hoverinfo='skip'    # 호버 제외
-                ), secondary_y=False)
-
-                # 2. 레전드 및 라인 전용 (이 선이 레전드 기준이 됨) 
-                fig_c.add_trace(go.Scatter(
-                    x=c_disp.index, y=c_disp, 
-                    name="Correlation",
-                    line=dict(width=3, color="#FFFFFF", dash="dot"),
-                    mode='lines' # 채우기 없음! 
-                ), secondary_y=False)
-
-                # [레전드 순서 2] BTC Price (오렌지 실선)
-                fig_c.add_trace(go.Scatter(
-                    x=cp_disp.index, y=cp_disp, 
-                    name="BTC", 
-                    line=dict(width=1.5, color="#F7931A")
-                ), secondary_y=True)
-                
-                # 기준선 (0.0)
-                fig_c.add_hline(y=0, line_dash="solid", line_color="rgba(255,255,255,0.2)", secondary_y=False)
-                
-                # UI 레이아웃 및 우측 상단 레전드 정렬
-                fig_c.update_layout(
-                    hovermode="x unified", height=500,
-                    paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
-                    margin=dict(t=10, b=10, l=10, r=10),
-                    legend=dict(
-                        orientation="h", 
-                        yanchor="bottom", y=1.02, 
-                        xanchor="right", x=0.95,
-                        bgcolor='rgba(0,0,0,0)',
-                        traceorder="normal" # add_trace 순서대로(BTC -> Corr)
-                    ),
-                    yaxis=dict(title="Correlation", range=[-1.1, 1.1], gridcolor='rgba(255,255,255,0.05)'),
-                    yaxis2=dict(title="BTC Price (USD)", showgrid=False)
-                )
-                
-                st.plotly_chart(fig_c, use_container_width=True)
-                
-                # 전략적 해석 로직
-                curr_c = float(c_disp.iloc[-1])
-                curr_p = float(cp_disp.iloc[-1])
-                
-                if curr_c > 0.6:
-                    c_status = "⚠️ 고동조화 (High Coupling): 자산 배분 효과 일시 감소"
-                elif curr_c < 0.1:
-                    c_status = "✅ 탈동조화 (Decoupling): 비트코인 표준 헤지 기능 강화"
-                else:
-                    c_status = "중립적 상관관계 (Neutral)"
-                
-                st.caption(f"Analysis Start: {c_disp.index[0].strftime('%Y-%m-%d')} | Source: Yahoo Finance & Global Exchange Data")
-                st.info(f"**Insight:** BTC ${curr_p:,.0f} | 현재 상관계수: **{curr_c:.2f}**, {c_status}")
-
-
-
-
-    # [E] BTC vs GOLD vs DXY RELATIVE STRENGTH (V160)
-    st.markdown("---")
-    st.subheader("DXY vs BTC vs GOLD")
-    
-    # 1. 입력 도구 (기본 날짜는 연초로 설정)
-    bgd_col1, bgd_col2 = st.columns([1, 2])
-    with bgd_col1:
-        # bgd_default_start = datetime(datetime.now().year, 1, 1)
-        bgd_default_start = datetime.now() - timedelta(days=365)
-        bgd_start_date = st.date_input("Analysis Start Date", value=bgd_default_start, key="bgd_ratio_date")
-    
-    # 2. 데이터 로드 (DX-Y.NYB, BTC-USD, GC=F)
-    with st.spinner("Analyzing Global Monetary Assets..."):
-        # DX-Y.NYB: Dollar Index, BTC-USD: Bitcoin, GC=F: Gold
-        bgd_tickers = ["DX-Y.NYB", "BTC-USD", "GC=F"]
-        bgd_raw_data = yf.download(bgd_tickers, start=bgd_start_date)['Close']
-        
-        if not bgd_raw_data.empty:
-            bgd_raw_data = bgd_raw_data.ffill().dropna()
-            
-            if not bgd_raw_data.empty:
-                # 수익률 표준화 (0% 기준)
-                bgd_norm = (bgd_raw_data / bgd_raw_data.iloc[0] - 1) * 100
-                
-                # 티커 변수 할당
-                dxy_col = "DX-Y.NYB"
-                btc_col = "BTC-USD"
-                gold_col = "GC=F"
-                
-                # Bitcoin / Gold Ratio 계산
-                bg_ratio = bgd_raw_data[btc_col] / bgd_raw_data[gold_col]
-                bg_ratio_norm = (bg_ratio / bg_ratio.iloc[0] - 1) * 100
-                
-                # 3. 차트 생성
-                fig_bgd = go.Figure()
-
-
-                # [레전드 순서 1] Ratio - 화이트 굵은 도트선
-                fig_bgd.add_trace(go.Scatter(
-                    x=bg_ratio_norm.index, y=bg_ratio_norm,
-                    mode='lines', name="BTC/Gold",
-                    line=dict(width=3, color="#FFFFFF", dash='dot'),
-                    hovertemplate="Ratio Change: %{y:.2f}%<extra></extra>"
-                ))
-                
-                # [레전드 순서 2] Dollar Index - 초록색
-                fig_bgd.add_trace(go.Scatter(
-                    x=bgd_norm.index, y=bgd_norm[dxy_col],
-                    mode='lines', name="DXY",
-                    line=dict(width=2, color="#00FF41"), # 사령부 시그니처 그린
-                    hovertemplate="DXY: %{y:.2f}%<extra></extra>"
-                ))
-                
-                # [레전드 순서 3] Bitcoin - 오렌지색 굵은 선
-                fig_bgd.add_trace(go.Scatter(
-                    x=bgd_norm.index, y=bgd_norm[btc_col],
-                    mode='lines', name="Bitcoin",
-                    line=dict(width=1.5, color="#F7931A"),
-                    hovertemplate="Bitcoin: %{y:.2f}%<extra></extra>"
-                ))
-                
-                # [레전드 순서 4] Gold - 금색 실선
-                fig_bgd.add_trace(go.Scatter(
-                    x=bgd_norm.index, y=bgd_norm[gold_col],
-                    mode='lines', name="Gold",
-                    line=dict(width=1.5, color="#FFD700"),
-                    hovertemplate="Gold: %{y:.2f}%<extra></extra>"
-                ))
-                
-                fig_bgd.update_layout(
-                    hovermode="x unified",
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    height=550,
-                    margin=dict(t=10, b=10, l=10, r=10),
-                    yaxis=dict(title="Performance / Ratio Change (%)", gridcolor='rgba(255,255,255,0.05)', zerolinecolor='#666'),
-                    xaxis=dict(gridcolor='rgba(255,255,255,0.05)'),
-                    legend=dict(
-                        orientation="h", 
-                        yanchor="bottom", y=1.02, 
-                        xanchor="right", x=1,
-                        traceorder="normal" # 코딩한 순서 유지
-                    )
-                )
-                
-                st.plotly_chart(fig_bgd, use_container_width=True)
-                
-                # 하단 캡션 추가
-                st.caption(f"Base Date: {bgd_raw_data.index[0].strftime('%Y-%m-%d')} (Normalized to 0%) | Source: Yahoo Finance & Global Exchange Data")
-                
-                # 4. 전략적 코멘트
-                current_dxy = bgd_norm[dxy_col].iloc[-1]
-                current_ratio_gain = bg_ratio_norm.iloc[-1]
-                st.info(f"**Insight:** 달러 인덱스는 기준일 대비 **{current_dxy:.2f}% {'강세' if current_dxy > 0 else '약세'}**이며, 금 대비 비트코인 구매력은 **{current_ratio_gain:.2f}% {'확장' if current_ratio_gain > 0 else '축소'}** 중입니다.")
-
-
-    render_footer()
-    st.stop()
-
-
-
-
-
-
-
-
-
-
-# --- MARKET MODULE (V103: USD/DXY Priority & Source) ---
-elif menu == "Bitcoin Standard":
-    st.title("BITCOIN STANDARD a.k.a FOREX")
-
-    # [A] BTC STANDARD: FIAT DEVALUATION (COLLECTIVE)
-    st.markdown("---")
-    st.subheader("BTC STANDARD: FIAT DEVALUATION")
-    st.info("비트코인(BTC) 대비 각 법정화폐의 실질 구매력 변화를 추적합니다. (BTC Standard = 1.00)")
-
-    # 1. 분석 기간 선택
-    btc_col1, btc_col2 = st.columns([1, 2])
-    with btc_col1:
-        # 성진님의 요청에 따라 2023-01-01 유지
-        btc_default_start = datetime(2023, 1, 1)
-        btc_analysis_start = st.date_input("Analysis Start Date", value=btc_default_start, key="btc_std_global_date")
-
-    # 2. 데이터 로드 로직 (구조 통일)
-    fiat_tickers = {
-        "USD": "DX-Y.NYB", "CAD": "CAD=X", "AUD": "AUD=X", 
-        "CHF": "CHF=X", "JPY": "JPY=X", "CNY": "CNY=X", "KRW": "KRW=X"
-    }
-
-    @st.cache_data(ttl=3600)
-    def get_btc_standard_v105(tickers_dict, start_date_str):
-        combined_list = []
-        try:
-            # [핵심] 시작일 공백 방지를 위해 3일 전부터 미리 로드
-            fetch_start = (datetime.strptime(start_date_str, '%Y-%m-%d') - timedelta(days=3)).strftime('%Y-%m-%d')
-            
-            # BTC-USD 가격 로드
-            btc_raw = yf.download("BTC-USD", start=fetch_start, interval='1d', progress=False)['Close']
-            if btc_raw.empty: return pd.DataFrame()
-            
-            for name, ticker in tickers_dict.items():
-                fiat_raw = yf.download(ticker, start=fetch_start, interval='1d', progress=False)['Close']
-                if not fiat_raw.empty:
-                    f_series = fiat_raw[ticker].ffill()
-                    b_series = btc_raw["BTC-USD"].ffill()
-                    
-                    if name == "USD":
-                        # DXY 기반 구매력 역산
-                        btc_per_fiat = (f_series / 100) / b_series
-                    else:
-                        btc_per_fiat = 1 / (f_series * b_series)
-                    
-                    btc_per_fiat.name = name
-                    combined_list.append(btc_per_fiat)
-            
-            if combined_list:
-                # 합친 후 성진님이 선택한 날짜부터 슬라이싱해서 출력
-                full_df = pd.concat(combined_list, axis=1).ffill()
-                return full_df[full_df.index >= start_date_str]
-        except: pass
-        return pd.DataFrame()
-
-    # 함수 호출 (이름 주의)
-    btc_df = get_btc_standard_v105(fiat_tickers, btc_analysis_start.strftime('%Y-%m-%d'))
-
-    if not btc_df.empty and len(btc_df) > 1:
-        btc_rel_perf = (btc_df / btc_df.iloc[0] - 1) * 100
-        
-        # 3. 차트 생성
-        fig_btc_melt = go.Figure()
-        # USD: 화이트, 나머지 컬러 유지
-        colors = {
-            "USD": "#FFFFFF", "CAD": "#FF5252", "AUD": "#FFD740", 
-            "CHF": "#64FFDA", "JPY": "#448AFF", "CNY": "#E040FB", "KRW": "#00E676"
-        }
-        
-        # 설정한 순서(USD 우선)대로 Trace 추가
-        for name in fiat_tickers.keys():
-            if name in btc_rel_perf.columns:
-                is_usd = (name == "USD")
-                fig_btc_melt.add_trace(go.Scatter(
-                    x=btc_rel_perf.index, y=btc_rel_perf[name],
-                    mode='lines', name=name,
-                    line=dict(
-                        width=3 if is_usd else 1.5, 
-                        color=colors.get(name),
-                        dash='dot' if is_usd else 'solid' # USD는 점선 강조
-                    ),
-                    connectgaps=True,
-                    hovertemplate=f"<b>{name}</b>: %{{y:.2f}}% (Purchasing Power)<extra></extra>"
-                ))
-
-        y_min, y_max = btc_rel_perf.min().min(), btc_rel_perf.max().max()
-        y_padding = abs(y_max - y_min) * 0.15
-
-        fig_btc_melt.update_layout(
-            template="plotly_dark", paper_bgcolor="rgba(0,0,0,0)", plot_bgcolor="rgba(0,0,0,0)",
-            height=550, margin=dict(l=10, r=10, t=10, b=10), hovermode="x unified",
-            legend=dict(
-                orientation="h",       # 가로 배치 유지
-                yanchor="top",      # 하단 기준 (y=1.02와 세트)
-                y=1,                # 차트 상단 살짝 위로 올림
-                xanchor="right",       # 오른쪽 기준점 설정 
-                x=1,                   # 오른쪽 끝으로 밀착 
-                bgcolor="rgba(0,0,0,0)", # 배경 투명하게
-                traceorder="normal"
-            ),
-            yaxis=dict(showgrid=True, gridcolor="#333", title="Purchasing Power Change (%)", range=[y_min - y_padding, y_max + y_padding])
-        )
-
-        st.plotly_chart(fig_btc_melt, use_container_width=True)
-        
-        # [V103] 캡션 업데이트: Source 추가 완료!
-        actual_start_str = btc_rel_perf.index[0].strftime('%Y-%m-%d')
-        st.caption(f"Analysis Start: {actual_start_str} | Source: Yahoo Finance & Global Exchange Data")
-        
-        # 전략적 코멘트
-        worst_fiat = btc_rel_perf.iloc[-1].idxmin()
-        worst_val = btc_rel_perf.iloc[-1].min()
-        st.error(f"**Worst Fiat Devaluation:** {actual_start_str} 이후 **{worst_fiat}**의 구매력은 비트코인 대비 **{worst_val:.2f}%** 하락했습니다.")
-
-
-
-
-# [B] SATOSHIS PER UNIT FIAT: THE SCARCITY TRACKER (Final Optimization)
-    st.markdown("---")
-    st.subheader("SATOSHIS PER UNIT FIAT (SCARCITY)")
-    st.info("각 통화 '1단위'로 구매 가능한 사토시(Sats)의 개수를 추적합니다. (USD는 달러 인덱스 기준)")
-
-    # 1. 설정: 레전드 순서 강제 지정 (BTC Standard 섹션과 동일하게 )
-    unit_config = {
-        "USD": 1,      "CAD": 1,      "AUD": 1,      
-        "CHF": 1,      "JPY": 100,    "CNY": 10,     "KRW": 1000       
-    }
-
-    # 2. 분석 시작일 설정
-    sats_col1, sats_col2 = st.columns([1, 2])
-    with sats_col1:
-        sats_default_start = datetime(2023, 1, 1)
-        sats_start_date = st.date_input(
-            "Analysis Start Date", 
-            value=sats_default_start, 
-            key="sats_scarcity_date"
-        )
-
-    @st.cache_data(ttl=3600)
-    def get_sats_per_fiat_final(start_date_str):
-        try:
-            # [보정] 시작일 공백 방지를 위해 3일 전부터 로드
-            fetch_start = (datetime.strptime(start_date_str, '%Y-%m-%d') - timedelta(days=3)).strftime('%Y-%m-%d')
-            
-            # BTC 가격 로드
-            btc_raw = yf.download("BTC-USD", start=fetch_start, interval='1d', progress=False)['Close']
-            if btc_raw.empty: return pd.DataFrame()
-            
-            # 티커 생성
-            tickers = {k: (f"{k}=X" if k != "USD" else "DX-Y.NYB") for k in unit_config.keys()}
-            fiat_raw = yf.download(list(tickers.values()), start=fetch_start, interval='1d', progress=False)['Close']
-            
-            combined_list = []
-            # unit_config 순서대로 돌아서 레전드 순서 보장
-            for fiat, unit in unit_config.items():
-                ticker = tickers[fiat]
-                if ticker in fiat_raw.columns:
-                    f_series = fiat_raw[ticker].ffill()
-                    b_series = btc_raw["BTC-USD"].ffill()
-                    
-                    if fiat == "USD":
-                        # DXY 기반 보정 수식 (바닥 탈출용)
-                        sats_per_unit = (f_series / 100) / b_series * 100_000_000
-                    else:
-                        sats_per_unit = (unit / f_series) / b_series * 100_000_000
-                    
-                    sats_per_unit.name = fiat
-                    combined_list.append(sats_per_unit)
-                
-            if combined_list:
-                # 합친 후 성진님이 선택한 날짜부터 슬라이싱
-                full_df = pd.concat(combined_list, axis=1).ffill()
-                return full_df[full_df.index >= start_date_str]
-        except: return pd.DataFrame()
-        return pd.DataFrame()
-
-    # 함수 이름 똑같이 맞춰서 호출!
-    sats_df = get_sats_per_fiat_final(sats_start_date.strftime('%Y-%m-%d'))
-
-    if not sats_df.empty:
-        # 3. 차트 생성
-        fig_sats = go.Figure()
-        colors = {
-            "USD": "#FFFFFF", "CAD": "#FF5252", "AUD": "#FFD740", 
-            "CHF": "#64FFDA", "JPY": "#448AFF", "CNY": "#E040FB", "KRW": "#00E676"
-        }
-        
-        # 레전드 순서대로 트레이스 추가
-        for fiat in unit_config.keys():
-            if fiat in sats_df.columns:
-                is_usd = (fiat == "USD")
-                legend_name = f"{unit_config[fiat]} {fiat}"
-                
-                fig_sats.add_trace(go.Scatter(
-                    x=sats_df.index, y=sats_df[fiat],
-                    mode='lines', 
-                    name=legend_name,
-                    line=dict(
-                        width=3 if is_usd else 1.5, 
-                        color=colors.get(fiat),
-                        dash='dot' if is_usd =="USD" else 'solid'
-                    ),
-                    hovertemplate=f"<b>{legend_name}</b>: %{{y:,.0f}} Sats<extra></extra>"
-                ))
-
-        fig_sats.update_layout(
-            template="plotly_dark", paper_bgcolor="rgba(0,0,0,0)", plot_bgcolor="rgba(0,0,0,0)",
-            height=500, margin=dict(l=10, r=10, t=10, b=10), hovermode="x unified",
-            yaxis_title="Satoshi Amount (Sats)",
-            legend=dict(
-                orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1, 
-                bgcolor="rgba(0,0,0,0)", traceorder="normal"
-            )
-        )
-        st.plotly_chart(fig_sats, use_container_width=True)
-        
-        # 캡션 및 경고문
-        actual_sats_base = sats_df.index[0].strftime('%Y-%m-%d')
-        st.caption(f"Analysis Start: {actual_sats_base} | Source: Yahoo Finance & Global Exchange Data")
-        
-        current_krw_sats = sats_df['KRW'].iloc[-1]
-        st.warning(f"**Scarcity Alert:** 현재 1,000원으로 살 수 있는 비트코인은 단 **{current_krw_sats:,.0f} 사토시**뿐입니다.")
-    else:
-        st.info("데이터를 분석하여 사토시 단위로 변환 중입니다...")
-
-
-
-
-    # [C] GLOBAL CURRENCY PERFORMANCE (V983: UI Unification)
-    st.markdown("---")
-    st.subheader("GLOBAL CURRENCY PERFORMANCE")
-
-    # 1. 대상 통화 목록
-    fx_tickers = {
-        "DXY": "DX-Y.NYB", "CAD": "CAD=X", "AUD": "AUD=X",
-        "CHF": "CHF=X", "JPY": "JPY=X", "CNY": "CNY=X", "KRW": "KRW=X"
-    }
-
-    # 2. 분석 기간 선택 (다른 차트들과 스타일 통일!)
-    fx_perf_col1, fx_perf_col2 = st.columns([1, 2])
-    with fx_perf_col1:
-        # 디폴트는 성진님이 요청하신 대로 현재 기준 1년 전
-        fx_perf_default_start = datetime.now() - timedelta(days=365)
-        fx_perf_start_date = st.date_input(
-            "Analysis Start Date", 
-            value=fx_perf_default_start, 
-            key="fx_global_perf_date"
-        )
-
-    @st.cache_data(ttl=3600)
-    def get_fx_data_v983(tickers_dict, start_date_str):
-        df_list = []
-        # 주말/휴일을 대비해 입력받은 날짜보다 7일 더 일찍 가져와서 보정
-        fetch_start = datetime.strptime(start_date_str, '%Y-%m-%d') - timedelta(days=7)
-        
-        for name, ticker in tickers_dict.items():
-            try:
-                raw = yf.download(ticker, start=fetch_start, interval='1d', progress=False, auto_adjust=True)
-                if not raw.empty:
-                    data = raw['Close']
-                    if isinstance(data, pd.DataFrame):
-                        data = data.iloc[:, 0]
-                    
-                    if name != "DXY":
-                        data = 1 / data
-                    
-                    data.name = name
-                    df_list.append(data)
-            except: continue
-        
-        if df_list:
-            combined = pd.concat(df_list, axis=1).ffill().dropna()
-            # 사용자가 선택한 날짜 이후의 데이터만 정확히 필터링
-            return combined[combined.index >= pd.Timestamp(start_date_str)]
-        return pd.DataFrame()
-
-    with st.spinner("Analyzing Global Currency Trends..."):
-        # 선택된 날짜를 문자열로 변환하여 전달
-        fx_df = get_fx_data_v983(fx_tickers, fx_perf_start_date.strftime('%Y-%m-%d'))
-
-    # 3. 차트 렌더링
-    if not fx_df.empty and len(fx_df) > 1:
-        # 선택한 시작점의 첫 데이터를 0%로 기준 잡기
-        first_valid_row = fx_df.iloc[0]
-        fx_ytd_rel = (fx_df / first_valid_row - 1) * 100
-        
-        y_min, y_max = fx_ytd_rel.min().min(), fx_ytd_rel.max().max()
-        y_padding = (y_max - y_min) * 0.2
-
-        fig_fx = go.Figure()
-        ordered_names = ["DXY", "CAD", "AUD", "CHF", "JPY", "CNY", "KRW"]
-        colors = {"DXY": "#FFFFFF", "CAD": "#FF5252", "AUD": "#FFD740", "CHF": "#64FFDA", "JPY": "#448AFF", "CNY": "#E040FB", "KRW": "#00E676"}
-
-        for name in ordered_names:
-            if name in fx_ytd_rel.columns:
-                fig_fx.add_trace(go.Scatter(
-                    x=fx_ytd_rel.index, y=fx_ytd_rel[name],
-                    mode='lines', name=name,
-                    line=dict(width=3 if name=="DXY" else 1.5, dash='dot' if name=="DXY" else 'solid', color=colors[name]),
-                    hovertemplate=f"<b>{name}</b>: %{{y:.2f}}%<extra></extra>"
-                ))
-
-        fig_fx.update_layout(
-            template="plotly_dark", paper_bgcolor="rgba(0,0,0,0)", plot_bgcolor="rgba(0,0,0,0)",
-            height=550, margin=dict(l=10, r=10, t=20, b=40), hovermode="x unified",
-            legend=dict(orientation="h", yanchor="top", y=1, xanchor="right", x=1, bgcolor="rgba(0,0,0,0.3)"),
-            yaxis=dict(showgrid=True, gridcolor="#333", title="Relative Return (%)", range=[y_min - y_padding, y_max + y_padding])
-        )
-        st.plotly_chart(fig_fx, use_container_width=True)
-        st.caption(f"Base Date: {fx_df.index[0].strftime('%Y-%m-%d')} (Normalized to 0.00%) | Source: Yahoo Finance & Global Exchange Data")
-    else:
-        st.info("선택하신 기간의 데이터를 불러오는 중입니다...")
-
-
-
-    # [D] MAJOR SPOT EXCHANGE RATES (USD BASED)
-    st.markdown("---")
-    st.subheader("MAJOR SPOT EXCHANGE RATES")
-
-    # 1. 티커 및 컬러 리스트 (레전드 순서 동기화)
-    spot_config = [
-        {"name": "USD/CAD", "ticker": "CAD=X", "color": "#FF5252"},
-        {"name": "USD/AUD", "ticker": "AUD=X", "color": "#FFD740"},
-        {"name": "USD/CHF", "ticker": "CHF=X", "color": "#64FFDA"},
-        {"name": "USD/JPY", "ticker": "JPY=X", "color": "#448AFF"},
-        {"name": "USD/CNY", "ticker": "CNY=X", "color": "#E040FB"},
-        {"name": "USD/KRW", "ticker": "KRW=X", "color": "#00E676"}
-    ]
-
-    # [V1080] 개별 차트 렌더링 루프
-    for config in spot_config:
-        name = config["name"]
-        ticker = config["ticker"]
-        color = config["color"]
-
-        # A. 차트 제목 출력
-        st.write(f"#### **{name}**")
-
-        # B. Analysis Start Date 선택 (왼쪽 정렬을 위해 컬럼 활용)
-        col_date, col_empty = st.columns([1, 2])
-        with col_date:
-            # 기본값: 1년 전
-            default_start = datetime.now() - timedelta(days=365)
-            individual_start = st.date_input(
-                "Analysis Start Date", 
-                value=default_start, 
-                key=f"date_{name}"
-            )
-
-        # C. 데이터 로드 및 차트 생성
-        try:
-            # progress=False로 깔끔하게 로드
-            raw = yf.download(ticker, start=individual_start, interval='1d', progress=False)
-            if not raw.empty:
-                if isinstance(raw.columns, pd.MultiIndex):
-                    spot_series = raw['Close'][ticker].copy()
-                else:
-                    spot_series = raw['Close'].copy()
-                
-                # Y축 범위 최적화
-                y_min, y_max = spot_series.min(), spot_series.max()
-                padding = (y_max - y_min) * 0.15
-
-                fig = go.Figure()
-                fig.add_trace(go.Scatter(
-                    x=spot_series.index, y=spot_series,
-                    mode='lines',
-                    line=dict(width=1.5, color=color),
-                    fill='tozeroy',
-                    fillcolor=f"rgba({int(color[1:3],16)}, {int(color[3:5],16)}, {int(color[5:7],16)}, 0.05)",
-                    hovertemplate=f"<b>{name}</b>: %{{y:.2f}}<extra></extra>"
-                ))
-                
-                fig.update_layout(
-                    template="plotly_dark",
-                    paper_bgcolor="rgba(0,0,0,0)",
-                    plot_bgcolor="rgba(0,0,0,0)",
-                    height=300,
-                    margin=dict(l=10, r=10, t=10, b=10),
-                    xaxis=dict(showgrid=False),
-                    yaxis=dict(
-                        showgrid=True, gridcolor="rgba(255,255,255,0.05)", 
-                        side="left",
-                        range=[y_min - padding, y_max + padding]
-                    ),
-                    showlegend=False,
-                    hovermode="x unified"
-                )
-                
-                st.plotly_chart(fig, use_container_width=True)
-                
-                # D. 하단 표준 캡션 (왼쪽 정렬)
-                actual_start_str = spot_series.index[0].strftime('%Y-%m-%d')
-                st.caption(f"Analysis Start: {actual_start_str} | Source: Yahoo Finance & Global Exchange Data")
-                st.markdown("<br>", unsafe_allow_html=True)
-            else:
-                st.warning(f"{name} 데이터가 해당 기간에 존재하지 않습니다.")
-        except Exception as e:
-            st.error(f"{name} 데이터를 가져오는 중 오류가 발생했습니다.")
-
-
-
-    # [E] GLOBAL CURRENCY HEATMAP: RELATIVE STRENGTH
-    st.markdown("---")
-    st.subheader("CURRENCY RELATIVE STRENGTH HEATMAP")
-    st.info("왼쪽(Base) 통화가 상단(Quote) 통화 대비 얼마나 강세인지 나타냅니다. 짙은 초록색일수록 왼쪽 통화의 강세를 의미합니다.")
-    hm_symbols = ["USD", "CAD", "AUD", "CHF", "JPY", "CNY", "KRW"]
-    
-    # [V1210] 캐시 무효화를 위해 실시간성을 더 높임
-    @st.cache_data(ttl=300) 
-    def get_heatmap_matrix_v1210(symbols):
-        matrix = pd.DataFrame(index=symbols, columns=symbols)
-        for base in symbols:
-            for quote in symbols:
-                if base == quote:
-                    matrix.loc[base, quote] = 0.0
-                    continue
-                
-                ticker = f"{base}{quote}=X"
-                if base == "USD": ticker = f"{quote}=X"
-                
-                try:
-                    # [V1210 핵심] 데이터를 1달치(1mo) 넉넉히 가져와서 결측치를 완전히 제거 
-                    raw_data = yf.download(ticker, period="1mo", interval="1d", progress=False)['Close']
-                    # MultiIndex인 경우 처리 
-                    data = raw_data[ticker] if isinstance(raw_data, pd.DataFrame) else raw_data
-                    series = data.dropna()
-                    
-                    if len(series) >= 2:
-                        # [V1210 로직] 맨 마지막 날(val_now)과 
-                        # 그 전날 중 값이 '다른' 날(val_prev)을 기어이 찾아냄 
-                        val_now = series.iloc[-1]
-                        val_prev = val_now
-                        
-                        for i in range(len(series)-2, -1, -1):
-                            if series.iloc[i] != val_now:
-                                val_prev = series.iloc[i]
-                                break
-                        
-                        change = ((val_now / val_prev) - 1) * 100
-                        # USD 기준은 부호 반전 
-                        matrix.loc[base, quote] = change if base != "USD" else -change
-                    else:
-                        matrix.loc[base, quote] = 0.0
-                except:
-                    matrix.loc[base, quote] = 0.0
-        return matrix.astype(float)
-
-    with st.spinner("주말의 침묵을 깨고 데이터를 강제 소환 중..."):
-        hm_df = get_heatmap_matrix_v1210(hm_symbols)
-
-    if not hm_df.empty:
-        import plotly.graph_objects as go
-
-        # [V1210] 데이터가 작아도 색이 잘 보이게 범위를 0.2%로 더 조임 
-        fig_hm = go.Figure(data=go.Heatmap(
-            z=hm_df.values,
-            x=hm_df.columns,
-            y=hm_df.index,
-            colorscale='RdYlGn',
-            zmin=-0.2, zmax=0.2, 
-            text=np.around(hm_df.values, decimals=2),
-            texttemplate="%{text}%",
-            hovertemplate="Base: %{y}<br>Quote: %{x}<br>Change: %{z:.2f}%<extra></extra>"
-        ))
-
-        fig_hm.update_layout(
-            template="plotly_dark",
-            paper_bgcolor="rgba(0,0,0,0)",
-            plot_bgcolor="rgba(0,0,0,0)",
-            margin=dict(l=10, r=10, t=30, b=10),
-            height=500,
-            xaxis=dict(side="top")
-        )
-        
-        st.plotly_chart(fig_hm, use_container_width=True)
-        st.caption(f"Last Sync: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} (Weekend Data Forced) | Source: Yahoo Finance & Global Exchange Data")
-
-    render_footer()
-    st.stop()
-
-
-
-
-
-
-
-
-
-
-
-
-
-elif menu != "Portfolio":
-    st.info(f"MODULE '{menu}' OFFLINE")
-    st.stop()
-    
-# --- PORTFOLIO DASHBOARD (Existing Code) ---
-# Ensure base_currency is available if skipped in sidebar
-if 'base_currency' not in locals():
-    base_currency = pm.get_setting("base_currency", "USD")
-
-# --- Main Dashboard (V756: Syntax Fix & Core Summary) ---
-st.title("PORTFOLIO MANAGER")
-st.markdown("---")
-
-# [데이터 엔진 - 기존 로직 유지]
-fx_rates, _ = md.get_fx_rates()
-raw_assets = pm.get_assets()
-total_val_display, sorted_assets = process_assets(raw_assets, fx_rates, base_currency)
-
-# [계산 엔진 - YTD & Sharpe & MDD]
-ytd_return = 0.0
-sharpe_auto = 0.0
-mdd_value = 0.0
-
-real_assets = [a for a in sorted_assets if a['ticker'] != 'CASH']
-total_history_display = pd.Series()
-if real_assets:
-    prices = get_cached_historical_data(st.session_state.ae, real_assets)
-    if not prices.empty:
-        prices = prices.ffill().dropna()
-        portfolio_value_series = pd.Series(0.0, index=prices.index)
-        for asset in real_assets:
-            if asset['ticker'] in prices.columns:
-                portfolio_value_series = portfolio_value_series.add(prices[asset['ticker']] * asset['quantity'], fill_value=0)
-        total_cash_usd = next((a['value_usd'] for a in sorted_assets if a['ticker'] == 'CASH'), 0.0)
-        total_history_display = (portfolio_value_series + total_cash_usd) * fx_rates.get(base_currency, 1.0)
-        
-        # 1. YTD 계산
-        this_year_start = pd.Timestamp(datetime(datetime.now().year, 1, 1))
-        this_year_data = total_history_display[total_history_display.index >= this_year_start]
-        if not this_year_data.empty:
-            ytd_return = (total_history_display.iloc[-1] - this_year_data.iloc[0]) / this_year_data.iloc[0]
-
-        # 2. MDD 실시간 계산
-        rolling_max = total_history_display.cummax()
-        drawdowns = (total_history_display - rolling_max) / rolling_max
-        mdd_value = drawdowns.min()
-
-# [전략적 Sharpe Ratio 계산]
-RISK_BENCHMARKS = {"Crypto": {"roi": 0.70, "vol": 0.60}, "Stock": {"roi": 0.12, "vol": 0.20}, "Bond": {"roi": 0.04, "vol": 0.08}, "Cash": {"roi": 0.035, "vol": 0.00}, "Other": {"roi": 0.05, "vol": 0.10}}
-RF_RATE = 0.035
-class_mapping = {"Crypto": "Crypto", "Stock": "Stock", "ETF": "Stock", "Cash": "Cash", "Bond": "Bond"}
-total_p_value = sum(a['value_usd'] for a in sorted_assets)
-weighted_roi, weighted_vol = 0.0, 0.0
-if total_p_value > 0:
-    for asset in sorted_assets:
-        ac = asset.get('asset_class', 'Other')
-        weight = asset['value_usd'] / total_p_value
-        bench_key = class_mapping.get(ac, "Other")
-        metrics = RISK_BENCHMARKS.get(bench_key, RISK_BENCHMARKS["Other"])
-        weighted_roi += metrics['roi'] * weight
-        weighted_vol += metrics['vol'] * weight
-    if weighted_vol > 0:
-        sharpe_auto = (weighted_roi - RF_RATE) / weighted_vol
-
-# --------------------------------------------------------------------------------
-# 🎯 UI 레이아웃 (V757: Sequential Logic Optimized)
-# --------------------------------------------------------------------------------
-
-# [단계 1] 레이아웃 및 m_right 데이터 계산 우선 수행
-m_left, m_right = st.columns([3, 7])
-
-with m_right:
-    # --- [공통 제어 변수 및 스타일] ---
-    try:
-        irx_data = yf.Ticker("^IRX").history(period="1d")
-        LIVE_RISK_FREE_RATE = irx_data['Close'].iloc[-1] / 100 if not irx_data.empty else 0.035
-    except Exception:
-        LIVE_RISK_FREE_RATE = 0.035
-
-    # --- [Sharpe & Sortino 실시간 정밀 산출] ---
-    # 'returns' 변수가 상단에서 정의되어 있어야 합니다.
-    daily_rf = LIVE_RISK_FREE_RATE / 252
-    
-    if 'returns' in locals() and not returns.empty:
-        excess_returns = returns - daily_rf
-        # 1. Sharpe 정밀 계산
-        sharpe_auto = (excess_returns.mean() / excess_returns.std()) * (252**0.5)
-        
-        # 2. Sortino 정밀 계산 (하락 변동성만 추출)
-        downside_returns = excess_returns[excess_returns < 0]
-        if not downside_returns.empty and len(downside_returns) > 1:
-            downside_deviation = downside_returns.std() * (252**0.5)
-            sortino_auto = (excess_returns.mean() * 252) / downside_deviation if downside_deviation > 0 else 0.0
-        else:
-            sortino_auto = sharpe_auto
-    else:
-        # 데이터 부재 시 기존 변수 유지 혹은 기본값
-        sharpe_auto = locals().get('sharpe_auto', 0.0)
-        sortino_auto = locals().get('sortino_auto', sharpe_auto * 1.2)
-
-    GAUGE_HEIGHT = 180
-    TOP_MARGIN, BOTTOM_MARGIN = 0, 3
-    TEXT_Y_POS, DESC_Y_POS = 0.42, 0.23
-    GAUGE_Y_RANGE = [0, 0.8]
-    VAL_FONT_SIZE, TXT_FONT_SIZE, DSC_FONT_SIZE = 32, 20, 11
-
-    row1_col1, row1_col2 = st.columns(2)
-    row2_col1, row2_col2 = st.columns(2)
-    
-    # [지표 계산: 전략적 장기 가치 중심]
-    # CAGR 40% 고정 (2030년 자산 50억 목표 기반)
-    cagr_val = 0.40 
-    
-    # MDD 및 MAR Ratio 계산
-    mdd_abs_val = abs(mdd_value) if mdd_value != 0 else 0.01
-    mar_ratio = cagr_val / mdd_abs_val
-
-    common_layout = dict(
-        height=GAUGE_HEIGHT, margin=dict(t=TOP_MARGIN, b=BOTTOM_MARGIN, l=15, r=15),
-        paper_bgcolor='rgba(0,0,0,0)', font={'color': "#FFF"}
-    )
-
-    # 1. MDD (고점 대비 최대 하락폭)
-    with row1_col1:
-        mdd_pct = mdd_value * 100
-        mdd_color = "#FDD835" if mdd_pct >= -20 else ("#FF9100" if mdd_pct >= -40 else "#FF1744")
-        fig_mdd = go.Figure(go.Indicator(
-            mode = "gauge+number", value = mdd_pct, domain = {'x': [0, 1], 'y': GAUGE_Y_RANGE},
-            number = {'font': {'size': VAL_FONT_SIZE, 'color': mdd_color}, 'suffix': "%", 'valueformat': ".1f"},
-            gauge = {'axis': {'range': [0, -60], 'tickvals': [0, -30, -60]},
-                     'bar': {'color': "rgba(255, 255, 255, 0.8)"},
-                     'steps': [{'range': [0, -20], 'color': "rgba(253, 216, 53, 0.3)"},
-                               {'range': [-20, -40], 'color': "rgba(255, 145, 0, 0.3)"},
-                               {'range': [-40, -60], 'color': "rgba(255, 23, 68, 0.3)"}]}
-        ))
-        fig_mdd.add_annotation(text="MDD", x=0.5, y=TEXT_Y_POS, font=dict(size=TXT_FONT_SIZE, color="#888"), showarrow=False)
-        fig_mdd.add_annotation(text="고점 대비 최대 하락폭", x=0.5, y=DESC_Y_POS, font=dict(size=DSC_FONT_SIZE, color="#666"), showarrow=False)
-        fig_mdd.update_layout(**common_layout)
-        st.plotly_chart(fig_mdd, use_container_width=True, key="mdd_v758")
-
-    # 2. SHARPE (변동성 대비 효율)
-    with row1_col2:
-        sharpe_c = "#66BB6A" if sharpe_auto >= 1.0 else "#FF1744"
-        fig_sharpe = go.Figure(go.Indicator(
-            mode = "gauge+number", value = sharpe_auto, domain = {'x': [0, 1], 'y': GAUGE_Y_RANGE},
-            number = {'font': {'size': VAL_FONT_SIZE, 'color': sharpe_c}, 'valueformat': ".2f"},
-            gauge = {'axis': {'range': [0, 2], 'tickvals': [0, 1, 2]},
-                     'bar': {'color': "rgba(255, 255, 255, 0.8)"},
-                     'steps': [{'range': [0, 1], 'color': "rgba(255, 23, 68, 0.3)"},
-                               {'range': [1, 2], 'color': "rgba(102, 187, 106, 0.3)"}]}
-        ))
-        fig_sharpe.add_annotation(text="SHARPE", x=0.5, y=TEXT_Y_POS, font=dict(size=TXT_FONT_SIZE, color="#888"), showarrow=False)
-        fig_sharpe.add_annotation(text=f"전체 변동성 대비 효율 (Rf: {LIVE_RISK_FREE_RATE:.1%})", x=0.5, y=DESC_Y_POS, font=dict(size=DSC_FONT_SIZE, color="#666"), showarrow=False)
-        fig_sharpe.update_layout(**common_layout)
-        st.plotly_chart(fig_sharpe, use_container_width=True, key="sharpe_v758")
-
-    # 3. MAR (고통 대비 생존률)
-    with row2_col1:
-        mar_c = "#66BB6A" if mar_ratio >= 1.0 else "#FF1744"
-        fig_mar = go.Figure(go.Indicator(mode = "gauge+number", value = mar_ratio, domain = {'x': [0, 1], 'y': GAUGE_Y_RANGE},
-            number = {'font': {'size': VAL_FONT_SIZE, 'color': mar_c}, 'valueformat': ".2f"},
-            gauge = {'axis': {'range': [0, 2]}, 'bar': {'color': "rgba(255, 255, 255, 0.8)"},
-                     'steps': [{'range': [0, 1], 'color': "rgba(255, 23, 68, 0.3)"}, {'range': [1, 2], 'color': "rgba(0, 230, 118, 0.3)"}]}
-        ))
-        fig_mar.add_annotation(text="MAR", x=0.5, y=TEXT_Y_POS, font=dict(size=TXT_FONT_SIZE, color="#888"), showarrow=False)
-        fig_mar.add_annotation(text="고통 대비 생존 보상률", x=0.5, y=DESC_Y_POS, font=dict(size=DSC_FONT_SIZE, color="#666"), showarrow=False)
-        fig_mar.update_layout(**common_layout)
-        st.plotly_chart(fig_mar, use_container_width=True, key="mar_v758")
-
-    # 4. SORTINO (하락 위험 대비 효율)
-    with row2_col2:
-        sort_c = "#66BB6A" if sortino_auto >= 1.0 else "#FF1744"
-        fig_sort = go.Figure(go.Indicator(mode = "gauge+number", value = sortino_auto, domain = {'x': [0, 1], 'y': GAUGE_Y_RANGE},
-            number = {'font': {'size': VAL_FONT_SIZE, 'color': sort_c}, 'valueformat': ".2f"},
-            gauge = {'axis': {'range': [0, 2]}, 'bar': {'color': "rgba(255, 255, 255, 0.8)"},
-                     'steps': [{'range': [0, 1], 'color': "rgba(255, 23, 68, 0.3)"}, {'range': [1, 2], 'color': "rgba(0, 200, 83, 0.3)"}]}
-        ))
-        fig_sort.add_annotation(text="SORTINO", x=0.5, y=TEXT_Y_POS, font=dict(size=TXT_FONT_SIZE, color="#888"), showarrow=False)
-        fig_sort.add_annotation(text="하락 위험 대비 수익 효율", x=0.5, y=DESC_Y_POS, font=dict(size=DSC_FONT_SIZE, color="#666"), showarrow=False)
-        fig_sort.update_layout(**common_layout)
-        st.plotly_chart(fig_sort, use_container_width=True, key="sort_v758")
-
-    # --- [Portfolio Score 실시간 최종 산출] ---
-    def get_step_score(val):
-        return min(90 + (val - 1.0) * 10, 100) if val >= 1.0 else val * 90
-
-    s_pts = get_step_score(sharpe_auto)
-    so_pts = get_step_score(sortino_auto)
-    mar_pts = get_step_score(mar_ratio)
-    
-    _mdd_abs_pct = abs(mdd_value * 100)
-    if _mdd_abs_pct == 0: mdd_pts = 100
-    elif _mdd_abs_pct <= 20: mdd_pts = 70
-    elif _mdd_abs_pct <= 40: mdd_pts = 50
-    else: mdd_pts = 30
-
-    W_EQUAL = 0.25
-    final_p_score = round((s_pts + so_pts + mar_pts + mdd_pts) * W_EQUAL, 1)
-
-# [단계 2] 계산된 데이터를 m_left에 시각화
-with m_left:
-    TOGGLE_TOP_MARGIN, CONTENT_TOP_MARGIN = 20, 30
-    SECTION_GAP, SCORE_SECTION_GAP = 10, 10
-    L_FONT, V_FONT, S_FONT, U_FONT = 20, 46, 52, 18
-    
-    LABEL_COLOR, NAV_COLOR, CUR_COLOR, UNIT_COLOR = "#888888", "#D500F9", "#444444", "#444444"
-    YTD_COLOR = "#00E676" if ytd_return > 0 else "#FF5252" if ytd_return < 0 else "#B0B0B0"
-    SCORE_COLOR = "#00E676" if final_p_score >= 80 else ("#FDD835" if final_p_score >= 60 else "#FF1744")
-
-    st.markdown(f'<div style="margin-top: {TOGGLE_TOP_MARGIN}px;"></div>', unsafe_allow_html=True)
-    hide_sensitive = st.toggle("Privacy Mode", value=False, key="privacy_v757")
-    
-    BASE_S = 'font-weight: 700; line-height: 1.0; letter-spacing: -1.5px;'
-    L_S = f'font-size: {L_FONT}px; color: {LABEL_COLOR}; margin-bottom: 4px; letter-spacing: 1.5px; font-weight: 500;'
-    P_S = f'font-size: {V_FONT}px; {BASE_S} color: {NAV_COLOR}; text-shadow: 0 0 15px rgba(213, 0, 249, 0.4);'
-    Y_S = f'font-size: {V_FONT}px; {BASE_S} color: {YTD_COLOR};'
-    S_S = f'font-size: {S_FONT}px; {BASE_S} color: {SCORE_COLOR}; text-shadow: 0 0 20px {SCORE_COLOR}44;'
-
-    # --- [데이터 처리 로직 수정] ---
-    val_d = f"{total_val_display:,.2f}" if not hide_sensitive else "••••••••"
-    ytd_d = f"{ytd_return:.2%}" if not hide_sensitive else "••••"
-    # Privacy Mode 여부와 관계없이 final_p_score를 그대로 노출합니다.
-    score_d = final_p_score 
-
-    st.markdown(f"""
-        <div style="margin-top: {CONTENT_TOP_MARGIN}px;">
-            <p style="{L_S}">NET ASSET VALUE</p>
-            <p style="{P_S}">{val_d} <span style="font-size: 16px; color: {CUR_COLOR}; font-weight: 600;">{base_currency}</span></p>
-        </div>
-        <div style="margin-top: {SECTION_GAP}px;">
-            <p style="{L_S}">YTD PERFORMANCE</p>
-            <p style="{Y_S}">{ytd_d}</p>
-        </div>
-        <div style="margin-top: {SCORE_SECTION_GAP}px;">
-            <p style="{L_S}">PORTFOLIO SCORE</p>
-            <p style="{S_S}">{score_d} <span style="font-size: {U_FONT}px; color: {UNIT_COLOR}; font-weight: 600;">/ 100</span></p>
-        </div>
-    """, unsafe_allow_html=True)
-
-            # 오리지널 게이지 컬러
-            #    {'range': [-1, 0], 'color': "#311B92"}, 
-            #    {'range': [0, 1], 'color': "#512DA8"},
-            #    {'range': [1, 2], 'color': "#7B1FA2"}, 
-            #    {'range': [2, 4], 'color': "#D500F9"}
-
-
-
-
-# --------------------------------------------------------------------------------
-# 1. [ALLOCATION] 자산 비중 분석 (Pie Charts) - 투명도 및 시각화 통일
-# --------------------------------------------------------------------------------
-st.markdown("---")
-st.header(section_labels.get("strategic_allocation", "ALLOCATION"))
-
-# --- [디자인 및 RGBA 색상 설정] ---
-# 게이지와 동일하게 0.5 투명도 적용
-ALPHA = 0.8
-
-def hex_to_rgba(hex_code, alpha):
-    hex_code = hex_code.lstrip('#')
-    lv = len(hex_code)
-    rgb = tuple(int(hex_code[i:i + lv // 3], 16) for i in range(0, lv, lv // 3))
-    return f"rgba({rgb[0]}, {rgb[1]}, {rgb[2]}, {alpha})"
-
-# 핵심 자산 색상 (RGBA)
-RGBA_CASH = hex_to_rgba("#4CAF50", ALPHA)
-RGBA_CRYPTO = hex_to_rgba("#D35400", ALPHA)
-RGBA_TSLA = hex_to_rgba("#D81B60", ALPHA)
-RGBA_ETC = hex_to_rgba("#555555", ALPHA)
-
-# 팔레트 변환 (RGBA)
-RGBA_CLASS = [hex_to_rgba(c, ALPHA) for c in ['#311B92', '#4527A0', '#512DA8', '#5E35B1', '#673AB7']]
-RGBA_SECTOR = [hex_to_rgba(c, ALPHA) for c in ['#7B1FA2', '#8E24AA', '#9C27B0', '#AB47BC', '#BA68C8']]
-RGBA_HOLDINGS = [hex_to_rgba(c, ALPHA) for c in ['#6200EA', '#651FFF', '#7C4DFF', '#B388FF', '#304FFE']]
-
-PIE_TEXT_COLOR = "#FFFFFF"
-CUSTOM_HOVER_TEMPLATE = "<b>%{label}</b><br>%{percent}<extra></extra>"
-
-if not raw_assets and pm.data['cash']['USD'] == 0:
-    st.warning("SYSTEM EMPTY. DEPLOY ASSETS TO INITIALIZE.")
-else:
-    df_assets = pd.DataFrame(sorted_assets)
-    chart_col1, chart_col2, chart_col3 = st.columns([1, 1, 1])
-
-    def group_small_assets(df, label_col, value_col, threshold=0.01):
-        total_val = df[value_col].sum()
-        if total_val == 0: return df
-        df = df.copy()
-        df['percent_calc'] = df[value_col] / total_val
-        df.loc[df['percent_calc'] < threshold, label_col] = 'etc'
-        return df.groupby(label_col)[value_col].sum().reset_index()
-
-    # --- 공통 차트 생성 함수 ---
-    def create_unified_pie(df, names_col, values_col, color_map, key_name):
-        fig = px.pie(df, values=values_col, names=names_col, hole=0.5, 
-                     color=names_col, color_discrete_map=color_map)
-        fig.update_traces(
-            hovertemplate=CUSTOM_HOVER_TEMPLATE,
-            textinfo='percent+label',
-            textposition='inside',
-            textfont=dict(color=PIE_TEXT_COLOR, size=12),
-            # 테두리 선도 투명도에 맞춰 부드럽게 조정
-            marker=dict(line=dict(color='rgba(0,0,0,0.3)', width=1.5)),
-            insidetextorientation='horizontal'
-        )
-        fig.update_layout(
-            margin=dict(t=30, b=30, l=10, r=10), 
-            paper_bgcolor='rgba(0,0,0,0)', 
-            showlegend=False,
-            uniformtext=dict(minsize=9, mode='show') 
-        )
-        st.plotly_chart(fig, use_container_width=True, key=key_name)
-
-    # --- [CHART 1] CLASS DISTRIBUTION ---
-    with chart_col1:
-        with st.container(border=True):
-            st.caption("CLASS DISTRIBUTION")
-            df_class = df_assets.copy()
-            df_class['asset_class'] = df_class['asset_class'].replace('ETF', 'Stock')
-            df_class = df_class.groupby('asset_class')['value_usd'].sum().reset_index()
-            class_map = {
-                'Crypto': RGBA_CLASS[0],
-                'Stock': RGBA_CLASS[1], 
-                'Other': RGBA_CLASS[3], 
-                'Cash': RGBA_CASH
-            }
-            create_unified_pie(df_class, 'asset_class', 'value_usd', class_map, "chart_class_v7")
-
-    # --- [CHART 2] STOCK SECTOR DISTRIBUTION ---
-    with chart_col2:
-        with st.container(border=True):
-            st.caption("STOCK SECTOR DISTRIBUTION")
-            df_stocks = df_assets[df_assets['asset_class'].isin(['Stock', 'ETF'])].copy()
-            if not df_stocks.empty:
-                df_stocks_grouped = group_small_assets(df_stocks, 'sector', 'value_usd', 0.01)
-                sector_colors = {}
-                for i, s in enumerate(df_stocks_grouped['sector']):
-                    if s == 'etc':
-                        sector_colors[s] = RGBA_ETC
-                    else:
-                        sector_colors[s] = RGBA_SECTOR[i % len(RGBA_SECTOR)]
-                create_unified_pie(df_stocks_grouped, 'sector', 'value_usd', sector_colors, "chart_sector_v7")
-            else:
-                st.markdown("<p style='text-align:center; color:#555; padding: 80px 0;'>NO DATA</p>", unsafe_allow_html=True)
-
-    # --- [CHART 3] TOTAL HOLDINGS ---
-    with chart_col3:
-        with st.container(border=True):
-            st.caption("TOTAL HOLDINGS")
-            df_holdings = df_assets.copy()
-            df_holdings['display_ticker'] = df_holdings['ticker'].str.replace("-USD", "")
-            df_holdings_grouped = group_small_assets(df_holdings, 'display_ticker', 'value_usd', 0.01)
-            
-            holdings_colors = {}
-            for i, t in enumerate(df_holdings_grouped['display_ticker']):
-                if t in ['BTC', 'ETH']:
-                    holdings_colors[t] = RGBA_CRYPTO
-                elif t == 'TSLA':
-                    holdings_colors[t] = RGBA_TSLA
-                elif t == 'CASH':
-                    holdings_colors[t] = RGBA_CASH
-                elif t == 'etc':
-                    holdings_colors[t] = RGBA_ETC
-                else:
-                    holdings_colors[t] = RGBA_HOLDINGS[i % len(RGBA_HOLDINGS)]
-            
-            create_unified_pie(df_holdings_grouped, 'display_ticker', 'value_usd', holdings_colors, "chart_holdings_v7")
-
-
-
-# --------------------------------------------------------------------------------
-# 2. [GROWTH] 자산 성장 추세 (Growth Trend)
-# --------------------------------------------------------------------------------
-st.markdown("---")
-st.header(section_labels.get("asset_growth", "Net Asset Value"))
-with st.container(border=True):
-    if not total_history_display.empty:
-        PURPLE_LINE = "#D500F9" 
-        PURPLE_FILL = "rgba(213, 0, 249, 0.15)" 
-        fig_growth = go.Figure()
-        fig_growth.add_trace(go.Scatter(x=total_history_display.index, y=total_history_display.values, fill='tozeroy', mode='lines', line=dict(color=PURPLE_LINE, width=2), fillcolor=PURPLE_FILL, name=f'Portfolio ({base_currency})'))
-        fig_growth.update_layout(paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', margin=dict(t=30, b=10, l=10, r=10), yaxis=dict(gridcolor='#222'), xaxis=dict(gridcolor='#222'), font=dict(color='#888'), height=350, legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1))
-        st.plotly_chart(fig_growth, use_container_width=True)
-        st.caption(f"**Analysis Start:** {total_history_display.index[0].strftime('%Y-%m-%d')} | Source: Yahoo Finance & Global Exchange Data")
-    else:
-        st.info("DATASTREAM OFFLINE.")
-
-
-
-# --------------------------------------------------------------------------------
-# 3. [YTD PERFORMANCE] 연초 대비 성과 (Jan 2nd Baseline)
-# --------------------------------------------------------------------------------
-st.markdown("---")
-st.header(section_labels.get("ytd_performance", "YTD PERFORMANCE"))
-
-with st.spinner("Analyzing 2026 Asset Performance..."):
-    if 'df_assets' in locals() and not df_assets.empty:
-        try:
-            raw_tickers = df_assets['ticker'].dropna().unique().tolist()
-            portfolio_tickers = [str(t).strip().upper() for t in raw_tickers if t not in ['KRW', 'USD', 'CAD', 'CASH', '현금']]
-            if portfolio_tickers:
-                fetch_start = datetime(2025, 12, 28) 
-                y_data = yf.download(portfolio_tickers, start=fetch_start, progress=False)
-                if not y_data.empty:
-                    p_df = y_data['Close'] if 'Close' in y_data else y_data
-                    p_df = p_df.ffill().dropna(how='all')
-                    target_start = datetime(2026, 1, 2).date()
-                    display_df = p_df.loc[p_df.index.date >= target_start]
-                    if not display_df.empty:
-                        base_price = display_df.iloc[0]
-                        ytd_perf = (display_df / base_price - 1) * 100
-                        fig_ytd = go.Figure()
-                        sorted_names = sorted(ytd_perf.columns if isinstance(ytd_perf, pd.DataFrame) else [portfolio_tickers[0]], key=lambda x: "BTC" not in x)
-                        for ticker in sorted_names:
-                            is_btc = "BTC" in ticker
-                            y_vals = ytd_perf[ticker] if isinstance(ytd_perf, pd.DataFrame) else ytd_perf
-                            fig_ytd.add_trace(go.Scatter(x=ytd_perf.index, y=y_vals, name=ticker, line=dict(width=3 if is_btc else 1.5, color="#F7931A" if is_btc else None), hovertemplate=f"<b>{ticker}</b>: %{{y:.2f}}%<extra></extra>"))
-                        fig_ytd.update_layout(hovermode="x unified", height=450, paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', margin=dict(t=20, b=10, l=10, r=10), legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1), yaxis=dict(title="Return (%)", gridcolor='rgba(255,255,255,0.05)', ticksuffix="%"), xaxis=dict(range=[target_start, ytd_perf.index[-1]], gridcolor='rgba(255,255,255,0.05)'))
-                        fig_ytd.add_hline(y=0, line_dash="solid", line_color="rgba(255,255,255,0.2)")
-                        st.plotly_chart(fig_ytd, use_container_width=True)
-                        st.caption(f"**Base Date:** {display_df.index[0].strftime('%Y-%m-%d')} (Normalized to 0.00%) | Source: Yahoo Finance & Global Exchange Data")
-                        last_p = ytd_perf.iloc[-1]
-                        if isinstance(last_p, pd.Series):
-                            st.info(f"YTD TOP: **{last_p.idxmax()}** ({last_p.max():+.2f}%)")
-        except Exception as e:
-            st.error(f"YTD 엔진 오류: {str(e)}")
-
-
-
-# --------------------------------------------------------------------------------
-# 4. [HOLDINGS] 자산 관리 테이블 (Full Width & Toggle & Dropdown)
-# --------------------------------------------------------------------------------
-st.markdown("---")
-
-# [추가] Expander의 글자 크기를 크게 만드는 CSS 인젝션
-st.markdown("""
-    <style>
-    /* Expander 헤더의 글자 크기 조절 */
-    .stExpander p {
-        font-size: 2.1rem !important;
-        font-weight: bold !important;
-    }
-    </style>
-    """, unsafe_allow_html=True)
-
-# [기능 1] st.expander를 통한 테이블 전체 토글(접기) 기능
-with st.expander("**HOLDINGS**", expanded=True):
-#    col_header, col_delete = st.columns([8, 1])
-#    with col_header:
-#        st.header("Manage Asset Inventory")
-
-    # 세션 상태 버퍼 초기화
-    if 'asset_buffer' not in st.session_state:
-        st.session_state['asset_buffer'] = [a.copy() for a in sorted_assets]
-
-    table_fx_rate = fx_rates.get(base_currency, 1.0)
-    currency_symbol = "$" if base_currency in ["USD", "CAD"] else "₩"
-    display_data = []
-    buffer_assets = st.session_state['asset_buffer']
-    display_map = [] 
-
-    # 데이터 전처리 및 테이블용 리스트 생성
-    for i, a in enumerate(buffer_assets):
-        if a['ticker'] == 'CASH': continue 
-        price = a.get('current_price', 0.0)
-        if price == 0: price = a.get('avg_price', 0.0)
-        val_calc = price * a.get('quantity', 0.0) * table_fx_rate
-        
-        display_data.append({
-            "DELETE": False, 
-            "TICKER": str(a.get('ticker', '')), 
-            "CLASS": str(a.get('asset_class', '')), 
-            "SECTOR": str(a.get('sector', '')), 
-            "QTY": f"{float(a.get('quantity', 0.0)):.4f}", 
-            "AVG COST": f"{float(a.get('avg_price', 0.0)):.2f}", 
-            "CURRENT PRICE": f"${float(price):,.2f}", 
-            "VALUE": f"{currency_symbol}{val_calc:,.2f}"
-        })
-        display_map.append(i)
-
-    df_display = pd.DataFrame(display_data)
-
-    # [기능 2] 데이터 세이브 로직 (기존 로직 유지)
-    def save_edits():
-        state = st.session_state["holdings_editor"]
-        edited_rows = state.get("edited_rows", {})
-        deleted_rows = state.get("deleted_rows", [])
-        added_rows = state.get("added_rows", []) 
-        
-        if not edited_rows and not deleted_rows and not added_rows: return
-        
-        buffer = st.session_state['asset_buffer']
-        updates_made = False
-        
-        # 체크박스 삭제 처리
-        checkbox_deletes = [int(idx) for idx, changes in edited_rows.items() if changes.get("DELETE") is True]
-        all_indices_to_delete = set(deleted_rows + checkbox_deletes)
-        
-        if all_indices_to_delete:
-            rows_to_delete = sorted([display_map[i] for i in all_indices_to_delete if i < len(display_map)], reverse=True)
-            for buf_idx in rows_to_delete:
-                if buf_idx < len(buffer):
-                    buffer.pop(buf_idx)
-                    updates_made = True
-                    
-        # 개별 셀 수정 처리
-        for idx, changes in edited_rows.items():
-            if int(idx) in all_indices_to_delete: continue 
-            buf_idx = display_map[int(idx)]
-            asset = buffer[buf_idx]
-            if "QTY" in changes: 
-                try: asset['quantity'] = float(str(changes["QTY"]).replace(',', ''))
-                except: pass
-                updates_made = True
-            if "AVG COST" in changes:
-                try: asset['avg_price'] = float(str(changes["AVG COST"]).replace(',', '').replace('$', ''))
-                except: pass
-                updates_made = True
-            if "SECTOR" in changes: asset['sector'] = str(changes["SECTOR"]).strip(); updates_made = True
-            if "CLASS" in changes: asset['asset_class'] = str(changes["CLASS"]).strip(); updates_made = True
-            if "TICKER" in changes: asset['ticker'] = str(changes["TICKER"]).strip().upper(); updates_made = True
-            
-        # 신규 행 추가 처리
-        if added_rows:
-            for new_row in added_rows:
-                raw_ticker = new_row.get('TICKER', '').strip().upper()
-                qty = 0.0; avg = 0.0
-                try: qty = float(str(new_row.get('QTY', '0')).replace(',', ''))
-                except: pass
-                try: avg = float(str(new_row.get('AVG COST', '0')).replace('$', '').replace(',', ''))
-                except: pass
-                buffer.append({
-                    "ticker": raw_ticker, "quantity": qty, "avg_price": avg, 
-                    "sector": "Unknown", "asset_class": "Stock", 
-                    "value_usd": 0.0, "current_price": 0.0
-                })
-                updates_made = True
-                
-        if updates_made:
-            valid_assets = [a for a in buffer if a.get('ticker') and a.get('ticker') != "CASH"]
-            cash_asset = next((a for a in pm.data['assets'] if a['ticker'] == 'CASH'), None)
-            pm.data['assets'] = valid_assets + ([cash_asset] if cash_asset else [])
-            pm.save_data()
-            st.toast("✅ Portfolio Updated")
-
-    # [기능 3] st.data_editor 출력 부분
-    st.data_editor(
-        df_display,
-        column_config={
-            "DELETE": st.column_config.CheckboxColumn("🗑️", width="small"),
-            "TICKER": st.column_config.TextColumn("Ticker", width="small"), 
-            "CLASS": st.column_config.SelectboxColumn(
-                "Class", 
-                width="medium",
-                options=["Stock", "Bond", "ETF", "Crypto"],
-                required=True
-            ),
-            "SECTOR": st.column_config.TextColumn("Sector", width="medium"),
-            "QTY": st.column_config.TextColumn("Quantity", width="small"), 
-            "AVG COST": st.column_config.TextColumn("Avg Cost", width="small"), 
-            "CURRENT PRICE": st.column_config.TextColumn("Price (USD)", width="medium", disabled=True), 
-            "VALUE": st.column_config.TextColumn(f"Value ({base_currency})", width="medium", disabled=True) 
-        },
-        hide_index=True,
-        use_container_width=True,
-        key="holdings_editor",
-        on_change=save_edits,
-        num_rows="dynamic" 
-    )
-
-
-
-
-# --------------------------------------------------------------------------------
-# 🎯 STRATEGIC PROJECTION: Clean Setup Box
-# --------------------------------------------------------------------------------
-st.markdown("---")
-st.header("STRATEGIC PROJECTION")
-
-# [1. 데이터 준비]
-from datetime import datetime
-import pandas as pd
-import numpy as np
-
-current_year = datetime.now().year
-years_to_target = 2030 - current_year
-years_range = np.arange(0, years_to_target + 1)
-
-# [2. 목표 설정 위젯]
-with st.container():
-    col_input, col_info = st.columns([1, 1])
-    
-    with col_input:
-        # CSS 없이 기본 number_input 사용 (사이드바에 영향 없음)
-        user_target_usd = st.number_input(
-            "TARGET NAV (USD)", 
-            min_value=100000, 
-            value=1500000, 
-            step=100000,
-            format="%d",
-            key="target_val_v_final_clean"
-        )
-    
-    with col_info:
-        krw_val = user_target_usd * 1350 
-        # KRW 텍스트에만 인라인 스타일 적용 (다른 곳에 영향 미치지 않음)
-        st.markdown(f"""
-            <div style="margin-top: 32px;">
-                <span style="
-                    font-size: 20px; 
-                    color: #00E676; 
-                    font-weight: 600;
-                ">
-                    ≈ KRW {krw_val/100000000:.1f}억 원
-                </span>
-            </div>
-        """, unsafe_allow_html=True)
-
-# 🚀 ROW 1: NAV GROWTH PATH
-with st.container(border=True):
-    st.subheader("NAV GROWTH PATH")
-    
-    # 상단의 cagr_val과 final_p_score를 실시간 반영
-    eff_cagr = cagr_val * (final_p_score / 100 + 0.2)
-    future_values = [total_val_display * (1 + eff_cagr)**y for y in years_range]
-    
-    df_roadmap = pd.DataFrame({
-        'Year': [current_year + y for y in years_range],
-        'Projected Value': future_values,
-        'Target': [user_target_usd] * len(years_range)
-    })
-
-    fig_roadmap = go.Figure()
-    
-    # 목표선 (Target Line)
-    fig_roadmap.add_trace(go.Scatter(
-        x=df_roadmap['Year'], y=df_roadmap['Target'], 
-        # name=f"Target (${user_target_usd/1000:,.0f}K)", 
-        name="Target",
-        line=dict(color="#FFD700", dash='dash', width=2)
-    ))
-    
-    # 예측 곡선 (Projected Path)
-    fig_roadmap.add_trace(go.Scatter(
-        x=df_roadmap['Year'], y=df_roadmap['Projected Value'], 
-        name="NAV",
-        fill='tozeroy', fillcolor='rgba(0, 230, 118, 0.1)', 
-        line=dict(color="#00E676", width=2)
-    ))
-
-    # Y축 최댓값 계산 (예측치와 목표치 중 큰 값의 1.15배를 상단 마진으로 확보)
-    y_max = max(max(future_values), user_target_usd) * 1.15
-
-    fig_roadmap.update_layout(
-        height=350, # 차트 가독성을 위해 높이를 소폭 상향
-        margin=dict(t=50, b=20, l=10, r=10),
-        paper_bgcolor='rgba(0,0,0,0)', 
-        plot_bgcolor='rgba(0,0,0,0)',
-        font=dict(color="#BBBBBB"), 
-        showlegend=True,
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1,
-            bgcolor="rgba(0,0,0,0)"
-        ),
-        xaxis=dict(
-            showgrid=False,
-            dtick=1,
-            tickformat="d"
-        ), 
-        yaxis=dict(
-            showgrid=True, 
-            gridcolor="#222", 
-            tickformat="$,.0f",
-            range=[0, y_max] # Y축 범위를 다이나믹하게 설정하여 잘림 방지
-        )
-    )
-    st.plotly_chart(fig_roadmap, use_container_width=True)
-    
-    # 인사이트
-    expected_2030 = future_values[-1]
-    achievement_rate = (expected_2030 / user_target_usd) * 100
-    
-    if achievement_rate >= 100:
-        st.success(f"현재 페이스 유지 시 2030년 목표의 **{achievement_rate:.1f}%** 달성이 예상됩니다.")
-    else:
-        st.warning(f"목표 달성률이 **{achievement_rate:.1f}%**입니다. 추가 자본 투입이나 CAGR 개선 전략이 필요합니다.")
-
-
-
-# 2. SURVIVAL STRESS TEST (Zero-Error Sync with Transparency)
-with st.container(border=True):
-    st.subheader("SURVIVAL STRESS TEST")
-
-    # [1. 데이터 무결성: 상단 MDD 지표와 100% 동기화]
-    try:
-        current_mdd_decimal = mdd_val / 100 if abs(mdd_val) > 1 else mdd_val
-        if current_mdd_decimal > 0: current_mdd_decimal = -current_mdd_decimal
-    except NameError:
-        current_mdd_decimal = -0.307
-
-    # [2. 블랙스완 시나리오: 전고점(ATH) 대비 -50% 하락]
-    target_mdd_decimal = -0.50
-    additional_shock_needed = (1 + target_mdd_decimal) / (1 + current_mdd_decimal) - 1
-    shock_factor = min(additional_shock_needed, -0.10)
-    shocked_value = total_val_display * (1 + shock_factor)
-    
-    # [3. 실시간 환율 및 현금흐름 산출]
-    try:
-        k_to_u = 1 / usdkrw_rate if usdkrw_rate != 0 else 1/1350
-        c_to_u = 1 / usdcad_rate if usdcad_rate != 0 else 0.72
-    except NameError:
-        k_to_u, c_to_u = 1/1350, 0.72
-
-    safety_net_annual = ((6000000 * 12) * k_to_u) + ((2000 * 12) * c_to_u)
-    
-    # [4. 시각화 - 투명도 적용]
-    labels = ['Current NAV', 'Black Swan Shock', 'Annual Safety Net']
-    values = [total_val_display, shocked_value, safety_net_annual]
-    
-    # RGBA 투명도 적용 컬러셋
-    colors = [
-        'rgba(136, 136, 136, 0.6)',  # Current (Grey)
-        'rgba(255, 23, 68, 0.6)',    # Shock (Red)
-        'rgba(76, 175, 80, 0.6)'     # Safety Net (Green)
-    ]
-    line_colors = [
-        'rgba(136, 136, 136, 0.6)',
-        'rgba(255, 23, 68, 0.6)',
-        'rgba(76, 175, 80, 0.6)'
-    ]
-    
-    fig_stress = go.Figure(go.Bar(
-        x=labels, y=values,
-        marker=dict(
-            color=colors,
-            line=dict(color=line_colors, width=2) # 테두리로 가시성 확보
-        ),
-        text=[f"${v/1000:,.0f}K" for v in values], 
-        textposition='auto',
-        textfont=dict(color="#FFFFFF", size=14)
-    ))
-    
-    fig_stress.update_layout(
-        height=350, margin=dict(t=40, b=20, l=10, r=10),
-        paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
-        font=dict(color="#BBBBBB"),
-        yaxis=dict(showgrid=True, gridcolor="#222", tickformat="$,.0f")
-    )
-    st.plotly_chart(fig_stress, use_container_width=True)
-    
-    # [5. 데이터 무결성 보고]
-    st.info(f"""
-        **1. Risk Data Audit:** 현재 포트폴리오는 전고점 대비 {current_mdd_decimal*100:.1f}% 하락한 상태입니다.
-        
-        **2. Scenario:** 시장이 최악의 경우 전고점 대비 -50%까지 추가 하락할 경우, 
-        현재가에서 {shock_factor*100:.1f}%의 추가 충격이 예상됩니다.
-        
-        **3. Stability:** 이 극한의 상황에서도 ${safety_net_annual:,.0f}의 연간 현금흐름이 
-        심리적 마지노선을 지탱하는 강력한 리스크 해자(Moat)가 됩니다.
-    """)
-
-
-
-
-# --------------------------------------------------------------------------------
-# 📜 FOOTER: RABBIT TERMINAL SIGNATURE
-# --------------------------------------------------------------------------------
-st.markdown("---") # 섹션 구분선
-
-# 사이드바와 동일한 폰트 스타일 및 중앙 정렬 적용
-st.markdown("""
-    <style>
-    .terminal-footer {
-        font-family: 'Courier New', Courier, monospace; /* 터미널 느낌의 고정폭 폰트 */
-        font-size: 14px;
-        color: #666666; /* 차분한 그레이 톤 */
-        text-align: center;
-        letter-spacing: 2px; /* 자간 조절로 전문성 강조 */
-        padding-top: 50px;
-        padding-bottom: 20px;
-        font-weight: 500;
-    }
-    </style>
-    <div class="terminal-footer">
-        RABBIT TERMINAL v2026.02
-    </div>
-""", unsafe_allow_html=True)
-
-
-
-
-
-
-
-
-
-
-
+page.render(ctx)
@@ -0,0 +1,99 @@
+"""
+Import-time budget for each entry point, measured with `python -X importtime` in a fresh
+interpreter per entry point (so nothing is already in sys.modules).
+
+    python bench_importtime.py                # all entry points, fails (exit 1) if any is over budget
+    python bench_importtime.py views.macro    # selected entry points only
+    python bench_importtime.py --scale 2      # slower machine: double every budget
+    python bench_importtime.py --top 15       # also list the slowest imports of each entry point
+    python -m pytest -q test_import_budget.py # the same budgets as a test (IMPORT_BUDGET_SCALE=2 on slow machines)
+
+Besides the time budget, each entry point lists modules it must not pull in at all
+(e.g. the login shell must not load yfinance, no page loads pandas_datareader until it fetches FRED data).
+"""
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+# entry point -> (modules imported, budget in ms, modules that must stay unloaded)
+HEAVY = ["yfinance", "pandas_datareader", "plotly"]
+# What app.py imports before the login gate, and right after it (every page renders on top of these)
+LOGIN = ["streamlit", "views", "views.common"]
+POST_LOGIN = LOGIN + ["portfolio_manager", "market_data", "analytics_engine", "technical_indicators"]
+ENTRY_POINTS: Dict[str, Tuple[List[str], float, List[str]]] = {
+    "login": (LOGIN, 1500, HEAVY + ["streamlit_gsheets"]),
+    "post_login": (POST_LOGIN, 2500, HEAVY),
+    # Storage / sheet codecs used outside the UI
+    "portfolio_manager": (["portfolio_manager"], 900, HEAVY + ["streamlit", "streamlit_gsheets"]),
+    "migrate_storage": (["migrate_storage"], 900, HEAVY + ["streamlit"]),
+    "snapshot_job": (["snapshot_job"], 2000, ["streamlit", "pandas_datareader", "plotly"]),
+    "fred_data": (["fred_data", "fred_store"], 900, HEAVY + ["streamlit"]),
+    "derived_series": (["derived_series"], 900, HEAVY + ["streamlit"]),
+    "fx_panel": (["fx_panel"], 900, HEAVY + ["streamlit"]),
+    "fetch_planner": (["fetch_planner"], 900, HEAVY + ["streamlit"]),
+    # Pages, on the real post-login path (what a session has loaded once the page is selected)
+    "views.portfolio": (POST_LOGIN + ["views.portfolio"], 4000, ["pandas_datareader"]),
+    "views.macro": (POST_LOGIN + ["views.macro"], 4000, ["pandas_datareader"]),
+    "views.market": (POST_LOGIN + ["views.market"], 4000, ["pandas_datareader", "yfinance"]),
+    "views.crypto": (POST_LOGIN + ["views.crypto"], 4000, ["pandas_datareader", "yfinance"]),
+    "views.bitcoin_standard": (POST_LOGIN + ["views.bitcoin_standard"], 4000, ["pandas_datareader", "yfinance"]),
+}
+
+
+def measure(modules: List[str]) -> Tuple[float, List[Tuple[float, float, str]]]:
+    """
+    Imports `modules` in a fresh interpreter.
+    Returns (total ms, [(self ms, cumulative ms, module), ...] for every module imported).
+    """
+    code = "import " + ", ".join(modules)
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__)))
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "import failed")
+    rows, total = [], 0.0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(self_us) / 1000, int(cumulative_us) / 1000, name.rstrip()))
+        if not name.startswith("  "):  # top-level import (nested ones are indented)
+            total += int(cumulative_us) / 1000
+    return total, rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check import time of each entry point against its budget.")
+    parser.add_argument("entry_points", nargs="*", help=f"default: all ({', '.join(ENTRY_POINTS)})")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply every budget (slow or cold machines)")
+    parser.add_argument("--top", type=int, default=0, help="list the N slowest imports (self time) per entry point")
+    args = parser.parse_args()
+
+    failures = 0
+    print(f"{'entry point':<24}{'ms':>10}{'budget':>10}  status")
+    for entry in args.entry_points or list(ENTRY_POINTS):
+        modules, budget, forbidden = ENTRY_POINTS[entry]
+        budget *= args.scale
+        try:
+            total, rows = measure(modules)
+        except RuntimeError as e:
+            print(f"{entry:<24}{'-':>10}{budget:>10.0f}  ERROR {e}")
+            failures += 1
+            continue
+        loaded = {name.strip() for _, _, name in rows}
+        leaked = sorted(m for m in forbidden if m in loaded)
+        status = "ok"
+        if total > budget:
+            status = "OVER BUDGET"
+        if leaked:
+            status = (status + ", " if status != "ok" else "") + "imports " + ", ".join(leaked)
+        failures += status != "ok"
+        print(f"{entry:<24}{total:>10.1f}{budget:>10.0f}  {status}")
+        for self_ms, cumulative_ms, name in sorted(rows, reverse=True)[:args.top]:
+            print(f"    {self_ms:>9.1f} self {cumulative_ms:>9.1f} cum  {name.strip()}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Load/save latency of each storage backend at several portfolio sizes.
+
+    python bench_storage.py                  # json, sqlite, parquet (if pyarrow is installed)
+    python bench_storage.py --gsheets        # also the live Google Sheet (writes Assets_bench etc.)
+    python bench_storage.py --sizes 10 1000  # custom row counts
+
+Each size means that many holdings and that many ledger transactions.
+"""
+import argparse
+import os
+import random
+import shutil
+import statistics
+import tempfile
+import time
+from storage_backends import JSONBackend, SQLiteBackend, ParquetBackend, GSheetsBackend, empty_data
+
+BENCH_USER = "bench"
+
+
+def make_portfolio(rows: int, seed: int = 0):
+    rng = random.Random(seed)
+    data = empty_data()
+    data["assets"] = [{
+        "ticker": f"T{i:06d}", "quantity": rng.uniform(1, 500), "avg_price": rng.uniform(5, 900),
+        "asset_class": rng.choice(["Stock", "ETF", "Crypto"]), "sector": rng.choice(["Tech", "Energy", "Financials"])
+    } for i in range(rows)]
+    data["transactions"] = [{
+        "date": f"20{10 + i % 15:02d}-{1 + i % 12:02d}-{1 + i % 28:02d}", "type": rng.choice(["BUY", "SELL"]),
+        "ticker": f"T{rng.randrange(max(rows, 1)):06d}", "quantity": rng.uniform(1, 50), "price": rng.uniform(5, 900),
+        "fee": 1.0, "amount": 0.0, "currency": "USD", "to_amount": 0.0, "to_currency": ""
+    } for i in range(rows)]
+    data["settings"]["section_labels"] = {"global_intel": "NEWS"}
+    data["settings"]["risk_inputs"] = {"roi": 0.0, "volatility": 0.0, "risk_free_rate": 4.5}
+    return data
+
+
+def time_call(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark portfolio storage backends.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1000, 100000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--gsheets", action="store_true", help="include the live Google Sheet (slow, uses API quota)")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_storage_")
+    backends = [JSONBackend(workdir), SQLiteBackend(os.path.join(workdir, "bench.db"))]
+    try:
+        backends.append(ParquetBackend(os.path.join(workdir, "parquet")))
+    except ImportError as e:
+        print(f"parquet skipped: {e}")
+    if args.gsheets:
+        backends.append(GSheetsBackend())
+
+    print(f"{'backend':<10}{'rows':>10}{'save ms':>12}{'load ms':>12}")
+    try:
+        for rows in args.sizes:
+            data = make_portfolio(rows)
+            for backend in backends:
+                # Sheets calls are rate limited: one sample is enough to see the order of magnitude
+                repeat = 1 if backend.name == "gsheets" else args.repeat
+                save_ms = time_call(lambda: backend.save(BENCH_USER, data), repeat)
+                load_ms = time_call(lambda: backend.load(BENCH_USER), repeat)
+                loaded = backend.load(BENCH_USER)
+                assert len(loaded["assets"]) == rows and len(loaded["transactions"]) == rows, backend.name
+                print(f"{backend.name:<10}{rows:>10}{save_ms:>12.1f}{load_ms:>12.1f}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+import pandas as pd
+import numpy as np
+import os
+import time
+from typing import Dict, List
+from transaction_ledger import TransactionLedger
+
+# yfinance is imported in refresh(), only when stale actions are actually downloaded.
+
+CORPORATE_ACTIONS_FILE = os.path.join(".cache", "corporate_actions.pkl")
+
+
+def extract_price_field(data: pd.DataFrame, field: str, tickers: List[str]) -> pd.DataFrame:
+    """
+    Pulls one field ('Close', 'Dividends', 'Stock Splits', ...) out of a yf.download result
+    as a date x ticker frame, whatever column layout the installed yfinance returns.
+    """
+    if data is None or data.empty:
+        return pd.DataFrame()
+    if isinstance(data.columns, pd.MultiIndex):
+        if field in data.columns.get_level_values(0):
+            out = data[field]
+        elif field in data.columns.get_level_values(1):
+            out = data.xs(field, axis=1, level=1)
+        else:
+            return pd.DataFrame()
+        if isinstance(out, pd.Series):
+            out = out.to_frame(name=tickers[0])
+    else:
+        if field not in data.columns:
+            return pd.DataFrame()
+        out = data[[field]].copy()
+        out.columns = tickers[:1]
+    return out.reindex(columns=[t for t in tickers if t in out.columns])
+
+
+class CorporateActions:
+    """
+    Persistent per-ticker cache of dividends and splits.
+    Stale tickers are refreshed together in one bulk yf.download(actions=True) at most once a day,
+    fetching only the window since the last refresh for tickers already known.
+    """
+    REFRESH_INTERVAL = 86400  # 1 day in seconds
+    OVERLAP_DAYS = 7          # re-read a few days back to catch late-posted actions
+
+    def __init__(self, path=CORPORATE_ACTIONS_FILE):
+        self.path = path
+        # {ticker: {"dividends": Series, "splits": Series, "fetched_at": epoch, "last_date": Timestamp}}
+        self._actions: Dict[str, Dict] = {}
+        self._failed_at: Dict[str, float] = {}  # ticker -> last failed fetch (retried a day later, not on every call)
+        self._load()
+
+    def _load(self):
+        try:
+            if os.path.exists(self.path):
+                self._actions = pd.read_pickle(self.path)
+        except Exception as e:
+            print(f"Corporate actions cache unreadable, starting fresh: {e}")
+            self._actions = {}
+
+    def _save(self):
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            pd.to_pickle(self._actions, self.path)
+        except Exception as e:
+            print(f"Corporate actions cache write failed: {e}")
+
+    def stale_tickers(self, tickers) -> List[str]:
+        now = time.time()
+        return [t for t in tickers
+                if (t not in self._actions or now - self._actions[t]["fetched_at"] > self.REFRESH_INTERVAL)
+                and now - self._failed_at.get(t, 0.0) > self.REFRESH_INTERVAL]
+
+    def refresh(self, tickers, force=False):
+        """Bulk-refreshes stale tickers: full history for new ones, an incremental window for known ones."""
+        tickers = [t for t in dict.fromkeys(tickers) if t and t != 'CASH']
+        stale = tickers if force else self.stale_tickers(tickers)
+        if not stale:
+            return
+
+        new = [t for t in stale if t not in self._actions]
+        known = [t for t in stale if t in self._actions]
+        batches = []
+        if new:
+            batches.append((new, {"period": "max"}))
+        if known:
+            since = min(self._actions[t]["last_date"] for t in known) - pd.Timedelta(days=self.OVERLAP_DAYS)
+            batches.append((known, {"start": since.strftime('%Y-%m-%d')}))
+
+        now = time.time()
+        for batch, window in batches:
+            try:
+                import yfinance as yf
+                data = yf.download(batch, actions=True, auto_adjust=False, progress=False, **window)
+            except Exception as e:
+                print(f"Corporate actions fetch error: {e}")
+                # Keep serving what is cached; retry after REFRESH_INTERVAL
+                self._failed_at.update(dict.fromkeys(batch, now))
+                continue
+            dividends = extract_price_field(data, 'Dividends', batch)
+            splits = extract_price_field(data, 'Stock Splits', batch)
+            last_date = pd.Timestamp(data.index[-1]) if not data.empty else pd.Timestamp.now().normalize()
+            for t in batch:
+                entry = self._actions.get(t, {"dividends": pd.Series(dtype=float), "splits": pd.Series(dtype=float)})
+                for key, frame in (("dividends", dividends), ("splits", splits)):
+                    if t in frame.columns:
+                        fresh = frame[t]
+                        fresh = fresh[fresh.fillna(0) != 0]
+                        entry[key] = fresh.combine_first(entry[key]).sort_index()
+                entry["fetched_at"] = now
+                entry["last_date"] = last_date
+                self._actions[t] = entry
+        self._save()
+
+    def _panel(self, key, tickers, index=None) -> pd.DataFrame:
+        self.refresh(tickers)
+        series = {t: self._actions[t][key] for t in tickers if t in self._actions and not self._actions[t][key].empty}
+        panel = pd.DataFrame(series).reindex(columns=list(tickers))
+        if index is not None:
+            panel = snap_to_index(panel, index)
+        return panel
+
+    def split_series(self, ticker) -> pd.Series:
+        self.refresh([ticker])
+        return self._actions.get(ticker, {}).get("splits", pd.Series(dtype=float))
+
+    def dividends(self, tickers, index=None) -> pd.DataFrame:
+        """date x ticker cash dividend per share (sparse; 0/NaN where none)."""
+        return self._panel("dividends", tickers, index)
+
+    def splits(self, tickers, index=None) -> pd.DataFrame:
+        """date x ticker split ratio (e.g. 4.0 for a 4:1 split)."""
+        return self._panel("splits", tickers, index)
+
+
+def snap_to_index(events: pd.DataFrame, index) -> pd.DataFrame:
+    """Moves sparse dated events onto the next date of `index` (weekend actions land on Monday)."""
+    index = pd.DatetimeIndex(index)
+    if events.empty or len(index) == 0:
+        return pd.DataFrame(0.0, index=index, columns=events.columns)
+    events = events.copy()
+    events.index = pd.DatetimeIndex(events.index).tz_localize(None) if getattr(events.index, 'tz', None) else pd.DatetimeIndex(events.index)
+    pos = index.searchsorted(events.index)
+    events = events[pos < len(index)]
+    events.index = index[pos[pos < len(index)]]
+    return events.groupby(level=0).sum().reindex(index).fillna(0.0)
+
+
+class TotalReturnEngine:
+    """
+    Builds consistent price-return and total-return series from raw (split-adjusted, not
+    dividend-adjusted) closes plus the cached corporate actions, for every holding at once.
+    """
+    def __init__(self, actions: CorporateActions = None):
+        self.actions = actions or CorporateActions()
+
+    def build(self, close: pd.DataFrame):
+        """
+        Returns (total_return_index, price_return_index), both starting at 1.0.
+        TR_t = TR_{t-1} * (Close_t + Div_t) / Close_{t-1}
+        """
+        if close.empty:
+            return pd.DataFrame(), pd.DataFrame()
+        close = close.ffill()
+        dividends = self.actions.dividends(list(close.columns), close.index).reindex(columns=close.columns).fillna(0.0)
+        prev = close.shift(1)
+        pr_ret = (close / prev - 1).fillna(0.0)
+        tr_ret = ((close + dividends) / prev - 1).fillna(0.0)
+        return (1 + tr_ret).cumprod(), (1 + pr_ret).cumprod()
+
+    def total_return_prices(self, close: pd.DataFrame) -> pd.DataFrame:
+        """Dividend-reinvested price levels, scaled so the last value equals the last close."""
+        tr_index, _ = self.build(close)
+        if tr_index.empty:
+            return tr_index
+        scale = close.ffill().iloc[-1] / tr_index.iloc[-1]
+        return (tr_index * scale).where(close.ffill().notna())
+
+    def split_adjusted_ledger(self, ledger):
+        """
+        Restates trade quantities in today's split-adjusted shares (price divided by the same
+        factor, so trade amounts are unchanged), matching Yahoo's backward-adjusted closes.
+        A trade on date d is multiplied by the product of all split ratios dated after d.
+        """
+        trades = ledger.df["type"].isin(["BUY", "SELL"])
+        if not trades.any():
+            return ledger
+        self.actions.refresh(ledger.tickers)
+        df = ledger.df.copy()
+        factor = pd.Series(1.0, index=df.index)
+        for t in ledger.tickers:
+            splits = self.actions.split_series(t)
+            splits = splits[splits > 0]
+            if splits.empty:
+                continue
+            rows = trades & (df["ticker"] == t)
+            split_dates = pd.DatetimeIndex(splits.index).tz_localize(None) if splits.index.tz is not None else pd.DatetimeIndex(splits.index)
+            # cum_after[i] = product of splits i..end; trades after the last split get 1.0
+            cum_after = np.append(splits.to_numpy()[::-1].cumprod()[::-1], 1.0)
+            factor[rows] = cum_after[split_dates.searchsorted(df.loc[rows, "date"], side="right")]
+        df["quantity"] = df["quantity"] * factor
+        df["price"] = df["price"] / factor
+        return TransactionLedger(df)
+
+    def dividend_transactions(self, ledger, index) -> List[Dict]:
+        """
+        DIVIDEND cash credits implied by the ledger's holdings on each ex-date
+        (split-adjusted shares held the day before x dividend per share), skipping ones already recorded.
+        Each is credited in the currency the ticker trades in (its latest BUY/SELL in the ledger).
+        """
+        tickers = ledger.tickers
+        if ledger.empty or not tickers:
+            return []
+        index = pd.DatetimeIndex(index)
+        dividends = self.actions.dividends(tickers, index).reindex(columns=tickers).fillna(0.0)
+        holdings = self.split_adjusted_ledger(ledger).holdings_matrix(index).reindex(columns=tickers).fillna(0.0)
+        credits = (holdings.shift(1).fillna(0.0) * dividends).stack()
+        credits = credits[credits > 0]
+        if credits.empty:
+            return []
+        recorded = ledger.df[ledger.df["type"] == "DIVIDEND"]
+        recorded_keys = set(zip(recorded["date"], recorded["ticker"]))
+        trades = ledger.df[ledger.df["type"].isin(["BUY", "SELL"])].sort_values("date", kind="stable")
+        currencies = trades.groupby("ticker")["currency"].last().to_dict()
+        return [
+            {"date": d.strftime('%Y-%m-%d'), "type": "DIVIDEND", "ticker": t, "amount": float(v),
+             "currency": currencies.get(t, "USD")}
+            for (d, t), v in credits.items() if (d, t) not in recorded_keys
+        ]
+
+    def credit_dividends(self, ledger, index):
+        """Copy of the ledger with implied dividend credits added to its cash."""
+        txns = self.dividend_transactions(ledger, index)
+        if not txns:
+            return ledger
+        return TransactionLedger(pd.concat([ledger.df, TransactionLedger(txns).df], ignore_index=True))
@@ -0,0 +1,117 @@
+import threading
+import pandas as pd
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from fred_data import get_fred_data
+
+MAX_SCOPES = 16  # memoized parameter sets (e.g. distinct start dates) kept per node
+
+
+def content_version(value: Any) -> Hashable:
+    """Version of a loaded value by content: the same data always gets the same version."""
+    if isinstance(value, (pd.Series, pd.DataFrame)):
+        columns = tuple(map(str, value.columns)) if isinstance(value, pd.DataFrame) else (str(value.name),)
+        return value.shape, columns, int(pd.util.hash_pandas_object(value, index=True).sum())
+    return hash(value)
+
+
+class _Node:
+    def __init__(self, name: str, inputs: List[str], fn: Optional[Callable], load: Optional[Callable],
+                 version: Optional[Callable]):
+        self.name = name
+        self.inputs = inputs
+        self.fn = fn            # derived: fn(*input values)
+        self.load = load        # source: load(**params)
+        self.version = version  # source: version(**params), cheap check without loading (optional)
+
+
+class SeriesGraph:
+    """
+    Derived series declared once from their inputs and evaluated lazily.
+    Sources are input series: `load(**params)` returns one, and `version(**params)`, if given,
+    tells whether it changed without loading it (otherwise the loaded data is hashed).
+    A derived node's version is the tuple of its inputs' versions, so it is recomputed only
+    when an input actually got new data; intermediates (CPI YoY, BTC per fiat) are shared by
+    every node built on them. Params (e.g. start=...) are passed down to the sources and
+    memoized per distinct value; sources that do not depend on them take **_ and ignore them.
+    Values are shared with the memo: copy before mutating.
+    """
+    def __init__(self):
+        self._nodes: Dict[str, _Node] = {}
+        self._memo: Dict[str, Dict[Tuple, Tuple[Hashable, Any]]] = {}
+        self._lock = threading.Lock()
+        self.evaluations = 0  # node computations / source loads actually run (for benchmarks / tests)
+
+    def _register(self, node: _Node):
+        with self._lock:
+            self._nodes[node.name] = node
+            self._memo.pop(node.name, None)
+
+    def source(self, name: str, load: Callable[..., Any], version: Optional[Callable[..., Hashable]] = None):
+        self._register(_Node(name, [], None, load, version))
+
+    def derive(self, name: str, inputs: List[str], fn: Callable[..., Any]):
+        self._register(_Node(name, list(inputs), fn, None, None))
+
+    def get(self, name: str, **params) -> Any:
+        return self._evaluate(name, params)[1]
+
+    def version(self, name: str, **params) -> Hashable:
+        return self._evaluate(name, params)[0]
+
+    def _memoized(self, name: str, scope: Tuple, version: Hashable) -> Optional[Tuple[Hashable, Any]]:
+        with self._lock:
+            hit = self._memo.get(name, {}).get(scope)
+        return hit if hit is not None and hit[0] == version else None
+
+    def _remember(self, name: str, scope: Tuple, version: Hashable, value: Any) -> Tuple[Hashable, Any]:
+        with self._lock:
+            self.evaluations += 1
+            memo = self._memo.setdefault(name, {})
+            memo.pop(scope, None)
+            memo[scope] = (version, value)
+            while len(memo) > MAX_SCOPES:
+                del memo[next(iter(memo))]  # oldest parameter set first
+        return version, value
+
+    def _evaluate(self, name: str, params: Dict[str, Any]) -> Tuple[Hashable, Any]:
+        node = self._nodes[name]
+        scope = tuple(sorted((k, str(v)) for k, v in params.items()))
+        if node.fn is None:
+            if node.version is not None:
+                version = node.version(**params)
+                hit = self._memoized(name, scope, version)
+                return hit or self._remember(name, scope, version, node.load(**params))
+            value = node.load(**params)
+            version = content_version(value)
+            return self._memoized(name, scope, version) or self._remember(name, scope, version, value)
+
+        evaluated = [self._evaluate(i, params) for i in node.inputs]
+        version = tuple(v for v, _ in evaluated)
+        hit = self._memoized(name, scope, version)
+        return hit or self._remember(name, scope, version, node.fn(*[value for _, value in evaluated]))
+
+
+def add_fred_sources(graph: SeriesGraph, series_ids: List[str]):
+    """
+    FRED series as graph sources, versioned by FredData (bumped only when a reload brings new
+    or revised observations). Callers make sure the history they need is loaded
+    (FredData.refresh) before reading a derived node.
+    """
+    for series_id in series_ids:
+        graph.source(series_id,
+                     load=lambda series_id=series_id, **_: get_fred_data().series(series_id),
+                     version=lambda series_id=series_id, **_: get_fred_data().version(series_id))
+
+
+_GRAPH: Optional[SeriesGraph] = None
+_GRAPH_LOCK = threading.Lock()
+
+
+def get_series_graph() -> SeriesGraph:
+    """The process-wide graph (nodes are declared by the page modules at import)."""
+    global _GRAPH
+    with _GRAPH_LOCK:
+        if _GRAPH is None:
+            _GRAPH = SeriesGraph()
+        return _GRAPH
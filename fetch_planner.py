@@ -0,0 +1,121 @@
+import threading
+import time
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from fx_panel import download_closes
+
+# Cost of one extra upstream request, in ticker-days of history: a section's tickers join an
+# earlier-starting batch when the additional history that costs is below this.
+REQUEST_COST = 2000
+
+
+class PriceNeed:
+    """Daily closes a page section will read: `tickers` from `start` on."""
+    def __init__(self, tickers: Iterable[str], start):
+        self.tickers = list(dict.fromkeys(tickers))
+        self.start = pd.Timestamp(start).normalize()
+
+
+def plan_requests(needs: List[PriceNeed], request_cost: int = REQUEST_COST) -> List[Tuple[List[str], pd.Timestamp]]:
+    """
+    Merges section needs into as few batched downloads as is worthwhile: [(tickers, start), ...].
+    Needs are taken earliest start first; tickers already in a batch are covered by it (it starts
+    earlier), the rest join the latest batch unless the extra history exceeds request_cost.
+    """
+    batches: List[Tuple[List[str], pd.Timestamp]] = []
+    planned = set()
+    for need in sorted(needs, key=lambda n: n.start):
+        missing = [t for t in need.tickers if t not in planned]
+        if not missing:
+            continue
+        planned.update(missing)
+        if batches and (need.start - batches[-1][1]).days * len(missing) <= request_cost:
+            batches[-1][0].extend(missing)
+        else:
+            batches.append((missing, need.start))
+    return batches
+
+
+class PagePrices:
+    """
+    Closes a page's sections share, loaded before the page renders.
+    `prefetch(needs)` plans the needs that are not covered yet and downloads the batches
+    concurrently; sections then read `closes(tickers, start)` (None when not covered, e.g. a
+    date picked inside a fragment after the page ran: the section downloads it itself).
+    Everything expires after TTL, the same as views.common.download_prices.
+    `fetcher(tickers, start)` is injectable for tests / offline runs.
+    """
+    TTL = 900
+
+    def __init__(self, fetcher: Callable[..., pd.DataFrame] = download_closes, max_workers: int = 4):
+        self.fetcher = fetcher
+        self.max_workers = max_workers
+        self.requests = 0  # upstream downloads (for benchmarks / tests)
+        self._closes = pd.DataFrame()
+        self._covered: Dict[str, pd.Timestamp] = {}  # ticker -> earliest date loaded
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    def _expired(self) -> bool:
+        return time.time() - self._loaded_at > self.TTL
+
+    def _missing(self, need: PriceNeed) -> List[str]:
+        return [t for t in need.tickers if t not in self._covered or self._covered[t] > need.start]
+
+    def prefetch(self, needs: List[PriceNeed]) -> int:
+        """Loads whatever `needs` are not covered yet; returns the number of requests made."""
+        with self._lock:
+            if self._expired():
+                self._closes, self._covered = pd.DataFrame(), {}
+            rebuilt = not self._covered  # the expiry clock starts with the first load
+            uncovered = [PriceNeed(self._missing(n), n.start) for n in needs if self._missing(n)]
+            if not uncovered:
+                return 0
+            batches = plan_requests(uncovered)
+            self.requests += len(batches)
+        # Downloads run outside the lock: other sessions keep reading what is already loaded
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(batches))) as pool:
+            results = list(pool.map(lambda b: self._fetch(*b), batches))
+        with self._lock:
+            for (tickers, start), fetched in zip(batches, results):
+                if fetched is None:
+                    continue
+                fetched = fetched.dropna(how="all")
+                self._closes = fetched if self._closes.empty else fetched.combine_first(self._closes)
+                # A symbol that failed inside a batch comes back all-NaN: leave it uncovered so the
+                # section falls back to its own download instead of an empty column until expiry
+                for t in tickers:
+                    if t in fetched.columns and fetched[t].notna().any():
+                        self._covered[t] = min(start, self._covered.get(t, start))
+            if rebuilt:
+                self._loaded_at = time.time()
+        return len(batches)
+
+    def _fetch(self, tickers: List[str], start: pd.Timestamp) -> Optional[pd.DataFrame]:
+        try:
+            return self.fetcher(tickers, start)
+        except Exception as e:
+            print(f"Batched price download failed ({len(tickers)} tickers): {e}")
+            return None
+
+    def closes(self, tickers: List[str], start) -> Optional[pd.DataFrame]:
+        """Closes of `tickers` from `start` (rows where any of them traded), or None if not loaded."""
+        with self._lock:
+            if self._expired() or self._missing(PriceNeed(tickers, start)):
+                return None
+            frame = self._closes.reindex(columns=list(dict.fromkeys(tickers)))
+        return frame[frame.index >= pd.Timestamp(start)].dropna(how="all")
+
+
+_PAGES: Dict[str, PagePrices] = {}
+_PAGES_LOCK = threading.Lock()
+
+
+def get_page_prices(page: str) -> PagePrices:
+    """Process-wide PagePrices of one page (market data is the same for every session)."""
+    with _PAGES_LOCK:
+        if page not in _PAGES:
+            _PAGES[page] = PagePrices()
+        return _PAGES[page]
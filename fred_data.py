@@ -0,0 +1,120 @@
+import threading
+import time
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from fred_store import FredStore, get_fred_store
+
+TAIL_LENGTH = 15          # points in the radar mini charts
+
+
+class FredTail:
+    """Latest value, change from the previous observation and the mini-chart tail of one series."""
+    def __init__(self, series: pd.Series, length: int = TAIL_LENGTH):
+        self.latest = float(series.iloc[-1])
+        self.prev = float(series.iloc[-2]) if len(series) > 1 else self.latest
+        self.delta = self.latest - self.prev
+        self.tail = series.tail(length)
+
+
+def _changed(previous: pd.Series, series: pd.Series) -> bool:
+    """New data in a reload: a new or dropped latest date, older history, or revised overlapping values."""
+    if series.index[-1] != previous.index[-1] or series.index[0] < previous.index[0]:
+        return True
+    common = previous.index.intersection(series.index)
+    return len(common) != len(previous) or not previous.loc[common].equals(series.loc[common])
+
+
+class FredData:
+    """
+    Process-wide FRED cache shared by all sessions, in front of the local FredStore mirror.
+    `get` loads every missing or expired series of a request in one parallel batch; each series
+    expires on its own release schedule (fred_store.next_release_ttl), so a Macro page rerun
+    normally touches neither the store nor upstream. Radar tails are computed once per load.
+    """
+    def __init__(self, store: Optional[FredStore] = None, max_workers: int = 16):
+        self.store = store
+        self.max_workers = max_workers
+        # series_id -> (expires_at, start loaded from, series, tail)
+        self._cache: Dict[str, Tuple[float, pd.Timestamp, pd.Series, FredTail]] = {}
+        self._versions: Dict[str, int] = {}  # series_id -> bumped when a reload changes its data
+        self._lock = threading.Lock()
+
+    def _stale(self, series_ids: List[str], start: pd.Timestamp) -> List[str]:
+        now = time.time()
+        with self._lock:
+            return [s for s in dict.fromkeys(series_ids)
+                    if s not in self._cache or self._cache[s][0] <= now or self._cache[s][1] > start]
+
+    def _load(self, series_id: str, start: pd.Timestamp):
+        with self._lock:
+            cached = self._cache.get(series_id)
+        if cached is not None:
+            start = min(start, cached[1])  # a reload never drops history an earlier caller loaded
+        try:
+            return series_id, start, self.store.load(series_id, start)
+        except Exception as e:
+            print(f"FRED fetch failed for {series_id}: {e}")
+            return series_id, start, None
+
+    def refresh(self, series_ids: List[str], start: datetime):
+        """Loads the series in `series_ids` that are missing, expired or too short, concurrently."""
+        start = pd.Timestamp(start)
+        stale = self._stale(series_ids, start)
+        if not stale:
+            return
+        if self.store is None:
+            self.store = get_fred_store()
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(stale))) as pool:
+            results = list(pool.map(lambda s: self._load(s, start), stale))
+        with self._lock:
+            for series_id, loaded_from, loaded in results:
+                if loaded is None or loaded[0].empty:
+                    continue  # keep serving the previous copy (if any) on failure
+                series, expires_at = loaded
+                previous = self._cache.get(series_id)
+                if previous is None or _changed(previous[2], series):
+                    self._versions[series_id] = self._versions.get(series_id, 0) + 1
+                self._cache[series_id] = (expires_at, loaded_from, series, FredTail(series))
+
+    def get(self, series_ids: List[str], start: datetime) -> pd.DataFrame:
+        """Series side by side (outer-joined on date, not forward-filled) from `start`."""
+        self.refresh(series_ids, start)
+        with self._lock:
+            columns = [self._cache[s][2] for s in series_ids if s in self._cache]
+        if not columns:
+            return pd.DataFrame()
+        frame = pd.concat(columns, axis=1)
+        return frame[frame.index >= pd.Timestamp(start)]
+
+    def tails(self, series_ids: List[str], start: datetime) -> Dict[str, FredTail]:
+        """{series_id: FredTail} for the radar (series that could not be loaded are omitted)."""
+        self.refresh(series_ids, start)
+        with self._lock:
+            return {s: self._cache[s][3] for s in series_ids if s in self._cache}
+
+    def series(self, series_id: str) -> pd.Series:
+        """The loaded history of one series (empty if it has not been loaded)."""
+        with self._lock:
+            entry = self._cache.get(series_id)
+        return entry[2] if entry is not None else pd.Series(dtype=float, name=series_id)
+
+    def version(self, series_id: str) -> int:
+        """Data version of a loaded series (0 = not loaded); unchanged by reloads that bring nothing new."""
+        with self._lock:
+            return self._versions.get(series_id, 0)
+
+
+_FRED: Optional[FredData] = None
+_FRED_LOCK = threading.Lock()
+
+
+def get_fred_data() -> FredData:
+    """The process-wide FredData instance."""
+    global _FRED
+    with _FRED_LOCK:
+        if _FRED is None:
+            _FRED = FredData()
+        return _FRED
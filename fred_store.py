@@ -0,0 +1,206 @@
+import sqlite3
+import os
+import time
+import threading
+import pandas as pd
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional, Tuple
+
+FRED_DB_FILE = os.path.join(".cache", "fred.db")
+
+# Observation-date convention of FRED series by frequency (median spacing in days):
+# daily/weekly observations are dated at the end of their period, monthly/quarterly ones at the
+# start (UNRATE 2026-09-01 = September, published in October).
+PERIOD_END_MAX_DAYS = 8
+
+MIN_TTL = 3600            # recheck at least this long after a fetch (and hourly once a release is due)
+MAX_TTL = 24 * 3600       # refetch at least daily so revisions are picked up
+
+
+def download_series(series_id: str, start: datetime, end: Optional[datetime] = None) -> pd.Series:
+    """One FRED series from `start` (pandas_datareader imported here: heavy, Macro page only)."""
+    import pandas_datareader.data as web
+    frame = web.DataReader(series_id, "fred", start, end or datetime.now())
+    return frame[series_id].dropna()
+
+
+def _spacing(series: pd.Series) -> timedelta:
+    return pd.Series(series.index).diff().median() if len(series) > 1 else timedelta(days=1)
+
+
+def next_release_ttl(series: pd.Series, now: Optional[datetime] = None) -> float:
+    """
+    Seconds until the next observation can be published, from the series' own spacing.
+    Daily/weekly: the period after the last observation has to end first. Monthly/quarterly
+    (dated at the period start): the period after the last one has to end, i.e. two periods on.
+    Overdue releases are rechecked every MIN_TTL; nothing is kept longer than MAX_TTL.
+    """
+    now = now or datetime.now()
+    if len(series) < 2:
+        return MIN_TTL
+    step = _spacing(series)
+    periods = 1 if step <= timedelta(days=PERIOD_END_MAX_DAYS) else 2
+    earliest = series.index[-1] + step * periods
+    return float(min(max((earliest - pd.Timestamp(now)).total_seconds(), MIN_TTL), MAX_TTL))
+
+
+class FredStore:
+    """
+    Local SQLite mirror of FRED series, keyed by series ID.
+    A series is downloaded in full once; afterwards a sync (only when its release-aware expiry
+    has passed) re-reads just the last few periods (REVISION_PERIODS, so revisions are seen)
+    plus anything new, and an earlier start date back-fills only the missing older span.
+    Every value is stored with its vintage (the day it was first seen with that value), so a
+    revised observation keeps its earlier value and reads can be made as of a past day.
+    `fetcher(series_id, start, end)` is injectable for tests / offline runs.
+    """
+    REVISION_PERIODS = 3
+    MIN_REVISION_WINDOW = timedelta(days=14)
+
+    def __init__(self, path=FRED_DB_FILE, fetcher: Callable[..., pd.Series] = download_series):
+        self.path = path
+        self.fetcher = fetcher
+        self.requests = 0  # upstream fetches (for benchmarks / tests)
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._init_schema()
+
+    def _init_schema(self):
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS observations (
+                    series_id TEXT NOT NULL, date TEXT NOT NULL, vintage TEXT NOT NULL, value REAL NOT NULL,
+                    PRIMARY KEY (series_id, date, vintage)
+                ) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS series (
+                    series_id TEXT PRIMARY KEY, covered_from TEXT NOT NULL,
+                    checked_at REAL NOT NULL, expires_at REAL NOT NULL
+                ) WITHOUT ROWID;
+            """)
+
+    # --- Reading ---
+
+    def read(self, series_id: str, start=None, as_of: Optional[str] = None) -> pd.Series:
+        """Latest vintage of every observation from `start` (as known on day `as_of`, if given)."""
+        start = pd.Timestamp(start).strftime("%Y-%m-%d") if start is not None else ""
+        with self._lock:
+            rows = self._conn.execute(
+                """SELECT o.date, o.value FROM observations o
+                   WHERE o.series_id = ? AND o.date >= ? AND o.vintage = (
+                       SELECT MAX(vintage) FROM observations
+                       WHERE series_id = o.series_id AND date = o.date AND vintage <= ?)
+                   ORDER BY o.date""",
+                (series_id, start, as_of or "9999-12-31")
+            ).fetchall()
+        return pd.Series([r[1] for r in rows], index=pd.DatetimeIndex([r[0] for r in rows], name="DATE"),
+                         name=series_id, dtype=float)
+
+    def vintages(self, series_id: str, date: str) -> pd.Series:
+        """Every value an observation has had, indexed by vintage (revision history)."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT vintage, value FROM observations WHERE series_id = ? AND date = ? ORDER BY vintage",
+                (series_id, date)
+            ).fetchall()
+        return pd.Series([r[1] for r in rows], index=[r[0] for r in rows], name=series_id, dtype=float)
+
+    def _recent(self, series_id: str) -> pd.Series:
+        """The last few years of a stored series (enough to see its spacing and last observation)."""
+        return self.read(series_id, pd.Timestamp.now() - timedelta(days=3 * 366))
+
+    def _meta(self, series_id: str) -> Optional[Tuple[str, float, float]]:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT covered_from, checked_at, expires_at FROM series WHERE series_id = ?", (series_id,)
+            ).fetchone()
+
+    # --- Writing ---
+
+    def _merge(self, series_id: str, fetched: pd.Series, vintage: str) -> int:
+        """Stores observations that are new or whose value changed, as vintage `vintage`."""
+        if fetched.empty:
+            return 0
+        current = self.read(series_id, fetched.index[0])
+        known = current.reindex(fetched.index)
+        changed = fetched[known.isna() | ((fetched - known).abs() > 1e-12)]
+        rows = [(series_id, d.strftime("%Y-%m-%d"), vintage, float(v)) for d, v in changed.items()]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO observations (series_id, date, vintage, value) VALUES (?, ?, ?, ?)", rows
+            )
+        return len(rows)
+
+    def _spans(self, series_id: str, start: pd.Timestamp) -> List[Tuple[pd.Timestamp, Optional[pd.Timestamp]]]:
+        """(start, end) ranges that have to come from upstream for a read from `start`."""
+        meta = self._meta(series_id)
+        if meta is None:
+            return [(start, None)]
+        covered_from, _, expires_at = meta
+        spans = []
+        if start < pd.Timestamp(covered_from):
+            spans.append((start, pd.Timestamp(covered_from)))
+        if expires_at <= time.time():
+            stored = self._recent(series_id)
+            if stored.empty:
+                spans.append((pd.Timestamp(covered_from), None))
+            else:
+                window = max(_spacing(stored) * self.REVISION_PERIODS, self.MIN_REVISION_WINDOW)
+                spans.append((max(stored.index[-1] - window, pd.Timestamp(covered_from)), None))
+        return spans
+
+    def sync(self, series_id: str, start) -> float:
+        """
+        Brings the stored series up to date for a read from `start`; returns when it expires.
+        On upstream failure the stored copy is kept and rechecked after MIN_TTL.
+        """
+        start = pd.Timestamp(start).normalize()
+        spans = self._spans(series_id, start)
+        meta = self._meta(series_id)
+        if not spans:
+            return meta[2]
+        vintage = datetime.now().strftime("%Y-%m-%d")
+        try:
+            for lo, hi in spans:
+                with self._lock:
+                    self.requests += 1
+                self._merge(series_id, self.fetcher(series_id, lo, hi), vintage)
+        except Exception as e:
+            print(f"FRED sync failed for {series_id}, serving stored data: {e}")
+            if meta is None:
+                raise
+            expires_at = time.time() + MIN_TTL
+            with self._lock, self._conn:
+                self._conn.execute("UPDATE series SET expires_at = ? WHERE series_id = ?", (expires_at, series_id))
+            return expires_at
+        covered_from = min(start, pd.Timestamp(meta[0])) if meta else start
+        now = time.time()
+        expires_at = now + next_release_ttl(self._recent(series_id))
+        with self._lock, self._conn:
+            self._conn.execute(
+                """INSERT INTO series (series_id, covered_from, checked_at, expires_at) VALUES (?, ?, ?, ?)
+                   ON CONFLICT(series_id) DO UPDATE SET covered_from = excluded.covered_from,
+                   checked_at = excluded.checked_at, expires_at = excluded.expires_at""",
+                (series_id, covered_from.strftime("%Y-%m-%d"), now, expires_at)
+            )
+        return expires_at
+
+    def load(self, series_id: str, start) -> Tuple[pd.Series, float]:
+        """(series from `start`, expiry timestamp): syncs first, then reads the local copy."""
+        expires_at = self.sync(series_id, start)
+        return self.read(series_id, start), expires_at
+
+
+_STORE: Optional[FredStore] = None
+_STORE_LOCK = threading.Lock()
+
+
+def get_fred_store() -> FredStore:
+    """Process-wide store (one SQLite connection shared by every session)."""
+    global _STORE
+    with _STORE_LOCK:
+        if _STORE is None:
+            _STORE = FredStore()
+        return _STORE
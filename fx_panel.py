@@ -0,0 +1,108 @@
+import threading
+import time
+import pandas as pd
+from datetime import timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+# BTC, the dollar index and every USD cross the Bitcoin Standard page shows (units per USD)
+FX_CURRENCIES = ["CAD", "AUD", "CHF", "JPY", "CNY", "KRW"]
+FX_PANEL_TICKERS = ["BTC-USD", "DX-Y.NYB"] + [f"{c}=X" for c in FX_CURRENCIES]
+
+
+def download_closes(tickers: List[str], start: pd.Timestamp, end: Optional[pd.Timestamp] = None) -> pd.DataFrame:
+    """Daily closes of `tickers` in one yf.download (yfinance imported here, like views.common)."""
+    import yfinance as yf
+    raw = yf.download(tickers, start=start.strftime('%Y-%m-%d'), end=end.strftime('%Y-%m-%d') if end is not None else None,
+                      interval='1d', progress=False, auto_adjust=True)
+    if raw.empty:
+        return pd.DataFrame(columns=tickers)
+    closes = raw['Close']
+    if isinstance(closes, pd.Series):
+        closes = closes.to_frame(tickers[0])
+    return closes.reindex(columns=tickers)
+
+
+class PricePanel:
+    """
+    Daily close history of a fixed ticker set (BTC + FX), shared by every section and session.
+    The first read downloads all tickers in one request; later reads are served from memory.
+    Once REFRESH_AFTER has passed, only the last OVERLAP_DAYS are downloaded again (today's
+    price moves) and merged; a read from an earlier start back-fills just the older span.
+    Rows are the union of all tickers' trading days, not forward-filled (BTC trades on
+    weekends, FX does not): each consumer fills or drops gaps as its chart needs.
+    `version` is bumped only when a download changed the data (derived_series source version).
+    After a failed download (the first one included) no request is made for REFRESH_AFTER.
+    """
+    REFRESH_AFTER = 300
+    OVERLAP_DAYS = 7
+
+    def __init__(self, tickers: List[str], fetcher: Callable[..., pd.DataFrame] = download_closes):
+        self.tickers = list(tickers)
+        self.fetcher = fetcher
+        self.version = 0
+        self.requests = 0  # upstream downloads (for benchmarks / tests)
+        self._frame: Optional[pd.DataFrame] = None
+        self._start: Optional[pd.Timestamp] = None
+        self._checked_at = 0.0
+        self._failed_at = 0.0
+        self._lock = threading.Lock()
+
+    def _merge(self, fetched: pd.DataFrame):
+        fetched = fetched.dropna(how="all")
+        merged = fetched if self._frame is None else fetched.combine_first(self._frame)
+        merged = merged.reindex(columns=self.tickers).sort_index()
+        if self._frame is None or not merged.equals(self._frame):
+            self._frame = merged
+            self.version += 1
+
+    def ensure(self, start):
+        """Makes sure the panel covers `start` onward and is no older than REFRESH_AFTER."""
+        start = pd.Timestamp(start).normalize()
+        with self._lock:
+            if time.time() - self._failed_at <= self.REFRESH_AFTER:
+                return  # a download failed recently (possibly the first one): back off, serve what is loaded
+            try:
+                if self._frame is None:
+                    self.requests += 1
+                    self._merge(self.fetcher(self.tickers, start))
+                    self._start, self._checked_at = start, time.time()
+                    return
+                if start < self._start:
+                    self.requests += 1
+                    self._merge(self.fetcher(self.tickers, start, self._start + timedelta(days=1)))
+                    self._start = start
+                if time.time() - self._checked_at > self.REFRESH_AFTER:
+                    last = self._frame.index[-1] if not self._frame.empty else self._start
+                    self.requests += 1
+                    self._merge(self.fetcher(self.tickers, max(last - timedelta(days=self.OVERLAP_DAYS), self._start)))
+                    self._checked_at = time.time()
+            except Exception as e:
+                # Keep serving what is loaded; retry on the next read after REFRESH_AFTER
+                print(f"Price panel download failed: {e}")
+                self._checked_at = self._failed_at = time.time()
+
+    def closes(self, start=None) -> pd.DataFrame:
+        """Raw closes from `start` (everything loaded if None); shared frame, copy before mutating."""
+        if start is not None:
+            self.ensure(start)
+        with self._lock:
+            frame = self._frame if self._frame is not None else pd.DataFrame(columns=self.tickers, index=pd.DatetimeIndex([]))
+        return frame if start is None else frame[frame.index >= pd.Timestamp(start)]
+
+
+_PANELS: Dict[Tuple[str, ...], PricePanel] = {}
+_PANELS_LOCK = threading.Lock()
+
+
+def get_price_panel(tickers: List[str]) -> PricePanel:
+    """The process-wide panel of one ticker set (same set, same panel, whatever the order)."""
+    key = tuple(sorted(set(tickers)))
+    with _PANELS_LOCK:
+        if key not in _PANELS:
+            _PANELS[key] = PricePanel(list(key))
+        return _PANELS[key]
+
+
+def get_fx_panel() -> PricePanel:
+    """The process-wide BTC + FX panel."""
+    return get_price_panel(FX_PANEL_TICKERS)
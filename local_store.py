@@ -0,0 +1,187 @@
+import sqlite3
+import json
+import os
+import time
+import threading
+from typing import Dict, List, Any, Optional
+
+LOCAL_DB_FILE = os.path.join(".cache", "portfolio.db")
+
+
+class LocalStore:
+    """
+    Local SQLite (WAL) primary store for portfolio data.
+    Every mutation is appended to a journal and applied to the per-user state row in one
+    transaction, so reads never wait on Google Sheets and edits survive outages/restarts.
+    Google Sheets is a replica: `synced_version` / `remote_hash` / `synced_data` record what it last held.
+    Writers pass the version they started from (compare-and-swap) so concurrent sessions never
+    silently overwrite each other; `synced_data` is the common ancestor for merging remote edits.
+    """
+    def __init__(self, path=LOCAL_DB_FILE):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._versions: Dict[str, int] = {}  # in-memory mirror of portfolio_state.version (cheap staleness checks)
+        self._init_schema()
+
+    def _init_schema(self):
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS portfolio_state (
+                    user TEXT PRIMARY KEY,
+                    data TEXT NOT NULL,
+                    version INTEGER NOT NULL,
+                    updated_at REAL NOT NULL,
+                    synced_version INTEGER NOT NULL DEFAULT 0,
+                    remote_hash TEXT,
+                    remote_checked_at REAL NOT NULL DEFAULT 0,
+                    synced_data TEXT
+                );
+                CREATE TABLE IF NOT EXISTS journal (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    user TEXT NOT NULL,
+                    version INTEGER NOT NULL,
+                    data TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_journal_user_version ON journal(user, version);
+                CREATE TABLE IF NOT EXISTS conflicts (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    user TEXT NOT NULL,
+                    local_version INTEGER NOT NULL,
+                    remote_data TEXT NOT NULL,
+                    remote_hash TEXT,
+                    detected_at REAL NOT NULL
+                );
+            """)
+            # Databases created before a column existed get it added in place
+            existing = {row[1] for row in self._conn.execute("PRAGMA table_info(portfolio_state)")}
+            if "synced_data" not in existing:
+                self._conn.execute("ALTER TABLE portfolio_state ADD COLUMN synced_data TEXT")
+
+    def load(self, user: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM portfolio_state WHERE user = ?", (user,)).fetchone()
+        if row is None:
+            return None
+        state = dict(row)
+        state["data"] = json.loads(state["data"])
+        state["synced_data"] = json.loads(state["synced_data"]) if state["synced_data"] else None
+        return state
+
+    def current_version(self, user: str) -> int:
+        """Latest committed version for the user; served from memory after the first lookup (0 if none)."""
+        with self._lock:
+            if user not in self._versions:
+                row = self._conn.execute("SELECT version FROM portfolio_state WHERE user = ?", (user,)).fetchone()
+                self._versions[user] = row["version"] if row else 0
+            return self._versions[user]
+
+    def users(self) -> List[str]:
+        """Users with local state (store keys, e.g. '_csj')."""
+        with self._lock:
+            return [r["user"] for r in self._conn.execute("SELECT user FROM portfolio_state ORDER BY user")]
+
+    def commit(self, user: str, data: Dict[str, Any], expected_version: Optional[int] = None) -> Optional[int]:
+        """
+        Journals a new local version of the user's data and makes it current. Returns the version.
+        With expected_version (compare-and-swap), returns None without writing if the current
+        version is different, i.e. another session committed since the caller loaded its copy.
+        """
+        payload = json.dumps(data)
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT version FROM portfolio_state WHERE user = ?", (user,)).fetchone()
+            current = row["version"] if row else 0
+            if expected_version is not None and current != expected_version:
+                return None
+            version = current + 1
+            self._conn.execute("INSERT INTO journal (user, version, data, created_at) VALUES (?, ?, ?, ?)",
+                               (user, version, payload, now))
+            self._conn.execute(
+                """INSERT INTO portfolio_state (user, data, version, updated_at) VALUES (?, ?, ?, ?)
+                   ON CONFLICT(user) DO UPDATE SET data = excluded.data, version = excluded.version,
+                       updated_at = excluded.updated_at""",
+                (user, payload, version, now)
+            )
+            self._versions[user] = version
+        return version
+
+    def adopt_remote(self, user: str, data: Dict[str, Any], remote_hash: str, expected_version: Optional[int] = None) -> Optional[int]:
+        """
+        Replaces local state with the replica's contents (already in sync by definition).
+        With expected_version, only applies if no local edit happened in the meantime.
+        Returns the new version, or None if not applied.
+        """
+        now = time.time()
+        payload = json.dumps(data)
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT version, synced_version FROM portfolio_state WHERE user = ?", (user,)).fetchone()
+            current = row["version"] if row else 0
+            if expected_version is not None and current != expected_version:
+                return None
+            if row is not None and row["synced_version"] < current:
+                return None  # unsynced local edits are merged by the next replication instead
+            version = current + 1
+            self._conn.execute(
+                """INSERT INTO portfolio_state (user, data, version, updated_at, synced_version, remote_hash,
+                       remote_checked_at, synced_data)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(user) DO UPDATE SET data = excluded.data, version = excluded.version,
+                       updated_at = excluded.updated_at, synced_version = excluded.synced_version,
+                       remote_hash = excluded.remote_hash, remote_checked_at = excluded.remote_checked_at,
+                       synced_data = excluded.synced_data""",
+                (user, payload, version, now, version, remote_hash, now, payload)
+            )
+            self._versions[user] = version
+        return version
+
+    def mark_synced(self, user: str, version: int, remote_hash: str, data: Optional[Dict[str, Any]] = None):
+        """
+        Records that the replica now holds `version` (and its contents, `data`, the base for later
+        merges); journal entries up to it are no longer needed.
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                """UPDATE portfolio_state SET synced_version = MAX(synced_version, ?), remote_hash = ?,
+                       remote_checked_at = ?, synced_data = COALESCE(?, synced_data) WHERE user = ?""",
+                (version, remote_hash, time.time(), json.dumps(data) if data is not None else None, user)
+            )
+            self._conn.execute("DELETE FROM journal WHERE user = ? AND version <= ?", (user, version))
+
+    def mark_checked(self, user: str):
+        with self._lock, self._conn:
+            self._conn.execute("UPDATE portfolio_state SET remote_checked_at = ? WHERE user = ?", (time.time(), user))
+
+    def record_conflict(self, user: str, local_version: int, remote_data: Dict[str, Any], remote_hash: str):
+        """Keeps a copy of replica contents that were edited elsewhere before local changes overwrite them."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO conflicts (user, local_version, remote_data, remote_hash, detected_at) VALUES (?, ?, ?, ?, ?)",
+                (user, local_version, json.dumps(remote_data), remote_hash, time.time())
+            )
+
+    def conflicts(self, user: str, limit: int = 20) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM conflicts WHERE user = ? ORDER BY id DESC LIMIT ?", (user, limit)
+            ).fetchall()
+        return [{**dict(r), "remote_data": json.loads(r["remote_data"])} for r in rows]
+
+
+_STORE: Optional[LocalStore] = None
+_STORE_LOCK = threading.Lock()
+
+
+def get_local_store() -> LocalStore:
+    """Process-wide store (one SQLite connection shared by every session)."""
+    global _STORE
+    with _STORE_LOCK:
+        if _STORE is None:
+            _STORE = LocalStore()
+        return _STORE
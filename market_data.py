@@ -1,7 +1,10 @@
-import yfinance as yf
 import pandas as pd
 from datetime import datetime, timedelta
 import time
+from concurrent.futures import ThreadPoolExecutor
+
+# yfinance is imported inside the methods that call it (like views.common): app.py imports this module
+# right after login, and the first page should not wait for yfinance until it actually fetches.
 
 class MarketData:
     """
@@ -23,6 +26,7 @@ class MarketData:
             return self._info_cache[ticker]
 
         try:
+            import yfinance as yf
             # Optimize: use Ticker.fast_info for price if possible, but we need sector
             # .info is slower but necessary for sector
             t = yf.Ticker(ticker)
@@ -79,6 +83,7 @@ class MarketData:
     def get_current_price(self, ticker: str) -> float:
         """Gets real-time price. Uses fast_info for speed."""
         try:
+            import yfinance as yf
             t = yf.Ticker(ticker)
             # fast_info is much faster than .info
             price = t.fast_info.last_price
@@ -90,6 +95,31 @@ class MarketData:
         except Exception:
             return 0.0
 
+    def get_current_prices(self, tickers) -> dict:
+        """
+        Last close for many tickers in one batched download (bulk imports).
+        Tickers yfinance can't resolve are returned with 0.0.
+        """
+        tickers = sorted(set(tickers))
+        if not tickers:
+            return {}
+        try:
+            import yfinance as yf
+            closes = yf.download(tickers, period="5d", progress=False)['Close']
+            if isinstance(closes, pd.Series):
+                closes = closes.to_frame(tickers[0])
+            last = closes.ffill().iloc[-1] if not closes.empty else pd.Series(dtype=float)
+            return {t: float(last.get(t, 0.0)) if pd.notna(last.get(t)) else 0.0 for t in tickers}
+        except Exception as e:
+            print(f"Batch price fetch failed: {e}")
+            return {t: 0.0 for t in tickers}
+
+    def get_asset_infos(self, tickers, max_workers=8) -> dict:
+        """get_asset_info for many tickers at once (concurrent, shares the per-ticker cache)."""
+        tickers = sorted(set(tickers))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return dict(zip(tickers, pool.map(self.get_asset_info, tickers)))
+
     def get_fx_rates(self, base_currency="USD") -> dict:
         """
         Returns dictionary of rates relative to Base.
@@ -108,6 +138,7 @@ class MarketData:
         }
         
         try:
+            import yfinance as yf
             # Fetch USD to CAD
             cad_ticker = yf.Ticker("CAD=X")
             rates["CAD"] = cad_ticker.fast_info.last_price
@@ -0,0 +1,47 @@
+"""
+Copies portfolios between storage backends and verifies the copy.
+
+    python migrate_storage.py --from json --to sqlite --user csj
+    python migrate_storage.py --from gsheets --to parquet --user csj --user guest --target-path .cache/parquet
+"""
+import argparse
+import sys
+from storage_backends import BACKENDS, get_backend, migrate
+
+PATH_ARGS = {"json": "directory", "sqlite": "path", "parquet": "directory"}
+
+
+def _backend(name, path):
+    kwargs = {PATH_ARGS[name]: path} if path and name in PATH_ARGS else {}
+    return get_backend(name, **kwargs)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Migrate portfolio data between storage backends.")
+    parser.add_argument("--from", dest="source", required=True, choices=list(BACKENDS))
+    parser.add_argument("--to", dest="target", required=True, choices=list(BACKENDS))
+    parser.add_argument("--user", dest="users", action="append", required=True, help="user id (repeatable)")
+    parser.add_argument("--source-path", help="file/directory for json, sqlite or parquet sources")
+    parser.add_argument("--target-path", help="file/directory for json, sqlite or parquet targets")
+    args = parser.parse_args(argv)
+
+    source = _backend(args.source, args.source_path)
+    target = _backend(args.target, args.target_path)
+    failed = 0
+    source.warm_up(args.users)
+    for user in args.users:
+        if not source.exists(user):
+            print(f"SKIP {user}: nothing stored in {args.source}")
+            continue
+        try:
+            summary = migrate(source, target, user)
+            print(f"OK   {user}: {summary['assets']} assets, {summary['transactions']} transactions, "
+                  f"settings [{', '.join(summary['settings'])}] -> {args.target}")
+        except Exception as e:
+            failed += 1
+            print(f"FAIL {user}: {e}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+import pandas as pd
+import json
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional
+
+# yfinance is imported in fetch_ticker, on a cache miss only.
+
+NEWS_CACHE_DIR = os.path.join(".cache", "news")
+
+
+class NewsAggregator:
+    """
+    Fetches yfinance news for many tickers concurrently.
+    Each ticker's raw headlines are cached on disk with a TTL, so reruns and other sessions
+    don't refetch; results are deduplicated with a hash set and merged newest-first.
+    """
+    CACHE_TTL = 900   # 15 minutes in seconds
+    MAX_WORKERS = 16
+
+    def __init__(self, cache_dir=NEWS_CACHE_DIR, ttl=CACHE_TTL, max_workers=MAX_WORKERS):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_workers = max_workers
+
+    # --- Disk cache ---
+
+    def _cache_path(self, ticker: str) -> str:
+        safe = re.sub(r'[^A-Za-z0-9._-]', '_', ticker)
+        return os.path.join(self.cache_dir, f"{safe}.json")
+
+    def _read_cache(self, ticker: str) -> Optional[List[Dict[str, Any]]]:
+        path = self._cache_path(ticker)
+        try:
+            if time.time() - os.path.getmtime(path) > self.ttl:
+                return None
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_cache(self, ticker: str, items: List[Dict[str, Any]]):
+        path = self._cache_path(ticker)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(items, f)
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"News cache write failed for {ticker}: {e}")
+
+    # --- Parsing ---
+
+    @staticmethod
+    def _to_epoch(value) -> float:
+        """pubDate comes as an ISO string in new yfinance, providerPublishTime as epoch seconds in old."""
+        if value is None or value == "":
+            return 0.0
+        if isinstance(value, (int, float)):
+            return float(value)
+        try:
+            return pd.Timestamp(value).timestamp()
+        except (ValueError, TypeError):
+            return 0.0
+
+    @classmethod
+    def parse_item(cls, ticker: str, item) -> Optional[Dict[str, Any]]:
+        if not isinstance(item, dict):
+            return None
+        content = item.get('content', item)
+        if not isinstance(content, dict):
+            content = {}
+        click = content.get('clickThroughUrl')
+        published = content.get('pubDate') or item.get('providerPublishTime')
+        return {
+            'ticker': ticker,
+            'title': content.get('title', 'No Title'),
+            'link': click.get('url') if isinstance(click, dict) else click,
+            'providerPublishTime': published,
+            'published_ts': cls._to_epoch(published)
+        }
+
+    # --- Fetching ---
+
+    def fetch_ticker(self, ticker: str) -> List[Dict[str, Any]]:
+        """Parsed headlines for one ticker, served from disk while fresh."""
+        cached = self._read_cache(ticker)
+        if cached is not None:
+            return cached
+        try:
+            import yfinance as yf
+            raw_news = yf.Ticker(ticker).news or []
+        except Exception as e:
+            print(f"News fetch error for {ticker}: {e}")
+            return []
+        items = [p for p in (self.parse_item(ticker, item) for item in raw_news) if p]
+        self._write_cache(ticker, items)
+        return items
+
+    def fetch_all(self, tickers: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """One thread per uncached ticker, so N tickers cost roughly one request's latency."""
+        tickers = list(dict.fromkeys(t for t in tickers if t and t != 'CASH'))
+        if not tickers:
+            return {}
+        workers = max(1, min(self.max_workers, len(tickers)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return dict(zip(tickers, pool.map(self.fetch_ticker, tickers)))
+
+    def get_news(self, tickers: List[str], limit_per_ticker=3) -> List[Dict[str, Any]]:
+        """Merged, deduplicated (by link, else title) headlines, newest first."""
+        per_ticker = self.fetch_all(tickers)
+        seen = set()
+        merged = []
+        for ticker, items in per_ticker.items():
+            count = 0
+            for item in items:
+                if count >= limit_per_ticker:
+                    break
+                key = item.get('link') or item.get('title')
+                if key in seen:
+                    continue
+                seen.add(key)
+                merged.append(item)
+                count += 1
+        merged.sort(key=lambda n: n.get('published_ts', 0.0), reverse=True)
+        return merged
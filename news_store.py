@@ -0,0 +1,192 @@
+import sqlite3
+import os
+import time
+import threading
+from typing import Dict, List, Any, Optional, Tuple
+
+NEWS_DB_FILE = os.path.join(".cache", "news.db")
+
+
+class NewsStore:
+    """
+    Local SQLite FTS5 index of portfolio headlines.
+    Ingestion is incremental: per ticker only items newer than the last seen publish time are
+    inserted, so months of history accumulate locally and the news view queries the index
+    (keyword / ticker / date filters, paged) without touching the network.
+    """
+    def __init__(self, path=NEWS_DB_FILE):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._init_schema()
+
+    def _init_schema(self):
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            migrated = self._migrate_dedupe_key()
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS news (
+                    id INTEGER PRIMARY KEY,
+                    dedupe_key TEXT NOT NULL,
+                    ticker TEXT NOT NULL,
+                    title TEXT NOT NULL,
+                    link TEXT,
+                    provider_publish_time TEXT,
+                    published_ts REAL NOT NULL DEFAULT 0,
+                    ingested_at REAL NOT NULL,
+                    UNIQUE (ticker, dedupe_key)
+                );
+                CREATE INDEX IF NOT EXISTS idx_news_ticker_ts ON news(ticker, published_ts);
+                CREATE INDEX IF NOT EXISTS idx_news_ts ON news(published_ts);
+
+                CREATE VIRTUAL TABLE IF NOT EXISTS news_fts USING fts5(
+                    title, ticker, content='news', content_rowid='id'
+                );
+                CREATE TRIGGER IF NOT EXISTS news_ai AFTER INSERT ON news BEGIN
+                    INSERT INTO news_fts(rowid, title, ticker) VALUES (new.id, new.title, new.ticker);
+                END;
+                CREATE TRIGGER IF NOT EXISTS news_ad AFTER DELETE ON news BEGIN
+                    INSERT INTO news_fts(news_fts, rowid, title, ticker) VALUES ('delete', old.id, old.title, old.ticker);
+                END;
+
+                CREATE TABLE IF NOT EXISTS ticker_state (
+                    ticker TEXT PRIMARY KEY,
+                    last_published_ts REAL NOT NULL DEFAULT 0,
+                    last_polled REAL NOT NULL DEFAULT 0
+                );
+            """)
+            if migrated:
+                self._conn.execute("INSERT INTO news_fts(news_fts) VALUES ('rebuild')")
+
+    def _migrate_dedupe_key(self) -> bool:
+        """
+        Old DBs had dedupe_key unique across all tickers, so a headline shared by two tickers was
+        stored only under the first one. Rebuilds the table with UNIQUE(ticker, dedupe_key) keeping rows
+        (the FTS index and triggers are recreated by the schema script, then reindexed).
+        """
+        row = self._conn.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name='news'").fetchone()
+        if row is None or "dedupe_key TEXT UNIQUE" not in row[0]:
+            return False
+        self._conn.executescript("""
+            DROP TABLE IF EXISTS news_fts;
+            DROP TRIGGER IF EXISTS news_ai;
+            DROP TRIGGER IF EXISTS news_ad;
+            ALTER TABLE news RENAME TO news_old;
+            DROP INDEX IF EXISTS idx_news_ticker_ts;
+            DROP INDEX IF EXISTS idx_news_ts;
+            CREATE TABLE news (
+                id INTEGER PRIMARY KEY,
+                dedupe_key TEXT NOT NULL,
+                ticker TEXT NOT NULL,
+                title TEXT NOT NULL,
+                link TEXT,
+                provider_publish_time TEXT,
+                published_ts REAL NOT NULL DEFAULT 0,
+                ingested_at REAL NOT NULL,
+                UNIQUE (ticker, dedupe_key)
+            );
+            INSERT INTO news SELECT * FROM news_old;
+            DROP TABLE news_old;
+        """)
+        return True
+
+    # --- Ingestion ---
+
+    def last_seen(self) -> Dict[str, float]:
+        with self._lock:
+            rows = self._conn.execute("SELECT ticker, last_published_ts FROM ticker_state").fetchall()
+        return {r["ticker"]: r["last_published_ts"] for r in rows}
+
+    def ingest(self, items: List[Dict[str, Any]]) -> int:
+        """
+        Inserts items newer than each ticker's high-water mark. Returns the number of new rows.
+        Items without a publish time are stored with the fetch time (deduped per ticker by link/title)
+        but don't move the high-water mark, so dated items published before this poll still get in.
+        """
+        if not items:
+            return 0
+        watermarks = self.last_seen()
+        now = time.time()
+        fresh = [
+            n for n in items
+            if (n.get('link') or n.get('title'))
+            and (not n.get('published_ts') or n['published_ts'] > watermarks.get(n.get('ticker'), 0.0))
+        ]
+        newest: Dict[str, float] = {}
+        for n in items:
+            t = n.get('ticker')
+            if t:
+                newest[t] = max(newest.get(t, 0.0), float(n.get('published_ts') or 0.0))
+
+        with self._lock, self._conn:
+            before = self._conn.execute("SELECT COUNT(*) FROM news").fetchone()[0]
+            self._conn.executemany(
+                """INSERT OR IGNORE INTO news (dedupe_key, ticker, title, link, provider_publish_time, published_ts, ingested_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                [(n.get('link') or n.get('title'), n.get('ticker'), n.get('title') or '', n.get('link'),
+                  str(n.get('providerPublishTime') or ''), float(n.get('published_ts') or now), now) for n in fresh]
+            )
+            inserted = self._conn.execute("SELECT COUNT(*) FROM news").fetchone()[0] - before
+            self._conn.executemany(
+                """INSERT INTO ticker_state (ticker, last_published_ts, last_polled) VALUES (?, ?, ?)
+                   ON CONFLICT(ticker) DO UPDATE SET
+                       last_published_ts = MAX(last_published_ts, excluded.last_published_ts),
+                       last_polled = excluded.last_polled""",
+                [(t, ts, now) for t, ts in newest.items()]
+            )
+        return inserted
+
+    def poll(self, aggregator, tickers: List[str]) -> int:
+        """Pulls the latest headlines through a NewsAggregator and ingests only the new ones."""
+        per_ticker = aggregator.fetch_all(tickers)
+        return self.ingest([item for items in per_ticker.values() for item in items])
+
+    # --- Queries ---
+
+    @staticmethod
+    def _fts_query(keyword: str) -> str:
+        """Turns free text into a safe FTS5 expression: every word must match (prefix match)."""
+        terms = [t.replace('"', '""') for t in keyword.split() if t.strip()]
+        return " ".join(f'"{t}"*' for t in terms)
+
+    def search(self, keyword: Optional[str] = None, tickers: Optional[List[str]] = None,
+               since: Optional[float] = None, until: Optional[float] = None,
+               page: int = 0, page_size: int = 20) -> Tuple[List[Dict[str, Any]], int]:
+        """Returns (rows for the requested page newest first, total matching rows)."""
+        where, params = [], []
+        source = "news n"
+        if keyword and self._fts_query(keyword):
+            source = "news n JOIN news_fts f ON f.rowid = n.id"
+            where.append("news_fts MATCH ?")
+            params.append(self._fts_query(keyword))
+        if tickers:
+            where.append(f"n.ticker IN ({','.join('?' * len(tickers))})")
+            params.extend(tickers)
+        if since is not None:
+            where.append("n.published_ts >= ?")
+            params.append(since)
+        if until is not None:
+            where.append("n.published_ts < ?")
+            params.append(until)
+        clause = f"WHERE {' AND '.join(where)}" if where else ""
+
+        with self._lock:
+            total = self._conn.execute(f"SELECT COUNT(*) FROM {source} {clause}", params).fetchone()[0]
+            rows = self._conn.execute(
+                f"""SELECT n.ticker, n.title, n.link, n.provider_publish_time, n.published_ts
+                    FROM {source} {clause}
+                    ORDER BY n.published_ts DESC, n.id DESC LIMIT ? OFFSET ?""",
+                params + [page_size, page * page_size]
+            ).fetchall()
+        return [{
+            'ticker': r['ticker'], 'title': r['title'], 'link': r['link'],
+            'providerPublishTime': r['provider_publish_time'], 'published_ts': r['published_ts']
+        } for r in rows], total
+
+    def prune(self, older_than_ts: float) -> int:
+        """Drops headlines published before `older_than_ts` (keeps the index bounded)."""
+        with self._lock, self._conn:
+            return self._conn.execute("DELETE FROM news WHERE published_ts < ?", (older_than_ts,)).rowcount
@@ -1,22 +1,271 @@
 import pandas as pd
-import streamlit as st
-from streamlit_gsheets import GSheetsConnection
 from typing import Dict, List, Any
 import json
+import copy
+import time
+import hashlib
+import threading
+from transaction_ledger import TransactionLedger, TRANSACTION_TYPES
+from write_behind import get_queue
+from local_store import get_local_store
+from portfolio_merge import three_way_merge
+from statement_import import drop_known, holdings_from_trades
+from sheets_batch_loader import get_batch_loader, open_spreadsheet
+from storage_backends import JSONBackend, empty_data, ASSET_FIELDS, DEFAULT_ACCOUNT
 
 # Default fallback if sheet is empty
-DEFAULT_ASSETS_DF = pd.DataFrame(columns=["Ticker", "Quantity", "AvgCost", "Class", "Sector"])
+DEFAULT_ASSETS_DF = pd.DataFrame(columns=["Ticker", "Quantity", "AvgCost", "Class", "Sector", "Account"])
 DEFAULT_CONFIG_DF = pd.DataFrame([
     {"Key": "CASH_USD", "Value": "0.0"},
     {"Key": "CASH_CAD", "Value": "0.0"},
     {"Key": "CASH_KRW", "Value": "0.0"},
     {"Key": "BASE_CURRENCY", "Value": "USD"}
 ], columns=["Key", "Value"])
+ASSET_SHEET_COLUMNS = {"Ticker": "ticker", "Quantity": "quantity", "AvgCost": "avg_price", "Class": "asset_class", "Sector": "sector", "Account": "account"}
+ASSET_REQUIRED_COLUMNS = ["Ticker", "Quantity"]
+LEDGER_SHEET_COLUMNS = {
+    "Date": "date", "Type": "type", "Ticker": "ticker", "Quantity": "quantity", "Price": "price",
+    "Fee": "fee", "Amount": "amount", "Currency": "currency", "ToAmount": "to_amount", "ToCurrency": "to_currency"
+}
+LEDGER_REQUIRED_COLUMNS = {"date": "Date", "type": "Type"}
+
+
+def _sheet_values(df: pd.DataFrame) -> List[List[Any]]:
+    """Row-major cell values as JSON-safe Python objects (blank for NaN)."""
+    return df.astype(object).where(df.notna(), "").values.tolist()
+
+
+def _normalize_cell(value) -> str:
+    """Comparison key for a cell, so 5 / 5.0 / '5.0' read back from the sheet compare equal."""
+    if value is None or (isinstance(value, float) and value != value):
+        return ""
+    try:
+        return repr(float(value))
+    except (TypeError, ValueError):
+        return str(value)
+
+
+def _sheet_rows(df: pd.DataFrame):
+    """(columns, normalized rows) fingerprint of a worksheet's contents."""
+    return tuple(df.columns), [tuple(_normalize_cell(v) for v in row) for row in _sheet_values(df)]
+
+
+def _dirty_rows(old, new):
+    """
+    Indices of rows in `new` that differ from `old` (appended rows included).
+    None means a partial write can't express the change: unknown baseline, new schema, or fewer rows.
+    """
+    if old is None:
+        return None
+    old_cols, old_rows = old
+    new_cols, new_rows = new
+    if old_cols != new_cols or len(new_rows) < len(old_rows):
+        return None
+    return [i for i, row in enumerate(new_rows) if i >= len(old_rows) or row != old_rows[i]]
+
+
+def _sheet_row_numbers(index) -> str:
+    """Sheet row numbers (header is row 1) for a boolean-masked index, abbreviated."""
+    rows = [str(i + 2) for i in index]
+    return ", ".join(rows[:10]) + (f" (+{len(rows) - 10} more)" if len(rows) > 10 else "")
+
+
+def _text(col: pd.Series) -> pd.Series:
+    """Stripped string column with blanks ('' for NaN)."""
+    return col.where(col.notna(), "").astype(str).str.strip()
+
+
+def _non_numeric(raw: pd.Series, coerced: pd.Series) -> pd.Series:
+    """Cells that failed numeric coercion but weren't blank (only those few are string-inspected)."""
+    suspect = coerced.isna() & raw.notna()
+    if suspect.any():
+        suspect[suspect] = _text(raw[suspect]) != ""
+    return suspect
+
+
+def _records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """DataFrame -> list of dicts of native Python values (column-wise, much faster than to_dict('records'))."""
+    columns = list(df.columns)
+    return [dict(zip(columns, row)) for row in zip(*(df[c].tolist() for c in columns))]
+
+
+def _parse_assets(df: pd.DataFrame):
+    """Holdings sheet -> (asset records, error messages). Quantity/AvgCost are coerced once per column."""
+    if df is None or df.empty:
+        return [], []
+    missing = [c for c in ASSET_REQUIRED_COLUMNS if c not in df.columns]
+    if missing:
+        return [], [f"missing required column(s) {', '.join(missing)}; sheet ignored"]
+
+    df = df.reset_index(drop=True)
+    blank = df.isna().all(axis=1)
+    out = pd.DataFrame({"ticker": _text(df["Ticker"])})
+    errors = []
+    bad = pd.Series(False, index=df.index)
+    for col, key in (("Quantity", "quantity"), ("AvgCost", "avg_price")):
+        raw = df[col] if col in df.columns else pd.Series(0.0, index=df.index)
+        values = pd.to_numeric(raw, errors="coerce")
+        invalid = _non_numeric(raw, values)
+        if invalid.any():
+            errors.append(f"non-numeric {col} in row(s) {_sheet_row_numbers(df.index[invalid & ~blank])}")
+        bad |= invalid
+        out[key] = values.fillna(0.0).astype(float)
+    no_ticker = out["ticker"] == ""
+    if (no_ticker & ~blank).any():
+        errors.append(f"missing Ticker in row(s) {_sheet_row_numbers(df.index[no_ticker & ~blank])}")
+    out["asset_class"] = _text(df["Class"]).replace("", "Stock") if "Class" in df.columns else "Stock"
+    out["sector"] = _text(df["Sector"]).replace("", "Unknown") if "Sector" in df.columns else "Unknown"
+    # Sheets written before multi-account support have no Account column
+    out["account"] = _text(df["Account"]).replace("", DEFAULT_ACCOUNT) if "Account" in df.columns else DEFAULT_ACCOUNT
+
+    keep = ~(bad | no_ticker | blank)
+    return _records(out[keep]), errors
+
+
+def _parse_config(df: pd.DataFrame):
+    """Key/Value sheet -> (cash dict, settings dict, error messages)."""
+    if df is None or df.empty:
+        return {}, {}, []
+    missing = [c for c in ("Key", "Value") if c not in df.columns]
+    if missing:
+        return {}, {}, [f"missing required column(s) {', '.join(missing)}; sheet ignored"]
+
+    df = df.reset_index(drop=True)
+    keys = _text(df["Key"])
+    errors = []
+    cash_rows = keys.str.startswith("CASH_")
+    amounts = pd.to_numeric(df.loc[cash_rows, "Value"], errors="coerce")
+    invalid = amounts.isna()
+    if invalid.any():
+        errors.append(f"non-numeric cash amount in row(s) {_sheet_row_numbers(amounts.index[invalid])}")
+    valid = amounts[~invalid]
+    cash = dict(zip(keys[valid.index].str.split("_").str[1], valid.astype(float)))
+
+    settings = {}
+    base = df.loc[keys == "BASE_CURRENCY", "Value"]
+    if not base.empty:
+        settings["base_currency"] = str(base.iloc[-1])
+    # Other settings (section_labels, risk_inputs, ...) are stored as JSON under SETTING_<key>
+    for key, value in zip(keys[keys.str.startswith("SETTING_")], df.loc[keys.str.startswith("SETTING_"), "Value"]):
+        try:
+            settings[key[len("SETTING_"):]] = json.loads(value)
+        except (TypeError, ValueError):
+            settings[key[len("SETTING_"):]] = value
+    return cash, settings, errors
+
+
+def data_to_frames(data: Dict[str, Any]) -> Dict[str, pd.DataFrame]:
+    """Sheet-schema DataFrames ('assets', 'config' and, once there are transactions, 'ledger') for a data dict."""
+    # 1. PREPARE ASSETS DATAFRAME
+    df_assets = pd.DataFrame.from_records(
+        data.get("assets", []), columns=list(ASSET_SHEET_COLUMNS.values())
+    ).rename(columns={v: k for k, v in ASSET_SHEET_COLUMNS.items()})
+    if df_assets.empty:
+        df_assets = DEFAULT_ASSETS_DF
+
+    # 2. PREPARE CONFIG DATAFRAME
+    config_list = []
+    # Cash
+    for curr, amount in data.get("cash", {}).items():
+        config_list.append({"Key": f"CASH_{curr}", "Value": str(amount)})
+    
+    # Settings
+    settings = data.get("settings", {})
+    config_list.append({"Key": "BASE_CURRENCY", "Value": settings.get("base_currency", "USD")})
+    for key, value in settings.items():
+        if key != "base_currency":
+            config_list.append({"Key": f"SETTING_{key}", "Value": json.dumps(value)})
+    
+    frames = {"assets": df_assets, "config": pd.DataFrame(config_list, columns=["Key", "Value"])}
+
+    # 3. PREPARE LEDGER DATAFRAME (only written once the user has transactions)
+    if data.get("transactions"):
+        sheet_names = {v: k for k, v in LEDGER_SHEET_COLUMNS.items()}
+        frames["ledger"] = pd.DataFrame.from_records(data["transactions"], columns=list(sheet_names)).rename(columns=sheet_names)
+    return frames
+
+
+def frames_to_data(frames: Dict[str, pd.DataFrame]):
+    """Inverse of data_to_frames: (data dict, {'assets' / 'config' / 'ledger': [error messages]})."""
+    assets, asset_errors = _parse_assets(frames.get("assets"))
+    cash, settings, config_errors = _parse_config(frames.get("config"))
+    transactions, ledger_errors = _parse_ledger(frames.get("ledger"))
+    data = {
+        "assets": assets,
+        "cash": {"USD": 0.0, "CAD": 0.0, "KRW": 0.0, **cash},
+        "settings": settings,
+        "transactions": transactions
+    }
+    return data, {"assets": asset_errors, "config": config_errors, "ledger": ledger_errors}
+
+
+def _parse_ledger(df: pd.DataFrame):
+    """Ledger sheet -> (transaction records, error messages). Rows TransactionLedger would drop are reported."""
+    if df is None or df.empty:
+        return [], []
+    df = df.rename(columns=LEDGER_SHEET_COLUMNS)
+    missing = [LEDGER_REQUIRED_COLUMNS[c] for c in LEDGER_REQUIRED_COLUMNS if c not in df.columns]
+    if missing:
+        return [], [f"missing required column(s) {', '.join(missing)}; sheet ignored"]
+
+    df = df[[c for c in LEDGER_SHEET_COLUMNS.values() if c in df.columns]].reset_index(drop=True)
+    blank = df.isna().all(axis=1)
+    errors = []
+    bad_date = pd.to_datetime(df["date"], errors="coerce").isna() & ~blank
+    if bad_date.any():
+        errors.append(f"unparseable Date in row(s) {_sheet_row_numbers(df.index[bad_date])}")
+    bad_type = ~_text(df["type"]).str.upper().isin(TRANSACTION_TYPES) & ~blank
+    if bad_type.any():
+        errors.append(f"unknown Type in row(s) {_sheet_row_numbers(df.index[bad_type])}")
+    for col in ("quantity", "price", "fee", "amount", "to_amount"):
+        if col in df.columns:
+            invalid = _non_numeric(df[col], pd.to_numeric(df[col], errors="coerce"))
+            if invalid.any():
+                errors.append(f"non-numeric {col} in row(s) {_sheet_row_numbers(df.index[invalid])}")
+    return TransactionLedger(df[~blank]).to_records(), errors
+
+
+def _hash_rows(rows_by_sheet: Dict[str, Any]) -> str:
+    """Order-independent content hash over {sheet: _sheet_rows(...)}."""
+    return hashlib.sha1(repr(sorted(rows_by_sheet.items())).encode("utf-8")).hexdigest()
+
+
+def _rows_hash(frames: Dict[str, pd.DataFrame]) -> str:
+    return _hash_rows({sheet: _sheet_rows(df) for sheet, df in frames.items()})
+
+
+def _contiguous(rows: List[int]):
+    """[1, 2, 3, 7, 8] -> [(1, 3), (7, 8)]"""
+    runs = []
+    for r in rows:
+        if runs and r == runs[-1][1] + 1:
+            runs[-1][1] = r
+        else:
+            runs.append([r, r])
+    return [tuple(run) for run in runs]
+
+
+def _a1_column(n: int) -> str:
+    letters = ""
+    while n > 0:
+        n, rem = divmod(n - 1, 26)
+        letters = chr(ord("A") + rem) + letters
+    return letters
+
 
 class PortfolioManager:
     """
-    Manages loading and saving of portfolio data to Google Sheets via st.connection.
+    Manages loading and saving of portfolio data.
+    A local SQLite journal is the primary store (reads never wait on the network and edits
+    survive outages); Google Sheets, via st.connection, is replicated write-behind by a
+    per-user queue after a short debounce.
+    Writes are optimistic: each instance remembers the version it loaded and commits with
+    compare-and-swap; concurrent edits from other sessions are three-way merged, not overwritten.
+    An instance is meant to live for the whole session: refresh() on each rerun only compares
+    versions in memory and reloads when another session or the sheets changed the portfolio.
     """
+    READ_TTL = 60  # seconds between background checks of the sheets for external edits
+
     def __init__(self, user_id=None):
         # user_id handling:
         # For GSheets, we might use different worksheets for different users 
@@ -26,123 +275,318 @@ class PortfolioManager:
         # Given "data_{user_id}.json" pattern, let's use:
         # Worksheet 'Assets_{user_id}' and 'Config_{user_id}'
         
+        self.user_id = user_id
         self.user_suffix = f"_{user_id}" if user_id else "_csj"
         self.assets_sheet = f"Assets{self.user_suffix}"
         self.config_sheet = f"Config{self.user_suffix}"
+        self.ledger_sheet = f"Ledger{self.user_suffix}"
+        self.sheet_names = {"assets": self.assets_sheet, "config": self.config_sheet, "ledger": self.ledger_sheet}
         
-        # Initialize Connection
+        # Local journal is the primary store; the sheets are replicated in the background
+        self.store = get_local_store()
+        self._sync = get_queue(self.user_suffix, self._replicate)
+
+        # Initialize Connection (optional: without it the app runs offline on the local store)
+        self.conn = None
+        self.load_errors: List[str] = []
+        self.version = 0  # local store version self.data is based on (compare-and-swap token)
+        self._checked_at = 0.0  # last background check of the sheets for external edits
         try:
+            # Streamlit is imported here, not at module level: the sheet codecs and storage helpers
+            # in this module are also used by CLIs (migrate_storage, snapshot_job) that have no UI
+            import streamlit as st
+            from streamlit_gsheets import GSheetsConnection
             self.conn = st.connection("gsheets", type=GSheetsConnection)
-            self.data = self._load_data()
         except Exception as e:
-            # Fallback for when secrets are missing or connection fails
-            # We don't want to crash the app, just show empty/local mode warning
-            print(f"GSheets Init Failed: {e}")
-            self.data = {
-                "assets": [],
-                "cash": {"USD": 0.0, "CAD": 0.0, "KRW": 0.0},
-                "settings": {"base_currency": "USD"}
-            }
-
-    def _load_data(self) -> Dict[str, Any]:
-        """Loads data from GSheets."""
-        data_struct = {
-            "assets": [],
-            "cash": {"USD": 0.0, "CAD": 0.0, "KRW": 0.0},
-            "settings": {} # Add specific settings defaults if needed
-        }
-        
-        # 1. LOAD ASSETS
+            print(f"GSheets Init Failed, running offline: {e}")
+
+        state = self.store.load(self.user_suffix)
+        if state is not None:
+            self.data = state["data"]
+            self.version = state["version"]
+            if state["synced_version"] < state["version"]:
+                # Edits made while offline / before a restart: resume replicating them
+                if not self._sync.has_pending:
+                    self._sync.submit({"version": state["version"], "data": state["data"]})
+            elif self.conn is not None and time.time() - state["remote_checked_at"] > self.READ_TTL:
+                self._pull_remote_async(state["version"])
+            else:
+                self._checked_at = state["remote_checked_at"]
+        else:
+            # First run on this machine: seed the local store from the sheets once
+            self.data = empty_data()
+            if self.conn is not None:
+                try:
+                    remote = self._read_sheets()
+                    if remote:
+                        self.data = self._load_data(remote)
+                        self.version = self.store.adopt_remote(self.user_suffix, self.data, _rows_hash(remote)) or 0
+                        self._checked_at = time.time()
+                        if self.load_errors:
+                            st.warning("Some sheet rows could not be loaded:\n\n" + "\n\n".join(self.load_errors))
+                except Exception as e:
+                    print(f"GSheets bootstrap failed, running offline: {e}")
+            if not self.data["assets"] and not self.data["transactions"]:
+                # Nothing in the sheets: carry over a legacy local JSON portfolio, if any
+                legacy = JSONBackend()
+                if legacy.exists(user_id or "csj"):
+                    self.data = legacy.load(user_id or "csj")
+                    self.version = self.store.commit(self.user_suffix, self.data)
+                    self._sync.submit({"version": self.version, "data": self.data})
+        # Common ancestor for merging this instance's edits with other sessions'
+        self._base = copy.deepcopy(self.data)
+
+        self._show_sync_status()
+
+    def _show_sync_status(self):
+        import streamlit as st
+        if self._sync.last_error is not None:
+            st.error(f"Failed to sync to GSheets (changes are kept locally): {self._sync.last_error}")
+        if self._sync.last_conflict is not None:
+            st.warning(self._sync.last_conflict)
+            self._sync.last_conflict = None
+
+    def refresh(self) -> bool:
+        """
+        Per-rerun staleness check for a session-cached instance. Compares versions in memory
+        (no storage I/O) and reloads only if another session, a merge or a pull committed since;
+        the sheets are checked in the background at most every READ_TTL seconds.
+        Returns True if the data was reloaded.
+        """
+        reloaded = False
+        if self.store.current_version(self.user_suffix) != self.version:
+            state = self.store.load(self.user_suffix)
+            self.data, self.version = state["data"], state["version"]
+            self._base = copy.deepcopy(self.data)
+            reloaded = True
+        if self.conn is not None and not self._sync.has_pending and time.time() - self._checked_at > self.READ_TTL:
+            self._pull_remote_async(self.version)
+        self._show_sync_status()
+        return reloaded
+
+    def _read_sheets(self, ttl=0) -> Dict[str, pd.DataFrame]:
+        """
+        Current worksheet contents keyed by sheet name (sheets that don't exist are omitted).
+        All sheets come from one values:batchGet through the shared, revision-cached batch loader;
+        per-sheet conn.read is the fallback.
+        """
         try:
-            df_assets = self.conn.read(worksheet=self.assets_sheet, ttl=60) # ttl=0 for fresh data
-            # Clean and Convert to Dict
-            if not df_assets.empty:
-                for _, row in df_assets.iterrows():
-                    data_struct["assets"].append({
-                        "ticker": str(row.get("Ticker", "")),
-                        "quantity": float(row.get("Quantity", 0.0)),
-                        "avg_price": float(row.get("AvgCost", 0.0)),
-                        "asset_class": str(row.get("Class", "Stock")),
-                        "sector": str(row.get("Sector", "Unknown"))
-                    })
-        except Exception:
-            # Sheet might not exist, return default
-            pass
+            return get_batch_loader(self.conn).load(list(self.sheet_names.values()))
+        except Exception as e:
+            print(f"Batched sheet read unavailable, reading sheets one by one: {e}")
+        frames = {}
+        for sheet in (self.assets_sheet, self.config_sheet, self.ledger_sheet):
+            try:
+                frames[sheet] = self.conn.read(worksheet=sheet, ttl=ttl)
+            except Exception:
+                # Sheet might not exist (e.g. no ledger yet)
+                pass
+        return frames
+
+    def _load_data(self, frames: Dict[str, pd.DataFrame]) -> Dict[str, Any]:
+        """
+        Builds the data dict from worksheet frames (see _read_sheets), column-wise.
+        Malformed rows are skipped and described in self.load_errors instead of silently dropped.
+        """
+        data, errors = frames_to_data({key: frames.get(sheet) for key, sheet in self.sheet_names.items()})
+        self.load_errors = [f"{self.sheet_names[key]}: {e}" for key, errs in errors.items() for e in errs]
+        for e in self.load_errors:
+            print(f"Sheet load warning: {e}")
+        return data
 
-        # 2. LOAD CONFIG (Cash & Settings)
+    def _pull_remote_async(self, expected_version: int):
+        """Picks up edits made directly in the sheets, off the render path (applies on the next rerun)."""
+        self._checked_at = time.time()
+        threading.Thread(target=self._pull_remote, args=(expected_version,), daemon=True).start()
+
+    def _pull_remote(self, expected_version: int):
         try:
-            df_config = self.conn.read(worksheet=self.config_sheet, ttl=60)
-            if not df_config.empty:
-                for _, row in df_config.iterrows():
-                    key = str(row.get("Key", ""))
-                    val = str(row.get("Value", ""))
-                    
-                    if key.startswith("CASH_"):
-                        currency = key.split("_")[1]
-                        try:
-                            data_struct["cash"][currency] = float(val)
-                        except: pass
-                    elif key == "BASE_CURRENCY":
-                         data_struct["settings"]["base_currency"] = val
-                    elif key.startswith("LABEL_"):
-                        # Reconstruct section labels?
-                        # Simplified: sticking to core data for now.
-                        pass
-        except Exception:
-            pass
-            
-        return data_struct
+            self.store.mark_checked(self.user_suffix)
+            remote = self._read_sheets()
+            state = self.store.load(self.user_suffix)
+            remote_hash = _rows_hash(remote)
+            if remote and state is not None and remote_hash != state["remote_hash"]:
+                self.store.adopt_remote(self.user_suffix, self._load_data(remote), remote_hash, expected_version)
+        except Exception as e:
+            print(f"GSheets pull failed: {e}")
 
     def save_data(self, data: Dict[str, Any] = None):
-        """Saves current data state to GSheets."""
+        """
+        Commits the current data state to the local journal and queues replication to GSheets.
+        If another session (tab, device) committed since this instance loaded, the two edits are
+        three-way merged against the loaded copy: quantities and cash balances both changed add up
+        (each edit is a delta), other fields both changed keep this session's value.
+        """
         if data:
             self.data = data
-            
-        # 1. PREPARE ASSETS DATAFRAME
-        assets_list = []
-        for a in self.data.get("assets", []):
-            assets_list.append({
-                "Ticker": a.get("ticker"),
-                "Quantity": a.get("quantity"),
-                "AvgCost": a.get("avg_price"),
-                "Class": a.get("asset_class"),
-                "Sector": a.get("sector")
-            })
-        
-        df_assets = pd.DataFrame(assets_list)
-        if df_assets.empty:
-            df_assets = DEFAULT_ASSETS_DF
-
-        # 2. PREPARE CONFIG DATAFRAME
-        config_list = []
-        # Cash
-        for curr, amount in self.data.get("cash", {}).items():
-            config_list.append({"Key": f"CASH_{curr}", "Value": str(amount)})
-        
-        # Settings
-        base_curr = self.data.get("settings", {}).get("base_currency", "USD")
-        config_list.append({"Key": "BASE_CURRENCY", "Value": base_curr})
-        
-        df_config = pd.DataFrame(config_list)
+        while True:
+            version = self.store.commit(self.user_suffix, self.data, expected_version=self.version)
+            if version is not None:
+                break
+            current = self.store.load(self.user_suffix)
+            self.data, conflicts = three_way_merge(self._base, self.data, current["data"])
+            self._base, self.version = current["data"], current["version"]
+            if conflicts:
+                import streamlit as st
+                st.warning("Another session changed the same fields at the same time; your values were kept: "
+                           + ", ".join(conflicts))
+        self.version = version
+        self._base = copy.deepcopy(self.data)
+        self._sync.submit({"version": version, "data": self.data})
+
+    def flush(self) -> bool:
+        """Blocks until queued changes are written (logout / before leaving the session)."""
+        ok = self._sync.flush()
+        if not ok:
+            import streamlit as st
+            st.error(f"Failed to sync to GSheets: {self._sync.last_error}")
+        return ok
+
+    def _snapshot_frames(self, snapshot: Dict[str, Any]) -> Dict[str, pd.DataFrame]:
+        """Sheet-shaped DataFrames for one data snapshot, keyed by worksheet name."""
+        return {self.sheet_names[key]: df for key, df in data_to_frames(snapshot).items()}
+
+    def _replicate(self, item: Dict[str, Any]):
+        """
+        Writes one journaled version to GSheets. Runs on the write-behind thread; raises on failure.
+        The sheets are read first: if their content hash differs from the one recorded at the last
+        sync, they were edited elsewhere and those edits are merged in first (see _merge_remote).
+        Only rows that differ from what each worksheet holds are sent, all sheets in a single
+        values.batchUpdate; a sheet is fully rewritten only when its columns changed or it lost rows.
+        """
+        if self.conn is None:
+            raise ConnectionError("GSheets connection unavailable")
+        remote = self._read_sheets()
+        state = self.store.load(self.user_suffix)
+        known_hash = state["remote_hash"] if state else None
+        if not remote and known_hash:
+            raise ConnectionError("GSheets worksheets could not be read")
+        remote_hash = _rows_hash(remote)
+        if known_hash and remote_hash != known_hash:
+            item = self._merge_remote(remote, remote_hash)
 
-        # 3. WRITE TO SHEETS
+        baseline = self._sync.baseline
+        baseline.clear()
+        baseline.update({sheet: _sheet_rows(df) for sheet, df in remote.items()})
+
+        frames = self._snapshot_frames(item["data"])
+        full, deltas = {}, {}
+        for sheet, df in frames.items():
+            dirty = _dirty_rows(baseline.get(sheet), _sheet_rows(df))
+            if dirty is None:
+                full[sheet] = df
+            elif dirty:
+                deltas[sheet] = dirty
+
+        if deltas:
+            try:
+                self._batch_update_rows(frames, deltas)
+                for sheet in deltas:
+                    baseline[sheet] = _sheet_rows(frames[sheet])
+            except Exception as e:
+                rows = sum(len(r) for r in deltas.values())
+                print(f"Delta sync unavailable ({type(e).__name__}: {e}); "
+                      f"falling back to full rewrites of {', '.join(deltas)} for {rows} changed row(s)")
+                full.update({sheet: frames[sheet] for sheet in deltas})
+
+        for sheet, df in full.items():
+            if sheet == self.ledger_sheet:
+                self._write_ledger(df)
+            else:
+                self.conn.update(worksheet=sheet, data=df)
+            baseline[sheet] = _sheet_rows(df)
+
+        self.store.mark_synced(self.user_suffix, item["version"], _hash_rows(baseline), item["data"])
         try:
-            self.conn.update(worksheet=self.assets_sheet, data=df_assets)
-            self.conn.update(worksheet=self.config_sheet, data=df_config)
-            # st.toast("☁️ Cloud Sync Complete") # Optional feedback
-        except Exception as e:
-            st.error(f"Failed to sync to GSheets: {e}")
+            get_batch_loader(self.conn).invalidate()
+        except Exception:
+            pass
+
+    def _merge_remote(self, remote: Dict[str, pd.DataFrame], remote_hash: str) -> Dict[str, Any]:
+        """
+        Folds edits made directly in the sheets (or by another machine) into the newest local
+        version: a three-way merge against what the sheets held at the last sync, committed with
+        compare-and-swap. Returns the merged {"version", "data"} to write back.
+        """
+        theirs = self._load_data(remote)
+        while True:
+            state = self.store.load(self.user_suffix)
+            if state["synced_data"] is None:
+                # Last synced before common ancestors were recorded: local wins, keep the sheet's copy
+                self.store.record_conflict(self.user_suffix, state["version"], theirs, remote_hash)
+                self._sync.last_conflict = (
+                    "The portfolio sheet was edited elsewhere since the last sync. "
+                    "Local changes were kept; the sheet's previous contents are saved in the local conflict log."
+                )
+                return {"version": state["version"], "data": state["data"]}
+            merged, conflicts = three_way_merge(state["synced_data"], state["data"], theirs)
+            version = self.store.commit(self.user_suffix, merged, expected_version=state["version"])
+            if version is not None:
+                break
+        if conflicts:
+            self.store.record_conflict(self.user_suffix, version, theirs, remote_hash)
+            self._sync.last_conflict = (
+                "The portfolio sheet was edited elsewhere since the last sync and the changes were merged. "
+                f"Fields changed on both sides kept the local value ({', '.join(conflicts)}); "
+                "the sheet's previous contents are saved in the local conflict log."
+            )
+        return {"version": version, "data": merged}
+
+    def _batch_update_rows(self, frames: Dict[str, pd.DataFrame], deltas: Dict[str, List[int]]):
+        """Sends the dirty rows of every sheet as contiguous A1 ranges in one API call."""
+        spreadsheet = open_spreadsheet()
+        data = []
+        for sheet, rows in deltas.items():
+            values = _sheet_values(frames[sheet])
+            last_col = _a1_column(len(frames[sheet].columns))
+            for first, last in _contiguous(rows):
+                # +2: sheet rows are 1-based and row 1 is the header
+                data.append({
+                    "range": f"'{sheet}'!A{first + 2}:{last_col}{last + 2}",
+                    "values": values[first:last + 1]
+                })
+        spreadsheet.values_batch_update(body={"valueInputOption": "RAW", "data": data})
+
+    def _write_ledger(self, df_ledger: pd.DataFrame):
+        try:
+            self.conn.update(worksheet=self.ledger_sheet, data=df_ledger)
+        except Exception:
+            # First transaction for this user: the worksheet does not exist yet
+            self.conn.create(worksheet=self.ledger_sheet, data=df_ledger)
 
     # --- Methods below remain largely same, interacting with self.data ---
 
     def get_assets(self) -> List[Dict[str, Any]]:
         return self.data.get("assets", [])
 
+    def get_accounts(self) -> List[str]:
+        """Named accounts (taxable, RRSP/TFSA, ISA, exchange wallets, ...), default account first."""
+        names = list(self.get_setting("accounts", [])) + [a.get("account", DEFAULT_ACCOUNT) for a in self.get_assets()]
+        return [DEFAULT_ACCOUNT] + sorted(set(names) - {DEFAULT_ACCOUNT})
+
+    def add_account(self, name: str):
+        name = name.strip()
+        if not name or name in self.get_accounts():
+            return
+        self.update_setting("accounts", sorted(set(self.get_setting("accounts", [])) | {name}))
+
+    def positions_frame(self, assets: List[Dict[str, Any]] = None) -> pd.DataFrame:
+        """Stacked positions table: one row per (account, ticker)."""
+        assets = self.get_assets() if assets is None else assets
+        df = pd.DataFrame.from_records(assets, columns=ASSET_FIELDS)
+        df["account"] = df["account"].fillna(DEFAULT_ACCOUNT)
+        df["quantity"] = pd.to_numeric(df["quantity"], errors="coerce").fillna(0.0)
+        df["avg_price"] = pd.to_numeric(df["avg_price"], errors="coerce").fillna(0.0)
+        return df
+
     def add_or_update_asset(self, asset: Dict[str, Any]):
         # Same Logic as before (in-memory update)
         # Then call save_data which pushes to sheet
+        # Positions are keyed by (account, ticker): the same ticker may sit in several accounts
         asset['ticker'] = asset['ticker'].upper()
-        existing_idx = next((i for i, a in enumerate(self.data["assets"]) if a["ticker"] == asset["ticker"]), None)
+        asset['account'] = asset.get('account') or DEFAULT_ACCOUNT
+        existing_idx = next((i for i, a in enumerate(self.data["assets"])
+                             if a["ticker"] == asset["ticker"] and a.get("account", DEFAULT_ACCOUNT) == asset["account"]), None)
         
         if existing_idx is not None:
              # Merge Logic (Simplified Reuse)
@@ -177,9 +621,11 @@ class PortfolioManager:
         
         self.save_data()
 
-    def remove_asset(self, ticker: str):
+    def remove_asset(self, ticker: str, account: str = None):
+        """Removes the ticker from one account, or from every account when account is None."""
         original_count = len(self.data["assets"])
-        self.data["assets"] = [a for a in self.data["assets"] if a["ticker"] != ticker.upper()]
+        self.data["assets"] = [a for a in self.data["assets"]
+                               if not (a["ticker"] == ticker.upper() and account in (None, a.get("account", DEFAULT_ACCOUNT)))]
         if len(self.data["assets"]) < original_count:
             self.save_data()
 
@@ -195,3 +641,54 @@ class PortfolioManager:
 
     def get_setting(self, key: str, default: Any = None) -> Any:
         return self.data.get("settings", {}).get(key, default)
+
+    def get_transactions(self) -> List[Dict[str, Any]]:
+        return self.data.get("transactions", [])
+
+    def get_ledger(self) -> TransactionLedger:
+        return TransactionLedger(self.get_transactions())
+
+    def import_transactions(self, txns: pd.DataFrame, asset_info: Dict[str, Dict[str, Any]] = None,
+                            account: str = None) -> Dict[str, int]:
+        """
+        Bulk import of normalized statement rows (see statement_import.read_statement).
+        Rows already in the ledger are skipped, holdings in `account` are updated from the net
+        BUY/SELL per ticker (average cost), and everything is committed with one save_data.
+        asset_info: {ticker: get_asset_info(...)} for tickers not held yet (class / sector).
+        """
+        account = account or DEFAULT_ACCOUNT
+        asset_info = asset_info or {}
+        ledger = self.get_ledger()
+        new = drop_known(txns, ledger)
+        if new.empty:
+            return {"transactions": 0, "duplicates": len(txns), "positions": 0}
+
+        held = {(a.get("account", DEFAULT_ACCOUNT), a["ticker"]): a for a in self.data["assets"]}
+        changes = holdings_from_trades(new)
+        for ticker, qty, bought, cost in zip(*(changes[c].tolist() for c in ("ticker", "quantity", "bought", "cost"))):
+            asset = held.get((account, ticker))
+            if asset is None:
+                info = asset_info.get(ticker) or {}
+                asset = {"ticker": ticker, "quantity": 0.0, "avg_price": 0.0,
+                         "asset_class": info.get("asset_class", "Stock"), "sector": info.get("sector", "Unknown"),
+                         "account": account}
+                held[(account, ticker)] = asset
+            old_qty, old_avg = float(asset.get("quantity", 0.0)), float(asset.get("avg_price", 0.0))
+            if old_qty + bought > 0:
+                asset["avg_price"] = (old_qty * old_avg + cost) / (old_qty + bought)
+            asset["quantity"] = old_qty + qty
+            if asset["quantity"] <= 1e-12:
+                del held[(account, ticker)]  # sold out
+        self.data["assets"] = list(held.values())
+
+        ledger.extend(new)
+        self.data["transactions"] = ledger.to_records()
+        self.save_data()
+        return {"transactions": len(new), "duplicates": len(txns) - len(new), "positions": len(changes)}
+
+    def add_transaction(self, txn: Dict[str, Any], save: bool = True):
+        ledger = self.get_ledger()
+        ledger.add(txn)
+        self.data["transactions"] = ledger.to_records()
+        if save:
+            self.save_data()
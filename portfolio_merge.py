@@ -0,0 +1,158 @@
+import json
+import math
+from collections import Counter
+from typing import Dict, List, Any, Tuple, Optional
+
+from storage_backends import DEFAULT_ACCOUNT
+
+
+def _same(a: Any, b: Any) -> bool:
+    """Equality that treats NaN as equal to NaN (sheet round trips produce fresh NaN objects)."""
+    if isinstance(a, float) and isinstance(b, float) and math.isnan(a) and math.isnan(b):
+        return True
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_same(a[k], b[k]) for k in a)
+    return a == b
+
+
+def _number(value: Any) -> Optional[float]:
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or math.isnan(value):
+        return None
+    return float(value)
+
+
+def _merge_delta(base: Any, mine: Any, theirs: Any) -> Optional[float]:
+    """
+    Balance-like value changed on both sides (quantity, cash): both edits are deltas against base,
+    so both apply (10 + 5 locally and 10 + 5 remotely -> 20). None if any side is not a number.
+    """
+    b, m, t = _number(base), _number(mine), _number(theirs)
+    if b is None or m is None or t is None:
+        return None
+    return m + t - b
+
+
+def _asset_key(asset: Dict[str, Any]) -> Tuple[str, str]:
+    return (asset.get("account") or DEFAULT_ACCOUNT, str(asset.get("ticker", "")).upper())
+
+
+def _merge_value(base: Any, mine: Any, theirs: Any) -> Tuple[Any, bool]:
+    """Classic three-way rule for one value. Returns (merged, conflicted); on conflict the local value wins."""
+    if _same(mine, theirs):
+        return mine, False
+    if _same(mine, base):
+        return theirs, False
+    if _same(theirs, base):
+        return mine, False
+    return mine, True
+
+
+def _merge_row(base: Optional[Dict[str, Any]], mine: Dict[str, Any], theirs: Dict[str, Any], label: str,
+               conflicts: List[str]) -> Dict[str, Any]:
+    """
+    Field-level merge of one asset row edited on both sides. A quantity changed on both sides adds
+    both changes, and avg_price is then recomputed from the combined cost (quantity x avg_price).
+    """
+    base = base or {}
+    merged = {}
+    fields = list(theirs) + [f for f in mine if f not in theirs]
+    qty = ("quantity", base.get("quantity"), mine.get("quantity"), theirs.get("quantity"))
+    # Equal new values on both sides are still two edits (each session added 5 to 10 -> both 15)
+    both_changed = not _same(qty[2], qty[1]) and not _same(qty[3], qty[1])
+    quantity = _merge_delta(*qty[1:]) if both_changed else None
+    if quantity is not None:
+        merged["quantity"] = quantity
+        avg = [_number(side.get("avg_price", 0.0)) for side in (base, mine, theirs)]
+        if all(a is not None for a in avg):
+            cost = qty[2] * avg[1] + qty[3] * avg[2] - qty[1] * avg[0]
+            merged["avg_price"] = cost / quantity if quantity > 0 else 0.0
+    for field in fields:
+        if field in merged:
+            continue
+        value, conflicted = _merge_value(base.get(field), mine.get(field), theirs.get(field))
+        if conflicted:
+            conflicts.append(f"{label}.{field}")
+        merged[field] = value
+    return {field: merged[field] for field in fields}
+
+
+def _merge_keyed(base: Dict[Any, Any], mine: Dict[Any, Any], theirs: Dict[Any, Any], label, conflicts: List[str],
+                 rows=False, additive=False) -> Dict[Any, Any]:
+    """
+    Merges two edited versions of a keyed collection against their common ancestor.
+    Keys keep the remote order, followed by keys only added locally. A key deleted on one side
+    and modified on the other is kept (modified) and reported.
+    additive=True: numeric values (cash balances) changed on both sides apply both changes.
+    """
+    merged = {}
+    for key in list(theirs) + [k for k in mine if k not in theirs]:
+        b, m, t = base.get(key), mine.get(key), theirs.get(key)
+        name = label(key)
+        if rows and m is not None and t is not None and (not _same(m, t) or (b is not None and not _same(m, b) and not _same(t, b))):
+            merged[key] = _merge_row(b, m, t, name, conflicts)
+            continue
+        value, conflicted = _merge_value(b, m, t)
+        if additive and not _same(m, b) and not _same(t, b) and _merge_delta(b, m, t) is not None:
+            value, conflicted = _merge_delta(b, m, t), False  # equal new balances are still two changes
+        if conflicted:
+            conflicts.append(name)
+            value = m if m is not None else t
+        if value is not None:
+            merged[key] = value
+    return merged
+
+
+def _merge_transactions(base: List[Dict[str, Any]], mine: List[Dict[str, Any]],
+                        theirs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Ledger rows have no id, so they merge as multisets: the remote rows, plus rows added locally,
+    minus rows deleted locally (relative to the common ancestor).
+    """
+    def key(txn):
+        return json.dumps(txn, sort_keys=True, default=str)
+
+    base_count = Counter(key(t) for t in base)
+    mine_count = Counter(key(t) for t in mine)
+    added = mine_count - base_count
+    removed = base_count - mine_count
+
+    merged = []
+    for txn in theirs:
+        k = key(txn)
+        if removed[k] > 0:
+            removed[k] -= 1
+            continue
+        merged.append(txn)
+    for txn in mine:
+        k = key(txn)
+        if added[k] > 0:
+            added[k] -= 1
+            merged.append(txn)
+    return merged
+
+
+def three_way_merge(base: Dict[str, Any], mine: Dict[str, Any], theirs: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Merges a local edit (`mine`) with a concurrent one (`theirs`) made from the same `base` snapshot.
+    Assets merge per (account, ticker) row and per field, cash per currency, settings per key and
+    the ledger as a multiset. Quantities and cash balances changed on both sides are treated as
+    deltas from `base` and both applied. Returns (merged data, descriptions of fields both sides changed
+    differently — those keep the local value).
+    """
+    conflicts: List[str] = []
+    merged = dict(theirs)
+
+    def assets_by_key(data):
+        return {_asset_key(a): a for a in data.get("assets", [])}
+
+    merged["assets"] = list(_merge_keyed(
+        assets_by_key(base), assets_by_key(mine), assets_by_key(theirs),
+        lambda k: f"assets[{k[0]}/{k[1]}]", conflicts, rows=True
+    ).values())
+    merged["cash"] = _merge_keyed(base.get("cash", {}), mine.get("cash", {}), theirs.get("cash", {}),
+                                  lambda k: f"cash[{k}]", conflicts, additive=True)
+    merged["settings"] = _merge_keyed(base.get("settings", {}), mine.get("settings", {}), theirs.get("settings", {}),
+                                      lambda k: f"settings[{k}]", conflicts)
+    merged["transactions"] = _merge_transactions(base.get("transactions", []), mine.get("transactions", []),
+                                                 theirs.get("transactions", []))
+    return merged, conflicts
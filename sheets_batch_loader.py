@@ -0,0 +1,163 @@
+import hashlib
+import threading
+import pandas as pd
+from typing import Dict, List, Any, Optional, Tuple
+
+SHEETS_API_URL = "https://sheets.googleapis.com/v4"
+DRIVE_API_URL = "https://www.googleapis.com/drive/v3"
+USER_SHEETS = ("Assets", "Config", "Ledger")
+
+
+def user_sheet_names(user_suffix: str) -> List[str]:
+    """Worksheets holding one user's portfolio (PortfolioManager naming: Assets_<user>, ...)."""
+    return [f"{prefix}{user_suffix}" for prefix in USER_SHEETS]
+
+
+def _values_frame(values: List[List[Any]]) -> pd.DataFrame:
+    """Sheets values (first row = header) -> DataFrame like conn.read returns (short rows padded)."""
+    if not values:
+        return pd.DataFrame()
+    header = [str(h) for h in values[0]]
+    width = len(header)
+    rows = [list(r[:width]) + [None] * (width - len(r)) for r in values[1:]]
+    df = pd.DataFrame(rows, columns=header)
+    # Empty cells read as NaN and fully blank rows are dropped, like conn.read
+    return df.mask(df.eq("")).dropna(how="all").infer_objects()
+
+
+class SheetsBatchLoader:
+    """
+    Reads many worksheets (one user's, or every user's during warm-up / reporting) with a
+    single values:batchGet request instead of one read per sheet.
+    Results are cached per range together with the Drive revision they were read at: while the
+    file version is unchanged, a load costs one small metadata request and no values are fetched;
+    a range read at an older revision is fetched again (even if another caller already saw the
+    new revision), and ranges whose contents hash the same keep their already-parsed DataFrame.
+    `session` is any requests-style session with auth (google.auth AuthorizedSession) and both
+    API roots are injectable, so the loader can run against a local fake server.
+    """
+    def __init__(self, spreadsheet_id: str, session, base_url: str = SHEETS_API_URL, drive_url: Optional[str] = DRIVE_API_URL):
+        self.spreadsheet_id = spreadsheet_id
+        self.session = session
+        self.base_url = base_url.rstrip("/")
+        self.drive_url = drive_url.rstrip("/") if drive_url else None
+        self.revision: Optional[str] = None
+        self.requests = 0  # HTTP calls made (for benchmarks / tests)
+        self._titles: Optional[List[str]] = None
+        # sheet -> (revision read at, content hash, frame)
+        self._cache: Dict[str, Tuple[Optional[str], str, pd.DataFrame]] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, url: str, params=None) -> Dict[str, Any]:
+        self.requests += 1
+        response = self.session.get(url, params=params)
+        response.raise_for_status()
+        return response.json()
+
+    def _current_revision(self) -> Optional[str]:
+        """Drive file version (bumped on every edit); None if unavailable (no caching then)."""
+        if not self.drive_url:
+            return None
+        try:
+            meta = self._get(f"{self.drive_url}/files/{self.spreadsheet_id}", params={"fields": "version"})
+            return str(meta.get("version"))
+        except Exception as e:
+            print(f"Sheets revision check unavailable, reading without cache: {e}")
+            self.drive_url = None
+            return None
+
+    def _sheet_titles(self) -> List[str]:
+        meta = self._get(f"{self.base_url}/spreadsheets/{self.spreadsheet_id}",
+                         params={"fields": "sheets.properties.title"})
+        return [s["properties"]["title"] for s in meta.get("sheets", [])]
+
+    def load(self, sheets: List[str]) -> Dict[str, pd.DataFrame]:
+        """
+        {sheet: DataFrame} for the requested worksheets that exist (missing ones are omitted,
+        like PortfolioManager._read_sheets). Frames are shared with the cache: copy before mutating.
+        """
+        with self._lock:
+            revision = self._current_revision()
+            if revision is None or revision != self.revision or self._titles is None:
+                self._titles = self._sheet_titles()
+            wanted = [s for s in sheets if s in self._titles]
+            # Each range is fresh only at the revision it was read at: the revision is per file,
+            # but a load refetches just its own ranges
+            stale = [s for s in wanted if revision is None or s not in self._cache or self._cache[s][0] != revision]
+
+            if stale:
+                body = self._get(
+                    f"{self.base_url}/spreadsheets/{self.spreadsheet_id}/values:batchGet",
+                    params=[("ranges", f"'{s}'") for s in stale] + [
+                        ("majorDimension", "ROWS"),
+                        ("valueRenderOption", "UNFORMATTED_VALUE"),
+                        ("dateTimeRenderOption", "FORMATTED_STRING"),
+                    ]
+                )
+                for sheet, value_range in zip(stale, body.get("valueRanges", [])):
+                    values = value_range.get("values", [])
+                    digest = hashlib.sha1(repr(values).encode("utf-8")).hexdigest()
+                    cached = self._cache.get(sheet)
+                    frame = cached[2] if cached is not None and cached[1] == digest else _values_frame(values)
+                    self._cache[sheet] = (revision, digest, frame)
+            # Sheets deleted since the last load must not be served from the cache
+            for sheet in set(self._cache) - set(self._titles):
+                del self._cache[sheet]
+            self.revision = revision
+            return {s: self._cache[s][2] for s in wanted if s in self._cache}
+
+    def load_users(self, user_suffixes: List[str]) -> Dict[str, Dict[str, pd.DataFrame]]:
+        """Every listed user's worksheets in one batch: {user_suffix: {sheet: DataFrame}}."""
+        frames = self.load([s for u in user_suffixes for s in user_sheet_names(u)])
+        return {u: {s: frames[s] for s in user_sheet_names(u) if s in frames} for u in user_suffixes}
+
+    def invalidate(self):
+        """Forget the revision after this process wrote to the spreadsheet itself."""
+        with self._lock:
+            self.revision = None
+
+
+def _authorized_session(spreadsheet):
+    """The AuthorizedSession gspread already holds (gspread 6: http_client.session, 5: client.session)."""
+    client = spreadsheet.client
+    return getattr(getattr(client, "http_client", None), "session", None) or client.session
+
+
+GSHEETS_CONNECTION = "gsheets"  # st.connection name (and [connections.gsheets] secrets section)
+_SPREADSHEETS: Dict[str, Any] = {}
+_SPREADSHEETS_LOCK = threading.Lock()
+
+
+def open_spreadsheet(connection_name: str = GSHEETS_CONNECTION):
+    """
+    gspread Spreadsheet of a GSheetsConnection, opened through gspread's public API from the
+    connection's own secrets (spreadsheet URL/key + service account), once per process.
+    streamlit_gsheets keeps its gspread client private, so it is not reused here.
+    """
+    with _SPREADSHEETS_LOCK:
+        if connection_name not in _SPREADSHEETS:
+            import gspread
+            import streamlit as st
+            info = dict(st.secrets["connections"][connection_name])
+            target = str(info.pop("spreadsheet"))
+            info.pop("worksheet", None)
+            client = gspread.service_account_from_dict(info)
+            _SPREADSHEETS[connection_name] = client.open_by_url(target) if target.startswith("http") else client.open_by_key(target)
+        return _SPREADSHEETS[connection_name]
+
+
+_LOADERS: Dict[int, Tuple[Any, SheetsBatchLoader]] = {}
+_LOADERS_LOCK = threading.Lock()
+
+
+def get_batch_loader(conn) -> SheetsBatchLoader:
+    """
+    Process-wide loader for the spreadsheet behind a GSheetsConnection (cache shared by all
+    sessions). The spreadsheet is opened once per connection, not on every load.
+    """
+    with _LOADERS_LOCK:
+        entry = _LOADERS.get(id(conn))
+        if entry is None or entry[0] is not conn:
+            spreadsheet = open_spreadsheet()
+            entry = _LOADERS[id(conn)] = (conn, SheetsBatchLoader(spreadsheet.id, _authorized_session(spreadsheet)))
+        return entry[1]
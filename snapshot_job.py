@@ -0,0 +1,58 @@
+"""
+Records today's portfolio snapshot (positions, cash, FX) for every user in the local store.
+Meant for a daily scheduler so history has no gaps on days the app isn't opened:
+
+    python snapshot_job.py                 # all users
+    python snapshot_job.py --user _csj     # local store keys
+"""
+import argparse
+import sys
+from datetime import datetime
+
+import pandas as pd
+
+from analytics_engine import AnalyticsEngine
+from local_store import get_local_store
+from market_data import MarketData
+from snapshot_store import get_snapshot_store, cash_to_usd
+from storage_backends import ASSET_FIELDS, DEFAULT_ACCOUNT
+
+
+def snapshot_user(user, data, md, ae, snapshots, day):
+    positions = pd.DataFrame.from_records(data.get("assets", []), columns=ASSET_FIELDS)
+    positions["account"] = positions["account"].fillna(DEFAULT_ACCOUNT)
+    positions["quantity"] = pd.to_numeric(positions["quantity"], errors="coerce").fillna(0.0)
+    positions["avg_price"] = pd.to_numeric(positions["avg_price"], errors="coerce").fillna(0.0)
+    positions = positions[positions["ticker"] != "CASH"]
+    fx_rates, _ = md.get_fx_rates()
+    valued = ae.value_positions(positions, md.get_current_prices(positions["ticker"].unique()))
+    cash_usd = cash_to_usd(data.get("cash", {}), fx_rates)
+    snapshots.record(user, day, valued, cash_usd, fx_rates)
+    return float(valued["value_usd"].sum()) + cash_usd
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Record today's portfolio snapshots.")
+    parser.add_argument("--user", dest="users", action="append", help="local store key (repeatable; default: all)")
+    args = parser.parse_args(argv)
+
+    store, snapshots = get_local_store(), get_snapshot_store()
+    md, ae = MarketData(), AnalyticsEngine()
+    day = datetime.now().strftime("%Y-%m-%d")
+    failed = 0
+    for user in args.users or store.users():
+        state = store.load(user)
+        if state is None:
+            print(f"SKIP {user}: no local state")
+            continue
+        try:
+            nav = snapshot_user(user, state["data"], md, ae, snapshots, day)
+            print(f"OK   {user}: {day} NAV ${nav:,.2f}")
+        except Exception as e:
+            failed += 1
+            print(f"FAIL {user}: {e}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
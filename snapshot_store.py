@@ -0,0 +1,156 @@
+import sqlite3
+import os
+import time
+import threading
+import pandas as pd
+from typing import Dict, Optional
+
+SNAPSHOT_DB_FILE = os.path.join(".cache", "snapshots.db")
+ALL_ACCOUNTS_VIEW = "*"
+DEFAULT_FX = {"USD": 1.0, "CAD": 1.35, "KRW": 1300.0}  # same fallbacks the dashboard uses
+
+
+def cash_to_usd(cash: Dict[str, float], rates: Dict[str, float]) -> float:
+    """User-level cash balances valued in USD (rates are units per USD)."""
+    return sum(amount / (rates.get(ccy) or DEFAULT_FX.get(ccy, 1.0)) for ccy, amount in cash.items())
+
+
+class SnapshotStore:
+    """
+    Local SQLite time series of what the portfolio actually held each day: per-position
+    quantity / price / value, user-level cash and the FX rates used, one row set per day
+    (the last snapshot of a day wins). NAV history for the consolidated view or a single
+    account is a GROUP BY over these rows, so history views need no upstream price fetch
+    and grow beyond the one-year download window.
+    Days before the first snapshot can be seeded once from a reconstructed history (backfill).
+    """
+    REFRESH_AFTER = 3600  # seconds: re-snapshot today at most hourly (latest prices win)
+
+    def __init__(self, path=SNAPSHOT_DB_FILE):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._init_schema()
+
+    def _init_schema(self):
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS positions (
+                    user TEXT NOT NULL, date TEXT NOT NULL, account TEXT NOT NULL, ticker TEXT NOT NULL,
+                    quantity REAL, price REAL, value_usd REAL,
+                    PRIMARY KEY (user, date, account, ticker)
+                ) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS days (
+                    user TEXT NOT NULL, date TEXT NOT NULL, cash_usd REAL NOT NULL, taken_at REAL NOT NULL,
+                    PRIMARY KEY (user, date)
+                ) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS fx (
+                    date TEXT NOT NULL, currency TEXT NOT NULL, rate REAL NOT NULL,
+                    PRIMARY KEY (date, currency)
+                ) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS backfill (
+                    user TEXT NOT NULL, view TEXT NOT NULL, date TEXT NOT NULL,
+                    positions_usd REAL NOT NULL, cash_usd REAL NOT NULL,
+                    PRIMARY KEY (user, view, date)
+                ) WITHOUT ROWID;
+            """)
+
+    # --- Writing ---
+
+    def due(self, user: str, day: str) -> bool:
+        """True if `day` has no snapshot yet, or today's is older than REFRESH_AFTER."""
+        with self._lock:
+            row = self._conn.execute("SELECT taken_at FROM days WHERE user = ? AND date = ?", (user, day)).fetchone()
+        return row is None or time.time() - row[0] > self.REFRESH_AFTER
+
+    def record(self, user: str, day: str, positions: pd.DataFrame, cash_usd: float, fx_rates: Dict[str, float]):
+        """
+        Replaces the user's snapshot for `day` in one transaction.
+        positions: valued positions table (account, ticker, quantity, current_price, value_usd).
+        """
+        rows = zip(positions["account"].tolist(), positions["ticker"].tolist(), positions["quantity"].tolist(),
+                   positions["current_price"].tolist(), positions["value_usd"].tolist())
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM positions WHERE user = ? AND date = ?", (user, day))
+            self._conn.executemany(
+                """INSERT INTO positions (user, date, account, ticker, quantity, price, value_usd) VALUES (?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(user, date, account, ticker) DO UPDATE SET quantity = quantity + excluded.quantity,
+                       value_usd = value_usd + excluded.value_usd""",
+                [(user, day, a, t, float(q), float(p), float(v)) for a, t, q, p, v in rows]
+            )
+            self._conn.execute("INSERT OR REPLACE INTO days (user, date, cash_usd, taken_at) VALUES (?, ?, ?, ?)",
+                               (user, day, float(cash_usd), time.time()))
+            self._conn.executemany("INSERT OR REPLACE INTO fx (date, currency, rate) VALUES (?, ?, ?)",
+                                   [(day, c, float(r)) for c, r in fx_rates.items() if r])
+
+    def backfill(self, user: str, view: str, positions_usd: pd.Series, cash_usd: float = 0.0):
+        """Seeds a view's history (USD, indexed by date) for days before snapshots existed. Runs once per view."""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO backfill (user, view, date, positions_usd, cash_usd) VALUES (?, ?, ?, ?, ?)",
+                [(user, view, d.strftime("%Y-%m-%d"), float(v), float(cash_usd)) for d, v in positions_usd.items()]
+            )
+
+    # --- Reading ---
+
+    def is_seeded(self, user: str, view: str) -> bool:
+        """True once the view has history to read (a backfill or at least two days of snapshots)."""
+        with self._lock:
+            seeded = self._conn.execute("SELECT 1 FROM backfill WHERE user = ? AND view = ? LIMIT 1", (user, view)).fetchone()
+            days = self._conn.execute("SELECT COUNT(*) FROM days WHERE user = ?", (user,)).fetchone()[0]
+        return seeded is not None or days >= 2
+
+    def nav_history(self, user: str, view: str = ALL_ACCOUNTS_VIEW) -> pd.DataFrame:
+        """
+        Daily positions_usd / cash_usd for the consolidated view ('*', includes cash) or one account.
+        Snapshot days take precedence; backfilled days fill in before the first snapshot.
+        """
+        account_filter = "" if view == ALL_ACCOUNTS_VIEW else "AND p.account = ?"
+        params = [view] if view != ALL_ACCOUNTS_VIEW else []
+        with self._lock:
+            snapped = self._conn.execute(
+                f"""SELECT d.date, COALESCE(SUM(p.value_usd), 0.0), {'d.cash_usd' if view == ALL_ACCOUNTS_VIEW else '0.0'}
+                    FROM days d LEFT JOIN positions p ON p.user = d.user AND p.date = d.date {account_filter}
+                    WHERE d.user = ? GROUP BY d.date ORDER BY d.date""",
+                params + [user]
+            ).fetchall()
+            first = snapped[0][0] if snapped else "9999-12-31"
+            seeded = self._conn.execute(
+                "SELECT date, positions_usd, cash_usd FROM backfill WHERE user = ? AND view = ? AND date < ? ORDER BY date",
+                (user, view, first)
+            ).fetchall()
+        rows = seeded + snapped
+        df = pd.DataFrame(rows, columns=["date", "positions_usd", "cash_usd"])
+        df.index = pd.to_datetime(df.pop("date"))
+        return df
+
+    def fx_history(self, currency: str) -> pd.Series:
+        """Recorded units of `currency` per USD, by snapshot date."""
+        with self._lock:
+            rows = self._conn.execute("SELECT date, rate FROM fx WHERE currency = ? ORDER BY date", (currency,)).fetchall()
+        return pd.Series({pd.Timestamp(d): r for d, r in rows}, dtype=float)
+
+    def positions_on(self, user: str, day: str) -> pd.DataFrame:
+        """What was held on `day` (latest snapshot of that day)."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT account, ticker, quantity, price, value_usd FROM positions WHERE user = ? AND date = ? ORDER BY value_usd DESC",
+                (user, day)
+            ).fetchall()
+        return pd.DataFrame(rows, columns=["account", "ticker", "quantity", "price", "value_usd"])
+
+
+_STORE: Optional[SnapshotStore] = None
+_STORE_LOCK = threading.Lock()
+
+
+def get_snapshot_store() -> SnapshotStore:
+    """Process-wide store (one SQLite connection shared by every session)."""
+    global _STORE
+    with _STORE_LOCK:
+        if _STORE is None:
+            _STORE = SnapshotStore()
+        return _STORE
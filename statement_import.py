@@ -0,0 +1,239 @@
+import io
+import re
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Iterator, Tuple
+
+from transaction_ledger import LEDGER_COLUMNS, TransactionLedger, upper_strip
+
+IMPORT_CHUNK_ROWS = 5000
+
+# Broker export headers -> ledger columns (compared case-insensitively)
+CSV_COLUMN_ALIASES = {
+    "date": ["date", "trade date", "transaction date", "settlement date", "run date", "activity date"],
+    "type": ["type", "action", "transaction type", "activity", "activity type", "description"],
+    "ticker": ["ticker", "symbol", "security", "instrument"],
+    "quantity": ["quantity", "qty", "shares", "units"],
+    "price": ["price", "unit price", "price per share", "execution price"],
+    "fee": ["fee", "fees", "commission", "commissions", "commission & fees"],
+    "amount": ["amount", "net amount", "total", "value"],
+    "currency": ["currency", "ccy", "settlement currency"],
+}
+
+# Broker wording -> TRANSACTION_TYPES (first matching keyword wins)
+ACTION_KEYWORDS = [
+    ("REINVEST", "BUY"), ("BOUGHT", "BUY"), ("BUY", "BUY"), ("PURCHASE", "BUY"),
+    ("SOLD", "SELL"), ("SELL", "SELL"),
+    ("DIV", "DIVIDEND"), ("INTEREST", "DIVIDEND"),
+    ("DEPOSIT", "DEPOSIT"), ("CONTRIBUTION", "DEPOSIT"), ("TRANSFER IN", "DEPOSIT"),
+    ("WITHDRAW", "WITHDRAW"), ("TRANSFER OUT", "WITHDRAW"),
+]
+
+# OFX aggregates that carry one transaction each, plus the security list (ticker lookup)
+OFX_BLOCK_TAGS = ["BUYSTOCK", "SELLSTOCK", "BUYMF", "SELLMF", "BUYOTHER", "SELLOTHER",
+                  "REINVEST", "INCOME", "INVBANKTRAN", "SECINFO"]
+OFX_BLOCK_TYPES = {"BUYSTOCK": "BUY", "BUYMF": "BUY", "BUYOTHER": "BUY", "REINVEST": "BUY",
+                   "SELLSTOCK": "SELL", "SELLMF": "SELL", "SELLOTHER": "SELL", "INCOME": "DIVIDEND"}
+_OFX_BLOCK_RE = re.compile(r"<(%s)>(.*?)</\1>" % "|".join(OFX_BLOCK_TAGS), re.S | re.I)
+_OFX_FIELD_RE = re.compile(r"<([A-Z0-9.]+)>([^<\r\n]*)", re.I)
+
+
+def normalize_symbols(symbols: pd.Series) -> pd.Series:
+    """
+    Broker symbols -> yfinance tickers, once per distinct value:
+    'NASDAQ:AAPL' -> 'AAPL', 'BRK.B' / 'BRK/B' -> 'BRK-B' (share classes); exchange suffixes such as '.TO' are kept.
+    """
+    cleaned = upper_strip(symbols)
+    codes, uniques = pd.factorize(cleaned)
+    out = []
+    for s in uniques:
+        s = s.split(":")[-1].split(" ")[0]
+        s = re.sub(r"^([A-Z]+)[./]([A-Z])$", r"\1-\2", s)
+        out.append(s)
+    return pd.Series(np.array(out + [""], dtype=object)[codes], index=symbols.index, dtype=object)
+
+
+def _map_actions(actions: pd.Series) -> pd.Series:
+    codes, uniques = pd.factorize(upper_strip(actions))
+    mapped = [next((t for k, t in ACTION_KEYWORDS if k in a), "") for a in uniques]
+    return pd.Series(np.array(mapped + [""], dtype=object)[codes], index=actions.index, dtype=object)
+
+
+def _number(col: pd.Series) -> pd.Series:
+    """'$1,234.50' / '(12.00)' -> 1234.5 / -12.0"""
+    if pd.api.types.is_numeric_dtype(col):
+        return col.astype(float)
+    text = col.astype("string").str.replace(r"[,$\s]", "", regex=True).str.replace(r"^\((.*)\)$", r"-\1", regex=True)
+    return pd.to_numeric(text, errors="coerce").astype(float)
+
+
+def _rename_csv_columns(columns) -> Dict[str, str]:
+    lookup = {alias: field for field, aliases in CSV_COLUMN_ALIASES.items() for alias in aliases}
+    renames, taken = {}, set()
+    for c in columns:
+        field = lookup.get(str(c).strip().lower())
+        if field and field not in taken:
+            renames[c] = field
+            taken.add(field)
+    return renames
+
+
+def normalize_chunk(df: pd.DataFrame) -> pd.DataFrame:
+    """One chunk of broker rows (ledger field names) -> ledger-shaped rows, column-wise."""
+    out = pd.DataFrame(index=df.index)
+    out["date"] = pd.to_datetime(df["date"], errors="coerce").dt.strftime("%Y-%m-%d")
+    out["type"] = _map_actions(df["type"]) if "type" in df.columns else "BUY"
+    out["ticker"] = normalize_symbols(df["ticker"]) if "ticker" in df.columns else ""
+    for col in ("quantity", "price", "fee", "amount"):
+        out[col] = _number(df[col]).fillna(0.0) if col in df.columns else 0.0
+    # Sells / buys are often exported with signed quantities and amounts; the ledger stores magnitudes
+    out[["quantity", "fee", "amount"]] = out[["quantity", "fee", "amount"]].abs()
+    missing_price = (out["price"] == 0) & (out["quantity"] > 0)
+    out.loc[missing_price, "price"] = out.loc[missing_price, "amount"] / out.loc[missing_price, "quantity"]
+    out["currency"] = upper_strip(df["currency"]).replace("", "USD") if "currency" in df.columns else "USD"
+    out["to_amount"] = 0.0
+    out["to_currency"] = ""
+    return out.reindex(columns=LEDGER_COLUMNS)
+
+
+def _valid(chunk: pd.DataFrame, offset: int, errors: List[str]) -> pd.DataFrame:
+    bad = chunk["date"].isna() | (chunk["type"] == "")
+    trade = chunk["type"].isin(["BUY", "SELL"])
+    bad |= trade & ((chunk["ticker"] == "") | (chunk["quantity"] <= 0))
+    if bad.any():
+        rows = (np.flatnonzero(bad.to_numpy()) + offset + 2).tolist()  # +2: 1-based with a header row
+        shown = ", ".join(map(str, rows[:10])) + (f" (+{len(rows) - 10} more)" if len(rows) > 10 else "")
+        errors.append(f"skipped {len(rows)} unrecognized row(s): {shown}")
+    return chunk[~bad]
+
+
+def iter_csv(source, chunksize: int = IMPORT_CHUNK_ROWS, errors: List[str] = None) -> Iterator[pd.DataFrame]:
+    """Streams a broker CSV export as normalized ledger chunks (never holds the raw file in memory)."""
+    errors = [] if errors is None else errors
+    offset = 0
+    for raw in pd.read_csv(source, chunksize=chunksize, dtype=str, skipinitialspace=True):
+        renames = _rename_csv_columns(raw.columns)
+        raw = raw.rename(columns=renames)
+        if "date" not in raw.columns:
+            raise ValueError(f"no date column found (expected one of: {', '.join(CSV_COLUMN_ALIASES['date'])})")
+        yield _valid(normalize_chunk(raw), offset, errors)
+        offset += len(raw)
+
+
+def _ofx_blocks(stream, read_size: int = 1 << 16) -> Iterator[Tuple[str, Dict[str, str]]]:
+    """Yields (aggregate tag, {field: value}) from an OFX/QFX stream, reading it incrementally."""
+    buffer = ""
+    while True:
+        piece = stream.read(read_size)
+        if isinstance(piece, bytes):
+            piece = piece.decode("utf-8", errors="replace")
+        buffer += piece
+        end = 0
+        for match in _OFX_BLOCK_RE.finditer(buffer):
+            fields = {k.upper(): v.strip() for k, v in _OFX_FIELD_RE.findall(match.group(2))}
+            yield match.group(1).upper(), fields
+            end = match.end()
+        buffer = buffer[end:]
+        if not piece:
+            break
+
+
+def iter_ofx(source, chunksize: int = IMPORT_CHUNK_ROWS, errors: List[str] = None) -> Iterator[pd.DataFrame]:
+    """
+    Reads an OFX/QFX investment statement as normalized ledger chunks. The file is parsed
+    incrementally and rows are normalized chunk by chunk as blocks arrive, but the chunks are
+    only yielded at the end: trades reference securities by CUSIP/ISIN and the SECLIST that
+    maps them to tickers usually comes after them.
+    """
+    errors = [] if errors is None else errors
+    rows, securities = [], {}
+    pending: List[Tuple[pd.DataFrame, np.ndarray]] = []  # (normalized chunk, raw security ids)
+
+    def flush():
+        chunk = pd.DataFrame(rows)
+        rows.clear()
+        chunk["date"] = pd.to_datetime(chunk["date"], format="%Y%m%d", errors="coerce")
+        ids = chunk["ticker"].fillna("").to_numpy()
+        # Types are already ledger types; keep them out of the keyword mapping
+        types = chunk.pop("type")
+        out = normalize_chunk(chunk)
+        out["type"] = types.to_numpy()
+        pending.append((out, ids))
+
+    for tag, f in _ofx_blocks(source):
+        if tag == "SECINFO":
+            securities[f.get("UNIQUEID", "")] = f.get("TICKER", "")
+            continue
+        if tag == "INVBANKTRAN":
+            amount = f.get("TRNAMT", "0")
+            kind = "DEPOSIT" if not amount.startswith("-") else "WITHDRAW"
+        else:
+            kind = OFX_BLOCK_TYPES[tag]
+        rows.append({
+            "date": (f.get("DTTRADE") or f.get("DTPOSTED") or "")[:8], "type": kind, "ticker": f.get("UNIQUEID", ""),
+            "quantity": f.get("UNITS"), "price": f.get("UNITPRICE"), "fee": f.get("COMMISSION") or f.get("FEES"),
+            "amount": f.get("TOTAL") or f.get("TRNAMT"), "currency": f.get("CURSYM") or f.get("CURDEF") or "USD",
+        })
+        if len(rows) >= chunksize:
+            flush()
+    if rows:
+        flush()
+
+    offset = 0
+    for out, ids in pending:
+        out["ticker"] = normalize_symbols(pd.Series([securities.get(u) or u for u in ids], index=out.index, dtype=object))
+        yield _valid(out, offset, errors)
+        offset += len(out)
+
+
+def read_statement(source, filename: str = "", chunksize: int = IMPORT_CHUNK_ROWS) -> Tuple[pd.DataFrame, List[str]]:
+    """
+    Reads a whole broker statement (CSV or OFX/QFX, by file extension) chunk by chunk.
+    Returns (ledger-shaped transactions, messages about rows that were skipped).
+    """
+    errors: List[str] = []
+    reader = iter_ofx if filename.lower().endswith((".ofx", ".qfx")) else iter_csv
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+    chunks = list(reader(source, chunksize=chunksize, errors=errors))
+    txns = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame(columns=LEDGER_COLUMNS)
+    return txns, errors
+
+
+# Fields that identify an already-recorded row: trades by what was traded (and its fee), cash rows
+# (quantity / price are 0) by their amount
+TRADE_KEY = ["date", "type", "ticker", "quantity", "price", "fee", "currency"]
+CASH_KEY = ["date", "type", "ticker", "amount", "currency"]
+
+
+def drop_known(txns: pd.DataFrame, ledger: TransactionLedger) -> pd.DataFrame:
+    """Removes rows already in the ledger, so re-importing an overlapping statement is harmless."""
+    if ledger.empty or txns.empty:
+        return txns
+    recorded = ledger.df.assign(date=ledger.df["date"].dt.strftime("%Y-%m-%d"))
+    known = pd.Series(False, index=txns.index)
+    is_trade = txns["type"].isin(["BUY", "SELL"])
+    for rows, key in ((is_trade, TRADE_KEY), (~is_trade, CASH_KEY)):
+        if not rows.any():
+            continue
+        merged = txns.loc[rows, key].merge(recorded[key].drop_duplicates(), on=key, how="left", indicator=True)
+        known[rows] = (merged["_merge"] == "both").to_numpy()
+    return txns[~known]
+
+
+def holdings_from_trades(txns: pd.DataFrame) -> pd.DataFrame:
+    """
+    Net position change per ticker from imported BUY/SELL rows (groupby, no per-row loop):
+    ticker, quantity (bought - sold), bought, cost (of the buys, for average-cost updates).
+    """
+    trades = txns[txns["type"].isin(["BUY", "SELL"])]
+    if trades.empty:
+        return pd.DataFrame(columns=["ticker", "quantity", "bought", "cost"])
+    is_buy = trades["type"] == "BUY"
+    signed = trades["quantity"].where(is_buy, -trades["quantity"])
+    frame = pd.DataFrame({
+        "ticker": trades["ticker"], "quantity": signed,
+        "bought": trades["quantity"].where(is_buy, 0.0),
+        "cost": (trades["quantity"] * trades["price"] + trades["fee"]).where(is_buy, 0.0),
+    })
+    return frame.groupby("ticker", sort=True).sum().reset_index()
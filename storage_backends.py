@@ -0,0 +1,300 @@
+import json
+import os
+import sqlite3
+import importlib.util
+from typing import Dict, List, Any
+from transaction_ledger import LEDGER_COLUMNS
+
+# Canonical data dict shared by every backend (the legacy JSON schema plus the ledger):
+#   {"assets": [{ticker, quantity, avg_price, asset_class, sector, account}], "cash": {CCY: amount},
+#    "settings": {base_currency, section_labels, risk_inputs, ...}, "transactions": [LEDGER_COLUMNS rows]}
+ASSET_FIELDS = ["ticker", "quantity", "avg_price", "asset_class", "sector", "account"]
+DEFAULT_ACCOUNT = "Main"
+
+
+def empty_data() -> Dict[str, Any]:
+    return {
+        "assets": [],
+        "cash": {"USD": 0.0, "CAD": 0.0, "KRW": 0.0},
+        "settings": {"base_currency": "USD"},
+        "transactions": []
+    }
+
+
+def with_defaults(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Fills keys older schemas don't have (e.g. legacy JSON files have no transactions)."""
+    out = empty_data()
+    out["assets"] = [{**a, "account": a.get("account") or DEFAULT_ACCOUNT} for a in data.get("assets", [])]
+    out["cash"].update(data.get("cash", {}))
+    out["settings"].update(data.get("settings", {}))
+    out["transactions"] = list(data.get("transactions", []))
+    return out
+
+
+def _frame_records(df) -> List[Dict[str, Any]]:
+    """DataFrame -> list of dicts of native Python values (column-wise)."""
+    columns = list(df.columns)
+    return [dict(zip(columns, row)) for row in zip(*(df[c].tolist() for c in columns))]
+
+
+class StorageBackend:
+    """
+    Where a user's portfolio lives. Backends only move the canonical data dict in and out;
+    PortfolioManager's local journal, write-behind queue and conflict handling sit on top.
+    """
+    name = "base"
+
+    def exists(self, user_id: str) -> bool:
+        raise NotImplementedError
+
+    def load(self, user_id: str) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    def save(self, user_id: str, data: Dict[str, Any]):
+        raise NotImplementedError
+
+    def warm_up(self, user_ids: List[str]):
+        """Optional bulk prefetch before loading several users (remote backends)."""
+
+
+class JSONBackend(StorageBackend):
+    """The original local file format: data_{user}.json in `directory`."""
+    name = "json"
+
+    def __init__(self, directory="."):
+        self.directory = directory
+
+    def path(self, user_id: str) -> str:
+        return os.path.join(self.directory, f"data_{user_id}.json")
+
+    def exists(self, user_id: str) -> bool:
+        return os.path.exists(self.path(user_id))
+
+    def load(self, user_id: str) -> Dict[str, Any]:
+        if not self.exists(user_id):
+            return empty_data()
+        with open(self.path(user_id), "r", encoding="utf-8") as f:
+            return with_defaults(json.load(f))
+
+    def save(self, user_id: str, data: Dict[str, Any]):
+        os.makedirs(self.directory or ".", exist_ok=True)
+        path = self.path(user_id)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=4)
+        os.replace(tmp, path)
+
+
+class SQLiteBackend(StorageBackend):
+    """Normalized tables (one row per holding / transaction / cash balance / setting) in one SQLite file."""
+    name = "sqlite"
+
+    def __init__(self, path=os.path.join(".cache", "portfolio_tables.db")):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(f"""
+                CREATE TABLE IF NOT EXISTS assets (user TEXT NOT NULL, {", ".join(f"{c}" for c in ASSET_FIELDS)});
+                CREATE INDEX IF NOT EXISTS idx_assets_user ON assets(user);
+                CREATE TABLE IF NOT EXISTS transactions (user TEXT NOT NULL, {", ".join(LEDGER_COLUMNS)});
+                CREATE INDEX IF NOT EXISTS idx_transactions_user ON transactions(user);
+                CREATE TABLE IF NOT EXISTS cash (user TEXT NOT NULL, currency TEXT NOT NULL, amount REAL, PRIMARY KEY (user, currency));
+                CREATE TABLE IF NOT EXISTS settings (user TEXT NOT NULL, key TEXT NOT NULL, value TEXT, PRIMARY KEY (user, key));
+            """)
+            # Databases created before a field existed get the column added in place
+            existing = {row[1] for row in self._conn.execute("PRAGMA table_info(assets)")}
+            for column in ASSET_FIELDS:
+                if column not in existing:
+                    self._conn.execute(f"ALTER TABLE assets ADD COLUMN {column}")
+
+    def exists(self, user_id: str) -> bool:
+        return any(
+            self._conn.execute(f"SELECT 1 FROM {table} WHERE user = ? LIMIT 1", (user_id,)).fetchone()
+            for table in ("assets", "transactions", "cash", "settings")
+        )
+
+    def _rows(self, table: str, columns: List[str], user_id: str) -> List[Dict[str, Any]]:
+        cursor = self._conn.execute(f"SELECT {', '.join(columns)} FROM {table} WHERE user = ? ORDER BY rowid", (user_id,))
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    def load(self, user_id: str) -> Dict[str, Any]:
+        return with_defaults({
+            "assets": self._rows("assets", ASSET_FIELDS, user_id),
+            "transactions": self._rows("transactions", LEDGER_COLUMNS, user_id),
+            "cash": dict(self._conn.execute("SELECT currency, amount FROM cash WHERE user = ?", (user_id,)).fetchall()),
+            "settings": {k: json.loads(v) for k, v in self._conn.execute("SELECT key, value FROM settings WHERE user = ?", (user_id,))}
+        })
+
+    def save(self, user_id: str, data: Dict[str, Any]):
+        """Replaces the user's rows in one transaction."""
+        with self._conn:
+            for table in ("assets", "transactions", "cash", "settings"):
+                self._conn.execute(f"DELETE FROM {table} WHERE user = ?", (user_id,))
+            self._conn.executemany(
+                f"INSERT INTO assets (user, {', '.join(ASSET_FIELDS)}) VALUES (?{', ?' * len(ASSET_FIELDS)})",
+                ([user_id] + [a.get(c) for c in ASSET_FIELDS] for a in data.get("assets", []))
+            )
+            self._conn.executemany(
+                f"INSERT INTO transactions (user, {', '.join(LEDGER_COLUMNS)}) VALUES (?{', ?' * len(LEDGER_COLUMNS)})",
+                ([user_id] + [t.get(c) for c in LEDGER_COLUMNS] for t in data.get("transactions", []))
+            )
+            self._conn.executemany("INSERT INTO cash (user, currency, amount) VALUES (?, ?, ?)",
+                                   ((user_id, c, a) for c, a in data.get("cash", {}).items()))
+            self._conn.executemany("INSERT INTO settings (user, key, value) VALUES (?, ?, ?)",
+                                   ((user_id, k, json.dumps(v)) for k, v in data.get("settings", {}).items()))
+
+
+class ParquetBackend(StorageBackend):
+    """
+    Columnar files per user: assets.parquet, transactions.parquet and meta.json (cash, settings).
+    Requires pyarrow (optional dependency).
+    """
+    name = "parquet"
+
+    def __init__(self, directory=os.path.join(".cache", "parquet")):
+        if importlib.util.find_spec("pyarrow") is None:
+            raise ImportError("ParquetBackend requires pyarrow (pip install pyarrow)")
+        self.directory = directory
+
+    def _dir(self, user_id: str) -> str:
+        return os.path.join(self.directory, user_id)
+
+    def exists(self, user_id: str) -> bool:
+        return os.path.exists(os.path.join(self._dir(user_id), "meta.json"))
+
+    def load(self, user_id: str) -> Dict[str, Any]:
+        import pandas as pd
+        if not self.exists(user_id):
+            return empty_data()
+        base = self._dir(user_id)
+        with open(os.path.join(base, "meta.json"), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        tables = {}
+        for key in ("assets", "transactions"):
+            path = os.path.join(base, f"{key}.parquet")
+            tables[key] = _frame_records(pd.read_parquet(path)) if os.path.exists(path) else []
+        return with_defaults({**meta, **tables})
+
+    def save(self, user_id: str, data: Dict[str, Any]):
+        import pandas as pd
+        base = self._dir(user_id)
+        os.makedirs(base, exist_ok=True)
+        for key, columns in (("assets", ASSET_FIELDS), ("transactions", LEDGER_COLUMNS)):
+            df = pd.DataFrame.from_records(data.get(key, []), columns=columns)
+            df.to_parquet(os.path.join(base, f"{key}.parquet"), index=False)
+        # meta.json last: its presence marks a complete save
+        tmp = os.path.join(base, f"meta.json.{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"cash": data.get("cash", {}), "settings": data.get("settings", {})}, f)
+        os.replace(tmp, os.path.join(base, "meta.json"))
+
+
+class GSheetsBackend(StorageBackend):
+    """Assets_{user} / Config_{user} / Ledger_{user} worksheets, in PortfolioManager's sheet schema."""
+    name = "gsheets"
+
+    def __init__(self, conn=None):
+        if conn is None:
+            import streamlit as st
+            from streamlit_gsheets import GSheetsConnection
+            conn = st.connection("gsheets", type=GSheetsConnection)
+        self.conn = conn
+
+    @staticmethod
+    def _sheet_names(user_id: str) -> Dict[str, str]:
+        return {"assets": f"Assets_{user_id}", "config": f"Config_{user_id}", "ledger": f"Ledger_{user_id}"}
+
+    def _loader(self):
+        from sheets_batch_loader import get_batch_loader
+        return get_batch_loader(self.conn)
+
+    def warm_up(self, user_ids: List[str]):
+        """Fetches every listed user's worksheets in one batched request (later loads hit the cache)."""
+        try:
+            self._loader().load_users([f"_{u}" for u in user_ids])
+        except Exception as e:
+            print(f"Batched warm-up unavailable: {e}")
+
+    def _read(self, user_id: str):
+        names = self._sheet_names(user_id)
+        try:
+            frames = self._loader().load(list(names.values()))
+            return {key: frames[sheet] for key, sheet in names.items() if sheet in frames}
+        except Exception as e:
+            print(f"Batched sheet read unavailable, reading sheets one by one: {e}")
+        frames = {}
+        for key, sheet in names.items():
+            try:
+                frames[key] = self.conn.read(worksheet=sheet, ttl=0)
+            except Exception:
+                # Sheet might not exist
+                pass
+        return frames
+
+    def exists(self, user_id: str) -> bool:
+        return bool(self._read(user_id))
+
+    def load(self, user_id: str) -> Dict[str, Any]:
+        from portfolio_manager import frames_to_data
+        data, errors = frames_to_data(self._read(user_id))
+        for key, errs in errors.items():
+            for e in errs:
+                print(f"{self._sheet_names(user_id)[key]}: {e}")
+        return data
+
+    def save(self, user_id: str, data: Dict[str, Any]):
+        from portfolio_manager import data_to_frames
+        names = self._sheet_names(user_id)
+        for key, df in data_to_frames(data).items():
+            try:
+                self.conn.update(worksheet=names[key], data=df)
+            except Exception:
+                # Worksheet does not exist yet
+                self.conn.create(worksheet=names[key], data=df)
+
+
+BACKENDS = {
+    "gsheets": GSheetsBackend,
+    "sqlite": SQLiteBackend,
+    "json": JSONBackend,
+    "parquet": ParquetBackend,
+}
+
+
+def get_backend(name: str, **kwargs) -> StorageBackend:
+    try:
+        return BACKENDS[name](**kwargs)
+    except KeyError:
+        raise ValueError(f"Unknown storage backend '{name}' (choose from {', '.join(BACKENDS)})")
+
+
+def migrate(source: StorageBackend, target: StorageBackend, user_id: str, target_user_id: str = None) -> Dict[str, Any]:
+    """
+    Copies one user's portfolio between backends and verifies the copy by reading it back.
+    Returns a summary; raises ValueError if the round trip lost data.
+    """
+    target_user_id = target_user_id or user_id
+    data = source.load(user_id)
+    target.save(target_user_id, data)
+    copied = target.load(target_user_id)
+
+    problems = []
+    for key in ("assets", "transactions"):
+        if len(copied[key]) != len(data[key]):
+            problems.append(f"{key}: {len(data[key])} rows in source, {len(copied[key])} in target")
+    if {k: float(v) for k, v in copied["cash"].items()} != {k: float(v) for k, v in with_defaults(data)["cash"].items()}:
+        problems.append("cash balances differ")
+    missing = set(data.get("settings", {})) - set(copied["settings"])
+    if missing:
+        problems.append(f"settings not preserved: {', '.join(sorted(missing))}")
+    if problems:
+        raise ValueError(f"Migration {source.name} -> {target.name} for '{user_id}' incomplete: " + "; ".join(problems))
+
+    return {
+        "user": target_user_id, "source": source.name, "target": target.name,
+        "assets": len(copied["assets"]), "transactions": len(copied["transactions"]),
+        "settings": sorted(copied["settings"])
+    }
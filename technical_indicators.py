@@ -0,0 +1,217 @@
+import pandas as pd
+import numpy as np
+from collections import OrderedDict
+
+
+class TechnicalIndicators:
+    """
+    Vectorized technical indicators over a price panel (DatetimeIndex x Tickers).
+    Every indicator accepts a Series (single ticker) or a DataFrame (one column per ticker)
+    and computes all columns at once.
+    Results are memoized per (ticker, indicator, params, data version), so re-running an
+    indicator on unchanged history is a dictionary lookup and only new/changed tickers are computed.
+    """
+    def __init__(self, max_entries=4096):
+        self._cache = OrderedDict()
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    # --- Cache plumbing ---
+
+    @staticmethod
+    def _as_frame(data):
+        """Returns (DataFrame, was_series)."""
+        if isinstance(data, pd.Series):
+            name = data.name if data.name is not None else "value"
+            return data.to_frame(name=name), True
+        return data, False
+
+    @staticmethod
+    def _data_versions(frames):
+        """
+        Cheap per-column fingerprint: (count, sum, first index, last index) of every input frame,
+        plus the frame's row count and index bounds (the same data reindexed onto more rows must
+        not hit results of the other shape).
+        Computed column-wise in one pass, so fingerprinting 100 tickers costs the same as one.
+        """
+        versions = {}
+        for df in frames:
+            shape = (len(df), df.index[0], df.index[-1]) if len(df) else (0, None, None)
+            counts = df.count()
+            sums = df.sum()
+            first_idx = df.apply(lambda s: s.first_valid_index())
+            last_idx = df.apply(lambda s: s.last_valid_index())
+            for col in df.columns:
+                versions.setdefault(col, [])
+                versions[col].append(shape + (int(counts[col]), round(float(sums[col]), 8), first_idx[col], last_idx[col]))
+        return {col: tuple(v) for col, v in versions.items()}
+
+    def _store(self, key, value):
+        self._cache[key] = value
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+
+    def _memoize(self, name, params, frames, fn, was_series=False):
+        """
+        Looks up each ticker in the cache and computes only the missing ones, vectorized.
+        fn receives the input frames restricted to the missing columns and returns
+        a dict {output_name: DataFrame}.
+        """
+        columns = list(frames[0].columns)
+        if not columns:
+            computed = fn(*frames)
+            return {out: (res.iloc[:, 0] if was_series and not res.empty else res) for out, res in computed.items()}
+        versions = self._data_versions(frames)
+        params_key = tuple(sorted(params.items()))
+
+        cached = {}
+        missing = []
+        for col in columns:
+            key = (col, name, params_key, versions[col])
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                cached[col] = self._cache[key]
+                self.hits += 1
+            else:
+                missing.append(col)
+                self.misses += 1
+
+        if missing:
+            computed = fn(*[df[missing] for df in frames])
+            for col in missing:
+                per_ticker = {out: res[col] for out, res in computed.items()}
+                cached[col] = per_ticker
+                self._store((col, name, params_key, versions[col]), per_ticker)
+
+        outputs = list(cached[columns[0]].keys())
+        result = {}
+        for out in outputs:
+            df = pd.concat({col: cached[col][out] for col in columns}, axis=1)
+            result[out] = df[columns[0]] if was_series else df
+        return result
+
+    def clear_cache(self):
+        self._cache.clear()
+
+    # --- Indicators ---
+
+    def sma(self, prices, window=20, min_periods=None):
+        """Simple moving average."""
+        df, was_series = self._as_frame(prices)
+        return self._memoize(
+            "sma", {"window": window, "min_periods": min_periods}, (df,),
+            lambda p: {"value": p.rolling(window=window, min_periods=min_periods).mean()},
+            was_series
+        )["value"]
+
+    def ema(self, prices, span=20, adjust=False):
+        """Exponential moving average."""
+        df, was_series = self._as_frame(prices)
+        return self._memoize(
+            "ema", {"span": span, "adjust": adjust}, (df,),
+            lambda p: {"value": p.ewm(span=span, adjust=adjust).mean()},
+            was_series
+        )["value"]
+
+    def wma(self, prices, window=20):
+        """Linearly weighted moving average (most recent observation weighted highest)."""
+        df, was_series = self._as_frame(prices)
+
+        def _calc(p):
+            values = p.to_numpy(dtype=float)
+            out = np.full(values.shape, np.nan)
+            if len(values) >= window:
+                weights = np.arange(1, window + 1, dtype=float)
+                # (n - window + 1, tickers, window) view -> one matrix product for every ticker
+                windows = np.lib.stride_tricks.sliding_window_view(values, window, axis=0)
+                out[window - 1:] = windows @ weights / weights.sum()
+            return {"value": pd.DataFrame(out, index=p.index, columns=p.columns)}
+
+        return self._memoize("wma", {"window": window}, (df,), _calc, was_series)["value"]
+
+    def rsi(self, prices, window=14, method="sma"):
+        """
+        Relative Strength Index.
+        method='sma' uses a simple rolling mean of gains/losses (the dashboard's original formula),
+        method='wilder' uses Wilder's smoothing.
+        """
+        df, was_series = self._as_frame(prices)
+
+        def _calc(p):
+            delta = p.diff()
+            gain = delta.where(delta > 0, 0.0)
+            loss = -delta.where(delta < 0, 0.0)
+            if method == "wilder":
+                avg_gain = gain.ewm(alpha=1 / window, adjust=False, min_periods=window).mean()
+                avg_loss = loss.ewm(alpha=1 / window, adjust=False, min_periods=window).mean()
+            else:
+                avg_gain = gain.rolling(window=window).mean()
+                avg_loss = loss.rolling(window=window).mean()
+            rs = avg_gain / avg_loss.replace(0, np.nan)
+            return {"value": 100 - (100 / (1 + rs))}
+
+        return self._memoize("rsi", {"window": window, "method": method}, (df,), _calc, was_series)["value"]
+
+    def bollinger_bands(self, prices, window=20, num_std=2.0):
+        """Returns dict with 'middle', 'upper', 'lower' bands."""
+        df, was_series = self._as_frame(prices)
+
+        def _calc(p):
+            roll = p.rolling(window=window)
+            mid = roll.mean()
+            std = roll.std()
+            return {"middle": mid, "upper": mid + num_std * std, "lower": mid - num_std * std}
+
+        return self._memoize("bollinger", {"window": window, "num_std": num_std}, (df,), _calc, was_series)
+
+    def macd(self, prices, fast=12, slow=26, signal=9):
+        """Returns dict with 'macd', 'signal', 'histogram'."""
+        df, was_series = self._as_frame(prices)
+
+        def _calc(p):
+            macd_line = p.ewm(span=fast, adjust=False).mean() - p.ewm(span=slow, adjust=False).mean()
+            signal_line = macd_line.ewm(span=signal, adjust=False).mean()
+            return {"macd": macd_line, "signal": signal_line, "histogram": macd_line - signal_line}
+
+        return self._memoize("macd", {"fast": fast, "slow": slow, "signal": signal}, (df,), _calc, was_series)
+
+    def atr(self, high, low, close, window=14):
+        """Average True Range (simple rolling mean of the true range)."""
+        h, was_series = self._as_frame(high)
+        l, _ = self._as_frame(low)
+        c, _ = self._as_frame(close)
+        if was_series:
+            # df['High'], df['Low'], df['Close'] carry their own names: cache and align them as one column
+            l, c = l.set_axis(h.columns, axis=1), c.set_axis(h.columns, axis=1)
+
+        def _calc(hh, ll, cc):
+            prev_close = cc.shift(1)
+            true_range = np.maximum(hh - ll, np.maximum((hh - prev_close).abs(), (ll - prev_close).abs()))
+            return {"value": true_range.rolling(window=window).mean()}
+
+        return self._memoize("atr", {"window": window}, (h, l, c), _calc, was_series)["value"]
+
+    def rolling_volatility(self, prices, window=30, periods_per_year=365, min_periods=None):
+        """
+        Annualized rolling volatility of simple returns (decimal, e.g. 0.55 = 55%).
+        Use periods_per_year=252 for exchange-traded assets, 365 for crypto.
+        """
+        df, was_series = self._as_frame(prices)
+
+        def _calc(p):
+            returns = p.pct_change()
+            return {"value": returns.rolling(window=window, min_periods=min_periods).std() * np.sqrt(periods_per_year)}
+
+        params = {"window": window, "periods_per_year": periods_per_year, "min_periods": min_periods}
+        return self._memoize("volatility", params, (df,), _calc, was_series)["value"]
+
+    def resample(self, prices, rule="W", how="last"):
+        """Multi-timeframe resampling, e.g. rule='W' / 'ME' with how='last' / 'mean' / 'max'."""
+        df, was_series = self._as_frame(prices)
+        return self._memoize(
+            "resample", {"rule": rule, "how": how}, (df,),
+            lambda p: {"value": getattr(p.resample(rule), how)()},
+            was_series
+        )["value"]
@@ -0,0 +1,49 @@
+"""
+Import-time budget of every entry point (bench_importtime.ENTRY_POINTS), as a test.
+
+    python -m pytest -q test_import_budget.py
+    IMPORT_BUDGET_SCALE=2 python -m pytest -q test_import_budget.py   # slower machine: double every budget
+
+An entry point that fails to import while some requirements.txt package is not installed is
+skipped, not failed (it is checked wherever the full environment exists).
+"""
+import os
+import re
+from importlib import metadata
+
+import pytest
+
+from bench_importtime import ENTRY_POINTS, measure
+
+SCALE = float(os.environ.get("IMPORT_BUDGET_SCALE", "1"))
+REQUIREMENTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "requirements.txt")
+
+
+def missing_requirements():
+    missing = []
+    with open(REQUIREMENTS) as f:
+        for line in f:
+            name = re.split(r"[\s<>=!~\[;#]", line.strip(), maxsplit=1)[0]
+            if not name:
+                continue
+            try:
+                metadata.version(name)
+            except metadata.PackageNotFoundError:
+                missing.append(name)
+    return missing
+
+
+@pytest.mark.parametrize("entry", list(ENTRY_POINTS))
+def test_entry_point_within_import_budget(entry):
+    modules, budget, forbidden = ENTRY_POINTS[entry]
+    try:
+        total, rows = measure(modules)
+    except RuntimeError as e:
+        missing = missing_requirements()
+        if missing:
+            pytest.skip(f"{e} (not installed: {', '.join(missing)})")
+        raise
+    loaded = {name.strip() for _, _, name in rows}
+
+    assert not sorted(m for m in forbidden if m in loaded), f"{entry} imports forbidden modules"
+    assert total <= budget * SCALE, f"{entry}: {total:.0f} ms > {budget * SCALE:.0f} ms"
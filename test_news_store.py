@@ -0,0 +1,53 @@
+"""
+NewsStore ingestion: per-ticker de-duplication, undated items and migration of the old schema.
+
+    python -m pytest -q test_news_store.py
+"""
+import sqlite3
+
+from news_store import NewsStore
+
+
+def item(ticker, title, ts, link=None):
+    return {"ticker": ticker, "title": title, "link": link or f"https://news.fake/{title}", "published_ts": ts}
+
+
+def test_shared_article_is_stored_under_every_ticker():
+    store = NewsStore(":memory:")
+
+    assert store.ingest([item("AAPL", "chips", 100.0), item("NVDA", "chips", 100.0)]) == 2
+    rows, total = store.search(keyword="chips", tickers=["NVDA"])
+
+    assert total == 1
+    assert rows[0]["ticker"] == "NVDA"
+
+
+def test_undated_item_is_kept_once_without_moving_the_watermark():
+    store = NewsStore(":memory:")
+
+    assert store.ingest([item("AAPL", "undated", 0.0)]) == 1
+    assert store.ingest([item("AAPL", "undated", 0.0), item("AAPL", "dated", 50.0)]) == 1
+
+    rows, total = store.search(tickers=["AAPL"])
+    assert total == 2
+    assert all(r["published_ts"] > 0 for r in rows)
+    assert store.last_seen() == {"AAPL": 50.0}
+
+
+def test_old_schema_is_migrated_with_its_rows(tmp_path):
+    path = str(tmp_path / "news.db")
+    old = sqlite3.connect(path)
+    old.executescript("""
+        CREATE TABLE news (
+            id INTEGER PRIMARY KEY, dedupe_key TEXT UNIQUE NOT NULL, ticker TEXT NOT NULL, title TEXT NOT NULL,
+            link TEXT, provider_publish_time TEXT, published_ts REAL NOT NULL DEFAULT 0, ingested_at REAL NOT NULL
+        );
+        CREATE VIRTUAL TABLE news_fts USING fts5(title, ticker, content='news', content_rowid='id');
+        INSERT INTO news VALUES (1, 'https://news.fake/chips', 'AAPL', 'chips', 'https://news.fake/chips', '', 100, 0);
+    """)
+    old.close()
+
+    store = NewsStore(path)
+
+    assert store.ingest([item("NVDA", "chips", 100.0)]) == 1
+    assert store.search(keyword="chips")[1] == 2
@@ -0,0 +1,49 @@
+"""
+Three-way merge of concurrent portfolio edits (local vs sheet, against the last synced state).
+
+    python -m pytest -q test_portfolio_merge.py
+"""
+from portfolio_merge import three_way_merge
+
+
+def portfolio(quantity, avg_price=100.0, cash=1000.0, sector="Tech"):
+    return {
+        "assets": [{"ticker": "AAPL", "account": "Main", "quantity": quantity, "avg_price": avg_price, "sector": sector}],
+        "cash": {"USD": cash}, "settings": {}, "transactions": [],
+    }
+
+
+def test_same_quantity_added_in_two_sessions_adds_both():
+    merged, conflicts = three_way_merge(portfolio(10), portfolio(15), portfolio(15))
+
+    assert merged["assets"][0]["quantity"] == 20
+    assert merged["assets"][0]["avg_price"] == 100.0
+    assert conflicts == []
+
+
+def test_quantity_added_on_both_sides_adds_both():
+    base = portfolio(10)
+    mine = portfolio(15, avg_price=110.0)     # +5 @ 130
+    theirs = portfolio(15, avg_price=100.0)   # +5 @ 100
+
+    merged, conflicts = three_way_merge(base, mine, theirs)
+
+    asset = merged["assets"][0]
+    assert asset["quantity"] == 20
+    assert asset["avg_price"] == (15 * 110.0 + 15 * 100.0 - 10 * 100.0) / 20
+    assert conflicts == []
+
+
+def test_cash_changed_on_both_sides_adds_both():
+    merged, conflicts = three_way_merge(portfolio(10), portfolio(10, cash=1500.0), portfolio(10, cash=800.0))
+
+    assert merged["cash"]["USD"] == 1300.0
+    assert conflicts == []
+    assert three_way_merge(portfolio(10), portfolio(10, cash=1500.0), portfolio(10, cash=1500.0))[0]["cash"]["USD"] == 2000.0
+
+
+def test_other_fields_changed_on_both_sides_still_conflict():
+    merged, conflicts = three_way_merge(portfolio(10), portfolio(10, sector="Semis"), portfolio(10, sector="Hardware"))
+
+    assert merged["assets"][0]["sector"] == "Semis"
+    assert conflicts == ["assets[Main/AAPL].sector"]
@@ -0,0 +1,69 @@
+"""
+SheetsBatchLoader against an in-memory fake of the Sheets values / Drive metadata API.
+
+    python -m pytest -q test_sheets_batch_loader.py
+"""
+from sheets_batch_loader import SheetsBatchLoader, user_sheet_names
+
+BASE = "https://sheets.fake/v4"
+DRIVE = "https://drive.fake/v3"
+
+
+class FakeResponse:
+    def __init__(self, body):
+        self.body = body
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.body
+
+
+class FakeSheets:
+    """One spreadsheet: {title: values}; every edit bumps the Drive version."""
+    def __init__(self, sheets):
+        self.sheets = {title: [list(r) for r in values] for title, values in sheets.items()}
+        self.version = 1
+
+    def edit(self, title, values):
+        self.sheets[title] = [list(r) for r in values]
+        self.version += 1
+
+    def get(self, url, params=None):
+        if url.startswith(DRIVE):
+            return FakeResponse({"version": str(self.version)})
+        if url.endswith("values:batchGet"):
+            ranges = [v.strip("'") for k, v in params if k == "ranges"]
+            return FakeResponse({"valueRanges": [{"values": self.sheets[r]} for r in ranges]})
+        return FakeResponse({"sheets": [{"properties": {"title": t}} for t in self.sheets]})
+
+
+def user_sheets(user, ticker):
+    assets, config, ledger = user_sheet_names(f"_{user}")
+    return {assets: [["ticker", "quantity"], [ticker, 1]], config: [["key", "value"]], ledger: [["date", "type"]]}
+
+
+def test_other_users_edit_is_not_hidden_by_a_newer_revision():
+    server = FakeSheets({**user_sheets("a", "AAA"), **user_sheets("b", "BBB")})
+    loader = SheetsBatchLoader("sheet-id", server, base_url=BASE, drive_url=DRIVE)
+    assets_b = user_sheet_names("_b")[0]
+    loader.load(user_sheet_names("_a"))
+    loader.load(user_sheet_names("_b"))
+
+    server.edit(assets_b, [["ticker", "quantity"], ["CHANGED", 2]])
+    loader.load(user_sheet_names("_a"))  # sees the new revision, reloads only A's ranges
+    frames = loader.load(user_sheet_names("_b"))
+
+    assert frames[assets_b]["ticker"].tolist() == ["CHANGED"]
+
+
+def test_unchanged_revision_serves_cache_without_values_request():
+    server = FakeSheets(user_sheets("a", "AAA"))
+    loader = SheetsBatchLoader("sheet-id", server, base_url=BASE, drive_url=DRIVE)
+    first = loader.load(user_sheet_names("_a"))
+    requests = loader.requests
+    again = loader.load(user_sheet_names("_a"))
+
+    assert loader.requests == requests + 1  # the revision check only
+    assert all(again[s] is first[s] for s in first)
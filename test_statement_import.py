@@ -0,0 +1,55 @@
+"""
+Broker statement import: normalization, OFX chunking and de-duplication against the ledger.
+
+    python -m pytest -q test_statement_import.py
+"""
+import io
+
+from statement_import import drop_known, read_statement
+from transaction_ledger import TransactionLedger
+
+CSV = """Date,Action,Symbol,Quantity,Price,Fees,Amount,Currency
+2024-01-02,Deposit,,,,,1000.00,USD
+2024-01-02,Dividend,AAPL,,,,12.50,USD
+2024-01-02,Bought,AAPL,10,185.00,1.00,1851.00,USD
+"""
+
+OFX = b"""<OFX><INVSTMTRS><INVTRANLIST>
+<BUYSTOCK><INVBUY><INVTRAN><DTTRADE>20240102</INVTRAN><SECID><UNIQUEID>037833100</SECID>
+<UNITS>10<UNITPRICE>185.00<COMMISSION>1.00<TOTAL>-1851.00</INVBUY></BUYSTOCK>
+<INVBANKTRAN><STMTTRN><DTPOSTED>20240103<TRNAMT>500.00</STMTTRN></INVBANKTRAN>
+<SELLSTOCK><INVSELL><INVTRAN><DTTRADE>20240104</INVTRAN><SECID><UNIQUEID>037833100</SECID>
+<UNITS>-4<UNITPRICE>190.00<TOTAL>760.00</INVSELL></SELLSTOCK>
+</INVTRANLIST></INVSTMTRS>
+<SECLIST><STOCKINFO><SECINFO><SECID><UNIQUEID>037833100</SECID><TICKER>AAPL</SECINFO></STOCKINFO></SECLIST></OFX>
+"""
+
+
+def test_cash_rows_with_new_amounts_are_not_dropped_as_known():
+    ledger = TransactionLedger([
+        {"date": "2024-01-02", "type": "DEPOSIT", "amount": 500.0, "currency": "USD"},
+        {"date": "2024-01-02", "type": "DIVIDEND", "ticker": "AAPL", "amount": 3.0, "currency": "USD"},
+    ])
+    txns, errors = read_statement(io.StringIO(CSV), "statement.csv")
+
+    new = drop_known(txns, ledger)
+
+    assert not errors
+    assert sorted(new["type"]) == ["BUY", "DEPOSIT", "DIVIDEND"]
+    assert sorted(new["amount"]) == [12.5, 1000.0, 1851.0]
+
+
+def test_reimporting_the_same_statement_adds_nothing():
+    txns, _ = read_statement(io.StringIO(CSV), "statement.csv")
+    ledger = TransactionLedger(txns.to_dict("records"))
+
+    assert drop_known(txns, ledger).empty
+
+
+def test_ofx_tickers_resolved_from_trailing_seclist_across_chunks():
+    txns, errors = read_statement(OFX, "statement.ofx", chunksize=1)
+
+    assert not errors
+    assert txns["type"].tolist() == ["BUY", "DEPOSIT", "SELL"]
+    assert txns["ticker"].tolist() == ["AAPL", "", "AAPL"]
+    assert txns["quantity"].tolist() == [10.0, 0.0, 4.0]
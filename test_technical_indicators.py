@@ -0,0 +1,41 @@
+"""
+TechnicalIndicators memoization: results must match an uncached computation for any input shape.
+
+    python -m pytest -q test_technical_indicators.py
+"""
+import numpy as np
+import pandas as pd
+
+from technical_indicators import TechnicalIndicators
+
+
+def ohlc(rows=60, seed=0):
+    rng = np.random.default_rng(seed)
+    close = pd.Series(100 * np.exp(np.cumsum(rng.normal(0, 0.01, rows))), index=pd.bdate_range("2024-01-01", periods=rows))
+    return pd.DataFrame({"High": close * 1.01, "Low": close * 0.99, "Close": close})
+
+
+def test_atr_accepts_named_ohlc_series():
+    df = ohlc()
+    ti = TechnicalIndicators()
+
+    atr = ti.atr(df["High"], df["Low"], df["Close"], window=14)
+
+    prev_close = df["Close"].shift(1)
+    true_range = pd.concat([df["High"] - df["Low"], (df["High"] - prev_close).abs(), (df["Low"] - prev_close).abs()], axis=1).max(axis=1, skipna=False)
+    expected = true_range.rolling(14).mean()
+    np.testing.assert_allclose(atr.to_numpy(), expected.to_numpy())
+    assert ti.atr(df["High"], df["Low"], df["Close"], window=14).equals(atr)
+    assert ti.hits == 1
+
+
+def test_reindexed_input_is_not_served_the_cached_shape():
+    close = ohlc(50)["Close"]
+    padded = close.reindex(pd.bdate_range(close.index[0], periods=81))
+    ti = TechnicalIndicators()
+
+    ti.sma(close, window=5)
+    sma = ti.sma(padded, window=5)
+
+    assert sma.shape == padded.shape
+    assert sma.index.equals(padded.index)
@@ -0,0 +1,37 @@
+"""
+TransactionLedger replay: money-weighted return over a valuation window.
+
+    python -m pytest -q test_transaction_ledger.py
+"""
+import pandas as pd
+import pytest
+
+from transaction_ledger import TransactionLedger
+
+
+def window_prices(start="2024-01-01", end="2024-12-31", first=100.0, last=110.0):
+    index = pd.date_range(start, end)
+    return pd.DataFrame({"AAPL": pd.Series(range(len(index)), index=index) * (last - first) / (len(index) - 1) + first})
+
+
+def test_xirr_starts_from_opening_nav_not_old_deposits():
+    ledger = TransactionLedger([
+        {"date": "2019-01-02", "type": "DEPOSIT", "amount": 500.0},
+        {"date": "2019-01-02", "type": "BUY", "ticker": "AAPL", "quantity": 10, "price": 50.0},
+    ])
+    prices = window_prices()
+    nav = ledger.nav(prices)
+
+    # 100 -> 110 over the window with no flows inside it: about 10%, not the 500 deposit re-dated to the window start
+    assert ledger.xirr(nav) == pytest.approx(0.10, abs=0.002)
+
+
+def test_positions_only_flows_include_fees():
+    ledger = TransactionLedger([
+        {"date": "2024-01-01", "type": "BUY", "ticker": "AAPL", "quantity": 10, "price": 100.0, "fee": 5.0},
+        {"date": "2024-06-03", "type": "SELL", "ticker": "AAPL", "quantity": 4, "price": 105.0, "fee": 2.0},
+    ])
+    flows = ledger.external_flows(window_prices().index, include_cash=False).sum(axis=1)
+
+    assert flows[pd.Timestamp("2024-01-01")] == 1005.0
+    assert flows[pd.Timestamp("2024-06-03")] == -418.0
@@ -0,0 +1,244 @@
+import pandas as pd
+import numpy as np
+from datetime import datetime
+from typing import Dict, List, Any
+
+# Supported transaction types
+#   BUY / SELL        : ticker, quantity, price (+ fee), settled in `currency`
+#   DEPOSIT / WITHDRAW: external cash flow of `amount` in `currency`
+#   FX                : convert `amount` of `currency` into `to_amount` of `to_currency`
+#   DIVIDEND          : `amount` of `currency` credited to cash (internal, not an external flow)
+TRANSACTION_TYPES = ["BUY", "SELL", "DEPOSIT", "WITHDRAW", "FX", "DIVIDEND"]
+
+LEDGER_COLUMNS = ["date", "type", "ticker", "quantity", "price", "fee", "amount", "currency", "to_amount", "to_currency"]
+
+
+def upper_strip(col: pd.Series) -> pd.Series:
+    """Upper-cased, stripped strings ('' for missing), cleaned once per distinct value."""
+    codes, uniques = pd.factorize(col)
+    cleaned = np.array([str(u).upper().strip() for u in uniques] + [""], dtype=object)
+    return pd.Series(cleaned[codes], index=col.index, dtype=object)
+
+
+class TransactionLedger:
+    """
+    Event-sourced transaction ledger.
+    Positions and cash are never stored; they are replayed from the transaction list into
+    dense date x ticker / date x currency matrices, which removes the look-ahead bias of
+    multiplying today's quantities by the whole price history.
+    """
+    def __init__(self, transactions: List[Dict[str, Any]] = None):
+        self.df = self._normalize(transactions if transactions is not None else [])
+
+    @staticmethod
+    def _normalize(transactions) -> pd.DataFrame:
+        df = pd.DataFrame(transactions, columns=LEDGER_COLUMNS) if not isinstance(transactions, pd.DataFrame) else transactions.reindex(columns=LEDGER_COLUMNS)
+        df["date"] = pd.to_datetime(df["date"], errors="coerce").dt.normalize()
+        df["type"] = upper_strip(df["type"])
+        df["ticker"] = upper_strip(df["ticker"])
+        for col in ["quantity", "price", "fee", "amount", "to_amount"]:
+            df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0.0)
+        df["currency"] = upper_strip(df["currency"]).replace("", "USD")
+        df["to_currency"] = upper_strip(df["to_currency"])
+        df = df[df["date"].notna() & df["type"].isin(TRANSACTION_TYPES)]
+        return df.sort_values("date", kind="stable").reset_index(drop=True)
+
+    def __len__(self):
+        return len(self.df)
+
+    @property
+    def empty(self):
+        return self.df.empty
+
+    @property
+    def tickers(self) -> List[str]:
+        trades = self.df[self.df["type"].isin(["BUY", "SELL"])]
+        return sorted(trades["ticker"].unique().tolist())
+
+    def subset(self, tickers) -> "TransactionLedger":
+        """Ledger restricted to trades in `tickers` (non-trade rows are kept)."""
+        keep = ~self.df["type"].isin(["BUY", "SELL"]) | self.df["ticker"].isin(list(tickers))
+        return TransactionLedger(self.df[keep])
+
+    def add(self, txn: Dict[str, Any]):
+        self.df = self._normalize(pd.concat([self.df, self._normalize([txn])], ignore_index=True))
+
+    def extend(self, txns) -> None:
+        """Appends many transactions (records or a DataFrame) with a single normalize/sort."""
+        self.df = self._normalize(pd.concat([self.df, self._normalize(txns)], ignore_index=True))
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        out = self.df.copy()
+        out["date"] = out["date"].dt.strftime("%Y-%m-%d")
+        # Column-wise tolist() + zip gives native Python values without to_dict's per-cell boxing
+        columns = list(out.columns)
+        return [dict(zip(columns, row)) for row in zip(*(out[c].tolist() for c in columns))]
+
+    # --- Replay ---
+
+    def _date_index(self, index=None) -> pd.DatetimeIndex:
+        if index is not None:
+            return pd.DatetimeIndex(index).normalize()
+        if self.df.empty:
+            return pd.DatetimeIndex([])
+        return pd.date_range(self.df["date"].min(), pd.Timestamp(datetime.now().date()), freq="D")
+
+    @staticmethod
+    def _replay(deltas: pd.DataFrame, key: str, index: pd.DatetimeIndex) -> pd.DataFrame:
+        """Pivots (date, key, delta) events, cumsums over the union of dates, then samples at `index`."""
+        if deltas.empty or len(index) == 0:
+            return pd.DataFrame(index=index, dtype=float)
+        daily = deltas.pivot_table(index="date", columns=key, values="delta", aggfunc="sum")
+        full_index = daily.index.union(index)
+        balances = daily.reindex(full_index).fillna(0.0).cumsum()
+        return balances.reindex(index).fillna(0.0)
+
+    def holdings_matrix(self, index=None) -> pd.DataFrame:
+        """Dense date x ticker matrix of quantities held at the end of each day."""
+        trades = self.df[self.df["type"].isin(["BUY", "SELL"])]
+        deltas = pd.DataFrame({
+            "date": trades["date"],
+            "ticker": trades["ticker"],
+            "delta": np.where(trades["type"] == "BUY", trades["quantity"], -trades["quantity"])
+        })
+        return self._replay(deltas, "ticker", self._date_index(index))
+
+    def cash_matrix(self, index=None) -> pd.DataFrame:
+        """Dense date x currency matrix of cash balances implied by the ledger."""
+        df = self.df
+        gross = df["quantity"] * df["price"]
+        sign = df["type"].map({"BUY": -1.0, "SELL": 1.0, "DEPOSIT": 1.0, "WITHDRAW": -1.0, "DIVIDEND": 1.0, "FX": -1.0}).fillna(0.0)
+        trade_amount = np.where(df["type"].isin(["BUY", "SELL"]), gross, df["amount"])
+        primary = pd.DataFrame({
+            "date": df["date"],
+            "currency": df["currency"],
+            "delta": sign * trade_amount - df["fee"]
+        })
+        fx = df[df["type"] == "FX"]
+        secondary = pd.DataFrame({"date": fx["date"], "currency": fx["to_currency"], "delta": fx["to_amount"]})
+        deltas = pd.concat([primary, secondary], ignore_index=True)
+        return self._replay(deltas, "currency", self._date_index(index))
+
+    @property
+    def has_cash_flows(self) -> bool:
+        """True when the ledger records deposits/withdrawals, i.e. cash can be replayed too."""
+        return bool(self.df["type"].isin(["DEPOSIT", "WITHDRAW"]).any())
+
+    def external_flows(self, index=None, include_cash=True) -> pd.DataFrame:
+        """
+        date x currency matrix of flows into the valued portfolio, bucketed to `index`.
+        include_cash=True : deposits (+) / withdrawals (-), for a NAV that includes cash.
+        include_cash=False: net trade cost including fees (buys + cost + fee, sells - proceeds + fee),
+                            for a positions-only NAV.
+        Flows dated before `index` are booked on its first date.
+        """
+        idx = self._date_index(index)
+        if include_cash:
+            ext = self.df[self.df["type"].isin(["DEPOSIT", "WITHDRAW"])]
+            signed = np.where(ext["type"] == "DEPOSIT", ext["amount"], -ext["amount"])
+        else:
+            ext = self.df[self.df["type"].isin(["BUY", "SELL"])]
+            gross = ext["quantity"] * ext["price"]
+            signed = np.where(ext["type"] == "BUY", gross, -gross) + ext["fee"].to_numpy()
+        if ext.empty or len(idx) == 0:
+            return pd.DataFrame(index=idx, dtype=float)
+        daily = pd.DataFrame({"date": ext["date"], "currency": ext["currency"], "delta": signed}).pivot_table(
+            index="date", columns="currency", values="delta", aggfunc="sum")
+        # Flows on non-trading days are booked on the next available index date
+        pos = idx.searchsorted(daily.index)
+        daily = daily[pos < len(idx)]
+        daily.index = idx[pos[pos < len(idx)]]
+        return daily.groupby(level=0).sum().reindex(idx).fillna(0.0)
+
+    # --- Valuation ---
+
+    @staticmethod
+    def _to_usd(frame: pd.DataFrame, fx_rates) -> pd.DataFrame:
+        """Converts a date x currency frame to USD. fx_rates: dict or date x currency frame of units per USD."""
+        if frame.empty:
+            return frame
+        if isinstance(fx_rates, pd.DataFrame):
+            rates = fx_rates.reindex(frame.index).ffill().bfill().reindex(columns=frame.columns)
+        else:
+            rates = pd.DataFrame({c: (fx_rates or {}).get(c, 1.0) for c in frame.columns}, index=frame.index)
+        rates = rates.fillna(1.0)
+        if "USD" in rates.columns:
+            rates["USD"] = 1.0
+        return frame / rates.replace(0, np.nan).fillna(1.0)
+
+    def market_value(self, prices: pd.DataFrame) -> pd.Series:
+        """Value of replayed positions (USD) on each date of the price index."""
+        if prices.empty:
+            return pd.Series(dtype=float)
+        prices = prices.ffill()
+        holdings = self.holdings_matrix(prices.index).reindex(columns=prices.columns).fillna(0.0)
+        return (holdings * prices.fillna(0.0)).sum(axis=1)
+
+    def nav(self, prices: pd.DataFrame, fx_rates=None, include_cash=True) -> pd.Series:
+        """Net asset value (USD) = replayed positions + replayed cash."""
+        value = self.market_value(prices)
+        if include_cash and not value.empty:
+            cash = self._to_usd(self.cash_matrix(value.index), fx_rates)
+            if not cash.empty:
+                value = value + cash.sum(axis=1)
+        return value
+
+    def time_weighted_return(self, nav: pd.Series, fx_rates=None, include_cash=True) -> pd.Series:
+        """
+        Cumulative TWR series. Each day's sub-period return strips out that day's flow:
+        r_t = (NAV_t - F_t) / NAV_{t-1} - 1
+        include_cash must match how `nav` was built (see external_flows).
+        """
+        if nav.empty:
+            return pd.Series(dtype=float)
+        flows = self._to_usd(self.external_flows(nav.index, include_cash), fx_rates)
+        flow = flows.sum(axis=1).reindex(nav.index).fillna(0.0) if not flows.empty else pd.Series(0.0, index=nav.index)
+        prev = nav.shift(1)
+        period = ((nav - flow) / prev.where(prev > 0)) - 1
+        period = period.replace([np.inf, -np.inf], np.nan).fillna(0.0)
+        return (1 + period).cumprod() - 1
+
+    def xirr(self, nav: pd.Series, fx_rates=None, include_cash=True, guess=0.1) -> float:
+        """
+        Money-weighted return (annualized IRR) over the window of `nav`: the opening NAV is
+        invested on its first date, then the investor's flows inside the window, plus the ending NAV.
+        (Flows from before the window are in the opening NAV, not re-dated to its first day.)
+        NPV is evaluated for every flow at once; a coarse rate grid brackets the root before Newton refines it.
+        """
+        if nav.empty:
+            return 0.0
+        flows = self._to_usd(self.external_flows(nav.index, include_cash), fx_rates)
+        flow = flows.sum(axis=1) if not flows.empty else pd.Series(0.0, index=nav.index)
+        # Flows up to and including the first date are already in the opening NAV
+        flow = flow[(flow != 0) & (flow.index > nav.index[0])]
+        # Investor perspective: money put in is an outflow (-), ending NAV is an inflow (+)
+        amounts = np.concatenate([[-nav.iloc[0]], -flow.to_numpy(), [nav.iloc[-1]]])
+        dates = pd.DatetimeIndex([nav.index[0]]).append(flow.index).append(pd.DatetimeIndex([nav.index[-1]]))
+        return self._solve_xirr(amounts, dates, guess)
+
+    @staticmethod
+    def _solve_xirr(amounts: np.ndarray, dates: pd.DatetimeIndex, guess=0.1) -> float:
+        if len(amounts) < 2 or not (np.any(amounts > 0) and np.any(amounts < 0)):
+            return 0.0
+        years = (dates - dates[0]).days.to_numpy() / 365.0
+
+        def npv(rates):
+            rates = np.atleast_1d(rates)
+            return (amounts[None, :] / (1 + rates[:, None]) ** years[None, :]).sum(axis=1)
+
+        # Bracket on a grid in one broadcast, then Newton from the bracket midpoint
+        grid = np.concatenate([np.linspace(-0.99, 1, 200), np.linspace(1, 100, 200)[1:]])
+        values = npv(grid)
+        sign_change = np.where(np.sign(values[:-1]) != np.sign(values[1:]))[0]
+        rate = (grid[sign_change[0]] + grid[sign_change[0] + 1]) / 2 if len(sign_change) else guess
+
+        for _ in range(50):
+            f = (amounts / (1 + rate) ** years).sum()
+            df = (-years * amounts / (1 + rate) ** (years + 1)).sum()
+            if df == 0:
+                break
+            step = f / df
+            rate = max(rate - step, -0.9999)
+            if abs(step) < 1e-10:
+                break
+        return float(rate)
@@ -0,0 +1,28 @@
+import importlib
+from typing import Dict
+
+# Sidebar MODULE menu (in display order) -> page module.
+# Pages are imported on first selection only, so a rerun loads just the selected page's
+# code and dependencies; every page module exposes render(ctx) and may add render_sidebar(ctx).
+PAGES: Dict[str, str] = {
+    "Portfolio": "views.portfolio",
+    "Bitcoin Standard": "views.bitcoin_standard",
+    "Crypto": "views.crypto",
+    "Macro": "views.macro",
+    "Market": "views.market",
+}
+DEFAULT_PAGE = "Portfolio"
+
+
+class PageContext:
+    """Session objects a page renders with (PortfolioManager and the shared analysis agents)."""
+    def __init__(self, pm, md, ae, ti):
+        self.pm = pm
+        self.md = md
+        self.ae = ae
+        self.ti = ti
+
+
+def load_page(name: str):
+    """The page module for a menu entry (imported once per process, then served from sys.modules)."""
+    return importlib.import_module(PAGES[name])
@@ -0,0 +1,467 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import plotly.graph_objects as go
+from datetime import datetime, timedelta
+
+from derived_series import get_series_graph
+from fx_panel import FX_PANEL_TICKERS, get_fx_panel, get_price_panel
+from views.common import render_footer
+
+
+# BTC STANDARD / SATS 섹션 통화 (USD는 달러 인덱스 기준)
+FIAT_TICKERS = {
+    "USD": "DX-Y.NYB", "CAD": "CAD=X", "AUD": "AUD=X",
+    "CHF": "CHF=X", "JPY": "JPY=X", "CNY": "CNY=X", "KRW": "KRW=X"
+}
+
+# GLOBAL CURRENCY PERFORMANCE 섹션 통화 (DXY 외에는 통화 가치 = 1 / USD당 수량)
+FX_PERF_TICKERS = {
+    "DXY": "DX-Y.NYB", "CAD": "CAD=X", "AUD": "AUD=X",
+    "CHF": "CHF=X", "JPY": "JPY=X", "CNY": "CNY=X", "KRW": "KRW=X"
+}
+
+# SATOSHIS PER UNIT FIAT 표시 단위 (레전드 순서 강제 지정, BTC Standard 섹션과 동일하게)
+SATS_UNIT_CONFIG = {
+    "USD": 1,      "CAD": 1,      "AUD": 1,      
+    "CHF": 1,      "JPY": 100,    "CNY": 10,     "KRW": 1000       
+}
+
+
+def btc_per_fiat(prices):
+    """
+    통화 1단위로 살 수 있는 BTC (열 = FIAT_TICKERS 순서).
+    USD는 DXY 기반 구매력 역산: (DXY / 100) / BTC, 나머지는 1 / (USD당 통화 수량 * BTC).
+    """
+    if prices.empty or "BTC-USD" not in prices.columns:
+        return pd.DataFrame()
+    fx = prices.reindex(columns=list(FIAT_TICKERS.values()))
+    fx.columns = list(FIAT_TICKERS)
+    fx["USD"] = 100 / fx["USD"]
+    return (1 / fx.mul(prices["BTC-USD"], axis=0)).dropna(axis=1, how="all")
+
+
+def sats_per_fiat(per_fiat):
+    """SATS_UNIT_CONFIG 단위(예: 100 JPY)당 사토시 = BTC per fiat * 단위 * 1억."""
+    units = pd.Series(SATS_UNIT_CONFIG)
+    return per_fiat.reindex(columns=[c for c in SATS_UNIT_CONFIG if c in per_fiat.columns]) * units * 100_000_000
+
+
+# [V48] BTC per fiat / Sats per fiat은 같은 가격 소스를 공유하는 파생 시리즈 (가격이 그대로면 재계산 없음)
+# [V49] 가격 소스 = 페이지 공용 BTC+FX 패널 (fx_panel): 전체 이력에서 한 번에 계산, 섹션별로 기간만 잘라 씀
+SERIES = get_series_graph()
+SERIES.source("BTC_FX_PRICES", lambda **_: get_fx_panel().closes().ffill(), version=lambda **_: get_fx_panel().version)
+SERIES.derive("BTC_PER_FIAT", ["BTC_FX_PRICES"], btc_per_fiat)
+SERIES.derive("SATS_PER_FIAT", ["BTC_PER_FIAT"], sats_per_fiat)
+
+
+def get_btc_standard_v105(start_date_str):
+    try:
+        # [핵심] 시작일 공백 방지를 위해 3일 전부터 패널에 확보
+        get_fx_panel().ensure(pd.Timestamp(start_date_str) - timedelta(days=3))
+        # 성진님이 선택한 날짜부터 슬라이싱해서 출력
+        full_df = SERIES.get("BTC_PER_FIAT")
+        return full_df[full_df.index >= start_date_str] if not full_df.empty else full_df
+    except Exception:
+        return pd.DataFrame()
+
+
+def get_sats_per_fiat_final(start_date_str):
+    try:
+        get_fx_panel().ensure(pd.Timestamp(start_date_str) - timedelta(days=3))
+        # 성진님이 선택한 날짜부터 슬라이싱 (SATS_UNIT_CONFIG 순서 = 레전드 순서)
+        full_df = SERIES.get("SATS_PER_FIAT")
+        return full_df[full_df.index >= start_date_str] if not full_df.empty else full_df
+    except Exception:
+        return pd.DataFrame()
+
+
+def get_fx_data_v983(start_date_str):
+    # 주말/휴일을 대비해 입력받은 날짜보다 7일 더 일찍부터 (공용 BTC+FX 패널에서)
+    closes = get_fx_panel().closes(pd.Timestamp(start_date_str) - timedelta(days=7))
+    fx = closes.reindex(columns=list(FX_PERF_TICKERS.values())).dropna(how="all")
+    fx.columns = list(FX_PERF_TICKERS)
+    # 통화 가치 = 1 / (USD당 수량), DXY는 그대로
+    values = 1 / fx
+    values["DXY"] = fx["DXY"]
+    combined = values.dropna(axis=1, how="all").ffill().dropna()
+    # 사용자가 선택한 날짜 이후의 데이터만 정확히 필터링
+    return combined[combined.index >= pd.Timestamp(start_date_str)]
+
+
+# [V45] 히트맵 기간 선택 (1D = 마지막 '변동된' 이전 값 대비, 주말/휴일 대비 V1210 로직 유지)
+HEATMAP_HORIZONS = {"1D": None, "1W": pd.DateOffset(weeks=1), "1M": pd.DateOffset(months=1), "YTD": "YTD"}
+# 기간별 색상 범위 (±%) - 1D는 변동폭이 작아서 0.2%로 조임
+HEATMAP_ZRANGE = {"1D": 0.2, "1W": 1.0, "1M": 2.0, "YTD": 5.0}
+# 히트맵 통화 (USD 크로스 {통화}=X 로 로드, 통화 추가는 여기만)
+HEATMAP_SYMBOLS = ["USD", "CAD", "AUD", "CHF", "JPY", "CNY", "KRW"]
+
+
+def get_usd_cross_panel(symbols):
+    """
+    [V45] 'USD 1달러당 통화 수량' 일봉 패널 (열 = 통화, USD = 1).
+    USD 크로스(JPY=X, KRW=X, ...)만 받고, 나머지 통화쌍은 전부 여기서 역산.
+    YTD 기준값(전년 말)과 1M 기준값이 모두 들어가도록 넉넉히 로드.
+    [V49] 크로스가 모두 공용 BTC+FX 패널에 있으면 그 패널을, 아니면 이 통화 목록의 패널을 공유.
+    로드되지 않은 통화는 열에서 빠짐 (0% '변화 없음'으로 보이지 않도록).
+    """
+    today = datetime.now()
+    start = min(datetime(today.year - 1, 12, 15), today - timedelta(days=45))
+    tickers = {c: f"{c}=X" for c in symbols if c != "USD"}
+    source = get_fx_panel() if set(tickers.values()) <= set(FX_PANEL_TICKERS) else get_price_panel(list(tickers.values()))
+    raw = source.closes(start).reindex(columns=list(tickers.values())).dropna(how="all")
+    if raw.empty:
+        return pd.DataFrame()
+    panel = pd.DataFrame({c: raw[t] for c, t in tickers.items()}, index=raw.index)
+    panel["USD"] = 1.0
+    return panel[list(symbols)].ffill().dropna(how="all").dropna(axis=1, how="all")
+
+
+def get_heatmap_matrix(panel, horizon):
+    """
+    [V45] 통화 강세 매트릭스 (%): [base, quote] = base 1단위의 quote 환산 가격 변화율.
+    base/quote 가격 = u_quote / u_base (u = USD 1달러당 수량)이므로
+    기간 수익 r = u_now / u_prev 벡터 하나로 전체 매트릭스 = outer(1/r_base, r_quote) - 1.
+    기준값이 없는 통화의 행/열은 NaN (빈 칸, '변화 없음' 0%가 아님).
+    """
+    values = panel.to_numpy(dtype=float)
+    now = values[-1]
+    if HEATMAP_HORIZONS[horizon] is None:
+        # 통화별로 마지막 값과 '다른' 가장 최근 값 (없으면 변화 0)
+        changed = (values[:-1] != now) & ~np.isnan(values[:-1])
+        has_prev = changed.any(axis=0)
+        last_changed = len(changed) - 1 - np.argmax(changed[::-1], axis=0)
+        prev = np.where(has_prev, values[last_changed, np.arange(values.shape[1])], now)
+    else:
+        last_date = panel.index[-1]
+        if HEATMAP_HORIZONS[horizon] == "YTD":
+            anchor = pd.Timestamp(last_date.year - 1, 12, 31)
+        else:
+            anchor = last_date - HEATMAP_HORIZONS[horizon]
+        prior = panel[panel.index <= anchor]
+        prev = prior.iloc[-1].to_numpy(dtype=float) if not prior.empty else values[0]
+    r = now / prev
+    matrix = (np.outer(1 / r, r) - 1) * 100
+    return pd.DataFrame(matrix, index=panel.columns, columns=panel.columns)
+
+
+@st.fragment
+def render_currency_heatmap():
+    st.subheader("CURRENCY RELATIVE STRENGTH HEATMAP")
+    st.info("왼쪽(Base) 통화가 상단(Quote) 통화 대비 얼마나 강세인지 나타냅니다. 짙은 초록색일수록 왼쪽 통화의 강세를 의미합니다.")
+    horizon = st.radio("Horizon", list(HEATMAP_HORIZONS), horizontal=True, key="hm_horizon", label_visibility="collapsed")
+
+    with st.spinner("주말의 침묵을 깨고 데이터를 강제 소환 중..."):
+        hm_panel = get_usd_cross_panel(tuple(HEATMAP_SYMBOLS))
+
+    if not hm_panel.empty:
+        hm_df = get_heatmap_matrix(hm_panel, horizon)
+        z_range = HEATMAP_ZRANGE[horizon]
+        fig_hm = go.Figure(data=go.Heatmap(
+            z=hm_df.values,
+            x=hm_df.columns,
+            y=hm_df.index,
+            colorscale='RdYlGn',
+            zmin=-z_range, zmax=z_range,
+            text=hm_df.map(lambda v: "" if pd.isna(v) else f"{v:.2f}%").values,
+            texttemplate="%{text}",
+            hovertemplate="Base: %{y}<br>Quote: %{x}<br>Change: %{z:.2f}%<extra></extra>"
+        ))
+
+        fig_hm.update_layout(
+            template="plotly_dark",
+            paper_bgcolor="rgba(0,0,0,0)",
+            plot_bgcolor="rgba(0,0,0,0)",
+            margin=dict(l=10, r=10, t=30, b=10),
+            height=500,
+            xaxis=dict(side="top")
+        )
+
+        st.plotly_chart(fig_hm, use_container_width=True)
+        missing = [c for c in HEATMAP_SYMBOLS if c not in hm_panel.columns]
+        no_data = f" | No data: {', '.join(missing)}" if missing else ""
+        st.caption(f"Horizon: {horizon} | Last Close: {hm_panel.index[-1].strftime('%Y-%m-%d')}{no_data} | Source: Yahoo Finance & Global Exchange Data")
+
+
+def render(ctx):
+    st.title("BITCOIN STANDARD a.k.a FOREX")
+
+    # [A] BTC STANDARD: FIAT DEVALUATION (COLLECTIVE)
+    st.markdown("---")
+    st.subheader("BTC STANDARD: FIAT DEVALUATION")
+    st.info("비트코인(BTC) 대비 각 법정화폐의 실질 구매력 변화를 추적합니다. (BTC Standard = 1.00)")
+
+    # 1. 분석 기간 선택
+    btc_col1, btc_col2 = st.columns([1, 2])
+    with btc_col1:
+        # 성진님의 요청에 따라 2023-01-01 유지
+        btc_default_start = datetime(2023, 1, 1)
+        btc_analysis_start = st.date_input("Analysis Start Date", value=btc_default_start, key="btc_std_global_date")
+
+    # 2. 데이터 로드 (통화 목록은 FIAT_TICKERS)
+    btc_df = get_btc_standard_v105(btc_analysis_start.strftime('%Y-%m-%d'))
+
+    if not btc_df.empty and len(btc_df) > 1:
+        btc_rel_perf = (btc_df / btc_df.iloc[0] - 1) * 100
+        
+        # 3. 차트 생성
+        fig_btc_melt = go.Figure()
+        # USD: 화이트, 나머지 컬러 유지
+        colors = {
+            "USD": "#FFFFFF", "CAD": "#FF5252", "AUD": "#FFD740", 
+            "CHF": "#64FFDA", "JPY": "#448AFF", "CNY": "#E040FB", "KRW": "#00E676"
+        }
+        
+        # 설정한 순서(USD 우선)대로 Trace 추가
+        for name in FIAT_TICKERS.keys():
+            if name in btc_rel_perf.columns:
+                is_usd = (name == "USD")
+                fig_btc_melt.add_trace(go.Scatter(
+                    x=btc_rel_perf.index, y=btc_rel_perf[name],
+                    mode='lines', name=name,
+                    line=dict(
+                        width=3 if is_usd else 1.5, 
+                        color=colors.get(name),
+                        dash='dot' if is_usd else 'solid' # USD는 점선 강조
+                    ),
+                    connectgaps=True,
+                    hovertemplate=f"<b>{name}</b>: %{{y:.2f}}% (Purchasing Power)<extra></extra>"
+                ))
+
+        y_min, y_max = btc_rel_perf.min().min(), btc_rel_perf.max().max()
+        y_padding = abs(y_max - y_min) * 0.15
+
+        fig_btc_melt.update_layout(
+            template="plotly_dark", paper_bgcolor="rgba(0,0,0,0)", plot_bgcolor="rgba(0,0,0,0)",
+            height=550, margin=dict(l=10, r=10, t=10, b=10), hovermode="x unified",
+            legend=dict(
+                orientation="h",       # 가로 배치 유지
+                yanchor="top",      # 하단 기준 (y=1.02와 세트)
+                y=1,                # 차트 상단 살짝 위로 올림
+                xanchor="right",       # 오른쪽 기준점 설정 
+                x=1,                   # 오른쪽 끝으로 밀착 
+                bgcolor="rgba(0,0,0,0)", # 배경 투명하게
+                traceorder="normal"
+            ),
+            yaxis=dict(showgrid=True, gridcolor="#333", title="Purchasing Power Change (%)", range=[y_min - y_padding, y_max + y_padding])
+        )
+
+        st.plotly_chart(fig_btc_melt, use_container_width=True)
+        
+        # [V103] 캡션 업데이트: Source 추가 완료!
+        actual_start_str = btc_rel_perf.index[0].strftime('%Y-%m-%d')
+        st.caption(f"Analysis Start: {actual_start_str} | Source: Yahoo Finance & Global Exchange Data")
+        
+        # 전략적 코멘트
+        worst_fiat = btc_rel_perf.iloc[-1].idxmin()
+        worst_val = btc_rel_perf.iloc[-1].min()
+        st.error(f"**Worst Fiat Devaluation:** {actual_start_str} 이후 **{worst_fiat}**의 구매력은 비트코인 대비 **{worst_val:.2f}%** 하락했습니다.")
+
+
+# [B] SATOSHIS PER UNIT FIAT: THE SCARCITY TRACKER (Final Optimization)
+    st.markdown("---")
+    st.subheader("SATOSHIS PER UNIT FIAT (SCARCITY)")
+    st.info("각 통화 '1단위'로 구매 가능한 사토시(Sats)의 개수를 추적합니다. (USD는 달러 인덱스 기준)")
+
+    # 2. 분석 시작일 설정
+    sats_col1, sats_col2 = st.columns([1, 2])
+    with sats_col1:
+        sats_default_start = datetime(2023, 1, 1)
+        sats_start_date = st.date_input(
+            "Analysis Start Date", 
+            value=sats_default_start, 
+            key="sats_scarcity_date"
+        )
+
+    # 함수 이름 똑같이 맞춰서 호출!
+    sats_df = get_sats_per_fiat_final(sats_start_date.strftime('%Y-%m-%d'))
+
+    if not sats_df.empty:
+        # 3. 차트 생성
+        fig_sats = go.Figure()
+        colors = {
+            "USD": "#FFFFFF", "CAD": "#FF5252", "AUD": "#FFD740", 
+            "CHF": "#64FFDA", "JPY": "#448AFF", "CNY": "#E040FB", "KRW": "#00E676"
+        }
+        
+        # 레전드 순서대로 트레이스 추가
+        for fiat in SATS_UNIT_CONFIG.keys():
+            if fiat in sats_df.columns:
+                is_usd = (fiat == "USD")
+                legend_name = f"{SATS_UNIT_CONFIG[fiat]} {fiat}"
+                
+                fig_sats.add_trace(go.Scatter(
+                    x=sats_df.index, y=sats_df[fiat],
+                    mode='lines', 
+                    name=legend_name,
+                    line=dict(
+                        width=3 if is_usd else 1.5, 
+                        color=colors.get(fiat),
+                        dash='dot' if is_usd =="USD" else 'solid'
+                    ),
+                    hovertemplate=f"<b>{legend_name}</b>: %{{y:,.0f}} Sats<extra></extra>"
+                ))
+
+        fig_sats.update_layout(
+            template="plotly_dark", paper_bgcolor="rgba(0,0,0,0)", plot_bgcolor="rgba(0,0,0,0)",
+            height=500, margin=dict(l=10, r=10, t=10, b=10), hovermode="x unified",
+            yaxis_title="Satoshi Amount (Sats)",
+            legend=dict(
+                orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1, 
+                bgcolor="rgba(0,0,0,0)", traceorder="normal"
+            )
+        )
+        st.plotly_chart(fig_sats, use_container_width=True)
+        
+        # 캡션 및 경고문
+        actual_sats_base = sats_df.index[0].strftime('%Y-%m-%d')
+        st.caption(f"Analysis Start: {actual_sats_base} | Source: Yahoo Finance & Global Exchange Data")
+        
+        current_krw_sats = sats_df['KRW'].iloc[-1]
+        st.warning(f"**Scarcity Alert:** 현재 1,000원으로 살 수 있는 비트코인은 단 **{current_krw_sats:,.0f} 사토시**뿐입니다.")
+    else:
+        st.info("데이터를 분석하여 사토시 단위로 변환 중입니다...")
+
+
+    # [C] GLOBAL CURRENCY PERFORMANCE (V983: UI Unification)
+    st.markdown("---")
+    st.subheader("GLOBAL CURRENCY PERFORMANCE")
+
+    # 1. 대상 통화 목록은 FX_PERF_TICKERS
+
+    # 2. 분석 기간 선택 (다른 차트들과 스타일 통일!)
+    fx_perf_col1, fx_perf_col2 = st.columns([1, 2])
+    with fx_perf_col1:
+        # 디폴트는 성진님이 요청하신 대로 현재 기준 1년 전
+        fx_perf_default_start = datetime.now() - timedelta(days=365)
+        fx_perf_start_date = st.date_input(
+            "Analysis Start Date", 
+            value=fx_perf_default_start, 
+            key="fx_global_perf_date"
+        )
+
+    with st.spinner("Analyzing Global Currency Trends..."):
+        # 선택된 날짜를 문자열로 변환하여 전달
+        fx_df = get_fx_data_v983(fx_perf_start_date.strftime('%Y-%m-%d'))
+
+    # 3. 차트 렌더링
+    if not fx_df.empty and len(fx_df) > 1:
+        # 선택한 시작점의 첫 데이터를 0%로 기준 잡기
+        first_valid_row = fx_df.iloc[0]
+        fx_ytd_rel = (fx_df / first_valid_row - 1) * 100
+        
+        y_min, y_max = fx_ytd_rel.min().min(), fx_ytd_rel.max().max()
+        y_padding = (y_max - y_min) * 0.2
+
+        fig_fx = go.Figure()
+        ordered_names = ["DXY", "CAD", "AUD", "CHF", "JPY", "CNY", "KRW"]
+        colors = {"DXY": "#FFFFFF", "CAD": "#FF5252", "AUD": "#FFD740", "CHF": "#64FFDA", "JPY": "#448AFF", "CNY": "#E040FB", "KRW": "#00E676"}
+
+        for name in ordered_names:
+            if name in fx_ytd_rel.columns:
+                fig_fx.add_trace(go.Scatter(
+                    x=fx_ytd_rel.index, y=fx_ytd_rel[name],
+                    mode='lines', name=name,
+                    line=dict(width=3 if name=="DXY" else 1.5, dash='dot' if name=="DXY" else 'solid', color=colors[name]),
+                    hovertemplate=f"<b>{name}</b>: %{{y:.2f}}%<extra></extra>"
+                ))
+
+        fig_fx.update_layout(
+            template="plotly_dark", paper_bgcolor="rgba(0,0,0,0)", plot_bgcolor="rgba(0,0,0,0)",
+            height=550, margin=dict(l=10, r=10, t=20, b=40), hovermode="x unified",
+            legend=dict(orientation="h", yanchor="top", y=1, xanchor="right", x=1, bgcolor="rgba(0,0,0,0.3)"),
+            yaxis=dict(showgrid=True, gridcolor="#333", title="Relative Return (%)", range=[y_min - y_padding, y_max + y_padding])
+        )
+        st.plotly_chart(fig_fx, use_container_width=True)
+        st.caption(f"Base Date: {fx_df.index[0].strftime('%Y-%m-%d')} (Normalized to 0.00%) | Source: Yahoo Finance & Global Exchange Data")
+    else:
+        st.info("선택하신 기간의 데이터를 불러오는 중입니다...")
+
+
+    # [D] MAJOR SPOT EXCHANGE RATES (USD BASED)
+    st.markdown("---")
+    st.subheader("MAJOR SPOT EXCHANGE RATES")
+
+    # 1. 티커 및 컬러 리스트 (레전드 순서 동기화)
+    spot_config = [
+        {"name": "USD/CAD", "ticker": "CAD=X", "color": "#FF5252"},
+        {"name": "USD/AUD", "ticker": "AUD=X", "color": "#FFD740"},
+        {"name": "USD/CHF", "ticker": "CHF=X", "color": "#64FFDA"},
+        {"name": "USD/JPY", "ticker": "JPY=X", "color": "#448AFF"},
+        {"name": "USD/CNY", "ticker": "CNY=X", "color": "#E040FB"},
+        {"name": "USD/KRW", "ticker": "KRW=X", "color": "#00E676"}
+    ]
+
+    # [V1080] 개별 차트 렌더링 루프
+    for config in spot_config:
+        name = config["name"]
+        ticker = config["ticker"]
+        color = config["color"]
+
+        # A. 차트 제목 출력
+        st.write(f"#### **{name}**")
+
+        # B. Analysis Start Date 선택 (왼쪽 정렬을 위해 컬럼 활용)
+        col_date, col_empty = st.columns([1, 2])
+        with col_date:
+            # 기본값: 1년 전
+            default_start = datetime.now() - timedelta(days=365)
+            individual_start = st.date_input(
+                "Analysis Start Date", 
+                value=default_start, 
+                key=f"date_{name}"
+            )
+
+        # C. 데이터 로드 및 차트 생성
+        try:
+            # [V49] 공용 BTC+FX 패널에서 (개별 다운로드 없음)
+            spot_series = get_fx_panel().closes(individual_start)[ticker].dropna()
+            if not spot_series.empty:
+                
+                # Y축 범위 최적화
+                y_min, y_max = spot_series.min(), spot_series.max()
+                padding = (y_max - y_min) * 0.15
+
+                fig = go.Figure()
+                fig.add_trace(go.Scatter(
+                    x=spot_series.index, y=spot_series,
+                    mode='lines',
+                    line=dict(width=1.5, color=color),
+                    fill='tozeroy',
+                    fillcolor=f"rgba({int(color[1:3],16)}, {int(color[3:5],16)}, {int(color[5:7],16)}, 0.05)",
+                    hovertemplate=f"<b>{name}</b>: %{{y:.2f}}<extra></extra>"
+                ))
+                
+                fig.update_layout(
+                    template="plotly_dark",
+                    paper_bgcolor="rgba(0,0,0,0)",
+                    plot_bgcolor="rgba(0,0,0,0)",
+                    height=300,
+                    margin=dict(l=10, r=10, t=10, b=10),
+                    xaxis=dict(showgrid=False),
+                    yaxis=dict(
+                        showgrid=True, gridcolor="rgba(255,255,255,0.05)", 
+                        side="left",
+                        range=[y_min - padding, y_max + padding]
+                    ),
+                    showlegend=False,
+                    hovermode="x unified"
+                )
+                
+                st.plotly_chart(fig, use_container_width=True)
+                
+                # D. 하단 표준 캡션 (왼쪽 정렬)
+                actual_start_str = spot_series.index[0].strftime('%Y-%m-%d')
+                st.caption(f"Analysis Start: {actual_start_str} | Source: Yahoo Finance & Global Exchange Data")
+                st.markdown("<br>", unsafe_allow_html=True)
+            else:
+                st.warning(f"{name} 데이터가 해당 기간에 존재하지 않습니다.")
+        except Exception as e:
+            st.error(f"{name} 데이터를 가져오는 중 오류가 발생했습니다.")
+
+
+    # [E] GLOBAL CURRENCY HEATMAP: RELATIVE STRENGTH
+    st.markdown("---")
+    render_currency_heatmap()
+
+    render_footer()
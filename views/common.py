@@ -0,0 +1,60 @@
+import streamlit as st
+
+
+# --- 공통 푸터 함수 정의 (업그레이드) ---
+def render_footer(sidebar=False):
+    # 어디에 출력할지 결정 (st 또는 st.sidebar)
+    target = st.sidebar if sidebar else st
+    
+    # 사이드바용일 때는 구분선(---)을 생략하거나 마진을 줄여 조절 가능
+    if not sidebar:
+        target.markdown("---")
+    
+    target.markdown(f"""
+        <div style="
+            font-family: 'Courier New', Courier, monospace;
+            font-size: 13px;
+            color: #777777;
+            text-align: center;
+            letter-spacing: 1px;
+            padding-top: { '10px' if sidebar else '50px' };
+            padding-bottom: 20px;
+            font-weight: 500;
+            width: 100%;
+        ">
+            RABBIT TERMINAL v2026.02
+        </div>
+    """, unsafe_allow_html=True)
+
+
+@st.cache_data(ttl=900, show_spinner=False)
+def download_prices(tickers, **kwargs):
+    """
+    yf.download for page sections, cached per ticker set and arguments for 15 minutes, so a
+    fragment rerun (or another section asking for the same data) does not hit Yahoo again.
+    yfinance is imported here rather than at module level: the login shell imports this module.
+    """
+    import yfinance as yf
+    return yf.download(tickers, **kwargs)
+
+
+def section_start(key, default):
+    """Start date a section will use: its date input's value in session state, else the widget default."""
+    import pandas as pd
+    return pd.Timestamp(st.session_state.get(key, default)).normalize()
+
+
+def page_closes(page, tickers, start):
+    """
+    Daily closes (one column per ticker) for a section of `page`: served from the page's prefetched
+    batches (fetch_planner) when they cover the request, otherwise the section's own cached download.
+    """
+    import pandas as pd
+    from fetch_planner import get_page_prices
+    tickers = list(tickers)
+    closes = get_page_prices(page).closes(tickers, start)
+    if closes is None:
+        closes = download_prices(tickers, start=start, progress=False)['Close']
+        if isinstance(closes, pd.Series):  # 단일 티커를 평탄한 열로 돌려주는 yfinance 버전
+            closes = closes.to_frame(tickers[0])
+    return closes
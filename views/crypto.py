@@ -0,0 +1,479 @@
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+from datetime import datetime, timedelta
+from plotly.subplots import make_subplots
+
+from fetch_planner import PriceNeed, get_page_prices
+from views.common import render_footer, page_closes, section_start
+
+
+# 시총 상위 10개 코인 티커 매핑 (스테이블코인 제외)
+CRYPTO_CONFIG = {
+    "Bitcoin": {"ticker": "BTC-USD", "color": "#F7931A", "width": 3},   # BTC 오렌지색
+    "Ethereum": {"ticker": "ETH-USD", "color": "#627EEA", "width": 1.5},  # ETH 블루
+    "Solana": {"ticker": "SOL-USD", "color": "#AF52DE", "width": 1.5},
+    "BNB": {"ticker": "BNB-USD", "color": "#F3BA2F", "width": 1.5},
+    "XRP": {"ticker": "XRP-USD", "color": "#14F195", "width": 1.5},
+    "Cardano": {"ticker": "ADA-USD", "color": "#0033AD", "width": 1.5},
+    "Avalanche": {"ticker": "AVAX-USD", "color": "#E84142", "width": 1.5},
+    "Dogecoin": {"ticker": "DOGE-USD", "color": "#C2A633", "width": 1.5},
+    "Tron": {"ticker": "TRX-USD", "color": "#FF0013", "width": 1.5},
+    "Chainlink": {"ticker": "LINK-USD", "color": "#2A5ADA", "width": 1.5}
+}
+
+
+def plan_needs():
+    """[V50] 페이지 첫 실행 전에 각 섹션이 읽을 (티커, 시작일): 섹션마다 지표 계산용 선행 구간 포함."""
+    default_start = datetime.now() - timedelta(days=365)
+    return [
+        PriceNeed([c["ticker"] for c in CRYPTO_CONFIG.values()], section_start("crypto_perf_date", default_start)),
+        PriceNeed(["BTC-USD"], section_start("btc_tech_v202", datetime.now() - timedelta(days=365*2)) - timedelta(days=365*6)),
+        PriceNeed(["BTC-USD"], section_start("vol_price_final_v230", default_start) - timedelta(days=60)),
+        PriceNeed(["BTC-USD", "^NDX", "^GSPC"], section_start("c_date_v228", default_start) - timedelta(days=100)),
+        PriceNeed(["DX-Y.NYB", "BTC-USD", "GC=F"], section_start("bgd_ratio_date", default_start)),
+    ]
+
+
+@st.fragment
+def render_top_cryptos():
+    # [A] TOP 10 CRYPTO PERFORMANCE (Excl. Stablecoins)
+    st.markdown("---")
+    st.subheader("TOP 10 CRYPTO PERFORMANCE")
+    
+    # 2. 입력 도구
+    c_col1, c_col2 = st.columns([1, 2])
+    with c_col1:
+        # 비트코인 표준에 맞춰 올해 초부터를 기본값으로 설정
+        crypto_default_start = datetime.now() - timedelta(days=365)
+        crypto_start_date = st.date_input("Analysis Start Date", value=crypto_default_start, key="crypto_perf_date")
+        
+    with c_col2:
+        selected_cryptos = st.multiselect(
+            "Select Assets to Compare", 
+            options=list(CRYPTO_CONFIG.keys()),
+            default=["Bitcoin", "Ethereum", "Solana", "BNB", "XRP", "Cardano", "Avalanche", "Dogecoin", "Tron", "Chainlink"], # 주요 코인 기본 선택
+            key="crypto_perf_select"
+        )
+    
+    # 3. 데이터 로드 및 시각화
+    if selected_cryptos:
+        with st.spinner("Syncing with Blockchain Data (via yfinance)..."):
+            c_target_tickers = [CRYPTO_CONFIG[l]["ticker"] for l in selected_cryptos]
+            c_data = page_closes("crypto", c_target_tickers, crypto_start_date)
+            
+            if not c_data.empty:
+                c_data = c_data.ffill().dropna()
+                
+                if not c_data.empty:
+                    # [레전드 순서 고정] 정의한 CRYPTO_CONFIG 순서대로
+                    c_priority = [CRYPTO_CONFIG[k]["ticker"] for k in CRYPTO_CONFIG.keys()]
+                    c_final_order = [t for t in c_priority if t in c_data.columns]
+                    c_data = c_data[c_final_order]
+                    
+                    # 수익률 계산
+                    c_norm_df = (c_data / c_data.iloc[0] - 1) * 100
+                    
+                    fig_crypto = go.Figure()
+                    
+                    for ticker in c_data.columns:
+                        label = [k for k, v in CRYPTO_CONFIG.items() if v["ticker"] == ticker][0]
+                        conf = CRYPTO_CONFIG[label]
+                        
+                        fig_crypto.add_trace(go.Scatter(
+                            x=c_norm_df.index, 
+                            y=c_norm_df[ticker], 
+                            mode='lines', 
+                            name=label,
+                            line=dict(width=conf["width"], color=conf["color"]),
+                            hovertemplate=f"{label}: %{{y:.2f}}%<extra></extra>"
+                        ))
+                    
+                    fig_crypto.update_layout(
+                        hovermode="x unified",
+                        paper_bgcolor='rgba(0,0,0,0)',
+                        plot_bgcolor='rgba(0,0,0,0)',
+                        height=550,
+                        margin=dict(t=10, b=10, l=10, r=10),
+                        yaxis=dict(title="Return (%)", gridcolor='rgba(255,255,255,0.05)', zerolinecolor='#666'),
+                        xaxis=dict(gridcolor='rgba(255,255,255,0.05)'),
+                        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1, traceorder="normal")
+                    )
+                    st.plotly_chart(fig_crypto, use_container_width=True)
+                    st.caption(f"Base Date: {c_data.index[0].strftime('%Y-%m-%d')} (Normalized to 0.00%) | Source: Yahoo Finance & Global Exchange Data")
+
+
+@st.fragment
+def render_btc_technical_radar(ti):
+    # [B] BITCOIN 217-WEEK CYCLE RADAR (V202: Clean RSI)
+    st.markdown("---")
+    st.subheader("BTC TECHNICAL RADAR")
+
+    tech_col1, tech_col2 = st.columns([1, 2])
+    with tech_col1:
+        tech_start_date = st.date_input("Analysis Start Date", value=datetime.now() - timedelta(days=365*2), key="btc_tech_v202")
+
+    with st.spinner("Calculating Strategic Indicators..."):
+        fetch_start_long = tech_start_date - timedelta(days=365*6)
+        btc_raw = page_closes("crypto", ["BTC-USD"], fetch_start_long)
+        
+        if not btc_raw.empty:
+            d_prices = btc_raw['BTC-USD'].ffill().dropna()
+            d_prices.name = "BTC-USD"
+            w_prices = ti.resample(d_prices, rule='W', how='last')
+
+            if len(w_prices) >= 217:
+                sma217w = ti.sma(w_prices, window=217)
+                ema217w = ti.ema(w_prices, span=217)
+                median217w = (sma217w + ema217w) / 2
+                median_daily = median217w.reindex(d_prices.index).ffill()
+                
+                # RSI 계산 (일봉 14일)
+                rsi = ti.rsi(d_prices, window=14)
+                
+                mask = d_prices.index.date >= tech_start_date
+                p_disp = d_prices[mask]
+                m_disp = median_daily[mask]
+                rsi_disp = rsi[mask].fillna(50)
+                
+                fig_tech = make_subplots(
+                    rows=2, cols=1, shared_xaxes=True, 
+                    vertical_spacing=0.08, row_heights=[0.7, 0.3],
+                    subplot_titles=("BTC", "RSI")
+                )
+                
+                # Trace 1: BTC Price
+                fig_tech.add_trace(go.Scatter(
+                    x=p_disp.index, y=p_disp, name="BTC", 
+                    line=dict(color="#F7931A", width=1.5)
+                ), row=1, col=1)
+                
+                # Trace 2: 217W Median
+                fig_tech.add_trace(go.Scatter(
+                    x=m_disp.index, y=m_disp, name="217W Median", 
+                    line=dict(color="#00E676", width=2, dash='dashdot') 
+                ), row=1, col=1)
+                
+                # Trace 3: RSI (선만 깔끔하게 표시)
+                fig_tech.add_trace(go.Scatter(
+                    x=rsi_disp.index, y=rsi_disp, name="RSI", 
+                    line=dict(color="#AF52DE", width=1.5)
+                ), row=2, col=1)
+                
+                # [수정] 30, 70 기준선만 명확하게 표시
+                fig_tech.add_hline(y=70, line_dash="dash", line_color="#FF5252", line_width=1, opacity=0.8, row=2, col=1)
+                fig_tech.add_hline(y=30, line_dash="dash", line_color="#00E676", line_width=1, opacity=0.8, row=2, col=1)
+                
+                fig_tech.update_layout(
+                    hovermode="x unified", height=650,
+                    paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
+                    margin=dict(t=10, b=10, l=10, r=10),
+                    legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1, traceorder="normal")
+                )
+                
+                fig_tech.update_yaxes(gridcolor='rgba(255,255,255,0.05)', row=1, col=1)
+                fig_tech.update_yaxes(range=[0, 100], gridcolor='rgba(255,255,255,0.05)', row=2, col=1)
+                
+                st.plotly_chart(fig_tech, use_container_width=True)
+                
+                # [추가] 실제 데이터 시작일 기준 Base Date 캡션
+                tech_actual_base = p_disp.index[0].strftime('%Y-%m-%d')
+                st.caption(f"Analysis Start: {tech_actual_base} | Source: Yahoo Finance & Global Exchange Data")
+
+                # 전략적 진단
+                curr_p = float(p_disp.iloc[-1])
+                curr_m = float(m_disp.iloc[-1])
+                curr_rsi = float(rsi_disp.iloc[-1])
+                dist = ((curr_p / curr_m) - 1) * 100
+                st.info(f"**Current:** BTC vs 217W Median: **{dist:.2f}%** | RSI: **{curr_rsi:.2f}**")
+            else:
+                st.warning("데이터가 부족합니다.")
+
+
+@st.fragment
+def render_btc_volatility(ti):
+    # [C] CRYPTO VOLATILITY & PRICE OVERLAY (V230: Legend Sorted)
+    st.markdown("---")
+    st.subheader("BTC VOLATILITY vs PRICE")
+
+    vol_col1, vol_col2 = st.columns([1, 2])
+    with vol_col1:
+        vol_start_date = st.date_input("Analysis Start Date", value=datetime.now() - timedelta(days=365), key="vol_price_final_v230")
+
+    with st.spinner("Analyzing BTC Pulse..."):
+        fetch_start = vol_start_date - timedelta(days=60)
+        btc_data = page_closes("crypto", ["BTC-USD"], fetch_start)
+        
+        if not btc_data.empty:
+            price_series = btc_data['BTC-USD'].ffill().dropna()
+            price_series.name = "BTC-USD"
+            
+            if len(price_series) > 30:
+                vol_30d = ti.rolling_volatility(price_series, window=30, periods_per_year=365, min_periods=20) * 100
+                
+                vol_display = vol_30d[vol_30d.index.date >= vol_start_date].dropna()
+                price_display = price_series[price_series.index.date >= vol_start_date].dropna()
+                
+                if not vol_display.empty:
+                    fig_dual = make_subplots(specs=[[{"secondary_y": True}]])
+                    
+                    # [레전드 순서 1] BTC Price (Secondary Y: True)
+                    fig_dual.add_trace(go.Scatter(
+                        x=price_display.index, y=price_display,
+                        mode='lines', name="BTC",
+                        line=dict(width=1.5, color="#F7931A")
+                    ), secondary_y=True)
+
+                    # [레전드 순서 2] 30D Volatility (Secondary Y: False)
+                    fig_dual.add_trace(go.Scatter(
+                        x=vol_display.index, y=vol_display,
+                        mode='lines', name="Volatility(30D)",
+                        line=dict(width=1.5, color="#00E5FF"),
+                        fill='tozeroy', fillcolor='rgba(0, 229, 255, 0.1)'
+                    ), secondary_y=False)
+                    
+                    # avg_vol 스칼라 변환
+                    raw_avg = vol_display.mean()
+                    avg_vol = float(raw_avg.iloc[0]) if isinstance(raw_avg, pd.Series) else float(raw_avg)
+                    
+                    fig_dual.add_hline(
+                        y=avg_vol, line_dash="dot", line_color="#FF5252", 
+                        annotation_text=f"AVG: {avg_vol:.1f}%",
+                        secondary_y=False
+                    )
+                    
+                    fig_dual.update_layout(
+                        hovermode="x unified",
+                        paper_bgcolor='rgba(0,0,0,0)',
+                        plot_bgcolor='rgba(0,0,0,0)',
+                        height=550,
+                        margin=dict(t=10, b=10, l=10, r=10),
+                        legend=dict(
+                            orientation="h", 
+                            yanchor="bottom", y=1.02, 
+                            xanchor="right", x=0.95, # 통일성을 위해 1로 고정
+                            traceorder="normal"
+                        ),
+                        yaxis=dict(title="Vol (%)", gridcolor='rgba(255,255,255,0.05)', ticksuffix="%"),
+                        yaxis2=dict(title="Price (USD)", showgrid=False)
+                    )
+                    
+                    st.plotly_chart(fig_dual, use_container_width=True)
+                    
+                    # [추가] 실제 데이터 시작일 기준 Base Date 캡션
+                    v_actual_base = vol_display.index[0].strftime('%Y-%m-%d')
+                    st.caption(f"Analysis Start: {v_actual_base} | Source: Yahoo Finance & Global Exchange Data")
+
+                    # 인포 박스 출력
+                    curr_vol = float(vol_display.iloc[-1])
+                    curr_price = float(price_display.iloc[-1])
+                    st.info(f"**Current:** BTC ${curr_price:,.0f} | Volatility {curr_vol:.2f}%")
+
+
+@st.fragment
+def render_btc_stock_correlation():
+    # [D] CRYPTO vs STOCK CORRELATION & PRICE (V228: Legend Sorted & White Dot)
+    st.markdown("---")
+    st.subheader("BTC vs U.S. STOCK CORRELATION")
+
+    c_col1, c_col2 = st.columns([1, 2])
+    with c_col1:
+        corr_start_date = st.date_input("Analysis Start Date", value=datetime.now() - timedelta(days=365), key="c_date_v228")
+    with c_col2:
+        s_bench = st.selectbox("Benchmark", ["Nasdaq 100 (^NDX)", "S&P 500 (^GSPC)"], key="s_bench_v228")
+        s_ticker = "^NDX" if "Nasdaq" in s_bench else "^GSPC"
+
+    with st.spinner("Analyzing Correlation Dynamics..."):
+        c_fetch_start = corr_start_date - timedelta(days=100)
+        c_raw = page_closes("crypto", ["BTC-USD", s_ticker], c_fetch_start)
+        
+        if not c_raw.empty:
+            c_raw = c_raw.ffill().dropna()
+            c_rets = c_raw.pct_change().dropna()
+            c_series = c_rets["BTC-USD"].rolling(window=60).corr(c_rets[s_ticker]).dropna()
+            
+            c_common = c_series.index.intersection(c_raw.index)
+            c_final = c_series.loc[c_common]
+            cp_final = c_raw.loc[c_common, "BTC-USD"]
+            
+            c_mask = c_final.index.date >= corr_start_date
+            c_disp = c_final[c_mask]
+            cp_disp = cp_final[c_mask]
+            
+            if not c_disp.empty:
+                fig_c = make_subplots(specs=[[{"secondary_y": True}]])
+
+                # 1. 배경 채우기 전용 (레전드에 나타나지 않음) 
+                fig_c.add_trace(go.Scatter(
+                    x=c_disp.index, y=c_disp, 
+                    fill='tozeroy', 
+                    fillcolor='rgba(255, 255, 255, 0.05)',
+                    line=dict(width=0), # 선은 안 보임
+                    showlegend=False,   # 레전드 제외
+                    hoverinfo='skip'    # 호버 제외
+                ), secondary_y=False)
+
+                # 2. 레전드 및 라인 전용 (이 선이 레전드 기준이 됨) 
+                fig_c.add_trace(go.Scatter(
+                    x=c_disp.index, y=c_disp, 
+                    name="Correlation",
+                    line=dict(width=3, color="#FFFFFF", dash="dot"),
+                    mode='lines' # 채우기 없음! 
+                ), secondary_y=False)
+
+                # [레전드 순서 2] BTC Price (오렌지 실선)
+                fig_c.add_trace(go.Scatter(
+                    x=cp_disp.index, y=cp_disp, 
+                    name="BTC", 
+                    line=dict(width=1.5, color="#F7931A")
+                ), secondary_y=True)
+                
+                # 기준선 (0.0)
+                fig_c.add_hline(y=0, line_dash="solid", line_color="rgba(255,255,255,0.2)", secondary_y=False)
+                
+                # UI 레이아웃 및 우측 상단 레전드 정렬
+                fig_c.update_layout(
+                    hovermode="x unified", height=500,
+                    paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
+                    margin=dict(t=10, b=10, l=10, r=10),
+                    legend=dict(
+                        orientation="h", 
+                        yanchor="bottom", y=1.02, 
+                        xanchor="right", x=0.95,
+                        bgcolor='rgba(0,0,0,0)',
+                        traceorder="normal" # add_trace 순서대로(BTC -> Corr)
+                    ),
+                    yaxis=dict(title="Correlation", range=[-1.1, 1.1], gridcolor='rgba(255,255,255,0.05)'),
+                    yaxis2=dict(title="BTC Price (USD)", showgrid=False)
+                )
+                
+                st.plotly_chart(fig_c, use_container_width=True)
+                
+                # 전략적 해석 로직
+                curr_c = float(c_disp.iloc[-1])
+                curr_p = float(cp_disp.iloc[-1])
+                
+                if curr_c > 0.6:
+                    c_status = "⚠️ 고동조화 (High Coupling): 자산 배분 효과 일시 감소"
+                elif curr_c < 0.1:
+                    c_status = "✅ 탈동조화 (Decoupling): 비트코인 표준 헤지 기능 강화"
+                else:
+                    c_status = "중립적 상관관계 (Neutral)"
+                
+                st.caption(f"Analysis Start: {c_disp.index[0].strftime('%Y-%m-%d')} | Source: Yahoo Finance & Global Exchange Data")
+                st.info(f"**Insight:** BTC ${curr_p:,.0f} | 현재 상관계수: **{curr_c:.2f}**, {c_status}")
+
+
+@st.fragment
+def render_btc_gold_dxy():
+    # [E] BTC vs GOLD vs DXY RELATIVE STRENGTH (V160)
+    st.markdown("---")
+    st.subheader("DXY vs BTC vs GOLD")
+    
+    # 1. 입력 도구 (기본 날짜는 연초로 설정)
+    bgd_col1, bgd_col2 = st.columns([1, 2])
+    with bgd_col1:
+        # bgd_default_start = datetime(datetime.now().year, 1, 1)
+        bgd_default_start = datetime.now() - timedelta(days=365)
+        bgd_start_date = st.date_input("Analysis Start Date", value=bgd_default_start, key="bgd_ratio_date")
+    
+    # 2. 데이터 로드 (DX-Y.NYB, BTC-USD, GC=F)
+    with st.spinner("Analyzing Global Monetary Assets..."):
+        # DX-Y.NYB: Dollar Index, BTC-USD: Bitcoin, GC=F: Gold
+        bgd_tickers = ["DX-Y.NYB", "BTC-USD", "GC=F"]
+        bgd_raw_data = page_closes("crypto", bgd_tickers, bgd_start_date)
+        
+        if not bgd_raw_data.empty:
+            bgd_raw_data = bgd_raw_data.ffill().dropna()
+            
+            if not bgd_raw_data.empty:
+                # 수익률 표준화 (0% 기준)
+                bgd_norm = (bgd_raw_data / bgd_raw_data.iloc[0] - 1) * 100
+                
+                # 티커 변수 할당
+                dxy_col = "DX-Y.NYB"
+                btc_col = "BTC-USD"
+                gold_col = "GC=F"
+                
+                # Bitcoin / Gold Ratio 계산
+                bg_ratio = bgd_raw_data[btc_col] / bgd_raw_data[gold_col]
+                bg_ratio_norm = (bg_ratio / bg_ratio.iloc[0] - 1) * 100
+                
+                # 3. 차트 생성
+                fig_bgd = go.Figure()
+
+
+                # [레전드 순서 1] Ratio - 화이트 굵은 도트선
+                fig_bgd.add_trace(go.Scatter(
+                    x=bg_ratio_norm.index, y=bg_ratio_norm,
+                    mode='lines', name="BTC/Gold",
+                    line=dict(width=3, color="#FFFFFF", dash='dot'),
+                    hovertemplate="Ratio Change: %{y:.2f}%<extra></extra>"
+                ))
+                
+                # [레전드 순서 2] Dollar Index - 초록색
+                fig_bgd.add_trace(go.Scatter(
+                    x=bgd_norm.index, y=bgd_norm[dxy_col],
+                    mode='lines', name="DXY",
+                    line=dict(width=2, color="#00FF41"), # 사령부 시그니처 그린
+                    hovertemplate="DXY: %{y:.2f}%<extra></extra>"
+                ))
+                
+                # [레전드 순서 3] Bitcoin - 오렌지색 굵은 선
+                fig_bgd.add_trace(go.Scatter(
+                    x=bgd_norm.index, y=bgd_norm[btc_col],
+                    mode='lines', name="Bitcoin",
+                    line=dict(width=1.5, color="#F7931A"),
+                    hovertemplate="Bitcoin: %{y:.2f}%<extra></extra>"
+                ))
+                
+                # [레전드 순서 4] Gold - 금색 실선
+                fig_bgd.add_trace(go.Scatter(
+                    x=bgd_norm.index, y=bgd_norm[gold_col],
+                    mode='lines', name="Gold",
+                    line=dict(width=1.5, color="#FFD700"),
+                    hovertemplate="Gold: %{y:.2f}%<extra></extra>"
+                ))
+                
+                fig_bgd.update_layout(
+                    hovermode="x unified",
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    height=550,
+                    margin=dict(t=10, b=10, l=10, r=10),
+                    yaxis=dict(title="Performance / Ratio Change (%)", gridcolor='rgba(255,255,255,0.05)', zerolinecolor='#666'),
+                    xaxis=dict(gridcolor='rgba(255,255,255,0.05)'),
+                    legend=dict(
+                        orientation="h", 
+                        yanchor="bottom", y=1.02, 
+                        xanchor="right", x=1,
+                        traceorder="normal" # 코딩한 순서 유지
+                    )
+                )
+                
+                st.plotly_chart(fig_bgd, use_container_width=True)
+                
+                # 하단 캡션 추가
+                st.caption(f"Base Date: {bgd_raw_data.index[0].strftime('%Y-%m-%d')} (Normalized to 0%) | Source: Yahoo Finance & Global Exchange Data")
+                
+                # 4. 전략적 코멘트
+                current_dxy = bgd_norm[dxy_col].iloc[-1]
+                current_ratio_gain = bg_ratio_norm.iloc[-1]
+                st.info(f"**Insight:** 달러 인덱스는 기준일 대비 **{current_dxy:.2f}% {'강세' if current_dxy > 0 else '약세'}**이며, 금 대비 비트코인 구매력은 **{current_ratio_gain:.2f}% {'확장' if current_ratio_gain > 0 else '축소'}** 중입니다.")
+
+
+def render(ctx):
+    st.title("CRYPTO INTELLIGENCE")
+
+    # [V50] 섹션들이 읽을 가격을 묶음 요청으로 한 번에 받아 두고, 각 fragment는 여기서 읽음
+    with st.spinner("Loading crypto market data..."):
+        get_page_prices("crypto").prefetch(plan_needs())
+
+    # [V44] 섹션마다 독립 fragment: 날짜/종목 선택은 해당 섹션만 다시 실행
+    render_top_cryptos()
+    render_btc_technical_radar(ctx.ti)
+    render_btc_volatility(ctx.ti)
+    render_btc_stock_correlation()
+    render_btc_gold_dxy()
+
+    render_footer()
@@ -0,0 +1,471 @@
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+from datetime import datetime, timedelta
+
+from derived_series import add_fred_sources, get_series_graph
+from fred_data import get_fred_data
+from views.common import render_footer
+
+
+def real_rate_frame(us3m, inflation):
+    """US3M, Inflation (CPI YoY), Real_Rate: 월간 물가를 다음 발표 전까지 매일 동일하게 적용(ffill)."""
+    df = pd.concat([us3m.rename('US3M'), inflation.rename('Inflation')], axis=1).sort_index().ffill()
+    df['Real_Rate'] = df['US3M'] - df['Inflation']
+    return df.dropna()
+
+
+def net_liquidity_series(walcl, tga, rrp):
+    """Net Liquidity ($T) = Fed 총자산 - TGA - 역레포 (WALCL/WTREGEN: 백만달러, RRPONTSYD: 십억달러)."""
+    nl = pd.concat([walcl / 1000000, tga / 1000000, rrp / 1000], axis=1)
+    return (nl.iloc[:, 0] - nl.iloc[:, 1] - nl.iloc[:, 2]).dropna()
+
+
+# [V48] 파생 시리즈는 한 번만 선언: 입력 FRED 시리즈에 새 데이터가 있을 때만 재계산 (derived_series)
+SERIES = get_series_graph()
+add_fred_sources(SERIES, ['DGS3MO', 'CPIAUCNS', 'WALCL', 'WTREGEN', 'RRPONTSYD'])
+SERIES.derive("CPI_YOY", ["CPIAUCNS"], lambda cpi: (cpi / cpi.shift(12) - 1) * 100)
+SERIES.derive("REAL_RATE", ["DGS3MO", "CPI_YOY"], real_rate_frame)
+SERIES.derive("NET_LIQUIDITY", ["WALCL", "WTREGEN", "RRPONTSYD"], net_liquidity_series)
+
+
+# --- MACRO INTELLIGENCE CLASS (V54) ---
+class MacroThinking:
+    # [V47] FRED 시리즈는 fred_data(로컬 FredStore 미러 + 릴리스 일정 기반 만료)에서 읽으므로 별도 st.cache_data 없음
+    @staticmethod
+    def get_real_interest_rate_data():
+        try:
+            # 1. 넉넉하게 3년치 데이터 호출
+            start_date = datetime.now() - timedelta(days=1100)
+            get_fred_data().refresh(['DGS3MO', 'CPIAUCNS'], start_date)
+
+            # 2. 실질금리 = 3M Yield - Inflation (CPI YoY): 파생 시리즈 REAL_RATE (V48)
+            df = SERIES.get("REAL_RATE")
+            return df[df.index >= pd.Timestamp(start_date)]
+            
+        except Exception as e:
+            st.error(f"Macro Data Error: {e}")
+            return pd.DataFrame()
+
+    @staticmethod
+    def get_treasury_yields():
+        try:
+            # DGS3MO, DGS1, DGS2, DGS5, DGS10, DGS30
+            tickers = ['DGS3MO', 'DGS1', 'DGS2', 'DGS3', 'DGS5', 'DGS10', 'DGS20', 'DGS30']
+            start = datetime.now() - timedelta(days=730)
+            df = get_fred_data().get(tickers, start)
+            return df.dropna()
+        except Exception as e:
+            print(f"Treasury Data Error: {e}")
+            return pd.DataFrame()
+
+
+def get_real_rate_data_v82(start_date):
+    try:
+        # CPI 계산을 위해 시작일보다 1년 더 전부터 가져와야 함 (YoY 계산용)
+        fetch_start = start_date - timedelta(days=365 + 30)
+        get_fred_data().refresh(['DGS3MO', 'CPIAUCNS'], fetch_start)
+        
+        # 실질금리 계산은 파생 시리즈 REAL_RATE (V48), 사용자가 선택한 날짜 이후 데이터만 반환
+        df = SERIES.get("REAL_RATE")
+        return df[df.index >= pd.Timestamp(start_date)]
+    except Exception as e:
+        st.error(f"Real Rate Data Error: {e}")
+        return pd.DataFrame()
+
+
+def get_treasury_yields_v79(start_date):
+    try:
+        # 주요 만기 티커 (3M, 1Y, 2Y, 3Y, 5Y, 10Y, 20Y, 30Y)
+        tickers = ['DGS3MO', 'DGS1', 'DGS2', 'DGS3', 'DGS5', 'DGS10', 'DGS20', 'DGS30']
+        # 주말 데이터 유실 방지를 위해 7일 정도 더 일찍 가져옴
+        fetch_start = start_date - timedelta(days=7)
+        df = get_fred_data().get(tickers, fetch_start)
+        return df.ffill().dropna()
+    except Exception as e:
+        st.error(f"Treasury Data Error: {e}")
+        return pd.DataFrame()
+
+
+# [E] MACRO INDICATORS RADAR 지표 (카테고리 -> {FRED ID: 표시 이름})
+RADAR_INDICATORS = {
+    "Leading": {
+        "T10Y2Y": "10Y-2Y Spread",
+        "ICSA": "Initial Claims",
+        "MICH": "Inflation Expectation",
+        "BAMLH0A0HYM2": "High Yield Spread"
+    },
+    "Coincident": {
+        "PAYEMS": "Nonfarm Payrolls",
+        "INDPRO": "Industrial Production",
+        "DPCCRV1Q225SBEA": "Personal Consumption", # % 변동률 지표로 교체
+        "CMRMTSPL": "Real Manufacturing Sales"
+    },
+    "Lagging": {
+        "UNRATE": "Unemployment Rate",
+        "BUSLOANS": "Commercial Loans",
+        "CP": "Corporate Profits",
+        "DRCCLACBS": "Credit Card Delinquency Rate"
+    }
+}
+RADAR_SERIES = [ticker for group in RADAR_INDICATORS.values() for ticker in group]
+# [V46] Market Pulse + Radar 시리즈: 페이지 진입 시 한 번의 병렬 배치로 로드 (fred_data 캐시)
+PULSE_SERIES = ['FEDFUNDS', 'WALCL', 'WTREGEN', 'RRPONTSYD']
+RADAR_LOOKBACK_DAYS = 900  # 분기별 지표 대응을 위해 900일 확보
+
+
+def render(ctx):
+    # V56: Global Macro Intelligence (Full Caption System)
+    st.title("MACRO INTELLIGENCE")
+    
+    # [A] TradingView Widgets (Top)
+    st.markdown("---")
+    st.markdown("### MARKET PULSE")
+    c1, c2 = st.columns(2)
+    
+    # 디폴트: 현재 시점 기준 1년 전 (정확히 설정되어 있습니다!)
+    sync_start_date = datetime.now() - timedelta(days=365)
+
+    # [V46] Fed Funds / Net Liquidity / Radar 시리즈를 한 번에 (캐시가 유효하면 요청 없음)
+    fred = get_fred_data()
+    radar_start = datetime.now() - timedelta(days=RADAR_LOOKBACK_DAYS)
+    fred.refresh(PULSE_SERIES + RADAR_SERIES, radar_start)
+    
+    with c1:
+        try:
+            fed_data = fred.get(['FEDFUNDS'], sync_start_date)
+            if not fed_data.empty:
+                latest_fed = fed_data.dropna().iloc[-1, 0]
+                prev_fed = fed_data.dropna().iloc[-2, 0]
+                
+                st.metric(label="Fed Funds Effective Rate", value=f"{latest_fed:.2f}%", 
+                          delta=f"{latest_fed - prev_fed:.2f}%", delta_color="normal")
+                
+                fig1 = px.area(fed_data.dropna(), y='FEDFUNDS')
+                fig1.update_traces(line_color='#00E676', fillcolor='rgba(0, 230, 118, 0.1)')
+                fig1.update_layout(
+                    height=200, margin=dict(t=10, b=0, l=0, r=0),
+                    paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
+                    yaxis=dict(showgrid=False, title=None, zeroline=False, 
+                               range=[fed_data['FEDFUNDS'].min() * 0.95, fed_data['FEDFUNDS'].max() * 1.05]),
+                    xaxis=dict(showgrid=False, title=None), showlegend=False)
+                st.plotly_chart(fig1, use_container_width=True, config={'displayModeBar': False})
+                
+                # [V56] Analysis Start + Source 통합 캡션
+                actual_fed_start = fed_data.index[0].strftime('%Y-%m-%d')
+                st.caption(f"Analysis Start: {actual_fed_start} | Source: Federal Reserve Bank of St. Louis (FRED)")
+                
+        except Exception as e:
+            st.error("Fed Data Offline")
+        
+    with c2:
+        try:
+            # [V48] 파생 시리즈 NET_LIQUIDITY (입력은 상단 배치에서 로드됨)
+            net_liquidity = SERIES.get("NET_LIQUIDITY")
+            net_liquidity = net_liquidity[net_liquidity.index >= sync_start_date]
+            
+            if not net_liquidity.empty:
+                latest_nl = net_liquidity.iloc[-1]
+                prev_nl = net_liquidity.iloc[-2] if len(net_liquidity) > 1 else latest_nl
+                diff = latest_nl - prev_nl
+                
+                st.metric(
+                    label="Net Liquidity", 
+                    value=f"${latest_nl:.2f}T", 
+                    delta=f"{diff:.3f}T (WoW)", 
+                    delta_color="normal"
+                )
+                
+                df_plot = net_liquidity.to_frame(name='liquidity')
+                fig2 = px.area(df_plot, y='liquidity')
+                fig2.update_traces(line_color='#00E676', fillcolor='rgba(0, 230, 118, 0.1)')
+                fig2.update_layout(
+                    height=200, margin=dict(t=10, b=0, l=0, r=0),
+                    paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
+                    yaxis=dict(
+                        showgrid=False, title=None, zeroline=False, 
+                        range=[net_liquidity.min() * 0.99, net_liquidity.max() * 1.01]
+                    ),
+                    xaxis=dict(showgrid=False, title=None),
+                    showlegend=False
+                )
+                st.plotly_chart(fig2, use_container_width=True, config={'displayModeBar': False})
+                
+                # [V56] Analysis Start + Source 통합 캡션
+                actual_nl_start = net_liquidity.index[0].strftime('%Y-%m-%d')
+                st.caption(f"Analysis Start: {actual_nl_start} | Source: Federal Reserve Bank of St. Louis (FRED)")
+                
+        except Exception as e:
+            st.error(f"Net Liquidity Stream Offline")
+
+    st.markdown("---")
+
+
+    # [B] Real Interest Rate Analysis (V82: 2-Year Default & Standard Caption)
+    st.subheader("REAL INTEREST RATE")
+
+    # 1. 분석 기간 선택 (디폴트: 현재 시점 기준 2년 전)
+    rr_col1, rr_col2 = st.columns([1, 2])
+    with rr_col1:
+        rr_default_start = datetime.now() - timedelta(days=365 * 2)
+        rr_start_date = st.date_input(
+            "Analysis Start Date", 
+            value=rr_default_start, 
+            key="real_interest_rate_date"
+        )
+
+    # 2. 데이터 로드 및 처리 (V82: 선택된 날짜 연동)
+    with st.spinner("Calculating Real Interest Rate Dynamics..."):
+        real_rate_df = get_real_rate_data_v82(rr_start_date)
+    
+    if not real_rate_df.empty:
+        # 1. 상단 메트릭 섹션
+        latest = real_rate_df.iloc[-1]
+        prev = real_rate_df.iloc[-2] if len(real_rate_df) > 1 else latest
+        
+        m1, m2, m3 = st.columns(3)
+        m1.metric("Real Interest Rate", f"{latest['Real_Rate']:.2f}%", delta=f"{latest['Real_Rate'] - prev['Real_Rate']:.2f}%")
+        m2.metric("Nominal Rate (US3M)", f"{latest['US3M']:.2f}%")
+        m3.metric("Inflation (CPI YoY)", f"{latest['Inflation']:.2f}%")
+        
+        # 2. 차트 시각화
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(x=real_rate_df.index, y=real_rate_df['Real_Rate'], fill='tozeroy', mode='lines', name='Real Rate', line=dict(color='#00E676', width=2), fillcolor='rgba(0, 230, 118, 0.1)'))
+        fig.add_trace(go.Scatter(x=real_rate_df.index, y=real_rate_df['Inflation'], mode='lines', name='Inflation', line=dict(color='#FF5252', width=1, dash='dot')))
+        
+        fig.update_layout(
+            paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', 
+            height=350, margin=dict(t=10, b=10, l=10, r=10), 
+            xaxis=dict(gridcolor='#333'), yaxis=dict(gridcolor='#333'), 
+            font=dict(color='#CCC'), legend=dict(orientation="h", y=1.02)
+        )
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # 3. [V82 핵심] 표준 캡션 추가
+        actual_start_str = real_rate_df.index[0].strftime('%Y-%m-%d')
+        st.caption(f"Analysis Start: {actual_start_str} | Source: Federal Reserve Bank of St. Louis (FRED)")
+    else:
+        st.warning("Data unavailable.")
+
+
+# [C] Treasury Yield Trend (V79: 2-Year Default & Date Input)
+    st.markdown("---")
+    st.subheader("U.S. TREASURY YIELD")
+
+    # 1. 분석 기간 선택 (디폴트: 현재 시점 기준 2년 전)
+    yield_col1, yield_col2 = st.columns([1, 2])
+    with yield_col1:
+        yield_default_start = datetime.now() - timedelta(days=365 * 2)
+        yield_start_date = st.date_input(
+            "Analysis Start Date", 
+            value=yield_default_start, 
+            key="treasury_yield_date"
+        )
+
+    # 2. 데이터 로드 로직 보강
+    with st.spinner("Accessing U.S. Treasury Data..."):
+        # 선택된 날짜에 맞춰 데이터 호출
+        yields_df_raw = get_treasury_yields_v79(yield_start_date)
+        # 선택한 날짜 이후로 정확히 필터링
+        yields_df = yields_df_raw[yields_df_raw.index >= pd.Timestamp(yield_start_date)]
+    
+    if not yields_df.empty:
+        # 1. 상단 메트릭 섹션
+        latest = yields_df.iloc[-1]
+        prev = yields_df.iloc[-2] if len(yields_df) > 1 else latest
+        
+        cols = st.columns(5)
+        
+        # 10Y-2Y Spread (장단기 금리차 감시)
+        if 'DGS10' in latest and 'DGS2' in latest:
+            inv_val = latest['DGS10'] - latest['DGS2']
+            inv_prev = prev['DGS10'] - prev['DGS2']
+            cols[0].metric("10Y-2Y Spread", f"{inv_val:.3f}%", 
+                          delta=f"{inv_val - inv_prev:.3f}%", delta_color="normal")
+        
+        # 주요 만기별 메트릭
+        keys = [('DGS3MO', '3M'), ('DGS2', '2Y'), ('DGS10', '10Y'), ('DGS30', '30Y')]
+        for i, (tic, lab) in enumerate(keys):
+            if tic in latest:
+                cols[i+1].metric(lab, f"{latest[tic]:.2f}%", 
+                                delta=f"{latest[tic]-prev[tic]:.3f}%", delta_color="normal")
+            
+        # 2. Yield Trend 시각화
+        fig_y = go.Figure()
+        neon_colors = ['#D500F9', '#7C4DFF', '#00B0FF', '#00E676']
+        plot_ticks = [('DGS3MO', '3M'), ('DGS2', '2Y'), ('DGS10', '10Y'), ('DGS30', '30Y')]
+        
+        active_cols = [t for t, l in plot_ticks if t in yields_df.columns]
+        plot_min = yields_df[active_cols].min().min() if active_cols else 0
+        plot_max = yields_df[active_cols].max().max() if active_cols else 5
+
+        for i, (tick, label) in enumerate(plot_ticks):
+            if tick in yields_df.columns:
+                 fig_y.add_trace(go.Scatter(
+                     x=yields_df.index, y=yields_df[tick], 
+                     mode='lines', name=label,
+                     line=dict(width=1.8, color=neon_colors[i])
+                 ))
+            
+        fig_y.update_layout(
+            paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', 
+            height=450, margin=dict(t=10, b=10, l=10, r=10), 
+            xaxis=dict(showgrid=False, tickfont=dict(color='#888')), 
+            yaxis=dict(
+                gridcolor='rgba(255,255,255,0.05)', tickfont=dict(color='#888'),
+                zeroline=False, range=[plot_min * 0.95, plot_max * 1.05]
+            ), 
+            legend=dict(
+                orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1,
+                font=dict(color='#CCC')
+            ),
+            hovermode='x unified'
+        )
+        
+        # [V81] 차트 출력 및 캡션 스타일 통일
+        st.plotly_chart(fig_y, use_container_width=True, config={'displayModeBar': False})
+        
+        # CORPORATE BOND 섹션과 동일한 폰트/스타일 적용
+        actual_start_str = yields_df.index[0].strftime('%Y-%m-%d')
+        st.caption(f"Analysis Start: {actual_start_str} | Source: Federal Reserve Bank of St. Louis (FRED)")
+    else:
+        st.info("국채 금리 데이터를 스캔하는 중입니다...")
+
+
+    # [D] CORPORATE BOND YIELD TRACKER (V145: FRED Data)
+    st.markdown("---")
+    st.subheader("U.S. CORPORATE BOND YIELDS")
+    
+    # 1. FRED 티커 및 스타일 설정
+    bond_config = {
+        "AAA Grade": {"ticker": "BAMLC0A1CAAAEY", "color": "#00E676"},   # Green
+        "BBB Grade": {"ticker": "BAMLC0A4CBBBEY", "color": "#FFC107"},   # Orange/Gold
+        "High Yield": {"ticker": "BAMLH0A0HYM2EY", "color": "#FF5252"}   # Red
+    }
+    
+    # 2. 입력 도구
+    bond_col1, bond_col2 = st.columns([1, 2])
+    with bond_col1:
+        # bond_start_date = st.date_input("Bond Analysis Start Date", value=datetime(2025, 1, 1), key="bond_start")
+        bond_default_start = datetime.now() - timedelta(days=365)
+        bond_start_date = st.date_input("Analysis Start Date", value=bond_default_start, key="bond_start")
+    
+    with bond_col2:
+        selected_bonds = st.multiselect(
+            "Select Bond Grades",
+            options=list(bond_config.keys()),
+            default=list(bond_config.keys()),
+            key="bond_select"
+        )
+    
+    # 3. 데이터 로드 및 시각화
+    if selected_bonds:
+        with st.spinner("Accessing FRED Bond Data..."):
+            bond_tickers = [bond_config[l]["ticker"] for l in selected_bonds]
+            # [V47] 로컬 FRED 미러 경유 (새 관측치만 증분 다운로드)
+            try:
+                bond_data = get_fred_data().get(bond_tickers, bond_start_date)
+                
+                if not bond_data.empty:
+                    bond_data = bond_data.ffill().dropna()
+                    
+                    # [레전드 순서 강제 고정]
+                    priority_order = [bond_config[k]["ticker"] for k in bond_config.keys()]
+                    final_order = [t for t in priority_order if t in bond_data.columns]
+                    bond_data = bond_data[final_order]
+                    
+                    fig_bond = go.Figure()
+                    
+                    for ticker in bond_data.columns:
+                        label = [k for k, v in bond_config.items() if v["ticker"] == ticker][0]
+                        conf = bond_config[label]
+                        
+                        # High Yield는 더 굵게 표시하여 리스크 강조
+                        line_width = 1.5 if label == "High Yield" else 1.5
+                        
+                        fig_bond.add_trace(go.Scatter(
+                            x=bond_data.index, 
+                            y=bond_data[ticker], 
+                            mode='lines', 
+                            name=label,
+                            line=dict(width=line_width, color=conf["color"]),
+                            hovertemplate=f"{label}: %{{y:.2f}}%<extra></extra>"
+                        ))
+                    
+                    fig_bond.update_layout(
+                        hovermode="x unified",
+                        paper_bgcolor='rgba(0,0,0,0)',
+                        plot_bgcolor='rgba(0,0,0,0)',
+                        height=550,
+                        margin=dict(t=10, b=10, l=10, r=10),
+                        yaxis=dict(title="Yield (%)", gridcolor='rgba(255,255,255,0.05)', zerolinecolor='#666', ticksuffix="%"),
+                        xaxis=dict(gridcolor='rgba(255,255,255,0.05)'),
+                        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1, traceorder="normal")
+                    )
+                    st.plotly_chart(fig_bond, use_container_width=True)
+                    bond_actual_base = bond_data.index[0].strftime('%Y-%m-%d')
+                    st.caption(f"Analysis Start: {bond_actual_base} | Source: Federal Reserve Bank of St. Louis (FRED)")
+            except Exception as e:
+                st.error(f"FRED Data Stream Offline: {e}")
+
+
+    # [E] Macro Indicators Radar (V92: PCE % Swap & Final Tuning)
+    st.markdown("---")
+    st.subheader("MACRO INDICATORS RADAR")
+
+    radar_tails = fred.tails(RADAR_SERIES, radar_start)
+    tabs = st.tabs(list(RADAR_INDICATORS.keys()))
+    neon_colors = ['#D500F9', '#7C4DFF', '#00B0FF', '#00E676']
+
+    for i, tab in enumerate(tabs):
+        with tab:
+            category = list(RADAR_INDICATORS.keys())[i]
+            cols = st.columns(4) 
+            for j, (ticker, name) in enumerate(RADAR_INDICATORS[category].items()):
+                try:
+                    # [V46] 최신값/변화량/미니차트 꼬리는 fred_data가 로드 시점에 미리 계산
+                    radar = radar_tails.get(ticker)
+                    
+                    if radar is not None:
+                        val_latest = radar.latest
+                        delta_val = radar.delta
+                        
+                        # --- 단위 및 출력 포맷 최적화 ---
+                        # 1. 퍼센트 기반 지표 (신규 PCE 포함)
+                        if "%" in name or ticker in ["T10Y2Y", "UNRATE", "MICH", "BAMLH0A0HYM2", "DRCCLACBS", "DPCCRV1Q225SBEA"]:
+                            display_val = f"{val_latest:.2f}%"
+                            delta_str = f"{delta_val:.2f}%"
+                        # 2. 고용 지표 (Millions)
+                        elif ticker == "PAYEMS":
+                            display_val = f"{val_latest/1000:,.1f}M"
+                            delta_str = f"{delta_val/1000:,.2f}M"
+                        # 3. 달러 기반 대형 지표 (Billions)
+                        elif "$B" in name:
+                            div = 1000 if ticker == "CMRMTSPL" else 1
+                            display_val = f"${val_latest/div:,.1f}B"
+                            delta_str = f"${delta_val/div:,.2f}B"
+                        else:
+                            display_val = f"{val_latest:,.1f}"
+                            delta_str = f"{delta_val:,.2f}"
+
+                        with cols[j]:
+                            st.metric(label=name, value=display_val, delta=delta_str, delta_color="normal")
+                            
+                            # 미니 차트 (더 굵고 선명하게)
+                            fig_mini = px.line(radar.tail.to_frame(), y=ticker)
+                            fig_mini.update_traces(line_color=neon_colors[i], line_width=3)
+                            fig_mini.update_layout(
+                                height=70, margin=dict(t=5, b=5, l=0, r=0),
+                                paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
+                                xaxis=dict(visible=False), yaxis=dict(visible=False), showlegend=False
+                            )
+                            st.plotly_chart(fig_mini, use_container_width=True, config={'displayModeBar': False})
+                except:
+                    pass
+
+    # [V93] 매크로 섹션 최종 출처 표기
+    st.caption("Source: Federal Reserve Bank of St. Louis (FRED)")
+
+    # 매크로 섹션의 진짜 마지막 지점에서 딱 한 번 멈춥니다.
+    render_footer()    
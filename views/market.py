@@ -0,0 +1,599 @@
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+from datetime import datetime, timedelta
+
+from derived_series import get_series_graph
+from fetch_planner import PriceNeed, get_page_prices
+from views.common import render_footer, page_closes, section_start
+
+
+def ratio_performance(prices, numerator, denominator):
+    """
+    두 자산의 기준일 대비 수익률(%)과 비율(numerator/denominator)의 변화율(%)을 한 프레임으로.
+    열: numerator, denominator, "Ratio" (비율이 상승하면 numerator 우위).
+    """
+    if prices.empty:
+        return pd.DataFrame()
+    perf = (prices[[numerator, denominator]] / prices[[numerator, denominator]].iloc[0] - 1) * 100
+    ratio = prices[numerator] / prices[denominator]
+    perf["Ratio"] = (ratio / ratio.iloc[0] - 1) * 100
+    return perf
+
+
+def closes(tickers, start):
+    """기간 내 종가 (빈 날은 직전 값, 공통 구간만)."""
+    return page_closes("market", tickers, start).ffill().dropna()
+
+
+# [V48] 비율 지표는 파생 시리즈로 한 번만 선언: 같은 시작일·같은 가격이면 재계산 없이 재사용
+SERIES = get_series_graph()
+SERIES.source("STYLE_PRICES", lambda start: closes(["VUG", "VTV"], start))
+SERIES.derive("GROWTH_VALUE", ["STYLE_PRICES"], lambda prices: ratio_performance(prices, "VUG", "VTV"))
+SERIES.source("COPPER_GOLD_PRICES", lambda start: closes(["HG=F", "GC=F"], start))
+SERIES.derive("COPPER_GOLD", ["COPPER_GOLD_PRICES"], lambda prices: ratio_performance(prices, "HG=F", "GC=F"))
+
+
+# 섹션별 종목 (plan_needs가 선택 가능한 전 종목을 미리 받아 둠)
+COMPARE_TICKERS = {
+    "Bitcoin": "BTC-USD",
+    "Total World (VT)": "VT",
+    "S&P 500": "^GSPC",
+    "Nasdaq 100": "^NDX",
+    "Russell 2000": "^RUT",
+    "Shanghai": "000001.SS",
+    "Nikkei 225": "^N225",
+    "KOSPI": "^KS11",
+    "India (Nifty 500)": "^CRSLDX",
+    "Vietnam (VN)": "^VNINDEX",        
+    "FTSE 100": "^FTSE",
+    "DAX": "^GDAXI",
+    "CAC 40": "^FCHI"
+}
+
+# 성진님 요청: S&P500(Green), Russell(Gold/SPY색상), Nasdaq(Orange/RUT색상)
+ETF_CONFIG = {
+    "S&P 500 (SPY)": {"ticker": "SPY", "color": "#00E676"},   # 초록색
+    "Nasdaq 100 (QQQ)": {"ticker": "QQQ", "color": "#00B0FF"}, # 기존 러셀 색상(Orange)
+    "Dow 30 (DIA)": {"ticker": "DIA", "color": "#87CEEB"},    # 스카이블루
+    "Russell 2000 (IWM)": {"ticker": "IWM", "color": "#FF5252"} # 기존 S&P 색상(Gold)
+}
+
+SECTOR_CONFIG = {
+    "S&P 500 (SPY)": {"ticker": "SPY", "color": "#FFFFFF", "width": 3, "dash": "dot"}, # [수정] 점선 스타일 추가
+    "Tech-Expanded (IGM)": {"ticker": "IGM", "color": "#1E90FF", "width": 1.5, "dash": "solid"},
+    "Software (IGV)": {"ticker": "IGV", "color": "#00FFFF", "width": 1.5, "dash": "solid"},
+    "Semiconductor (SOXX)": {"ticker": "SOXX", "color": "#FF00FF", "width": 1.5, "dash": "solid"},
+    "Biotech (IBB)": {"ticker": "IBB", "color": "#008000", "width": 1.5, "dash": "solid"},
+    "Medical Devices (IHI)": {"ticker": "IHI", "color": "#FF0000", "width": 1.5, "dash": "solid"},
+    "Genomics (IDNA)": {"ticker": "IDNA", "color": "#FFFF00", "width": 1.5, "dash": "solid"},
+    "Aerospace (ITA)": {"ticker": "ITA", "color": "#FFA500", "width": 1.5, "dash": "solid"},
+    "Clean Energy (POW)": {"ticker": "POW", "color": "#00FF00", "width": 1.5, "dash": "solid"},
+    "Oil & Gas (IEO)": {"ticker": "IEO", "color": "#808080", "width": 1.5, "dash": "solid"},
+    "Utilities (IDU)": {"ticker": "IDU", "color": "#EC83B2", "width": 1.5, "dash": "solid"},
+    "Consumer Disc (IYC)": {"ticker": "IYC", "color": "#800080", "width": 1.5, "dash": "solid"},
+    "Financials (IYF)": {"ticker": "IYF", "color": "#008080", "width": 1.5, "dash": "solid"},
+    "Fintech (ARKF)": {"ticker": "ARKF", "color": "#FFC0CB", "width": 1.5, "dash": "solid"},
+    "Industrials (IYJ)": {"ticker": "IYJ", "color": "#8B4513", "width": 1.5, "dash": "solid"},
+    "Materials (IYM)": {"ticker": "IYM", "color": "#484DC4", "width": 1.5, "dash": "solid"}
+}
+
+COM_CONFIG = {
+    "DXY": {
+        "ticker": "DX-Y.NYB", 
+        "color": "#FFFFFF", 
+        "width": 3, 
+        "dash": "dot"  # [업데이트] 점선 스타일 추가
+    },
+
+    "Gold": {"ticker": "GC=F", "color": "#FFD700", "width": 1.5, "dash": "solid"},
+    "Copper": {"ticker": "HG=F", "color": "#B87333", "width": 1.5, "dash": "solid"},        
+    "Silver": {
+        "ticker": "SI=F", 
+        "color": "#1E90FF", # [업데이트] DodgerBlue (달러와 확실히 구분됨)
+        "width": 1.5, 
+        "dash": "solid"
+    },
+    "Palladium": {"ticker": "PA=F", "color": "#CED4DA", "width": 1.5, "dash": "solid"},
+    "Platinum": {"ticker": "PL=F", "color": "#E5E4E2", "width": 1.5, "dash": "solid"},
+    "WTI Crude": {"ticker": "CL=F", "color": "#FF4500", "width": 1.5, "dash": "solid"},
+    "Brent Oil": {"ticker": "BZ=F", "color": "#8B0000", "width": 1.5, "dash": "solid"},
+    "Natural Gas": {"ticker": "NG=F", "color": "#00CED1", "width": 1.5, "dash": "solid"},
+}
+
+
+def plan_needs():
+    """[V50] 페이지 첫 실행 전에 각 섹션이 읽을 (티커, 시작일): 선택 가능한 전 종목, 현재 날짜 입력값 기준."""
+    default_start = datetime.now() - timedelta(days=365)
+    return [
+        PriceNeed(COMPARE_TICKERS.values(), section_start("global_perf_date", default_start)),
+        PriceNeed([c["ticker"] for c in ETF_CONFIG.values()], section_start("etf_start_date_v111", default_start)),
+        PriceNeed([c["ticker"] for c in SECTOR_CONFIG.values()], section_start("sec_start", default_start)),
+        PriceNeed(["VUG", "VTV"], section_start("rot_start", default_start)),
+        PriceNeed([c["ticker"] for c in COM_CONFIG.values()], section_start("com_start_v121", default_start)),
+        PriceNeed(["HG=F", "GC=F"], section_start("cgr_start", default_start)),
+    ]
+
+
+@st.fragment
+def render_global_indices():
+    # [A] RELATIVE PERFORMANCE ANALYZER (V116: Bitcoin Color Fixed)
+    st.markdown("---")
+    st.subheader("GLOBAL INDICES PERFORMANCE")
+    
+    input_col1, input_col2 = st.columns([1, 2])
+    with input_col1:
+        default_start = datetime.now() - timedelta(days=365)
+        start_date = st.date_input("Analysis Start Date", value=default_start, key="global_perf_date")
+        
+    with input_col2:
+        selected_labels = st.multiselect(
+            "Select Indices to Compare", 
+            options=list(COMPARE_TICKERS.keys()),
+            default=["Bitcoin", "Total World (VT)", "S&P 500", "Shanghai", "Nikkei 225", "KOSPI", "FTSE 100", "DAX", "CAC 40"],
+            key="global_perf_select"
+        )
+    
+    if selected_labels:
+        with st.spinner("Fetching Global Market Data..."):
+            selected_tickers = [COMPARE_TICKERS[l] for l in selected_labels]
+            data = page_closes("market", selected_tickers, start_date)
+            
+            if not data.empty:
+                data = data.ffill().dropna()
+                if not data.empty:
+                    # [V138: 레전드 순서 고정 로직]
+                    # 1. 우선 순위 리스트 정의 (티커 기준)
+                    priority_tickers = [COMPARE_TICKERS["Bitcoin"], COMPARE_TICKERS["Total World (VT)"], COMPARE_TICKERS["S&P 500"]]
+                    
+                    # 2. 현재 데이터프레임 컬럼 중 우선 순위에 없는 나머지 티커들 추출
+                    remaining_tickers = [t for t in data.columns if t not in priority_tickers]
+                    
+                    # 3. 전체 순서 합치기 (우선순위 + 나머지)
+                    # 데이터에 실제로 존재하는 티커만 필터링하여 순서 재배치
+                    final_order = [t for t in priority_tickers if t in data.columns] + remaining_tickers
+                    data = data.reindex(columns=final_order)
+
+                    # 수익률 계산
+                    norm_df = (data / data.iloc[0] - 1) * 100
+                    
+                    fig_perf = go.Figure()
+                    
+                    # 이제 정렬된 데이터프레임 순서대로 루프를 돕니다.
+                    for ticker in data.columns:
+                        label = [k for k, v in COMPARE_TICKERS.items() if v == ticker][0]
+                        
+                        # [핵심] 비트코인 및 주요 지수 스타일 지정
+                        if label == "Bitcoin":
+                            line_config = dict(width=3, color="#F7931A") 
+                        elif label == "KOSPI":
+                            line_config = dict(width=1.5, color="#00B0FF")
+                        elif label == "S&P 500":
+                            line_config = dict(width=1.5, color="#00E676") # S&P500 강조 (옵션)
+                        else:
+                            line_config = dict(width=1.5) 
+                        
+                        fig_perf.add_trace(go.Scatter(
+                            x=norm_df.index, 
+                            y=norm_df[ticker], 
+                            mode='lines', 
+                            name=label,
+                            line=line_config, 
+                            hovertemplate=f"{label}: %{{y:.2f}}%<extra></extra>"
+                        ))
+                    
+                    fig_perf.update_layout(
+                        hovermode="x unified",
+                        paper_bgcolor='rgba(0,0,0,0)',
+                        plot_bgcolor='rgba(0,0,0,0)',
+                        height=550,
+                        margin=dict(t=10, b=10, l=10, r=10),
+                        yaxis=dict(title="Return (%)", gridcolor='rgba(255,255,255,0.05)', zerolinecolor='#666'),
+                        xaxis=dict(gridcolor='rgba(255,255,255,0.05)'),
+                        # traceorder를 'normal'로 두면 add_trace한 순서대로 레전드가 나옵니다.
+                        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1, traceorder="normal")
+                    )
+                    st.plotly_chart(fig_perf, use_container_width=True)
+                    st.caption(f"Base Date: {data.index[0].strftime('%Y-%m-%d')} (Normalized to 0%) | Source: Yahoo Finance & Global Exchange Data")
+
+
+@st.fragment
+def render_index_etfs():
+    # [B] U.S. INDEX ETF PERFORMANCE ANALYZER (V111: Date & Color Customization)
+    st.markdown("---")
+    st.subheader("U.S. INDEX ETF PERFORMANCE")
+    
+    # 2. 입력 도구 상단 배치
+    etf_input_col1, etf_input_col2 = st.columns([1, 2])
+    
+    with etf_input_col1:
+        # [수정] 디폴트 시작 날짜를 2026년 1월 1일로 고정
+        etf_default_start = datetime.now() - timedelta(days=365)
+        etf_start_date = st.date_input("Analysis Start Date", value=etf_default_start, key="etf_start_date_v111")
+        
+    with etf_input_col2:
+        selected_etfs = st.multiselect(
+            "Select ETFs to Compare", 
+            options=list(ETF_CONFIG.keys()),
+            default=list(ETF_CONFIG.keys()),
+            key="etf_select_v111"
+        )
+    
+    # 3. 데이터 로드 및 수익률 계산
+    if selected_etfs:
+        with st.spinner("Fetching ETF Market Data..."):
+            target_tickers = [ETF_CONFIG[l]["ticker"] for l in selected_etfs]
+            etf_data = page_closes("market", target_tickers, etf_start_date)
+            
+            if not etf_data.empty:
+                # [V140: MultiIndex 대응 및 순서 고정 로직]
+                etf_data = etf_data.ffill().dropna()
+                
+                if not etf_data.empty:
+                    # 1. 성진님이 정의한 ETF_CONFIG의 티커 순서 추출
+                    priority_tickers = [ETF_CONFIG[k]["ticker"] for k in ETF_CONFIG.keys()]
+                    
+                    # 2. 실제 다운로드된 데이터의 컬럼 리스트 확인
+                    # MultiIndex인 경우를 대비해 columns.get_level_values를 고려한 안전한 추출
+                    available_cols = etf_data.columns.tolist()
+                    
+                    # 3. 데이터에 존재하는 티커만 우선순위대로 필터링
+                    final_order = [t for t in priority_tickers if t in available_cols]
+                    
+                    # 4. 순서 재배치 (여기서 오류가 주로 발생하므로 reindex 대신 직접 컬럼 슬라이싱)
+                    etf_data = etf_data[final_order]
+                    
+                    # 수익률 계산
+                    etf_norm_df = (etf_data / etf_data.iloc[0] - 1) * 100
+                    
+                    fig_etf = go.Figure()
+                    
+                    # 5. 정렬된 컬럼 순서대로 루프 실행
+                    for ticker in etf_data.columns:
+                        # 티커에 해당하는 라벨과 색상 매핑
+                        label = [k for k, v in ETF_CONFIG.items() if v["ticker"] == ticker][0]
+                        line_color = ETF_CONFIG[label]["color"]
+                        
+                        fig_etf.add_trace(go.Scatter(
+                            x=etf_norm_df.index, 
+                            y=etf_norm_df[ticker], 
+                            mode='lines', 
+                            name=label,
+                            line=dict(width=1.5, color=line_color),
+                            hovertemplate=f"{label}: %{{y:.2f}}%<extra></extra>"
+                        ))
+                    
+                    fig_etf.update_layout(
+                        hovermode="x unified",
+                        paper_bgcolor='rgba(0,0,0,0)',
+                        plot_bgcolor='rgba(0,0,0,0)',
+                        height=550,
+                        margin=dict(t=10, b=10, l=10, r=10),
+                        yaxis=dict(title="Return (%)", gridcolor='rgba(255,255,255,0.05)', zerolinecolor='#666'),
+                        xaxis=dict(gridcolor='rgba(255,255,255,0.05)'),
+                        # 트레이스 추가 순서대로 레전드 표시
+                        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1, traceorder="normal")
+                    )
+                    st.plotly_chart(fig_etf, use_container_width=True)
+                    st.caption(f"Base Date: {etf_data.index[0].strftime('%Y-%m-%d')} (Normalized to 0%) | Source: Yahoo Finance & Global Exchange Data")
+
+
+@st.fragment
+def render_sectors():
+    # [C] SECTOR PERFORMANCE ANALYZER (V120: SPY Priority & Dot Style)
+    st.markdown("---")
+    st.subheader("U.S. SECTOR PERFORMANCE")
+    
+    # 1. 섹터 ETF 및 컬러 매핑
+    
+    # 2. 입력 도구 (1년 트래킹 유지)
+    sec_in_col1, sec_in_col2 = st.columns([1, 2])
+    with sec_in_col1:
+        sec_default_start = datetime.now() - timedelta(days=365)
+        sec_start_date = st.date_input("Analysis Start Date", value=sec_default_start, key="sec_start")
+    
+    with sec_in_col2:
+        selected_sectors = st.multiselect(
+            "Select Sectors to Compare", 
+            options=list(SECTOR_CONFIG.keys()),
+            default=["S&P 500 (SPY)", "Tech-Expanded (IGM)", "Semiconductor (SOXX)", "Software (IGV)", "Materials (IYM)", "Clean Energy (POW)", "Oil & Gas (IEO)", "Aerospace (ITA)", "Genomics (IDNA)"],
+            key="sec_select"
+        )
+    
+    # 3. 데이터 로드 및 시각화
+    if selected_sectors:
+        with st.spinner("Scanning Sector Rotation..."):
+            sec_target_tickers = [SECTOR_CONFIG[l]["ticker"] for l in selected_sectors]
+            sec_raw_data = page_closes("market", sec_target_tickers, sec_start_date)
+            
+            if not sec_raw_data.empty:
+                sec_raw_data = sec_raw_data.ffill().dropna()
+                
+                # [V120 핵심] SPY가 가장 먼저 오도록 컬럼 순서 재배치
+                if "SPY" in sec_raw_data.columns:
+                    other_cols = [c for c in sec_raw_data.columns if c != "SPY"]
+                    sec_raw_data = sec_raw_data[["SPY"] + other_cols]
+                
+                sec_norm_df = (sec_raw_data / sec_raw_data.iloc[0] - 1) * 100
+                
+                fig_sec = go.Figure()
+                
+                # 재배치된 순서대로 trace 추가 (레전드 순서 결정)
+                for ticker in sec_raw_data.columns:
+                    label = [k for k, v in SECTOR_CONFIG.items() if v["ticker"] == ticker][0]
+                    conf = SECTOR_CONFIG[label]
+                    
+                    fig_sec.add_trace(go.Scatter(
+                        x=sec_norm_df.index, 
+                        y=sec_norm_df[ticker], 
+                        mode='lines', 
+                        name=label,
+                        line=dict(
+                            width=conf["width"], 
+                            color=conf["color"],
+                            dash=conf.get("dash", "solid") # SPY는 dot, 나머지는 solid
+                        ),
+                        hovertemplate=f"<b>{label}</b>: %{{y:.2f}}%<extra></extra>"
+                    ))
+                
+                fig_sec.update_layout(
+                    hovermode="x unified",
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    height=600,
+                    margin=dict(t=10, b=10, l=10, r=10),
+                    yaxis=dict(title="Return (%)", gridcolor='rgba(255,255,255,0.05)', zerolinecolor='#666'),
+                    xaxis=dict(gridcolor='rgba(255,255,255,0.05)'),
+                    legend=dict(
+                        orientation="h", 
+                        yanchor="bottom", y=1.02, 
+                        xanchor="right", x=1,
+                        traceorder="normal" # 추가한 순서(SPY 우선)대로 표시
+                    )
+                )
+                st.plotly_chart(fig_sec, use_container_width=True)
+                st.caption(f"Base Date: {sec_raw_data.index[0].strftime('%Y-%m-%d')} (Normalized to 0.00%) | Source: Yahoo Finance & Global Exchange Data")
+
+
+@st.fragment
+def render_growth_value():
+    # [D] GROWTH vs VALUE ROTATION ANALYZER (V117)
+    st.markdown("---")
+    st.subheader("GROWTH vs VALUE")
+    
+    # 1. 입력 도구 (기존 스타일 유지, 2026/01/01 디폴트)
+    rot_in_col1, rot_in_col2 = st.columns([1, 2])
+    with rot_in_col1:
+        # [수정 포인트] 2026년 고정 대신 현재로부터 365일 전으로 설정
+        rot_default_start = datetime.now() - timedelta(days=365)
+        rot_start_date = st.date_input(
+            "Analysis Start Date", 
+            value=rot_default_start, 
+            key="rot_start"
+        )
+    
+    # 2. 데이터 로드 (VUG, VTV)
+    with st.spinner("Analyzing Style Rotation..."):
+        # 수익률 표준화 (0% 기준) + 성장주/가치주 비율 (VUG / VTV) 변화율
+        # 이 비율이 상승하면 성장주 우위, 하락하면 가치주 우위입니다.
+        rot_norm = SERIES.get("GROWTH_VALUE", start=rot_start_date)
+        
+        if not rot_norm.empty:
+            ratio_norm = rot_norm["Ratio"]
+            
+            # 차트 생성 (수익률 비교 + 비율 변화)
+            fig_rot = go.Figure()
+            
+            # [V119 핵심] 레전드 순서 1번: Growth/Value Ratio (화이트 강조선)
+            fig_rot.add_trace(go.Scatter(
+                x=ratio_norm.index, y=ratio_norm,
+                mode='lines', name="Growth/Value",
+                line=dict(width=3, color="#FFFFFF", dash='dot'), # 점선 유지
+                hovertemplate="Ratio Change: %{y:.2f}%<extra></extra>"
+            ))
+
+            # 레전드 순서 2번: 성장주 (VUG)
+            fig_rot.add_trace(go.Scatter(
+                x=rot_norm.index, y=rot_norm["VUG"],
+                mode='lines', name="Growth (VUG)",
+                line=dict(width=1.5, color="#00E5FF"),
+                hovertemplate="Growth: %{y:.2f}%<extra></extra>"
+            ))
+            
+            # 레전드 순서 3번: 가치주 (VTV)
+            fig_rot.add_trace(go.Scatter(
+                x=rot_norm.index, y=rot_norm["VTV"],
+                mode='lines', name="Value (VTV)",
+                line=dict(width=1.5, color="#FFC107"),
+                hovertemplate="Value: %{y:.2f}%<extra></extra>"
+            ))
+            
+            fig_rot.update_layout(
+                hovermode="x unified",
+                paper_bgcolor='rgba(0,0,0,0)',
+                plot_bgcolor='rgba(0,0,0,0)',
+                height=550,
+                margin=dict(t=10, b=10, l=10, r=10),
+                yaxis=dict(title="Performance / Ratio Change (%)", gridcolor='rgba(255,255,255,0.05)', zerolinecolor='#666'),
+                xaxis=dict(gridcolor='rgba(255,255,255,0.05)'),
+                legend=dict(
+                    orientation="h", 
+                    yanchor="bottom", y=1.02, 
+                    xanchor="right", x=1,
+                    traceorder="normal" # 코딩한 순서(Ratio -> Growth -> Value) 강제 유지
+                )
+            )
+            
+            st.plotly_chart(fig_rot, use_container_width=True)
+            st.caption(f"Base Date: {rot_norm.index[0].strftime('%Y-%m-%d')} (Normalized to 0%) | Source: Yahoo Finance & Global Exchange Data")
+
+            # 3. 전략적 코멘트
+            current_ratio = ratio_norm.iloc[-1]
+            status = "성장주 우위" if current_ratio > 0 else "가치주 우위"
+            st.info(f"**Insight:** 기준일 대비 **{status}** 상태입니다. (Ratio 변동률: {current_ratio:.2f}%)")
+
+
+@st.fragment
+def render_commodities():
+    # [F] COMMODITIES & DOLLAR INDEX RADAR (V121: Sequence Enforcement)
+    st.markdown("---")
+    st.subheader("COMMODITIES PERFORMANCE") 
+
+    # 1. 딕셔너리 순서 및 스타일 업데이트
+    
+    # 2. 입력 도구 (기존과 동일)
+    com_in_col1, com_in_col2 = st.columns([1, 2])
+    with com_in_col1:
+        # [수정 포인트] 현재 시점으로부터 365일 전으로 디폴트 설정
+        com_default_start = datetime.now() - timedelta(days=365)
+        com_start_date = st.date_input(
+            "Analysis Start Date", 
+            value=com_default_start, 
+            key="com_start_v121"
+        )
+    with com_in_col2:
+        selected_coms = st.multiselect(
+            "Select Commodities to Compare", 
+            options=list(COM_CONFIG.keys()),
+            default=["DXY", "Gold", "Silver", "Copper", "WTI Crude", "Natural Gas"],
+            key="com_select_v121"
+        )
+    
+    # 3. 데이터 로드 및 시각화
+    if selected_coms:
+        with st.spinner("Scanning Commodity Markets..."):
+            com_target_tickers = [COM_CONFIG[l]["ticker"] for l in selected_coms]
+            com_raw_data = page_closes("market", com_target_tickers, com_start_date)
+            
+            if not com_raw_data.empty:
+                # [핵심] 알파벳 순으로 정렬된 컬럼을 우리가 선택한 순서(com_target_tickers)대로 재배치
+                com_raw_data = com_raw_data.reindex(columns=com_target_tickers)
+                
+                com_raw_data = com_raw_data.ffill().dropna()
+                if not com_raw_data.empty:
+                    com_norm_df = (com_raw_data / com_raw_data.iloc[0] - 1) * 100
+                    
+                    fig_com = go.Figure()
+                    
+                    # 이제 정렬된 데이터프레임 순서대로 루프를 돌기 때문에 레전드가 순서대로 나옵니다.
+                    for ticker in com_norm_df.columns:
+                        label = [k for k, v in COM_CONFIG.items() if v["ticker"] == ticker][0]
+                        conf = COM_CONFIG[label]
+                        
+                        fig_com.add_trace(go.Scatter(
+                            x=com_norm_df.index, 
+                            y=com_norm_df[ticker], 
+                            mode='lines', 
+                            name=label,
+                            line=dict(width=conf["width"], color=conf["color"], 
+                            dash=conf.get("dash", "solid")),
+                            hovertemplate=f"{label}: %{{y:.2f}}%<extra></extra>"
+                        ))
+                    
+                    fig_com.update_layout(
+                        hovermode="x unified",
+                        paper_bgcolor='rgba(0,0,0,0)',
+                        plot_bgcolor='rgba(0,0,0,0)',
+                        height=550,
+                        margin=dict(t=10, b=10, l=10, r=10),
+                        yaxis=dict(title="Return (%)", gridcolor='rgba(255,255,255,0.05)', zerolinecolor='#666'),
+                        xaxis=dict(gridcolor='rgba(255,255,255,0.05)'),
+                        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+                    )
+                    st.plotly_chart(fig_com, use_container_width=True)
+                    st.caption(f"Base Date: {com_raw_data.index[0].strftime('%Y-%m-%d')} (Normalized to 0%) | Source: Yahoo Finance & Global Exchange Data")
+
+
+@st.fragment
+def render_copper_gold():
+    # [G] COPPER / GOLD RATIO ANALYZER (V122: The Economic Pulse)
+    st.markdown("---")
+    st.subheader("COPPER/GOLD RATIO")
+    
+    # 1. 입력 도구 (2026/01/01 디폴트)
+    cgr_in_col1, cgr_in_col2 = st.columns([1, 2])
+    with cgr_in_col1:
+        # [수정 포인트] 현재 시점으로부터 365일 전으로 디폴트 설정
+        cgr_default_start = datetime.now() - timedelta(days=365)
+        cgr_start_date = st.date_input(
+            "Analysis Start Date", 
+            value=cgr_default_start, 
+            key="cgr_start"
+        )
+    
+    # 2. 데이터 로드 (Copper: HG=F, Gold: GC=F)
+    with st.spinner("Calculating Economic Pulse..."):
+        # 수익률 표준화 (0% 기준) + Copper / Gold Ratio 변화율
+        cgr_norm = SERIES.get("COPPER_GOLD", start=cgr_start_date)
+        
+        if not cgr_norm.empty:
+            cg_ratio_norm = cgr_norm["Ratio"]
+            
+            # 차트 생성
+            fig_cgr = go.Figure()
+            
+            # [V124 핵심] 레전드 순서 1번: Copper/Gold Ratio (화이트 강조 점선)
+            fig_cgr.add_trace(go.Scatter(
+                x=cg_ratio_norm.index, y=cg_ratio_norm,
+                mode='lines', name="Copper/Gold",
+                line=dict(width=3, color="#FFFFFF", dash='dot'), # 화이트 점선 유지
+                hovertemplate="Ratio Change: %{y:.2f}%<extra></extra>"
+            ))
+            
+            # 레전드 순서 2번: Copper (HG=F)
+            fig_cgr.add_trace(go.Scatter(
+                x=cgr_norm.index, y=cgr_norm["HG=F"],
+                mode='lines', name="Copper",
+                line=dict(width=1.5, color="#B87333"),
+                hovertemplate="Copper: %{y:.2f}%<extra></extra>"
+            ))
+            
+            # 레전드 순서 3번: Gold (GC=F)
+            fig_cgr.add_trace(go.Scatter(
+                x=cgr_norm.index, y=cgr_norm["GC=F"],
+                mode='lines', name="Gold",
+                line=dict(width=1.5, color="#FFD700"),
+                hovertemplate="Gold: %{y:.2f}%<extra></extra>"
+            ))
+            
+            fig_cgr.update_layout(
+                hovermode="x unified",
+                paper_bgcolor='rgba(0,0,0,0)',
+                plot_bgcolor='rgba(0,0,0,0)',
+                height=550,
+                margin=dict(t=10, b=10, l=10, r=10),
+                yaxis=dict(title="Performance / Ratio Change (%)", gridcolor='rgba(255,255,255,0.05)', zerolinecolor='#666'),
+                xaxis=dict(gridcolor='rgba(255,255,255,0.05)'),
+                legend=dict(
+                    orientation="h", 
+                    yanchor="bottom", y=1.02, 
+                    xanchor="right", x=1,
+                    traceorder="normal" # 추가한 순서(Ratio 우선) 강제 적용
+                )
+            )
+            
+            st.plotly_chart(fig_cgr, use_container_width=True)
+            st.caption(f"Base Date: {cgr_norm.index[0].strftime('%Y-%m-%d')} (Normalized to 0%) | Source: Yahoo Finance & Global Exchange Data")
+            
+            # 3. 전략적 진단
+            current_cgr = cg_ratio_norm.iloc[-1]
+            cgr_status = "경기 확장/인플레이션 압력" if current_cgr > 0 else "경기 둔화/디플레이션 우려"
+            st.info(f"**Insight:** 기준일 대비 Copper/Gold 비율이 **{current_cgr:.2f}% { '상승' if current_cgr > 0 else '하락' }**하여, **{cgr_status}** 시그널을 보이고 있습니다.")
+
+
+def render(ctx):
+    st.title("MARKET INTELLIGENCE")
+
+    # [V50] 섹션들이 읽을 가격을 묶음 요청으로 한 번에 받아 두고, 각 fragment는 여기서 읽음
+    with st.spinner("Loading market data..."):
+        get_page_prices("market").prefetch(plan_needs())
+
+    # [V44] 섹션마다 독립 fragment: 날짜/종목 선택은 해당 섹션만 다시 실행
+    render_global_indices()
+    render_index_etfs()
+    render_sectors()
+    render_growth_value()
+    render_commodities()
+    render_copper_gold()
+
+    render_footer()
@@ -0,0 +1,1199 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+import yfinance as yf
+import time
+import html
+from datetime import datetime, timedelta
+
+from news_store import NewsStore
+from snapshot_store import get_snapshot_store, cash_to_usd, ALL_ACCOUNTS_VIEW
+from statement_import import read_statement
+from storage_backends import ASSET_FIELDS, DEFAULT_ACCOUNT
+from views.common import download_prices
+
+
+ALL_ACCOUNTS = "ALL ACCOUNTS"
+
+
+# Analytics Wrapper
+@st.cache_data(ttl=900)
+def get_news(_ae, tickers):
+    # [V29] 캐시 키는 티커 튜플만 사용 (가격이 바뀌는 자산 dict를 키로 쓰지 않음)
+    return _ae.get_portfolio_news([{'ticker': t} for t in tickers], limit_per_asset=15)
+
+@st.cache_resource
+def get_news_store():
+    # [V30] 프로세스당 하나의 로컬 FTS 인덱스 (세션 간 공유)
+    return NewsStore()
+
+@st.cache_data(ttl=900)
+def sync_news_index(_ae, tickers):
+    # [V30] 15분마다 한 번만 폴링, 티커별 마지막 게시 시각 이후 기사만 인덱스에 추가
+    return get_news_store().ingest(get_news(_ae, tickers))
+
+# 야후 파이낸스 캐싱
+@st.cache_data(ttl=3600)  # 1시간 동안 가격 데이터를 메모리에 저장
+def get_cached_historical_data(_ae, assets, total_return=True):
+    """야후 파이낸스 데이터를 1시간 동안 캐싱하여 차트 오프라인 방지"""
+    try:
+        return _ae.fetch_historical_data(assets, total_return=total_return)
+    except Exception as e:
+        return pd.DataFrame()
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_risk_free_rate():
+    # [V44] 13주 T-Bill(^IRX) 수익률, 조회 실패 시 3.5%
+    try:
+        irx_data = yf.Ticker("^IRX").history(period="1d")
+        return irx_data['Close'].iloc[-1] / 100 if not irx_data.empty else 0.035
+    except Exception:
+        return 0.035
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def get_cached_current_prices(_md, tickers):
+    """보유 종목 현재가를 한 번의 묶음 다운로드로 (5분 캐시: 재실행마다 종목별 조회 없음)"""
+    return _md.get_current_prices(list(tickers))
+
+
+# Helper: Value Positions
+def value_all_positions(pm, md, ae, assets):
+    # [V36] 모든 계좌의 포지션을 한 테이블로 쌓고, 고유 티커 전체를 한 번의 시세 조회로 (계좌별/통합 뷰가 공유)
+    positions = pm.positions_frame(assets)
+    prices = get_cached_current_prices(md, tuple(sorted(positions['ticker'].unique())))
+    return ae.value_positions(positions, prices)
+
+# Helper: Process Assets
+def process_assets(pm, ae, valued_positions, rates, base_currency, include_cash=True):
+    # [V36] 같은 티커는 계좌를 합산 (groupby, 행 단위 루프 없음)
+    consolidated = ae.consolidate_positions(valued_positions)
+    processed_assets = consolidated.to_dict('records')
+    total_val = float(consolidated['value_usd'].sum()) if not consolidated.empty else 0.0
+    
+    # Cash (현금은 계좌 구분 없이 사용자 단위로 관리되므로 통합 뷰에서만 포함)
+    total_cash_usd = cash_to_usd(pm.data.get('cash', {}), rates) if include_cash else 0.0
+    
+    total_val += total_cash_usd
+    
+    if total_cash_usd > 1:
+        processed_assets.append({
+            'ticker': 'CASH',
+            'quantity': 1,
+            'current_price': total_cash_usd,
+            'value_usd': total_cash_usd,
+            'sector': 'Liquidity',
+            'asset_class': 'Cash'
+        })
+
+    # Sort
+    def asset_rank(a):
+        ac = a.get('asset_class', 'Other')
+        if ac == 'Crypto': return 0
+        if ac == 'Stock': return 1
+        if ac == 'ETF': return 2
+        if ac == 'Index': return 3
+        if ac == 'Future': return 4
+        if ac == 'Cash': return 99
+        return 50 # Other
+    
+    # Sort by Rank -> Sector -> Value (Desc)
+    processed_assets.sort(key=lambda x: (asset_rank(x), x.get('sector', 'Unknown'), -x['value_usd']))
+    
+    display_total = total_val
+    if base_currency != 'USD':
+        display_total = total_val * rates.get(base_currency, 1.0)
+        
+    return display_total, processed_assets
+
+
+# --- [디자인 및 RGBA 색상 설정] ---
+# 게이지와 동일하게 0.5 투명도 적용
+ALPHA = 0.8
+
+def hex_to_rgba(hex_code, alpha):
+    hex_code = hex_code.lstrip('#')
+    lv = len(hex_code)
+    rgb = tuple(int(hex_code[i:i + lv // 3], 16) for i in range(0, lv, lv // 3))
+    return f"rgba({rgb[0]}, {rgb[1]}, {rgb[2]}, {alpha})"
+
+# 핵심 자산 색상 (RGBA)
+RGBA_CASH = hex_to_rgba("#4CAF50", ALPHA)
+RGBA_CRYPTO = hex_to_rgba("#D35400", ALPHA)
+RGBA_TSLA = hex_to_rgba("#D81B60", ALPHA)
+RGBA_ETC = hex_to_rgba("#555555", ALPHA)
+
+# 팔레트 변환 (RGBA)
+RGBA_CLASS = [hex_to_rgba(c, ALPHA) for c in ['#311B92', '#4527A0', '#512DA8', '#5E35B1', '#673AB7']]
+RGBA_SECTOR = [hex_to_rgba(c, ALPHA) for c in ['#7B1FA2', '#8E24AA', '#9C27B0', '#AB47BC', '#BA68C8']]
+RGBA_HOLDINGS = [hex_to_rgba(c, ALPHA) for c in ['#6200EA', '#651FFF', '#7C4DFF', '#B388FF', '#304FFE']]
+
+PIE_TEXT_COLOR = "#FFFFFF"
+CUSTOM_HOVER_TEMPLATE = "<b>%{label}</b><br>%{percent}<extra></extra>"
+
+
+def group_small_assets(df, label_col, value_col, threshold=0.01):
+    total_val = df[value_col].sum()
+    if total_val == 0: return df
+    df = df.copy()
+    df['percent_calc'] = df[value_col] / total_val
+    df.loc[df['percent_calc'] < threshold, label_col] = 'etc'
+    return df.groupby(label_col)[value_col].sum().reset_index()
+
+
+# --- 공통 차트 생성 함수 ---
+def create_unified_pie(df, names_col, values_col, color_map, key_name):
+    fig = px.pie(df, values=values_col, names=names_col, hole=0.5, 
+                 color=names_col, color_discrete_map=color_map)
+    fig.update_traces(
+        hovertemplate=CUSTOM_HOVER_TEMPLATE,
+        textinfo='percent+label',
+        textposition='inside',
+        textfont=dict(color=PIE_TEXT_COLOR, size=12),
+        # 테두리 선도 투명도에 맞춰 부드럽게 조정
+        marker=dict(line=dict(color='rgba(0,0,0,0.3)', width=1.5)),
+        insidetextorientation='horizontal'
+    )
+    fig.update_layout(
+        margin=dict(t=30, b=30, l=10, r=10), 
+        paper_bgcolor='rgba(0,0,0,0)', 
+        showlegend=False,
+        uniformtext=dict(minsize=9, mode='show') 
+    )
+    st.plotly_chart(fig, use_container_width=True, key=key_name)
+
+
+def get_step_score(val):
+    return min(90 + (val - 1.0) * 10, 100) if val >= 1.0 else val * 90
+
+
+def render_sidebar(ctx):
+    pm, md = ctx.pm, ctx.md
+
+    # 1. SETTINGS (통화 설정)
+    st.subheader("SETTINGS")
+    curr_val = pm.get_setting("base_currency", "USD")
+    new_curr = st.radio("CURRENCY", ["USD", "CAD", "KRW"], horizontal=True, key="sidebar_curr_v780")
+    if new_curr != curr_val:
+        pm.update_setting("base_currency", new_curr)
+        st.rerun()
+    
+    st.markdown("---")
+
+
+    # [V36] ACCOUNT (계좌별 보기 / 계좌 추가)
+    st.subheader("ACCOUNT")
+    account_options = [ALL_ACCOUNTS] + pm.get_accounts()
+    if st.session_state.get("account_view") not in account_options:
+        st.session_state["account_view"] = ALL_ACCOUNTS
+    st.selectbox("VIEW", account_options, key="account_view")
+    with st.form("add_account_form_sidebar", clear_on_submit=True):
+        new_account = st.text_input("New Account", placeholder="e.g. TFSA, RRSP, Binance")
+        if st.form_submit_button("ADD ACCOUNT", use_container_width=True) and new_account.strip():
+            pm.add_account(new_account)
+            st.toast(f"✅ Account Added: {new_account.strip()}")
+            st.rerun()
+
+    st.markdown("---")
+
+    # 2. CASH (현금 관리)
+    st.subheader("CASH")
+    cash_data = pm.data.get('cash', {'USD':0.0, 'CAD':0.0, 'KRW':0.0})
+    
+    c1, c2 = st.columns(2)
+    with c1:
+        usd_in = st.number_input("USD", value=cash_data.get('USD', 0.0), key="cash_usd")
+        if usd_in != cash_data.get('USD', 0.0):
+            pm.update_cash('USD', usd_in)
+            st.rerun()
+    with c2:
+        cad_in = st.number_input("CAD", value=cash_data.get('CAD', 0.0), key="cash_cad")
+        if cad_in != cash_data.get('CAD', 0.0):
+            pm.update_cash('CAD', cad_in)
+            st.rerun()
+    krw_in = st.number_input("KRW", value=cash_data.get('KRW', 0.0), key="cash_krw", step=1000.0)
+    if krw_in != cash_data.get('KRW', 0.0):
+        pm.update_cash('KRW', krw_in)
+        st.rerun()
+        
+    st.markdown("---")
+
+
+    # 3. ADD NEW ASSET (자산 추가 섹션)
+    st.sidebar.subheader("Add New Asset") # 익스팬더 대신 서브헤더 사용
+
+    # 폼 내부의 텍스트가 커지는 것을 방지하기 위해 폼 자체를 사이드바에 직접 배치
+    with st.sidebar.form("add_asset_form_sidebar"):
+        new_ticker = st.text_input("Ticker Symbol", placeholder="e.g. BTC, TSLA").upper()
+        
+        c_qty, c_cost = st.columns(2)
+        with c_qty:
+            new_qty = st.number_input("Qty", min_value=0.0, format="%.4f")
+        with c_cost:
+            new_cost = st.number_input("Avg Cost", min_value=0.0, format="%.2f")
+        
+        new_class = st.selectbox("Class", ["Stock", "Crypto", "ETF", "Bond", "Cash", "Other"])
+        new_sector = st.text_input("Sector", value="Technology")
+        accounts = pm.get_accounts()
+        view_account = st.session_state.get("account_view", ALL_ACCOUNTS)
+        new_asset_account = st.selectbox("Account", accounts, index=accounts.index(view_account) if view_account in accounts else 0)
+        
+        # 버튼 스타일이 전역 CSS에 오염되지 않도록 container width 활용
+        submitted_add = st.form_submit_button("ADD TO PORTFOLIO", use_container_width=True)
+        
+        if submitted_add and new_ticker:
+            curr_price = 0.0
+            info = md.get_asset_info(new_ticker)
+            if info:
+                curr_price = md.get_current_price(new_ticker)
+                if new_sector == "Technology":
+                    new_sector = info.get('sector', new_sector)
+            
+            new_asset_entry = {
+                "ticker": new_ticker, "quantity": new_qty, "avg_price": new_cost,
+                "sector": new_sector, "asset_class": new_class, "account": new_asset_account,
+                "value_usd": 0.0, "current_price": curr_price
+            }
+            if pm.get_transactions():
+                # [V27] 거래 원장 사용 중이면 매수 거래도 함께 기록 (저장은 아래에서 한 번에)
+                pm.add_transaction({
+                    "date": datetime.now().strftime('%Y-%m-%d'), "type": "BUY", "ticker": new_ticker,
+                    "quantity": new_qty, "price": new_cost, "currency": "USD"
+                }, save=False)
+            pm.add_or_update_asset(new_asset_entry)
+            pm.save_data()
+            st.toast(f"✅ Asset Added: {new_ticker}")
+            time.sleep(0.5)
+            st.rerun()
+
+    st.markdown("---")
+
+    # 4. [V38] IMPORT STATEMENT (브로커 CSV/OFX 일괄 가져오기)
+    st.sidebar.subheader("Import Statement")
+    with st.sidebar.form("import_statement_form_sidebar", clear_on_submit=True):
+        statement_file = st.file_uploader("Broker export", type=["csv", "ofx", "qfx"])
+        import_account = st.selectbox("Account", accounts, index=accounts.index(view_account) if view_account in accounts else 0, key="import_account")
+        submitted_import = st.form_submit_button("IMPORT", use_container_width=True)
+
+        if submitted_import and statement_file is not None:
+            with st.spinner("Importing..."):
+                try:
+                    txns, import_errors = read_statement(statement_file, statement_file.name)
+                except Exception as e:
+                    txns, import_errors = None, [str(e)]
+                if txns is not None and not txns.empty:
+                    # 새 티커만 한 번에 조회 (메타데이터는 병렬, 가격은 일괄 다운로드)
+                    held = {a['ticker'] for a in pm.get_assets()}
+                    traded = txns.loc[txns['type'].isin(["BUY", "SELL"]), 'ticker'].unique().tolist()
+                    new_tickers = sorted(set(traded) - held)
+                    asset_info = md.get_asset_infos(new_tickers)
+                    new_prices = md.get_current_prices(new_tickers)
+                    unresolved = [t for t in new_tickers if not new_prices.get(t) and not asset_info.get(t)]
+                    result = pm.import_transactions(txns, asset_info, import_account)
+                    st.toast(f"✅ Imported {result['transactions']:,} transactions "
+                             f"({result['duplicates']:,} already recorded, {result['positions']} positions updated)")
+                    if unresolved:
+                        import_errors.append(f"unknown symbols (kept as-is): {', '.join(unresolved[:20])}")
+                for e in import_errors:
+                    st.warning(f"{statement_file.name}: {e}")
+
+    st.markdown("---")
+
+
+@st.fragment
+def render_risk_gauges(mdd_value, sharpe_auto, sortino_auto, mar_ratio, risk_free_rate):
+    GAUGE_HEIGHT = 180
+    TOP_MARGIN, BOTTOM_MARGIN = 0, 3
+    TEXT_Y_POS, DESC_Y_POS = 0.42, 0.23
+    GAUGE_Y_RANGE = [0, 0.8]
+    VAL_FONT_SIZE, TXT_FONT_SIZE, DSC_FONT_SIZE = 32, 20, 11
+
+    row1_col1, row1_col2 = st.columns(2)
+    row2_col1, row2_col2 = st.columns(2)
+
+    common_layout = dict(
+        height=GAUGE_HEIGHT, margin=dict(t=TOP_MARGIN, b=BOTTOM_MARGIN, l=15, r=15),
+        paper_bgcolor='rgba(0,0,0,0)', font={'color': "#FFF"}
+    )
+
+    # 1. MDD (고점 대비 최대 하락폭)
+    with row1_col1:
+        mdd_pct = mdd_value * 100
+        mdd_color = "#FDD835" if mdd_pct >= -20 else ("#FF9100" if mdd_pct >= -40 else "#FF1744")
+        fig_mdd = go.Figure(go.Indicator(
+            mode = "gauge+number", value = mdd_pct, domain = {'x': [0, 1], 'y': GAUGE_Y_RANGE},
+            number = {'font': {'size': VAL_FONT_SIZE, 'color': mdd_color}, 'suffix': "%", 'valueformat': ".1f"},
+            gauge = {'axis': {'range': [0, -60], 'tickvals': [0, -30, -60]},
+                     'bar': {'color': "rgba(255, 255, 255, 0.8)"},
+                     'steps': [{'range': [0, -20], 'color': "rgba(253, 216, 53, 0.3)"},
+                               {'range': [-20, -40], 'color': "rgba(255, 145, 0, 0.3)"},
+                               {'range': [-40, -60], 'color': "rgba(255, 23, 68, 0.3)"}]}
+        ))
+        fig_mdd.add_annotation(text="MDD", x=0.5, y=TEXT_Y_POS, font=dict(size=TXT_FONT_SIZE, color="#888"), showarrow=False)
+        fig_mdd.add_annotation(text="고점 대비 최대 하락폭", x=0.5, y=DESC_Y_POS, font=dict(size=DSC_FONT_SIZE, color="#666"), showarrow=False)
+        fig_mdd.update_layout(**common_layout)
+        st.plotly_chart(fig_mdd, use_container_width=True, key="mdd_v758")
+
+    # 2. SHARPE (변동성 대비 효율)
+    with row1_col2:
+        sharpe_c = "#66BB6A" if sharpe_auto >= 1.0 else "#FF1744"
+        fig_sharpe = go.Figure(go.Indicator(
+            mode = "gauge+number", value = sharpe_auto, domain = {'x': [0, 1], 'y': GAUGE_Y_RANGE},
+            number = {'font': {'size': VAL_FONT_SIZE, 'color': sharpe_c}, 'valueformat': ".2f"},
+            gauge = {'axis': {'range': [0, 2], 'tickvals': [0, 1, 2]},
+                     'bar': {'color': "rgba(255, 255, 255, 0.8)"},
+                     'steps': [{'range': [0, 1], 'color': "rgba(255, 23, 68, 0.3)"},
+                               {'range': [1, 2], 'color': "rgba(102, 187, 106, 0.3)"}]}
+        ))
+        fig_sharpe.add_annotation(text="SHARPE", x=0.5, y=TEXT_Y_POS, font=dict(size=TXT_FONT_SIZE, color="#888"), showarrow=False)
+        fig_sharpe.add_annotation(text=f"전체 변동성 대비 효율 (Rf: {risk_free_rate:.1%})", x=0.5, y=DESC_Y_POS, font=dict(size=DSC_FONT_SIZE, color="#666"), showarrow=False)
+        fig_sharpe.update_layout(**common_layout)
+        st.plotly_chart(fig_sharpe, use_container_width=True, key="sharpe_v758")
+
+    # 3. MAR (고통 대비 생존률)
+    with row2_col1:
+        mar_c = "#66BB6A" if mar_ratio >= 1.0 else "#FF1744"
+        fig_mar = go.Figure(go.Indicator(mode = "gauge+number", value = mar_ratio, domain = {'x': [0, 1], 'y': GAUGE_Y_RANGE},
+            number = {'font': {'size': VAL_FONT_SIZE, 'color': mar_c}, 'valueformat': ".2f"},
+            gauge = {'axis': {'range': [0, 2]}, 'bar': {'color': "rgba(255, 255, 255, 0.8)"},
+                     'steps': [{'range': [0, 1], 'color': "rgba(255, 23, 68, 0.3)"}, {'range': [1, 2], 'color': "rgba(0, 230, 118, 0.3)"}]}
+        ))
+        fig_mar.add_annotation(text="MAR", x=0.5, y=TEXT_Y_POS, font=dict(size=TXT_FONT_SIZE, color="#888"), showarrow=False)
+        fig_mar.add_annotation(text="고통 대비 생존 보상률", x=0.5, y=DESC_Y_POS, font=dict(size=DSC_FONT_SIZE, color="#666"), showarrow=False)
+        fig_mar.update_layout(**common_layout)
+        st.plotly_chart(fig_mar, use_container_width=True, key="mar_v758")
+
+    # 4. SORTINO (하락 위험 대비 효율)
+    with row2_col2:
+        sort_c = "#66BB6A" if sortino_auto >= 1.0 else "#FF1744"
+        fig_sort = go.Figure(go.Indicator(mode = "gauge+number", value = sortino_auto, domain = {'x': [0, 1], 'y': GAUGE_Y_RANGE},
+            number = {'font': {'size': VAL_FONT_SIZE, 'color': sort_c}, 'valueformat': ".2f"},
+            gauge = {'axis': {'range': [0, 2]}, 'bar': {'color': "rgba(255, 255, 255, 0.8)"},
+                     'steps': [{'range': [0, 1], 'color': "rgba(255, 23, 68, 0.3)"}, {'range': [1, 2], 'color': "rgba(0, 200, 83, 0.3)"}]}
+        ))
+        fig_sort.add_annotation(text="SORTINO", x=0.5, y=TEXT_Y_POS, font=dict(size=TXT_FONT_SIZE, color="#888"), showarrow=False)
+        fig_sort.add_annotation(text="하락 위험 대비 수익 효율", x=0.5, y=DESC_Y_POS, font=dict(size=DSC_FONT_SIZE, color="#666"), showarrow=False)
+        fig_sort.update_layout(**common_layout)
+        st.plotly_chart(fig_sort, use_container_width=True, key="sort_v758")
+
+
+@st.fragment
+def render_summary(total_val_display, ytd_return, final_p_score, base_currency):
+    # Privacy Mode 토글은 이 요약 패널만 다시 그림
+    TOGGLE_TOP_MARGIN, CONTENT_TOP_MARGIN = 20, 30
+    SECTION_GAP, SCORE_SECTION_GAP = 10, 10
+    L_FONT, V_FONT, S_FONT, U_FONT = 20, 46, 52, 18
+
+    LABEL_COLOR, NAV_COLOR, CUR_COLOR, UNIT_COLOR = "#888888", "#D500F9", "#444444", "#444444"
+    YTD_COLOR = "#00E676" if ytd_return > 0 else "#FF5252" if ytd_return < 0 else "#B0B0B0"
+    SCORE_COLOR = "#00E676" if final_p_score >= 80 else ("#FDD835" if final_p_score >= 60 else "#FF1744")
+
+    st.markdown(f'<div style="margin-top: {TOGGLE_TOP_MARGIN}px;"></div>', unsafe_allow_html=True)
+    hide_sensitive = st.toggle("Privacy Mode", value=False, key="privacy_v757")
+
+    BASE_S = 'font-weight: 700; line-height: 1.0; letter-spacing: -1.5px;'
+    L_S = f'font-size: {L_FONT}px; color: {LABEL_COLOR}; margin-bottom: 4px; letter-spacing: 1.5px; font-weight: 500;'
+    P_S = f'font-size: {V_FONT}px; {BASE_S} color: {NAV_COLOR}; text-shadow: 0 0 15px rgba(213, 0, 249, 0.4);'
+    Y_S = f'font-size: {V_FONT}px; {BASE_S} color: {YTD_COLOR};'
+    S_S = f'font-size: {S_FONT}px; {BASE_S} color: {SCORE_COLOR}; text-shadow: 0 0 20px {SCORE_COLOR}44;'
+
+    # --- [데이터 처리 로직 수정] ---
+    val_d = f"{total_val_display:,.2f}" if not hide_sensitive else "••••••••"
+    ytd_d = f"{ytd_return:.2%}" if not hide_sensitive else "••••"
+    # Privacy Mode 여부와 관계없이 final_p_score를 그대로 노출합니다.
+    score_d = final_p_score 
+
+    st.markdown(f"""
+        <div style="margin-top: {CONTENT_TOP_MARGIN}px;">
+            <p style="{L_S}">NET ASSET VALUE</p>
+            <p style="{P_S}">{val_d} <span style="font-size: 16px; color: {CUR_COLOR}; font-weight: 600;">{base_currency}</span></p>
+        </div>
+        <div style="margin-top: {SECTION_GAP}px;">
+            <p style="{L_S}">YTD PERFORMANCE</p>
+            <p style="{Y_S}">{ytd_d}</p>
+        </div>
+        <div style="margin-top: {SCORE_SECTION_GAP}px;">
+            <p style="{L_S}">PORTFOLIO SCORE</p>
+            <p style="{S_S}">{score_d} <span style="font-size: {U_FONT}px; color: {UNIT_COLOR}; font-weight: 600;">/ 100</span></p>
+        </div>
+    """, unsafe_allow_html=True)
+
+
+@st.fragment
+def render_allocation(sorted_assets, system_empty, title):
+    st.markdown("---")
+    st.header(title)
+
+    if system_empty:
+        st.warning("SYSTEM EMPTY. DEPLOY ASSETS TO INITIALIZE.")
+    else:
+        df_assets = pd.DataFrame(sorted_assets)
+        chart_col1, chart_col2, chart_col3 = st.columns([1, 1, 1])
+
+        # --- [CHART 1] CLASS DISTRIBUTION ---
+        with chart_col1:
+            with st.container(border=True):
+                st.caption("CLASS DISTRIBUTION")
+                df_class = df_assets.copy()
+                df_class['asset_class'] = df_class['asset_class'].replace('ETF', 'Stock')
+                df_class = df_class.groupby('asset_class')['value_usd'].sum().reset_index()
+                class_map = {
+                    'Crypto': RGBA_CLASS[0],
+                    'Stock': RGBA_CLASS[1], 
+                    'Other': RGBA_CLASS[3], 
+                    'Cash': RGBA_CASH
+                }
+                create_unified_pie(df_class, 'asset_class', 'value_usd', class_map, "chart_class_v7")
+
+        # --- [CHART 2] STOCK SECTOR DISTRIBUTION ---
+        with chart_col2:
+            with st.container(border=True):
+                st.caption("STOCK SECTOR DISTRIBUTION")
+                df_stocks = df_assets[df_assets['asset_class'].isin(['Stock', 'ETF'])].copy()
+                if not df_stocks.empty:
+                    df_stocks_grouped = group_small_assets(df_stocks, 'sector', 'value_usd', 0.01)
+                    sector_colors = {}
+                    for i, s in enumerate(df_stocks_grouped['sector']):
+                        if s == 'etc':
+                            sector_colors[s] = RGBA_ETC
+                        else:
+                            sector_colors[s] = RGBA_SECTOR[i % len(RGBA_SECTOR)]
+                    create_unified_pie(df_stocks_grouped, 'sector', 'value_usd', sector_colors, "chart_sector_v7")
+                else:
+                    st.markdown("<p style='text-align:center; color:#555; padding: 80px 0;'>NO DATA</p>", unsafe_allow_html=True)
+
+        # --- [CHART 3] TOTAL HOLDINGS ---
+        with chart_col3:
+            with st.container(border=True):
+                st.caption("TOTAL HOLDINGS")
+                df_holdings = df_assets.copy()
+                df_holdings['display_ticker'] = df_holdings['ticker'].str.replace("-USD", "")
+                df_holdings_grouped = group_small_assets(df_holdings, 'display_ticker', 'value_usd', 0.01)
+
+                holdings_colors = {}
+                for i, t in enumerate(df_holdings_grouped['display_ticker']):
+                    if t in ['BTC', 'ETH']:
+                        holdings_colors[t] = RGBA_CRYPTO
+                    elif t == 'TSLA':
+                        holdings_colors[t] = RGBA_TSLA
+                    elif t == 'CASH':
+                        holdings_colors[t] = RGBA_CASH
+                    elif t == 'etc':
+                        holdings_colors[t] = RGBA_ETC
+                    else:
+                        holdings_colors[t] = RGBA_HOLDINGS[i % len(RGBA_HOLDINGS)]
+
+                create_unified_pie(df_holdings_grouped, 'display_ticker', 'value_usd', holdings_colors, "chart_holdings_v7")
+
+
+@st.fragment
+def render_nav_history(total_history_display, base_currency, title):
+    st.markdown("---")
+    st.header(title)
+    with st.container(border=True):
+        if not total_history_display.empty:
+            PURPLE_LINE = "#D500F9" 
+            PURPLE_FILL = "rgba(213, 0, 249, 0.15)" 
+            fig_growth = go.Figure()
+            fig_growth.add_trace(go.Scatter(x=total_history_display.index, y=total_history_display.values, fill='tozeroy', mode='lines', line=dict(color=PURPLE_LINE, width=2), fillcolor=PURPLE_FILL, name=f'Portfolio ({base_currency})'))
+            fig_growth.update_layout(paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', margin=dict(t=30, b=10, l=10, r=10), yaxis=dict(gridcolor='#222'), xaxis=dict(gridcolor='#222'), font=dict(color='#888'), height=350, legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1))
+            st.plotly_chart(fig_growth, use_container_width=True)
+            st.caption(f"**Analysis Start:** {total_history_display.index[0].strftime('%Y-%m-%d')} | Source: Yahoo Finance & Global Exchange Data")
+        else:
+            st.info("DATASTREAM OFFLINE.")
+
+
+@st.fragment
+def render_ytd_performance(tickers, title):
+    st.markdown("---")
+    st.header(title)
+
+    with st.spinner("Analyzing 2026 Asset Performance..."):
+        if tickers:
+            try:
+                raw_tickers = list(tickers)
+                portfolio_tickers = [str(t).strip().upper() for t in raw_tickers if t not in ['KRW', 'USD', 'CAD', 'CASH', '현금']]
+                if portfolio_tickers:
+                    fetch_start = datetime(2025, 12, 28) 
+                    y_data = download_prices(portfolio_tickers, start=fetch_start, progress=False)
+                    if not y_data.empty:
+                        p_df = y_data['Close'] if 'Close' in y_data else y_data
+                        p_df = p_df.ffill().dropna(how='all')
+                        target_start = datetime(2026, 1, 2).date()
+                        display_df = p_df.loc[p_df.index.date >= target_start]
+                        if not display_df.empty:
+                            base_price = display_df.iloc[0]
+                            ytd_perf = (display_df / base_price - 1) * 100
+                            fig_ytd = go.Figure()
+                            sorted_names = sorted(ytd_perf.columns if isinstance(ytd_perf, pd.DataFrame) else [portfolio_tickers[0]], key=lambda x: "BTC" not in x)
+                            for ticker in sorted_names:
+                                is_btc = "BTC" in ticker
+                                y_vals = ytd_perf[ticker] if isinstance(ytd_perf, pd.DataFrame) else ytd_perf
+                                fig_ytd.add_trace(go.Scatter(x=ytd_perf.index, y=y_vals, name=ticker, line=dict(width=3 if is_btc else 1.5, color="#F7931A" if is_btc else None), hovertemplate=f"<b>{ticker}</b>: %{{y:.2f}}%<extra></extra>"))
+                            fig_ytd.update_layout(hovermode="x unified", height=450, paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', margin=dict(t=20, b=10, l=10, r=10), legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1), yaxis=dict(title="Return (%)", gridcolor='rgba(255,255,255,0.05)', ticksuffix="%"), xaxis=dict(range=[target_start, ytd_perf.index[-1]], gridcolor='rgba(255,255,255,0.05)'))
+                            fig_ytd.add_hline(y=0, line_dash="solid", line_color="rgba(255,255,255,0.2)")
+                            st.plotly_chart(fig_ytd, use_container_width=True)
+                            st.caption(f"**Base Date:** {display_df.index[0].strftime('%Y-%m-%d')} (Normalized to 0.00%) | Source: Yahoo Finance & Global Exchange Data")
+                            last_p = ytd_perf.iloc[-1]
+                            if isinstance(last_p, pd.Series):
+                                st.info(f"YTD TOP: **{last_p.idxmax()}** ({last_p.max():+.2f}%)")
+            except Exception as e:
+                st.error(f"YTD 엔진 오류: {str(e)}")
+
+
+@st.fragment
+def render_holdings(pm, ae, selected_account, view_positions, all_positions, fx_rates, base_currency):
+    st.markdown("---")
+
+    # [추가] Expander의 글자 크기를 크게 만드는 CSS 인젝션
+    st.markdown("""
+        <style>
+        /* Expander 헤더의 글자 크기 조절 */
+        .stExpander p {
+            font-size: 2.1rem !important;
+            font-weight: bold !important;
+        }
+        </style>
+        """, unsafe_allow_html=True)
+
+    # [기능 1] st.expander를 통한 테이블 전체 토글(접기) 기능
+    with st.expander("**HOLDINGS**", expanded=True):
+    #    col_header, col_delete = st.columns([8, 1])
+    #    with col_header:
+    #        st.header("Manage Asset Inventory")
+
+        # 세션 상태 버퍼 초기화
+        # [V36] 버퍼는 계좌별 포지션 행을 보관 (보기 계좌가 바뀌면 다시 채움)
+        # [V37] 다른 세션이 저장해 버전이 바뀌어도 다시 채움 (오래된 버퍼로 덮어쓰지 않도록)
+        if ('asset_buffer' not in st.session_state or st.session_state.get('asset_buffer_account') != selected_account
+                or st.session_state.get('asset_buffer_version') != pm.version):
+            st.session_state['asset_buffer'] = view_positions.sort_values('value_usd', ascending=False).to_dict('records')
+            st.session_state['asset_buffer_account'] = selected_account
+            st.session_state['asset_buffer_version'] = pm.version
+        account_choices = pm.get_accounts()
+        default_row_account = selected_account if selected_account != ALL_ACCOUNTS else DEFAULT_ACCOUNT
+
+        table_fx_rate = fx_rates.get(base_currency, 1.0)
+        currency_symbol = "$" if base_currency in ["USD", "CAD"] else "₩"
+
+        # [V36] 계좌별 합계 (계좌가 둘 이상일 때 통합 뷰에서 표시)
+        if selected_account == ALL_ACCOUNTS and all_positions['account'].nunique() > 1:
+            acct_summary = ae.account_summary(all_positions)
+            st.dataframe(pd.DataFrame({
+                "ACCOUNT": acct_summary['account'],
+                "POSITIONS": acct_summary['positions'],
+                f"VALUE ({base_currency})": (acct_summary['value_usd'] * table_fx_rate).map(lambda v: f"{currency_symbol}{v:,.2f}"),
+                "WEIGHT": (acct_summary['weight'] * 100).map(lambda v: f"{v:.1f}%")
+            }), hide_index=True, use_container_width=True)
+
+        display_data = []
+        buffer_assets = st.session_state['asset_buffer']
+        display_map = [] 
+
+        # 데이터 전처리 및 테이블용 리스트 생성
+        for i, a in enumerate(buffer_assets):
+            if a['ticker'] == 'CASH': continue 
+            price = a.get('current_price', 0.0)
+            if price == 0: price = a.get('avg_price', 0.0)
+            val_calc = price * a.get('quantity', 0.0) * table_fx_rate
+
+            display_data.append({
+                "DELETE": False, 
+                "TICKER": str(a.get('ticker', '')), 
+                "ACCOUNT": str(a.get('account') or DEFAULT_ACCOUNT), 
+                "CLASS": str(a.get('asset_class', '')), 
+                "SECTOR": str(a.get('sector', '')), 
+                "QTY": f"{float(a.get('quantity', 0.0)):.4f}", 
+                "AVG COST": f"{float(a.get('avg_price', 0.0)):.2f}", 
+                "CURRENT PRICE": f"${float(price):,.2f}", 
+                "VALUE": f"{currency_symbol}{val_calc:,.2f}"
+            })
+            display_map.append(i)
+
+        df_display = pd.DataFrame(display_data, columns=["DELETE", "TICKER", "ACCOUNT", "CLASS", "SECTOR", "QTY", "AVG COST", "CURRENT PRICE", "VALUE"])
+
+        # [기능 2] 데이터 세이브 로직 (기존 로직 유지)
+        def save_edits():
+            state = st.session_state["holdings_editor"]
+            edited_rows = state.get("edited_rows", {})
+            deleted_rows = state.get("deleted_rows", [])
+            added_rows = state.get("added_rows", []) 
+
+            if not edited_rows and not deleted_rows and not added_rows: return
+
+            buffer = st.session_state['asset_buffer']
+            updates_made = False
+
+            # 체크박스 삭제 처리
+            checkbox_deletes = [int(idx) for idx, changes in edited_rows.items() if changes.get("DELETE") is True]
+            all_indices_to_delete = set(deleted_rows + checkbox_deletes)
+
+            if all_indices_to_delete:
+                rows_to_delete = sorted([display_map[i] for i in all_indices_to_delete if i < len(display_map)], reverse=True)
+                for buf_idx in rows_to_delete:
+                    if buf_idx < len(buffer):
+                        buffer.pop(buf_idx)
+                        updates_made = True
+
+            # 개별 셀 수정 처리
+            for idx, changes in edited_rows.items():
+                if int(idx) in all_indices_to_delete: continue 
+                buf_idx = display_map[int(idx)]
+                asset = buffer[buf_idx]
+                if "QTY" in changes: 
+                    try: asset['quantity'] = float(str(changes["QTY"]).replace(',', ''))
+                    except: pass
+                    updates_made = True
+                if "AVG COST" in changes:
+                    try: asset['avg_price'] = float(str(changes["AVG COST"]).replace(',', '').replace('$', ''))
+                    except: pass
+                    updates_made = True
+                if "SECTOR" in changes: asset['sector'] = str(changes["SECTOR"]).strip(); updates_made = True
+                if "CLASS" in changes: asset['asset_class'] = str(changes["CLASS"]).strip(); updates_made = True
+                if "TICKER" in changes: asset['ticker'] = str(changes["TICKER"]).strip().upper(); updates_made = True
+                if "ACCOUNT" in changes: asset['account'] = str(changes["ACCOUNT"] or default_row_account).strip(); updates_made = True
+
+            # 신규 행 추가 처리
+            if added_rows:
+                for new_row in added_rows:
+                    raw_ticker = new_row.get('TICKER', '').strip().upper()
+                    qty = 0.0; avg = 0.0
+                    try: qty = float(str(new_row.get('QTY', '0')).replace(',', ''))
+                    except: pass
+                    try: avg = float(str(new_row.get('AVG COST', '0')).replace('$', '').replace(',', ''))
+                    except: pass
+                    buffer.append({
+                        "ticker": raw_ticker, "quantity": qty, "avg_price": avg, 
+                        "sector": "Unknown", "asset_class": "Stock", 
+                        "account": new_row.get('ACCOUNT') or default_row_account,
+                        "value_usd": 0.0, "current_price": 0.0
+                    })
+                    updates_made = True
+
+            if updates_made:
+                valid_assets = [{k: a.get(k) for k in ASSET_FIELDS} for a in buffer if a.get('ticker') and a.get('ticker') != "CASH"]
+                cash_asset = next((a for a in pm.data['assets'] if a['ticker'] == 'CASH'), None)
+                # 계좌별 보기에서 저장할 때는 다른 계좌의 포지션을 그대로 유지
+                other_accounts = [] if selected_account == ALL_ACCOUNTS else [
+                    a for a in pm.data['assets']
+                    if a['ticker'] != 'CASH' and a.get('account', DEFAULT_ACCOUNT) != selected_account
+                ]
+                pm.data['assets'] = other_accounts + valid_assets + ([cash_asset] if cash_asset else [])
+                pm.save_data()
+                st.session_state["holdings_saved"] = True
+                st.toast("✅ Portfolio Updated")
+
+        # [기능 3] st.data_editor 출력 부분
+        st.data_editor(
+            df_display,
+            column_config={
+                "DELETE": st.column_config.CheckboxColumn("🗑️", width="small"),
+                "TICKER": st.column_config.TextColumn("Ticker", width="small"), 
+                "ACCOUNT": st.column_config.SelectboxColumn("Account", width="small", options=account_choices), 
+                "CLASS": st.column_config.SelectboxColumn(
+                    "Class", 
+                    width="medium",
+                    options=["Stock", "Bond", "ETF", "Crypto"],
+                    required=True
+                ),
+                "SECTOR": st.column_config.TextColumn("Sector", width="medium"),
+                "QTY": st.column_config.TextColumn("Quantity", width="small"), 
+                "AVG COST": st.column_config.TextColumn("Avg Cost", width="small"), 
+                "CURRENT PRICE": st.column_config.TextColumn("Price (USD)", width="medium", disabled=True), 
+                "VALUE": st.column_config.TextColumn(f"Value ({base_currency})", width="medium", disabled=True) 
+            },
+            hide_index=True,
+            use_container_width=True,
+            key="holdings_editor",
+            on_change=save_edits,
+            num_rows="dynamic" 
+        )
+
+        # [V44] 저장된 편집은 NAV/비중/게이지에도 반영되어야 하므로 이때만 페이지 전체를 다시 실행
+        if st.session_state.pop("holdings_saved", False):
+            st.rerun()
+
+
+@st.fragment
+def render_news(ae, news_tickers, title):
+    with st.expander(f"**{title}**", expanded=False):
+        if news_tickers:
+            sync_news_index(ae, news_tickers)
+
+        news_store = get_news_store()
+        n_col1, n_col2, n_col3 = st.columns([2, 2, 1])
+        with n_col1:
+            news_query = st.text_input("KEYWORD", key="news_query", placeholder="e.g. earnings guidance")
+        with n_col2:
+            news_filter = st.multiselect("TICKERS", options=list(news_tickers), key="news_tickers")
+        with n_col3:
+            news_days = st.selectbox("PERIOD", [7, 30, 90, 365], index=1, format_func=lambda d: f"{d}D", key="news_days")
+
+        news_page_size = 15
+        news_since = (datetime.now() - timedelta(days=news_days)).timestamp()
+        news_page = st.session_state.get("news_page", 0)
+        news_rows, news_total = news_store.search(
+            news_query, list(news_filter) or list(news_tickers), since=news_since,
+            page=news_page, page_size=news_page_size
+        )
+        news_pages = max(1, -(-news_total // news_page_size))
+        if news_page >= news_pages:
+            st.session_state["news_page"] = 0
+            news_page = 0
+            news_rows, news_total = news_store.search(
+                news_query, list(news_filter) or list(news_tickers), since=news_since,
+                page=0, page_size=news_page_size
+            )
+
+        if not news_rows:
+            st.caption("No headlines in the local index for this filter.")
+        for item in news_rows:
+            published = datetime.fromtimestamp(item['published_ts']).strftime('%Y-%m-%d %H:%M') if item['published_ts'] else ""
+            link_html = f" · <a class='news-link' href='{html.escape(item['link'])}' target='_blank'>OPEN</a>" if item['link'] else ""
+            st.markdown(f"""
+                <div class="news-item">
+                    <div class="news-title">{html.escape(item['title'])}</div>
+                    <div class="news-meta">{item['ticker']} · {published}{link_html}</div>
+                </div>
+            """, unsafe_allow_html=True)
+
+        p_col1, p_col2, p_col3 = st.columns([1, 2, 1])
+        with p_col1:
+            if st.button("PREV", key="news_prev", disabled=news_page == 0, use_container_width=True):
+                st.session_state["news_page"] = news_page - 1
+                st.rerun(scope="fragment")
+        with p_col2:
+            st.markdown(f"<div style='text-align: center; color: #777; font-size: 12px; padding-top: 10px;'>PAGE {news_page + 1} / {news_pages} · {news_total} HEADLINES</div>", unsafe_allow_html=True)
+        with p_col3:
+            if st.button("NEXT", key="news_next", disabled=news_page + 1 >= news_pages, use_container_width=True):
+                st.session_state["news_page"] = news_page + 1
+                st.rerun(scope="fragment")
+
+
+@st.fragment
+def render_projection(total_val_display, cagr_val, final_p_score):
+    st.markdown("---")
+    st.header("STRATEGIC PROJECTION")
+
+    # [1. 데이터 준비]
+
+    current_year = datetime.now().year
+    years_to_target = 2030 - current_year
+    years_range = np.arange(0, years_to_target + 1)
+
+    # [2. 목표 설정 위젯]
+    with st.container():
+        col_input, col_info = st.columns([1, 1])
+
+        with col_input:
+            # CSS 없이 기본 number_input 사용 (사이드바에 영향 없음)
+            user_target_usd = st.number_input(
+                "TARGET NAV (USD)", 
+                min_value=100000, 
+                value=1500000, 
+                step=100000,
+                format="%d",
+                key="target_val_v_final_clean"
+            )
+
+        with col_info:
+            krw_val = user_target_usd * 1350 
+            # KRW 텍스트에만 인라인 스타일 적용 (다른 곳에 영향 미치지 않음)
+            st.markdown(f"""
+                <div style="margin-top: 32px;">
+                    <span style="
+                        font-size: 20px; 
+                        color: #00E676; 
+                        font-weight: 600;
+                    ">
+                        ≈ KRW {krw_val/100000000:.1f}억 원
+                    </span>
+                </div>
+            """, unsafe_allow_html=True)
+
+    # 🚀 ROW 1: NAV GROWTH PATH
+    with st.container(border=True):
+        st.subheader("NAV GROWTH PATH")
+
+        # 상단의 cagr_val과 final_p_score를 실시간 반영
+        eff_cagr = cagr_val * (final_p_score / 100 + 0.2)
+        future_values = [total_val_display * (1 + eff_cagr)**y for y in years_range]
+
+        df_roadmap = pd.DataFrame({
+            'Year': [current_year + y for y in years_range],
+            'Projected Value': future_values,
+            'Target': [user_target_usd] * len(years_range)
+        })
+
+        fig_roadmap = go.Figure()
+
+        # 목표선 (Target Line)
+        fig_roadmap.add_trace(go.Scatter(
+            x=df_roadmap['Year'], y=df_roadmap['Target'], 
+            # name=f"Target (${user_target_usd/1000:,.0f}K)", 
+            name="Target",
+            line=dict(color="#FFD700", dash='dash', width=2)
+        ))
+
+        # 예측 곡선 (Projected Path)
+        fig_roadmap.add_trace(go.Scatter(
+            x=df_roadmap['Year'], y=df_roadmap['Projected Value'], 
+            name="NAV",
+            fill='tozeroy', fillcolor='rgba(0, 230, 118, 0.1)', 
+            line=dict(color="#00E676", width=2)
+        ))
+
+        # Y축 최댓값 계산 (예측치와 목표치 중 큰 값의 1.15배를 상단 마진으로 확보)
+        y_max = max(max(future_values), user_target_usd) * 1.15
+
+        fig_roadmap.update_layout(
+            height=350, # 차트 가독성을 위해 높이를 소폭 상향
+            margin=dict(t=50, b=20, l=10, r=10),
+            paper_bgcolor='rgba(0,0,0,0)', 
+            plot_bgcolor='rgba(0,0,0,0)',
+            font=dict(color="#BBBBBB"), 
+            showlegend=True,
+            legend=dict(
+                orientation="h",
+                yanchor="bottom",
+                y=1.02,
+                xanchor="right",
+                x=1,
+                bgcolor="rgba(0,0,0,0)"
+            ),
+            xaxis=dict(
+                showgrid=False,
+                dtick=1,
+                tickformat="d"
+            ), 
+            yaxis=dict(
+                showgrid=True, 
+                gridcolor="#222", 
+                tickformat="$,.0f",
+                range=[0, y_max] # Y축 범위를 다이나믹하게 설정하여 잘림 방지
+            )
+        )
+        st.plotly_chart(fig_roadmap, use_container_width=True)
+
+        # 인사이트
+        expected_2030 = future_values[-1]
+        achievement_rate = (expected_2030 / user_target_usd) * 100
+
+        if achievement_rate >= 100:
+            st.success(f"현재 페이스 유지 시 2030년 목표의 **{achievement_rate:.1f}%** 달성이 예상됩니다.")
+        else:
+            st.warning(f"목표 달성률이 **{achievement_rate:.1f}%**입니다. 추가 자본 투입이나 CAGR 개선 전략이 필요합니다.")
+
+
+def render(ctx):
+    pm, md, ae = ctx.pm, ctx.md, ctx.ae
+    base_currency = pm.get_setting("base_currency", "USD")
+    section_labels = pm.get_setting('section_labels', {
+        "strategic_allocation": "ALLOCATION",
+        "asset_growth": "NET ASSET VALUE",
+        "asset_manifest": "HOLDINGS", 
+        "risk_analysis": "RISK ANALYSIS",
+        "global_intel": "NEWS"
+    })
+
+    # --- Main Dashboard (V756: Syntax Fix & Core Summary) ---
+    st.title("PORTFOLIO MANAGER")
+    st.markdown("---")
+
+    # [데이터 엔진 - 기존 로직 유지]
+    fx_rates, _ = md.get_fx_rates()
+    raw_assets = pm.get_assets()
+    selected_account = st.session_state.get("account_view", ALL_ACCOUNTS)
+    if selected_account != ALL_ACCOUNTS and selected_account not in pm.get_accounts():
+        selected_account = ALL_ACCOUNTS
+    all_positions = value_all_positions(pm, md, ae, raw_assets)
+    if selected_account == ALL_ACCOUNTS:
+        view_positions = all_positions
+    else:
+        view_positions = all_positions[all_positions['account'] == selected_account]
+    total_val_display, sorted_assets = process_assets(pm, ae, view_positions, fx_rates, base_currency, include_cash=selected_account == ALL_ACCOUNTS)
+
+    # [계산 엔진 - YTD & Sharpe & MDD]
+    ytd_return = 0.0
+    sharpe_auto = 0.0
+    mdd_value = 0.0
+
+    real_assets = [a for a in sorted_assets if a['ticker'] != 'CASH']
+    # [V36] 거래 원장은 계좌 구분이 없으므로 통합 뷰에서만 사용
+    ledger = pm.get_ledger() if selected_account == ALL_ACCOUNTS else pm.get_ledger().subset([])
+
+    # [V39] 일별 스냅샷 기록 (포지션/현금/환율, 같은 날은 최대 1시간마다 최신 값으로 갱신)
+    snapshot_store = get_snapshot_store()
+    snapshot_day = datetime.now().strftime('%Y-%m-%d')
+    snapshot_view = ALL_ACCOUNTS_VIEW if selected_account == ALL_ACCOUNTS else selected_account
+    if snapshot_store.due(pm.user_suffix, snapshot_day):
+        snapshot_store.record(pm.user_suffix, snapshot_day, all_positions[all_positions['ticker'] != 'CASH'],
+                              cash_to_usd(pm.data.get('cash', {}), fx_rates), fx_rates)
+
+    total_history_display = pd.Series()
+    if not snapshot_store.is_seeded(pm.user_suffix, snapshot_view) and (real_assets or not ledger.empty):
+        # [V39] 스냅샷 이전 구간은 처음 한 번만 가격 이력으로 재구성해 채워둠 (이후에는 업스트림 조회 없음)
+        # [V27] 원장이 있으면 과거에 보유했던 종목까지 포함 (티커만 캐시 키로 사용)
+        # [V36] 모든 계좌의 티커로 한 번만 조회해 계좌 전환 시에도 같은 캐시를 공유
+        history_tickers = sorted(set(all_positions['ticker']) | set(pm.get_ledger().tickers))
+        # [V28] 현금까지 재생하는 원장은 배당을 현금으로 적립하므로 배당 미포함 가격 사용
+        prices = get_cached_historical_data(ae, [{'ticker': t} for t in history_tickers], total_return=not ledger.has_cash_flows)
+        if not prices.empty:
+            total_cash_usd = next((a['value_usd'] for a in sorted_assets if a['ticker'] == 'CASH'), 0.0)
+            if not ledger.empty:
+                # [V27] 거래 원장 재생: 날짜별 실제 보유 수량 x 가격 (look-ahead bias 제거)
+                portfolio_value_series, _, _ = ae.calculate_ledger_performance(ledger, prices.ffill(), fx_rates)
+                portfolio_value_series = portfolio_value_series[portfolio_value_series.ne(0).cummax()]
+                if ledger.has_cash_flows:
+                    total_cash_usd = 0.0 # 원장에 현금 흐름이 있으면 현금도 원장에서 재생됨
+            else:
+                quantities = pd.Series({a['ticker']: a['quantity'] for a in real_assets})
+                prices = prices.reindex(columns=quantities.index.intersection(prices.columns)).ffill().dropna()
+                portfolio_value_series = (prices * quantities.reindex(prices.columns)).sum(axis=1)
+            snapshot_store.backfill(pm.user_suffix, snapshot_view, portfolio_value_series, total_cash_usd)
+
+    # [V39] NAV 이력은 스냅샷 테이블에서 읽음 (그날 기록된 환율로 기준 통화 환산)
+    history_usd = snapshot_store.nav_history(pm.user_suffix, snapshot_view) if snapshot_store.is_seeded(pm.user_suffix, snapshot_view) else pd.DataFrame()
+    if not history_usd.empty:
+        nav_usd = history_usd['positions_usd'] + history_usd['cash_usd']
+        day_fx = snapshot_store.fx_history(base_currency).reindex(nav_usd.index).ffill().fillna(fx_rates.get(base_currency, 1.0))
+        total_history_display = nav_usd * day_fx
+        this_year_start = pd.Timestamp(datetime(datetime.now().year, 1, 1))
+
+        if not ledger.empty:
+            # 1. YTD: 입출금/매매 효과를 제거한 시간가중수익률 기준
+            # (현금 흐름이 없는 원장은 매매를 외부 흐름으로 보므로 포지션 가치만으로 계산)
+            twr_nav = nav_usd if ledger.has_cash_flows else history_usd['positions_usd']
+            ledger_twr = ledger.time_weighted_return(twr_nav, fx_rates, include_cash=ledger.has_cash_flows)
+            if not ledger_twr.empty:
+                wealth = 1 + ledger_twr
+                before_year = wealth[wealth.index < this_year_start]
+                ytd_base = before_year.iloc[-1] if not before_year.empty else wealth.iloc[0]
+                ytd_return = wealth.iloc[-1] / ytd_base - 1
+
+                # 2. MDD: 자금 유입에 왜곡되지 않도록 TWR 지수로 계산
+                mdd_value = (wealth / wealth.cummax() - 1).min()
+        else:
+            # 1. YTD 계산
+            this_year_data = total_history_display[total_history_display.index >= this_year_start]
+            if not this_year_data.empty:
+                ytd_return = (total_history_display.iloc[-1] - this_year_data.iloc[0]) / this_year_data.iloc[0]
+
+            # 2. MDD 실시간 계산
+            rolling_max = total_history_display.cummax()
+            drawdowns = (total_history_display - rolling_max) / rolling_max
+            mdd_value = drawdowns.min()
+
+    # [전략적 Sharpe Ratio 계산]
+    RISK_BENCHMARKS = {"Crypto": {"roi": 0.70, "vol": 0.60}, "Stock": {"roi": 0.12, "vol": 0.20}, "Bond": {"roi": 0.04, "vol": 0.08}, "Cash": {"roi": 0.035, "vol": 0.00}, "Other": {"roi": 0.05, "vol": 0.10}}
+    RF_RATE = 0.035
+    class_mapping = {"Crypto": "Crypto", "Stock": "Stock", "ETF": "Stock", "Cash": "Cash", "Bond": "Bond"}
+    total_p_value = sum(a['value_usd'] for a in sorted_assets)
+    weighted_roi, weighted_vol = 0.0, 0.0
+    if total_p_value > 0:
+        for asset in sorted_assets:
+            ac = asset.get('asset_class', 'Other')
+            weight = asset['value_usd'] / total_p_value
+            bench_key = class_mapping.get(ac, "Other")
+            metrics = RISK_BENCHMARKS.get(bench_key, RISK_BENCHMARKS["Other"])
+            weighted_roi += metrics['roi'] * weight
+            weighted_vol += metrics['vol'] * weight
+        if weighted_vol > 0:
+            sharpe_auto = (weighted_roi - RF_RATE) / weighted_vol
+
+    # --------------------------------------------------------------------------------
+    # 🎯 UI 레이아웃 (V757: Sequential Logic Optimized)
+    # --------------------------------------------------------------------------------
+
+    # [V44] ^IRX는 1시간 캐시 (게이지/위젯 조작마다 조회하지 않음)
+    LIVE_RISK_FREE_RATE = get_risk_free_rate()
+
+    # --- [Sharpe & Sortino 실시간 정밀 산출] ---
+    # 'returns' 변수가 상단에서 정의되어 있어야 합니다.
+    daily_rf = LIVE_RISK_FREE_RATE / 252
+
+    if 'returns' in locals() and not returns.empty:
+        excess_returns = returns - daily_rf
+        # 1. Sharpe 정밀 계산
+        sharpe_auto = (excess_returns.mean() / excess_returns.std()) * (252**0.5)
+
+        # 2. Sortino 정밀 계산 (하락 변동성만 추출)
+        downside_returns = excess_returns[excess_returns < 0]
+        if not downside_returns.empty and len(downside_returns) > 1:
+            downside_deviation = downside_returns.std() * (252**0.5)
+            sortino_auto = (excess_returns.mean() * 252) / downside_deviation if downside_deviation > 0 else 0.0
+        else:
+            sortino_auto = sharpe_auto
+    else:
+        # 데이터 부재 시 기존 변수 유지 혹은 기본값
+        sharpe_auto = locals().get('sharpe_auto', 0.0)
+        sortino_auto = locals().get('sortino_auto', sharpe_auto * 1.2)
+
+    # [지표 계산: 전략적 장기 가치 중심]
+    # CAGR 40% 고정 (2030년 자산 50억 목표 기반)
+    cagr_val = 0.40 
+
+    # MDD 및 MAR Ratio 계산
+    mdd_abs_val = abs(mdd_value) if mdd_value != 0 else 0.01
+    mar_ratio = cagr_val / mdd_abs_val
+
+    # --- [Portfolio Score 실시간 최종 산출] ---
+    s_pts = get_step_score(sharpe_auto)
+    so_pts = get_step_score(sortino_auto)
+    mar_pts = get_step_score(mar_ratio)
+
+    _mdd_abs_pct = abs(mdd_value * 100)
+    if _mdd_abs_pct == 0: mdd_pts = 100
+    elif _mdd_abs_pct <= 20: mdd_pts = 70
+    elif _mdd_abs_pct <= 40: mdd_pts = 50
+    else: mdd_pts = 30
+
+    W_EQUAL = 0.25
+    final_p_score = round((s_pts + so_pts + mar_pts + mdd_pts) * W_EQUAL, 1)
+
+    # [V44] 각 섹션은 독립 fragment: 섹션 안의 조작(Privacy Mode, 날짜, 편집, 검색)은 그 섹션만 다시 실행
+    m_left, m_right = st.columns([3, 7])
+    with m_right:
+        render_risk_gauges(mdd_value, sharpe_auto, sortino_auto, mar_ratio, LIVE_RISK_FREE_RATE)
+    with m_left:
+        render_summary(total_val_display, ytd_return, final_p_score, base_currency)
+
+
+    # --------------------------------------------------------------------------------
+    # 1. [ALLOCATION] 자산 비중 분석 (Pie Charts) - 투명도 및 시각화 통일
+    # --------------------------------------------------------------------------------
+    system_empty = not raw_assets and pm.data['cash']['USD'] == 0
+    render_allocation(sorted_assets, system_empty, section_labels.get("strategic_allocation", "ALLOCATION"))
+
+
+    # --------------------------------------------------------------------------------
+    # 2. [GROWTH] 자산 성장 추세 (Growth Trend)
+    # --------------------------------------------------------------------------------
+    render_nav_history(total_history_display, base_currency, section_labels.get("asset_growth", "Net Asset Value"))
+
+
+    # --------------------------------------------------------------------------------
+    # 3. [YTD PERFORMANCE] 연초 대비 성과 (Jan 2nd Baseline)
+    # --------------------------------------------------------------------------------
+    ytd_tickers = () if system_empty else tuple(dict.fromkeys(a['ticker'] for a in sorted_assets if a.get('ticker')))
+    render_ytd_performance(ytd_tickers, section_labels.get("ytd_performance", "YTD PERFORMANCE"))
+
+
+    # --------------------------------------------------------------------------------
+    # 4. [HOLDINGS] 자산 관리 테이블 (Full Width & Toggle & Dropdown)
+    # --------------------------------------------------------------------------------
+    render_holdings(pm, ae, selected_account, view_positions, all_positions, fx_rates, base_currency)
+
+
+    # --------------------------------------------------------------------------------
+    # 📰 NEWS: Local full-text index (V30)
+    # --------------------------------------------------------------------------------
+    news_tickers = tuple(sorted(a['ticker'] for a in real_assets))
+    render_news(ae, news_tickers, section_labels.get('global_intel', 'NEWS'))
+
+
+    # --------------------------------------------------------------------------------
+    # 🎯 STRATEGIC PROJECTION: Clean Setup Box
+    # --------------------------------------------------------------------------------
+    render_projection(total_val_display, cagr_val, final_p_score)
+
+
+    # 2. SURVIVAL STRESS TEST (Zero-Error Sync with Transparency)
+    with st.container(border=True):
+        st.subheader("SURVIVAL STRESS TEST")
+
+        # [1. 데이터 무결성: 상단 MDD 지표와 100% 동기화]
+        try:
+            current_mdd_decimal = mdd_val / 100 if abs(mdd_val) > 1 else mdd_val
+            if current_mdd_decimal > 0: current_mdd_decimal = -current_mdd_decimal
+        except NameError:
+            current_mdd_decimal = -0.307
+
+        # [2. 블랙스완 시나리오: 전고점(ATH) 대비 -50% 하락]
+        target_mdd_decimal = -0.50
+        additional_shock_needed = (1 + target_mdd_decimal) / (1 + current_mdd_decimal) - 1
+        shock_factor = min(additional_shock_needed, -0.10)
+        shocked_value = total_val_display * (1 + shock_factor)
+
+        # [3. 실시간 환율 및 현금흐름 산출]
+        try:
+            k_to_u = 1 / usdkrw_rate if usdkrw_rate != 0 else 1/1350
+            c_to_u = 1 / usdcad_rate if usdcad_rate != 0 else 0.72
+        except NameError:
+            k_to_u, c_to_u = 1/1350, 0.72
+
+        safety_net_annual = ((6000000 * 12) * k_to_u) + ((2000 * 12) * c_to_u)
+
+        # [4. 시각화 - 투명도 적용]
+        labels = ['Current NAV', 'Black Swan Shock', 'Annual Safety Net']
+        values = [total_val_display, shocked_value, safety_net_annual]
+
+        # RGBA 투명도 적용 컬러셋
+        colors = [
+            'rgba(136, 136, 136, 0.6)',  # Current (Grey)
+            'rgba(255, 23, 68, 0.6)',    # Shock (Red)
+            'rgba(76, 175, 80, 0.6)'     # Safety Net (Green)
+        ]
+        line_colors = [
+            'rgba(136, 136, 136, 0.6)',
+            'rgba(255, 23, 68, 0.6)',
+            'rgba(76, 175, 80, 0.6)'
+        ]
+
+        fig_stress = go.Figure(go.Bar(
+            x=labels, y=values,
+            marker=dict(
+                color=colors,
+                line=dict(color=line_colors, width=2) # 테두리로 가시성 확보
+            ),
+            text=[f"${v/1000:,.0f}K" for v in values], 
+            textposition='auto',
+            textfont=dict(color="#FFFFFF", size=14)
+        ))
+
+        fig_stress.update_layout(
+            height=350, margin=dict(t=40, b=20, l=10, r=10),
+            paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
+            font=dict(color="#BBBBBB"),
+            yaxis=dict(showgrid=True, gridcolor="#222", tickformat="$,.0f")
+        )
+        st.plotly_chart(fig_stress, use_container_width=True)
+
+        # [5. 데이터 무결성 보고]
+        st.info(f"""
+            **1. Risk Data Audit:** 현재 포트폴리오는 전고점 대비 {current_mdd_decimal*100:.1f}% 하락한 상태입니다.
+
+            **2. Scenario:** 시장이 최악의 경우 전고점 대비 -50%까지 추가 하락할 경우, 
+            현재가에서 {shock_factor*100:.1f}%의 추가 충격이 예상됩니다.
+
+            **3. Stability:** 이 극한의 상황에서도 ${safety_net_annual:,.0f}의 연간 현금흐름이 
+            심리적 마지노선을 지탱하는 강력한 리스크 해자(Moat)가 됩니다.
+        """)
+
+
+    # --------------------------------------------------------------------------------
+    # 📜 FOOTER: RABBIT TERMINAL SIGNATURE
+    # --------------------------------------------------------------------------------
+    st.markdown("---") # 섹션 구분선
+
+    # 사이드바와 동일한 폰트 스타일 및 중앙 정렬 적용
+    st.markdown("""
+        <style>
+        .terminal-footer {
+            font-family: 'Courier New', Courier, monospace; /* 터미널 느낌의 고정폭 폰트 */
+            font-size: 14px;
+            color: #666666; /* 차분한 그레이 톤 */
+            text-align: center;
+            letter-spacing: 2px; /* 자간 조절로 전문성 강조 */
+            padding-top: 50px;
+            padding-bottom: 20px;
+            font-weight: 500;
+        }
+        </style>
+        <div class="terminal-footer">
+            RABBIT TERMINAL v2026.02
+        </div>
+    """, unsafe_allow_html=True)
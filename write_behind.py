@@ -0,0 +1,116 @@
+import atexit
+import copy
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+class WriteBehindQueue:
+    """
+    Debounced write-behind buffer for one user's portfolio state.
+    submit() only records the latest snapshot and (re)arms a timer; after `delay` seconds
+    without further mutations (or `max_delay` since the first unsaved one) a background
+    thread hands the newest snapshot to `writer`, so a burst of edits costs one write.
+    A failed write is retried on its own timer, backing off from RETRY_DELAY up to
+    MAX_RETRY_DELAY, so the last edit of an idle session is not left unwritten.
+    """
+    DEBOUNCE_DELAY = 2.0   # seconds of quiet before flushing
+    MAX_DELAY = 10.0       # never hold an unsaved mutation longer than this
+    RETRY_DELAY = 5.0      # first retry after a failed write, doubled per consecutive failure
+    MAX_RETRY_DELAY = 300.0
+
+    def __init__(self, writer: Callable[[Dict[str, Any]], None], delay=DEBOUNCE_DELAY, max_delay=MAX_DELAY):
+        self.writer = writer
+        self.delay = delay
+        self.max_delay = max_delay
+        self.pending: Optional[Dict[str, Any]] = None
+        self.last_submitted: Optional[Dict[str, Any]] = None
+        self.last_submitted_at = 0.0
+        self.last_error: Optional[Exception] = None
+        self.baseline: Dict[str, Any] = {}     # writer-owned record of what the remote currently holds
+        self.last_conflict: Optional[str] = None  # writer-reported conflict, shown once by the UI
+        self._first_pending_at = 0.0
+        self._failures = 0  # consecutive failed writes (retry backoff)
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()         # guards pending / timer
+        self._write_lock = threading.Lock()   # serializes writes, keeps them in order
+
+    def submit(self, snapshot: Dict[str, Any]):
+        snapshot = copy.deepcopy(snapshot)
+        now = time.time()
+        with self._lock:
+            if self.pending is None:
+                self._first_pending_at = now
+            self.pending = snapshot
+            self.last_submitted = snapshot
+            self.last_submitted_at = now
+            self._arm(max(0.0, min(self.delay, self._first_pending_at + self.max_delay - now)))
+
+    def _arm(self, wait: float):
+        """(Re)starts the flush timer; caller holds self._lock."""
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(wait, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def flush(self) -> bool:
+        """Writes the pending snapshot now (blocking). Returns False if the write failed."""
+        with self._write_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                snapshot, self.pending = self.pending, None
+            if snapshot is None:
+                return True
+            try:
+                self.writer(snapshot)
+                self.last_error = None
+                self._failures = 0
+                return True
+            except Exception as e:
+                print(f"Background sync failed: {e}")
+                self.last_error = e
+                self._failures += 1
+                with self._lock:
+                    # Keep it for the next flush unless a newer snapshot already replaced it
+                    if self.pending is None:
+                        self.pending = snapshot
+                        self._first_pending_at = time.time()
+                    # Retry even if nothing else is submitted (a newer submit keeps its own, shorter timer)
+                    if self._timer is None:
+                        self._arm(min(self.RETRY_DELAY * 2 ** (self._failures - 1), self.MAX_RETRY_DELAY))
+                return False
+
+    @property
+    def has_pending(self) -> bool:
+        return self.pending is not None
+
+
+_QUEUES: Dict[str, WriteBehindQueue] = {}
+_QUEUES_LOCK = threading.Lock()
+
+
+def get_queue(key: str, writer: Callable[[Dict[str, Any]], None]) -> WriteBehindQueue:
+    """
+    One queue per user per process, shared by every PortfolioManager instance
+    (Streamlit builds a new one on each rerun). The writer is rebound to the newest instance.
+    """
+    with _QUEUES_LOCK:
+        queue = _QUEUES.get(key)
+        if queue is None:
+            queue = _QUEUES[key] = WriteBehindQueue(writer)
+        else:
+            queue.writer = writer
+        return queue
+
+
+def flush_all():
+    with _QUEUES_LOCK:
+        queues = list(_QUEUES.values())
+    for queue in queues:
+        queue.flush()
+
+
+atexit.register(flush_all)